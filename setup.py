@@ -48,6 +48,8 @@ setup(
         'redis': ['redis>=2.10.5,<7.0.0'],
         'uwsgi': ['uwsgi>=2.0.0'],
         'cpphash': ['mmh3cffi==0.2.1'],
+        're2': ['google-re2>=1.0'],
+        'orjson': ['orjson>=3.0.0'],
         'asyncio': ['aiohttp>=3.8.4', 'aiofiles>=23.1.0'],
         'kerberos': ['requests-kerberos>=0.15.0']
     },
@@ -3,6 +3,7 @@ from collections import namedtuple
 import requests
 import urllib
 import abc
+import gzip
 import logging
 import json
 import threading
@@ -10,8 +11,8 @@ from urllib3.util import parse_url
 
 from splitio.optional.loaders import HTTPKerberosAuth, OPTIONAL
 from splitio.client.config import AuthenticateScheme
-from splitio.optional.loaders import aiohttp
-from splitio.util.time import get_current_epoch_time_ms
+from splitio.optional.loaders import aiohttp, asyncio
+from splitio.util.time import get_current_epoch_time_ms, get_current_perf_counter_ns, get_elapsed_micros
 
 SDK_URL = 'https://sdk.split.io/api'
 EVENTS_URL = 'https://events.split.io/api'
@@ -20,6 +21,12 @@ TELEMETRY_URL = 'https://telemetry.split.io/api'
 
 _LOGGER = logging.getLogger(__name__)
 _EXC_MSG = '{source} library is throwing exceptions'
+_DEFAULT_POOL_MAXSIZE = 10
+_DEFAULT_DNS_CACHE_TTL = 10
+_DEFAULT_KEEPALIVE_TIMEOUT = 15
+_GZIP_MIN_BYTES = 1024
+_EXECUTOR_MIN_ITEMS = 500
+_NOT_MODIFIED = 304
 
 HttpResponse = namedtuple('HttpResponse', ['status_code', 'body', 'headers'])
 
@@ -47,6 +54,52 @@ def _construct_urls(sdk_url=None, events_url=None, auth_url=None, telemetry_url=
         'telemetry': telemetry_url if telemetry_url is not None else TELEMETRY_URL,
     }
 
+def _compress_payload(payload):
+    """
+    Gzip compress a serialized request body when it is big enough to pay off.
+
+    :param payload: serialized body.
+    :type payload: bytes
+
+    :return: Payload to send and whether it was compressed.
+    :rtype: tuple(bytes, bool)
+    """
+    if len(payload) < _GZIP_MIN_BYTES:
+        return payload, False
+
+    return gzip.compress(payload, compresslevel=6), True
+
+def _encode_body(body):
+    """
+    Serialize a request body, gzip compressing it when it is big enough to pay off.
+
+    :param body: body to be sent.
+    :type body: object
+
+    :return: Encoded body and whether it was compressed.
+    :rtype: tuple(bytes, bool)
+    """
+    return _compress_payload(json.dumps(body).encode('utf-8'))
+
+def _count_items(body):
+    """
+    Count the records in a bulk, including those grouped one level deep such as impressions by flag.
+
+    :param body: body to be sent.
+    :type body: object
+
+    :return: Number of records.
+    :rtype: int
+    """
+    if not isinstance(body, list):
+        return 1
+
+    return sum(
+        sum(len(value) for value in item.values() if isinstance(value, list)) or 1
+        if isinstance(item, dict) else 1
+        for item in body
+    )
+
 def _build_basic_headers(sdk_key):
     """
     Build basic headers with auth.
@@ -59,6 +112,22 @@ def _build_basic_headers(sdk_key):
         'Authorization': "Bearer %s" % sdk_key
     }
 
+def _build_session(pool_maxsize):
+    """
+    Build a keep-alive session with its own connection pool.
+
+    :param pool_maxsize: Max connections kept open to the host, should match request concurrency.
+    :type pool_maxsize: int
+
+    :return: A session requesting gzip encoded responses.
+    :rtype: requests.Session
+    """
+    session = requests.Session()
+    session.headers['Accept-Encoding'] = 'gzip'
+    session.mount('https://', requests.adapters.HTTPAdapter(pool_maxsize=pool_maxsize))
+    session.mount('http://', requests.adapters.HTTPAdapter(pool_maxsize=pool_maxsize))
+    return session
+
 class HttpClientException(Exception):
     """HTTP Client exception."""
 
@@ -74,8 +143,8 @@ class HttpClientException(Exception):
 class HTTPAdapterWithProxyKerberosAuth(requests.adapters.HTTPAdapter):
     """HTTPAdapter override for Kerberos Proxy auth"""
 
-    def __init__(self, principal=None, password=None):
-        requests.adapters.HTTPAdapter.__init__(self)
+    def __init__(self, principal=None, password=None, pool_maxsize=_DEFAULT_POOL_MAXSIZE):
+        requests.adapters.HTTPAdapter.__init__(self, pool_maxsize=pool_maxsize)
         self._principal = principal
         self._password = password
 
@@ -148,11 +217,11 @@ class HttpClientBase(object, metaclass=abc.ABCMeta):
         :param status_code: http request status code
         :type status_code: int
 
-        :param elapsed: response time elapsed.
+        :param elapsed: response time elapsed, in microseconds.
         :type status_code: int
         """
         self._telemetry_runtime_producer.record_sync_latency(self._metric_name, elapsed)
-        if 200 <= status_code < 300:
+        if 200 <= status_code < 300 or status_code == _NOT_MODIFIED:
             self._telemetry_runtime_producer.record_successful_sync(self._metric_name, get_current_epoch_time_ms())
             return
 
@@ -161,7 +230,8 @@ class HttpClientBase(object, metaclass=abc.ABCMeta):
 class HttpClient(HttpClientBase):
     """HttpClient wrapper."""
 
-    def __init__(self, timeout=None, sdk_url=None, events_url=None, auth_url=None, telemetry_url=None):
+    def __init__(self, timeout=None, sdk_url=None, events_url=None, auth_url=None, telemetry_url=None,
+                 pool_maxsize=_DEFAULT_POOL_MAXSIZE):
         """
         Class constructor.
 
@@ -175,9 +245,27 @@ class HttpClient(HttpClientBase):
         :type auth_url: str
         :param telemetry_url: Optional alternative telemetry URL.
         :type telemetry_url: str
+        :param pool_maxsize: Max keep-alive connections kept per server.
+        :type pool_maxsize: int
         """
         HttpClientBase.__init__(self, timeout, sdk_url, events_url, auth_url, telemetry_url)
-        
+        self._pool_maxsize = pool_maxsize
+        self._sessions = {server: _build_session(pool_maxsize) for server in self._urls}
+
+    def close_sessions(self):
+        """Close every server session and its pooled connections."""
+        for session in self._sessions.values():
+            session.close()
+
+    def recreate_sessions(self):
+        """
+        Replace every server session with a new one.
+
+        Used after a fork, so the child doesn't share keep-alive connections opened by the parent.
+        """
+        self.close_sessions()
+        self._sessions = {server: _build_session(self._pool_maxsize) for server in self._urls}
+
     def get(self, server, path, sdk_key, query=None, extra_headers=None):  # pylint: disable=too-many-arguments
         """
         Issue a get request.
@@ -196,15 +284,15 @@ class HttpClient(HttpClientBase):
         :return: Tuple of status_code & response text
         :rtype: HttpResponse
         """
-        start = get_current_epoch_time_ms()
+        start = get_current_perf_counter_ns()
         try:
-            response = requests.get(
+            response = self._sessions[server].get(
                 _build_url(server, path, self._urls),
                 params=query,
                 headers=self._get_headers(extra_headers, sdk_key),
                 timeout=self._timeout
             )
-            self._record_telemetry(response.status_code, get_current_epoch_time_ms() - start)
+            self._record_telemetry(response.status_code, get_elapsed_micros(start))
             return HttpResponse(response.status_code, response.text, response.headers)
 
         except requests.exceptions.ChunkedEncodingError as exc:
@@ -234,16 +322,16 @@ class HttpClient(HttpClientBase):
         :return: Tuple of status_code & response text
         :rtype: HttpResponse
         """
-        start = get_current_epoch_time_ms()
+        start = get_current_perf_counter_ns()
         try:
-            response = requests.post(
+            response = self._sessions[server].post(
                 _build_url(server, path, self._urls),
                 json=body,
                 params=query,
                 headers=self._get_headers(extra_headers, sdk_key),
                 timeout=self._timeout,
             )
-            self._record_telemetry(response.status_code, get_current_epoch_time_ms() - start)
+            self._record_telemetry(response.status_code, get_elapsed_micros(start))
             return HttpResponse(response.status_code, response.text, response.headers)
         except Exception as exc:  # pylint: disable=broad-except
             raise HttpClientException(_EXC_MSG.format(source='request')) from exc
@@ -251,7 +339,9 @@ class HttpClient(HttpClientBase):
 class HttpClientAsync(HttpClientBase):
     """HttpClientAsync wrapper."""
 
-    def __init__(self, timeout=None, sdk_url=None, events_url=None, auth_url=None, telemetry_url=None):
+    def __init__(self, timeout=None, sdk_url=None, events_url=None, auth_url=None, telemetry_url=None,
+                 pool_maxsize=_DEFAULT_POOL_MAXSIZE, dns_cache_ttl=_DEFAULT_DNS_CACHE_TTL,
+                 keepalive_timeout=_DEFAULT_KEEPALIVE_TIMEOUT):
         """
         Class constructor.
         :param timeout: How many milliseconds to wait until the server responds.
@@ -264,9 +354,27 @@ class HttpClientAsync(HttpClientBase):
         :type auth_url: str
         :param telemetry_url: Optional alternative telemetry URL.
         :type telemetry_url: str
+        :param pool_maxsize: Max connections kept open per server.
+        :type pool_maxsize: int
+        :param dns_cache_ttl: Seconds resolved addresses are cached for.
+        :type dns_cache_ttl: int
+        :param keepalive_timeout: Seconds idle connections are kept open for.
+        :type keepalive_timeout: int
         """
         HttpClientBase.__init__(self, timeout, sdk_url, events_url, auth_url, telemetry_url)
-        self._session = aiohttp.ClientSession()
+        self._connector = aiohttp.TCPConnector(limit=0, limit_per_host=pool_maxsize, ttl_dns_cache=dns_cache_ttl,
+                                               keepalive_timeout=keepalive_timeout)
+        self._session = aiohttp.ClientSession(connector=self._connector)
+
+    @property
+    def connector(self):
+        """
+        Return the connector pooling connections, to be shared by other sessions.
+
+        :return: Connector owned by this client.
+        :rtype: aiohttp.TCPConnector
+        """
+        return self._connector
 
     async def get(self, server, path, apikey, query=None, extra_headers=None):  # pylint: disable=too-many-arguments
         """
@@ -284,13 +392,15 @@ class HttpClientAsync(HttpClientBase):
         :return: Tuple of status_code & response text
         :rtype: HttpResponse
         """
-        start = get_current_epoch_time_ms()
+        start = get_current_perf_counter_ns()
         headers = self._get_headers(extra_headers, apikey)
         try:
             url = _build_url(server, path, self._urls)
-            _LOGGER.debug("GET request: %s", url)
-            _LOGGER.debug("query params: %s", query)
-            _LOGGER.debug("headers: %s", headers)
+            debug = _LOGGER.isEnabledFor(logging.DEBUG)
+            if debug:
+                _LOGGER.debug("GET request: %s", url)
+                _LOGGER.debug("query params: %s", query)
+                _LOGGER.debug("headers: %s", headers)
             async with self._session.get(
                 url,
                 params=query,
@@ -298,10 +408,11 @@ class HttpClientAsync(HttpClientBase):
                 timeout=self._timeout
             ) as response:
                 body = await response.text()
-                _LOGGER.debug("Response:")
-                _LOGGER.debug(response)
-                _LOGGER.debug(body)
-                await self._record_telemetry(response.status, get_current_epoch_time_ms() - start)
+                if debug:
+                    _LOGGER.debug("Response:")
+                    _LOGGER.debug(response)
+                    _LOGGER.debug(body)
+                await self._record_telemetry(response.status, get_elapsed_micros(start))
                 return HttpResponse(response.status, body, response.headers)
 
         except aiohttp.ClientPayloadError as exc:
@@ -330,26 +441,36 @@ class HttpClientAsync(HttpClientBase):
         :rtype: HttpResponse
         """
         headers = self._get_headers(extra_headers, apikey)
-        start = get_current_epoch_time_ms()
+        if _count_items(body) < _EXECUTOR_MIN_ITEMS:
+            data, compressed = _encode_body(body)
+        else:
+            # serializing and compressing big bulks takes long enough to stall the event loop, do it in a thread.
+            data, compressed = await asyncio.get_running_loop().run_in_executor(None, _encode_body, body)
+        start = get_current_perf_counter_ns()
         try:
             headers['Accept-Encoding'] = 'gzip'
-            _LOGGER.debug("POST request: %s", _build_url(server, path, self._urls))
-            _LOGGER.debug("query params: %s", query)
-            _LOGGER.debug("headers: %s", headers)
-            _LOGGER.debug("payload: ")
-            _LOGGER.debug(str(json.dumps(body)).encode('utf-8'))
+            if compressed:
+                headers['Content-Encoding'] = 'gzip'
+            url = _build_url(server, path, self._urls)
+            debug = _LOGGER.isEnabledFor(logging.DEBUG)
+            if debug:
+                _LOGGER.debug("POST request: %s", url)
+                _LOGGER.debug("query params: %s", query)
+                _LOGGER.debug("headers: %s", headers)
+                _LOGGER.debug("payload: %s", "%d gzip bytes" % len(data) if compressed else data)
             async with self._session.post(
-                _build_url(server, path, self._urls),
+                url,
                 params=query,
                 headers=headers,
-                json=body,
+                data=data,
                 timeout=self._timeout
             ) as response:
                 body = await response.text()
-                _LOGGER.debug("Response:")
-                _LOGGER.debug(response)
-                _LOGGER.debug(body)
-                await self._record_telemetry(response.status, get_current_epoch_time_ms() - start)
+                if debug:
+                    _LOGGER.debug("Response:")
+                    _LOGGER.debug(response)
+                    _LOGGER.debug(body)
+                await self._record_telemetry(response.status, get_elapsed_micros(start))
                 return HttpResponse(response.status, body, response.headers)
 
         except aiohttp.ClientError as exc:  # pylint: disable=broad-except
@@ -362,11 +483,11 @@ class HttpClientAsync(HttpClientBase):
         :param status_code: http request status code
         :type status_code: int
 
-        :param elapsed: response time elapsed.
+        :param elapsed: response time elapsed, in microseconds.
         :type status_code: int
         """
         await self._telemetry_runtime_producer.record_sync_latency(self._metric_name, elapsed)
-        if 200 <= status_code < 300:
+        if 200 <= status_code < 300 or status_code == _NOT_MODIFIED:
             await self._telemetry_runtime_producer.record_successful_sync(self._metric_name, get_current_epoch_time_ms())
             return
 
@@ -379,7 +500,8 @@ class HttpClientAsync(HttpClientBase):
 class HttpClientKerberos(HttpClientBase):
     """HttpClient wrapper."""
 
-    def __init__(self, timeout=None, sdk_url=None, events_url=None, auth_url=None, telemetry_url=None, authentication_scheme=None, authentication_params=None):
+    def __init__(self, timeout=None, sdk_url=None, events_url=None, auth_url=None, telemetry_url=None, authentication_scheme=None, authentication_params=None,
+                 pool_maxsize=_DEFAULT_POOL_MAXSIZE):
         """
         Class constructor.
 
@@ -397,6 +519,8 @@ class HttpClientKerberos(HttpClientBase):
         :type authentication_scheme: splitio.client.config.AuthenticateScheme
         :param authentication_params: Optional authentication username and password to use.
         :type authentication_params: [str, str]
+        :param pool_maxsize: Max keep-alive connections kept per server.
+        :type pool_maxsize: int
         """
         _LOGGER.debug("Initializing httpclient for Kerberos auth")
         self._timeout = timeout/1000 if timeout else None # Convert ms to seconds.
@@ -404,11 +528,27 @@ class HttpClientKerberos(HttpClientBase):
         self._authentication_scheme = authentication_scheme
         self._authentication_params = authentication_params
         self._lock = threading.RLock()
-        self._sessions = {'sdk': requests.Session(),
-                          'events': requests.Session(),
-                          'auth': requests.Session(),
-                          'telemetry': requests.Session()}
-        self._set_authentication()
+        self._pool_maxsize = pool_maxsize
+        self._sessions = {}
+        self.recreate_sessions()
+
+    def close_sessions(self):
+        """Close every server session and its pooled connections."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+
+    def recreate_sessions(self):
+        """
+        Replace every server session with a new authenticated one.
+
+        Used after a fork, so the child doesn't share keep-alive connections opened by the parent.
+        """
+        with self._lock:
+            self.close_sessions()
+            self._sessions = {server: _build_session(self._pool_maxsize)
+                              for server in ['sdk', 'events', 'auth', 'telemetry']}
+            self._set_authentication()
 
     def get(self, server, path, sdk_key, query=None, extra_headers=None):  # pylint: disable=too-many-arguments
         """
@@ -428,14 +568,14 @@ class HttpClientKerberos(HttpClientBase):
         :rtype: HttpResponse
         """
         with self._lock:
-            start = get_current_epoch_time_ms()
+            start = get_current_perf_counter_ns()
             try:
                 return self._do_get(server, path, sdk_key, query, extra_headers, start)
 
             except requests.exceptions.ProxyError as exc:
                 _LOGGER.debug("Proxy Exception caught, resetting the http session")
                 self._sessions[server].close()
-                self._sessions[server] = requests.Session()
+                self._sessions[server] = _build_session(self._pool_maxsize)
                 self._set_authentication(server_name=server)
                 try:
                     return self._do_get(server, path, sdk_key, query, extra_headers, start)
@@ -469,7 +609,7 @@ class HttpClientKerberos(HttpClientBase):
             params=query,
             timeout=self._timeout
         ) as response:
-            self._record_telemetry(response.status_code, get_current_epoch_time_ms() - start)
+            self._record_telemetry(response.status_code, get_elapsed_micros(start))
             return HttpResponse(response.status_code, response.text, response.headers)
 
     def post(self, server, path, sdk_key, body, query=None, extra_headers=None):  # pylint: disable=too-many-arguments
@@ -493,14 +633,14 @@ class HttpClientKerberos(HttpClientBase):
         :rtype: HttpResponse
         """
         with self._lock:
-            start = get_current_epoch_time_ms()
+            start = get_current_perf_counter_ns()
             try:
                 return self._do_post(server, path, sdk_key, query, extra_headers, body, start)
 
             except requests.exceptions.ProxyError as exc:
                 _LOGGER.debug("Proxy Exception caught, resetting the http session")
                 self._sessions[server].close()
-                self._sessions[server] = requests.Session()
+                self._sessions[server] = _build_session(self._pool_maxsize)
                 self._set_authentication(server_name=server)
                 try:
                     return self._do_post(server, path, sdk_key, query, extra_headers, body, start)
@@ -538,7 +678,7 @@ class HttpClientKerberos(HttpClientBase):
             json=body,
             timeout=self._timeout,
         ) as response:
-            self._record_telemetry(response.status_code, get_current_epoch_time_ms() - start)
+            self._record_telemetry(response.status_code, get_elapsed_micros(start))
             return HttpResponse(response.status_code, response.text, response.headers)
 
     def _set_authentication(self, server_name=None):
@@ -560,6 +700,6 @@ class HttpClientKerberos(HttpClientBase):
             elif self._authentication_scheme == AuthenticateScheme.KERBEROS_PROXY:
                 _LOGGER.debug("Using Kerberos Proxy Authentication")
                 if self._authentication_params != [None, None]:
-                    self._sessions[server].mount('https://', HTTPAdapterWithProxyKerberosAuth(principal=self._authentication_params[0], password=self._authentication_params[1]))
+                    self._sessions[server].mount('https://', HTTPAdapterWithProxyKerberosAuth(principal=self._authentication_params[0], password=self._authentication_params[1], pool_maxsize=self._pool_maxsize))
                 else:
-                    self._sessions[server].mount('https://', HTTPAdapterWithProxyKerberosAuth())
+                    self._sessions[server].mount('https://', HTTPAdapterWithProxyKerberosAuth(pool_maxsize=self._pool_maxsize))
@@ -1,9 +1,17 @@
 """Commons module."""
+import threading
+
 from splitio.util.time import get_current_epoch_time_ms
 from splitio.spec import SPEC_VERSION
 
 _CACHE_CONTROL = 'Cache-Control'
 _CACHE_CONTROL_NO_CACHE = 'no-cache'
+_IF_NONE_MATCH = 'If-None-Match'
+_IF_MODIFIED_SINCE = 'If-Modified-Since'
+_ETAG = 'ETag'
+_LAST_MODIFIED = 'Last-Modified'
+
+NOT_MODIFIED = 304
 
 def headers_from_metadata(sdk_metadata, client_key=None):
     """
@@ -49,11 +57,76 @@ def record_telemetry(status_code, elapsed, metric_name, telemetry_runtime_produc
     :type telemetry_runtime_producer: splitio.engine.telemetry.TelemetryRuntimeProducer
     """
     telemetry_runtime_producer.record_sync_latency(metric_name, elapsed)
-    if 200 <= status_code < 300:
+    if 200 <= status_code < 300 or status_code == NOT_MODIFIED:
         telemetry_runtime_producer.record_successful_sync(metric_name, get_current_epoch_time_ms())
         return
     telemetry_runtime_producer.record_sync_error(metric_name, status_code)
 
+class ResponseValidators(object):
+    """
+    Validators received for each polled resource, used to issue conditional requests.
+
+    Validators are only kept for responses without changes, and only sent again for the exact
+    same query, so a 304 always means there is still nothing new since the requested change
+    number and the body can be skipped.
+    """
+
+    def __init__(self):
+        """Class constructor."""
+        self._lock = threading.Lock()
+        self._validators = {}
+
+    def add_conditional_headers(self, resource, query, headers):
+        """
+        Return the headers to use for a request, including stored validators if any.
+
+        :param resource: Requested path.
+        :type resource: str
+        :param query: Query parameters of the request.
+        :type query: dict
+        :param headers: Headers of the request.
+        :type headers: dict
+
+        :return: The same headers if there's nothing stored, or an extended copy.
+        :rtype: dict
+        """
+        with self._lock:
+            stored = self._validators.get(resource)
+
+        if stored is None or stored[0] != query:
+            return headers
+
+        _, etag, last_modified = stored
+        headers = dict(headers)
+        if etag is not None:
+            headers[_IF_NONE_MATCH] = etag
+        if last_modified is not None:
+            headers[_IF_MODIFIED_SINCE] = last_modified
+        return headers
+
+    def update(self, resource, query, response_headers, unchanged):
+        """
+        Store the validators of a successful response, or drop the previous ones.
+
+        :param resource: Requested path.
+        :type resource: str
+        :param query: Query parameters of the request.
+        :type query: dict
+        :param response_headers: Headers of the response.
+        :type response_headers: dict
+        :param unchanged: Whether the response had no changes since the requested change number.
+        :type unchanged: bool
+        """
+        etag = response_headers.get(_ETAG)
+        last_modified = response_headers.get(_LAST_MODIFIED)
+        with self._lock:
+            if not unchanged or (etag is None and last_modified is None):
+                self._validators.pop(resource, None)
+                return
+
+            self._validators[resource] = (dict(query), etag, last_modified)
+
+
 class FetchOptions(object):
     """Fetch Options object."""
 
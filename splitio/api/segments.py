@@ -4,7 +4,7 @@ import json
 import logging
 
 from splitio.api import APIException, headers_from_metadata
-from splitio.api.commons import build_fetch
+from splitio.api.commons import build_fetch, ResponseValidators, NOT_MODIFIED
 from splitio.api.client import HttpClientException
 from splitio.models.telemetry import HTTPExceptionsAndLatencies
 
@@ -12,6 +12,21 @@ from splitio.models.telemetry import HTTPExceptionsAndLatencies
 _LOGGER = logging.getLogger(__name__)
 
 
+def _unchanged_segment(segment_name, change_number):
+    """
+    Build the segmentChanges response matching a 304 for the given change number.
+
+    :param segment_name: Name of the segment.
+    :type segment_name: str
+    :param change_number: Requested change number.
+    :type change_number: int
+
+    :return: Json representation of a segmentChange response without changes.
+    :rtype: dict
+    """
+    return {'name': segment_name, 'added': [], 'removed': [], 'since': change_number, 'till': change_number}
+
+
 class SegmentsAPI(object):  # pylint: disable=too-few-public-methods
     """Class that uses an httpClient to communicate with the segments API."""
 
@@ -32,6 +47,7 @@ class SegmentsAPI(object):  # pylint: disable=too-few-public-methods
         self._metadata = headers_from_metadata(sdk_metadata)
         self._telemetry_runtime_producer = telemetry_runtime_producer
         self._client.set_telemetry_data(HTTPExceptionsAndLatencies.SEGMENT, self._telemetry_runtime_producer)
+        self._validators = ResponseValidators()
 
     def fetch_segment(self, segment_name, change_number, fetch_options):
         """
@@ -51,15 +67,22 @@ class SegmentsAPI(object):  # pylint: disable=too-few-public-methods
         """
         try:
             query, extra_headers = build_fetch(change_number, fetch_options, self._metadata)
+            path = 'segmentChanges/{segment_name}'.format(segment_name=segment_name)
             response = self._client.get(
                 'sdk',
-                'segmentChanges/{segment_name}'.format(segment_name=segment_name),
+                path,
                 self._sdk_key,
-                extra_headers=extra_headers,
+                extra_headers=self._validators.add_conditional_headers(path, query, extra_headers),
                 query=query,
             )
+            if response.status_code == NOT_MODIFIED:
+                return _unchanged_segment(segment_name, change_number)
+
             if 200 <= response.status_code < 300:
-                return json.loads(response.body)
+                segment_changes = json.loads(response.body)
+                self._validators.update(path, query, response.headers,
+                                        segment_changes.get('since') == segment_changes.get('till'))
+                return segment_changes
 
             raise APIException(response.body, response.status_code)
         except HttpClientException as exc:
@@ -91,6 +114,7 @@ class SegmentsAPIAsync(object):  # pylint: disable=too-few-public-methods
         self._metadata = headers_from_metadata(sdk_metadata)
         self._telemetry_runtime_producer = telemetry_runtime_producer
         self._client.set_telemetry_data(HTTPExceptionsAndLatencies.SEGMENT, self._telemetry_runtime_producer)
+        self._validators = ResponseValidators()
 
     async def fetch_segment(self, segment_name, change_number, fetch_options):
         """
@@ -110,15 +134,22 @@ class SegmentsAPIAsync(object):  # pylint: disable=too-few-public-methods
         """
         try:
             query, extra_headers = build_fetch(change_number, fetch_options, self._metadata)
+            path = 'segmentChanges/{segment_name}'.format(segment_name=segment_name)
             response = await self._client.get(
                 'sdk',
-                'segmentChanges/{segment_name}'.format(segment_name=segment_name),
+                path,
                 self._sdk_key,
-                extra_headers=extra_headers,
+                extra_headers=self._validators.add_conditional_headers(path, query, extra_headers),
                 query=query,
             )
+            if response.status_code == NOT_MODIFIED:
+                return _unchanged_segment(segment_name, change_number)
+
             if 200 <= response.status_code < 300:
-                return json.loads(response.body)
+                segment_changes = json.loads(response.body)
+                self._validators.update(path, query, response.headers,
+                                        segment_changes.get('since') == segment_changes.get('till'))
+                return segment_changes
 
             raise APIException(response.body, response.status_code)
         except HttpClientException as exc:
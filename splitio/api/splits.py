@@ -1,11 +1,11 @@
 """Splits API module."""
 
 import logging
-import json
 
 from splitio.api import APIException, headers_from_metadata
-from splitio.api.commons import build_fetch, FetchOptions
+from splitio.api.commons import build_fetch, FetchOptions, ResponseValidators, NOT_MODIFIED
 from splitio.api.client import HttpClientException
+from splitio.optional.loaders import json_loads
 from splitio.models.telemetry import HTTPExceptionsAndLatencies
 from splitio.util.time import utctime_ms
 from splitio.spec import SPEC_VERSION
@@ -14,6 +14,7 @@ from splitio.sync import util
 _LOGGER = logging.getLogger(__name__)
 _SPEC_1_1 = "1.1"
 _PROXY_CHECK_INTERVAL_MILLISECONDS_SS =  24 * 60 * 60 * 1000
+_SPLIT_CHANGES = 'splitChanges'
 
 class SplitsAPIBase(object):  # pylint: disable=too-few-public-methods
     """Class that uses an httpClient to communicate with the splits API."""
@@ -38,6 +39,7 @@ class SplitsAPIBase(object):  # pylint: disable=too-few-public-methods
         self._last_proxy_check_timestamp = 0
         self.clear_storage = False
         self._old_spec_since = None
+        self._validators = ResponseValidators()
 
     def _check_last_proxy_check_timestamp(self, since):
         if self._spec_version == _SPEC_1_1 and ((utctime_ms() - self._last_proxy_check_timestamp) >= _PROXY_CHECK_INTERVAL_MILLISECONDS_SS):
@@ -51,7 +53,36 @@ class SplitsAPIBase(object):  # pylint: disable=too-few-public-methods
             self._old_spec_since = None
             return since
         return change_number
-    
+
+    def _add_conditional_headers(self, query, extra_headers):
+        """Add stored validators unless the spec version is being checked against a proxy."""
+        if self._spec_version == _SPEC_1_1 or self._last_proxy_check_timestamp != 0:
+            return extra_headers
+
+        return self._validators.add_conditional_headers(_SPLIT_CHANGES, query, extra_headers)
+
+    def _parse_response(self, query, response):
+        """
+        Parse a successful splitChanges response, keeping its validators if there were no changes.
+
+        :return: Json representation of a splitChanges response.
+        :rtype: dict
+        """
+        if response.status_code == NOT_MODIFIED:
+            return {'ff': {'d': [], 's': query['since'], 't': query['since']},
+                    'rbs': {'d': [], 's': query['rbSince'], 't': query['rbSince']}}
+
+        if self._spec_version == _SPEC_1_1:
+            return util.convert_to_new_spec(json_loads(response.body))
+
+        self.clear_storage = self._last_proxy_check_timestamp != 0
+        self._last_proxy_check_timestamp = 0
+        feature_flag_changes = json_loads(response.body)
+        self._validators.update(_SPLIT_CHANGES, query, response.headers, all(
+            changes.get('s') == changes.get('t')
+            for changes in (feature_flag_changes.get('ff', {}), feature_flag_changes.get('rbs', {}))))
+        return feature_flag_changes
+
 
 class SplitsAPI(SplitsAPIBase):  # pylint: disable=too-few-public-methods
     """Class that uses an httpClient to communicate with the splits API."""
@@ -96,18 +127,13 @@ class SplitsAPI(SplitsAPIBase):  # pylint: disable=too-few-public-methods
             query, extra_headers = build_fetch(change_number, fetch_options, self._metadata, rbs_change_number)
             response = self._client.get(
                 'sdk',
-                'splitChanges',
+                _SPLIT_CHANGES,
                 self._sdk_key,
-                extra_headers=extra_headers,
+                extra_headers=self._add_conditional_headers(query, extra_headers),
                 query=query,
             )
-            if 200 <= response.status_code < 300:
-                if self._spec_version == _SPEC_1_1:
-                    return util.convert_to_new_spec(json.loads(response.body))
-                
-                self.clear_storage = self._last_proxy_check_timestamp != 0
-                self._last_proxy_check_timestamp = 0
-                return json.loads(response.body)
+            if 200 <= response.status_code < 300 or response.status_code == NOT_MODIFIED:
+                return self._parse_response(query, response)
 
             else:
                 if response.status_code == 414:
@@ -170,18 +196,13 @@ class SplitsAPIAsync(SplitsAPIBase):  # pylint: disable=too-few-public-methods
             query, extra_headers = build_fetch(change_number, fetch_options, self._metadata, rbs_change_number)
             response = await self._client.get(
                 'sdk',
-                'splitChanges',
+                _SPLIT_CHANGES,
                 self._sdk_key,
-                extra_headers=extra_headers,
+                extra_headers=self._add_conditional_headers(query, extra_headers),
                 query=query,
             )
-            if 200 <= response.status_code < 300:
-                if self._spec_version == _SPEC_1_1:
-                    return util.convert_to_new_spec(json.loads(response.body))
-                
-                self.clear_storage = self._last_proxy_check_timestamp != 0
-                self._last_proxy_check_timestamp = 0
-                return json.loads(response.body)
+            if 200 <= response.status_code < 300 or response.status_code == NOT_MODIFIED:
+                return self._parse_response(query, response)
 
             else:
                 if response.status_code == 414:
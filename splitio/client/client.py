@@ -10,7 +10,7 @@ from splitio.models.impressions import Impression, Label, ImpressionDecorated
 from splitio.models.events import Event, EventWrapper
 from splitio.models.telemetry import get_latency_bucket_index, MethodExceptionsAndLatencies
 from splitio.client import input_validator
-from splitio.util.time import get_current_epoch_time_ms, utctime_ms
+from splitio.util.time import get_current_perf_counter_ns, get_elapsed_micros, utctime_ms
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -322,7 +322,7 @@ class Client(ClientBase):  # pylint: disable=too-many-instance-attributes
         if not self._client_is_usable(): # not destroyed & not waiting for a fork
             return self._get_fallback_treatment_with_config(feature)
 
-        start = get_current_epoch_time_ms()
+        start = get_current_perf_counter_ns()
         if not self.ready:
             _LOGGER.error("Client is not ready - no calls possible")
             self._telemetry_init_producer.record_not_ready_usage()
@@ -621,7 +621,7 @@ class Client(ClientBase):  # pylint: disable=too-many-instance-attributes
         :return: The treatments and configs for the key and feature flags
         :rtype: dict
         """
-        start = get_current_epoch_time_ms()
+        start = get_current_perf_counter_ns()
         if not self._client_is_usable():
             return input_validator.generate_control_treatments(features, self._fallback_treatment_calculator)
 
@@ -665,14 +665,13 @@ class Client(ClientBase):  # pylint: disable=too-many-instance-attributes
         :param impressions_decorated: Generated impressions
         :type impressions_decorated: list[tuple[splitio.models.impression.ImpressionDecorated, dict]]
 
-        :param start: timestamp when get_treatment or get_treatments was called
+        :param start: perf counter timestamp when get_treatment or get_treatments was called
         :type start: int
 
         :param operation: operation performed.
         :type operation: str
         """
-        end = get_current_epoch_time_ms()
-        self._recorder.record_treatment_stats(impressions_decorated, get_latency_bucket_index(end - start),
+        self._recorder.record_treatment_stats(impressions_decorated, get_latency_bucket_index(get_elapsed_micros(start)),
                                               operation, 'get_' + operation.value)
 
     def track(self, key, traffic_type, event_type, value=None, properties=None):
@@ -697,7 +696,7 @@ class Client(ClientBase):  # pylint: disable=too-many-instance-attributes
             _LOGGER.warning("track: the SDK is not ready, results may be incorrect. Make sure to wait for SDK readiness before using this method")
             self._telemetry_init_producer.record_not_ready_usage()
 
-        start = get_current_epoch_time_ms()
+        start = get_current_perf_counter_ns()
         should_validate_existance = self.ready and self._factory._sdk_key != 'localhost'  # pylint: disable=protected-access
         traffic_type = input_validator.validate_traffic_type(
             traffic_type,
@@ -712,7 +711,7 @@ class Client(ClientBase):  # pylint: disable=too-many-instance-attributes
             return_flag = self._recorder.record_track_stats([EventWrapper(
                 event=event,
                 size=size,
-            )], get_latency_bucket_index(get_current_epoch_time_ms() - start))
+            )], get_latency_bucket_index(get_elapsed_micros(start)))
             return return_flag
 
         except Exception:  # pylint: disable=broad-except
@@ -823,7 +822,7 @@ class ClientAsync(ClientBase):  # pylint: disable=too-many-instance-attributes
         if not self._client_is_usable(): # not destroyed & not waiting for a fork
             return self._get_fallback_treatment_with_config(feature)
 
-        start = get_current_epoch_time_ms()
+        start = get_current_perf_counter_ns()
         if not self.ready:
             _LOGGER.error("Client is not ready - no calls possible")
             await self._telemetry_init_producer.record_not_ready_usage()
@@ -1034,7 +1033,7 @@ class ClientAsync(ClientBase):  # pylint: disable=too-many-instance-attributes
         :return: The treatments and configs for the key and feature flags
         :rtype: dict
         """
-        start = get_current_epoch_time_ms()
+        start = get_current_perf_counter_ns()
         if not self._client_is_usable():
             return input_validator.generate_control_treatments(features, self._fallback_treatment_calculator)
 
@@ -1078,14 +1077,13 @@ class ClientAsync(ClientBase):  # pylint: disable=too-many-instance-attributes
         :param impressions_decorated: Generated impressions decorated
         :type impressions_decorated: list[tuple[splitio.models.impression.Impression, dict]]
 
-        :param start: timestamp when get_treatment or get_treatments was called
+        :param start: perf counter timestamp when get_treatment or get_treatments was called
         :type start: int
 
         :param operation: operation performed.
         :type operation: str
         """
-        end = get_current_epoch_time_ms()
-        await self._recorder.record_treatment_stats(impressions_decorated, get_latency_bucket_index(end - start),
+        await self._recorder.record_treatment_stats(impressions_decorated, get_latency_bucket_index(get_elapsed_micros(start)),
                                               operation, 'get_' + operation.value)
 
     async def track(self, key, traffic_type, event_type, value=None, properties=None):
@@ -1110,7 +1108,7 @@ class ClientAsync(ClientBase):  # pylint: disable=too-many-instance-attributes
             _LOGGER.warning("track: the SDK is not ready, results may be incorrect. Make sure to wait for SDK readiness before using this method")
             await self._telemetry_init_producer.record_not_ready_usage()
 
-        start = get_current_epoch_time_ms()
+        start = get_current_perf_counter_ns()
         should_validate_existance = self.ready and self._factory._sdk_key != 'localhost'  # pylint: disable=protected-access
         traffic_type = await input_validator.validate_traffic_type_async(
             traffic_type,
@@ -1125,7 +1123,7 @@ class ClientAsync(ClientBase):  # pylint: disable=too-many-instance-attributes
             return_flag = await self._recorder.record_track_stats([EventWrapper(
                 event=event,
                 size=size,
-            )], get_latency_bucket_index(get_current_epoch_time_ms() - start))
+            )], get_latency_bucket_index(get_elapsed_micros(start)))
             return return_flag
 
         except Exception:  # pylint: disable=broad-except
@@ -19,16 +19,28 @@ class AuthenticateScheme(Enum):
 DEFAULT_CONFIG = {
     'operationMode': 'standalone',
     'connectionTimeout': 1500,
+    'httpPoolMaxSize': 10,
+    'httpDnsCacheTTL': 10,
+    'httpKeepAliveTimeout': 15,
     'streamingEnabled': True,
     'featuresRefreshRate': 30,
     'segmentsRefreshRate': 30,
+    'segmentsSyncConcurrency': 10,
+    'criticalSegments': None,
+    'segmentsMaxRefreshRate': None,
     'metricsRefreshRate': 3600,
     'impressionsRefreshRate': 5 * 60,
     'impressionsBulkSize': 5000,
     'impressionsQueueSize': 10000,
+    'impressionsFlushConcurrency': 2,
     'eventsPushRate': 10,
     'eventsBulkSize': 5000,
     'eventsQueueSize': 10000,
+    'eventsFlushConcurrency': 2,
+    'spilloverDirectory': None,
+    'spilloverMaxBytes': 256 * 1024 * 1024,
+    'snapshotFile': None,
+    'snapshotRefreshRate': 5 * 60,
     'labelsEnabled': True,
     'IPAddressesEnabled': True,
     'impressionsMode': 'OPTIMIZED',
@@ -74,6 +86,11 @@ DEFAULT_CONFIG = {
     'fallbackTreatments': FallbackTreatmentsConfiguration(None)
 }
 
+_POSITIVE_INT_SETTINGS = ('httpPoolMaxSize', 'segmentsSyncConcurrency', 'impressionsFlushConcurrency',
+                          'eventsFlushConcurrency', 'spilloverMaxBytes', 'snapshotRefreshRate')
+_NON_NEGATIVE_SETTINGS = ('httpDnsCacheTTL', 'httpKeepAliveTimeout')
+_PATH_SETTINGS = ('spilloverDirectory', 'snapshotFile')
+
 def _parse_operation_mode(sdk_key, config):
     """
     Process incoming config to determine operation mode and storage type
@@ -130,6 +147,54 @@ def _sanitize_impressions_mode(storage_type, mode, refresh_rate=None):
 
     return mode, refresh_rate
 
+def _sanitize_tuning_config(processed):
+    """
+    Check connection, concurrency and on-disk storage settings, defaulting the invalid ones.
+
+    :param processed: default + supplied config
+    :type processed: dict
+
+    :returns: config with sanitized settings
+    :rtype: dict
+    """
+    for name in _POSITIVE_INT_SETTINGS:
+        value = processed[name]
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            _LOGGER.warning('Config: %s parameter should be a positive integer, defaulting to %s.',
+                            name, DEFAULT_CONFIG[name])
+            processed[name] = DEFAULT_CONFIG[name]
+
+    for name in _NON_NEGATIVE_SETTINGS:
+        value = processed[name]
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+            _LOGGER.warning('Config: %s parameter should be a non negative number of seconds, defaulting to %s.',
+                            name, DEFAULT_CONFIG[name])
+            processed[name] = DEFAULT_CONFIG[name]
+
+    max_rate = processed['segmentsMaxRefreshRate']
+    if max_rate is not None and (isinstance(max_rate, bool) or not isinstance(max_rate, int)
+                                 or max_rate < processed['segmentsRefreshRate']):
+        _LOGGER.warning('Config: segmentsMaxRefreshRate parameter should be an integer not lower than '
+                        'segmentsRefreshRate, adaptive segment polling is disabled.')
+        processed['segmentsMaxRefreshRate'] = None
+
+    critical = processed['criticalSegments']
+    if critical is not None:
+        if isinstance(critical, str) or not isinstance(critical, (list, tuple, set, frozenset)) \
+                or not all(isinstance(name, str) for name in critical):
+            _LOGGER.warning('Config: criticalSegments parameter should be a list of segment names, '
+                            'waiting for every segment instead.')
+            processed['criticalSegments'] = None
+        else:
+            processed['criticalSegments'] = list(critical)
+
+    for name in _PATH_SETTINGS:
+        if processed[name] is not None and not isinstance(processed[name], str):
+            _LOGGER.warning('Config: %s parameter should be a path, it will be ignored.', name)
+            processed[name] = None
+
+    return processed
+
 def sanitize(sdk_key, config):
     """
     Look for inconsistencies or ill-formed configs and tune it accordingly.
@@ -170,6 +235,7 @@ def sanitize(sdk_key, config):
                             ' Defaulting to `none` mode.')
         processed["httpAuthenticateScheme"] = authenticate_scheme
 
+    processed = _sanitize_tuning_config(processed)
     processed = _sanitize_fallback_config(config, processed)    
     
     if config.get("redisErrors") is not None:
@@ -1,5 +1,6 @@
 """A module for Split.io Factories."""
 import logging
+import os
 import threading
 from collections import Counter
 from enum import Enum
@@ -11,6 +12,7 @@ from splitio.client.config import sanitize as sanitize_config, DEFAULT_DATA_SAMP
 from splitio.client.manager import SplitManager, SplitManagerAsync
 from splitio.client import util
 from splitio.client.listener import ImpressionListenerWrapper, ImpressionListenerWrapperAsync
+from splitio.engine import hashfns
 from splitio.engine.impressions.impressions import Manager as ImpressionsManager
 from splitio.engine.impressions import set_classes, set_classes_async
 from splitio.engine.impressions.strategies import StrategyDebugMode, StrategyNoneMode
@@ -26,6 +28,8 @@ from splitio.storage.inmemmory import InMemorySplitStorage, InMemorySegmentStora
     InMemoryEventStorageAsync, InMemoryTelemetryStorageAsync, LocalhostTelemetryStorageAsync, \
     InMemoryRuleBasedSegmentStorage, InMemoryRuleBasedSegmentStorageAsync
 from splitio.storage.adapters import redis
+from splitio.storage.spillover import SegmentLog, SpilloverImpressionStorage, SpilloverEventStorage
+from splitio.storage.snapshot import StorageSnapshot
 from splitio.storage.redis import RedisSplitStorage, RedisSegmentStorage, RedisImpressionsStorage, \
     RedisEventsStorage, RedisTelemetryStorage, RedisSplitStorageAsync, RedisEventsStorageAsync,\
     RedisSegmentStorageAsync, RedisImpressionsStorageAsync, RedisTelemetryStorageAsync, \
@@ -52,6 +56,7 @@ from splitio.tasks.impressions_sync import ImpressionsSyncTask, ImpressionsCount
     ImpressionsCountSyncTaskAsync, ImpressionsSyncTaskAsync
 from splitio.tasks.events_sync import EventsSyncTask, EventsSyncTaskAsync
 from splitio.tasks.telemetry_sync import TelemetrySyncTask, TelemetrySyncTaskAsync
+from splitio.tasks.snapshot_sync import SnapshotSyncTask
 
 # Synchronizer
 from splitio.sync.synchronizer import SplitTasks, SplitSynchronizers, Synchronizer, \
@@ -61,7 +66,7 @@ from splitio.sync.manager import Manager, RedisManager, ManagerAsync, RedisManag
 from splitio.sync.split import SplitSynchronizer, LocalSplitSynchronizer, LocalhostMode,\
     SplitSynchronizerAsync, LocalSplitSynchronizerAsync
 from splitio.sync.segment import SegmentSynchronizer, LocalSegmentSynchronizer, SegmentSynchronizerAsync,\
-    LocalSegmentSynchronizerAsync
+    LocalSegmentSynchronizerAsync, SegmentPollSchedule
 from splitio.sync.impression import ImpressionSynchronizer, ImpressionsCountSynchronizer, \
     ImpressionsCountSynchronizerAsync, ImpressionSynchronizerAsync
 from splitio.sync.event import EventSynchronizer, EventSynchronizerAsync
@@ -171,7 +176,8 @@ class SplitFactory(SplitFactoryBase):  # pylint: disable=too-many-instance-attri
             telemetry_init_producer=None,
             telemetry_submitter=None,
             preforked_initialization=False,
-            fallback_treatment_calculator=None
+            fallback_treatment_calculator=None,
+            api_client=None
     ):
         """
         Class constructor.
@@ -190,17 +196,21 @@ class SplitFactory(SplitFactoryBase):  # pylint: disable=too-many-instance-attri
         :type recorder: StatsRecorder
         :param preforked_initialization: Whether should be instantiated as preforked or not.
         :type preforked_initialization: bool
+        :param api_client: Http client used by the synchronization, if any.
+        :type api_client: splitio.api.client.HttpClient
         """
         SplitFactoryBase.__init__(self, sdk_key, storages)
         self._labels_enabled = labels_enabled
         self._sync_manager = sync_manager
         self._recorder = recorder
         self._preforked_initialization = preforked_initialization
+        self._api_client = api_client
         self._telemetry_evaluation_producer = telemetry_producer.get_telemetry_evaluation_producer()
         self._telemetry_init_producer = telemetry_init_producer
         self._telemetry_submitter = telemetry_submitter
         self._ready_time = get_current_epoch_time_ms()
         _LOGGER.debug("Running in threading mode")
+        _LOGGER.debug("Using %s murmur3 implementation", hashfns.IMPLEMENTATION)
         self._sdk_internal_ready_flag = sdk_ready_flag
         self._fallback_treatment_calculator = fallback_treatment_calculator
         self._start_status_updater()
@@ -291,18 +301,31 @@ class SplitFactory(SplitFactoryBase):  # pylint: disable=too-many-instance-attri
                 if destroyed_event is not None:
 
                     def _wait_for_tasks_to_stop():
-                        self._sync_manager.stop(True)
-                        destroyed_event.set()
+                        try:
+                            self._sync_manager.stop(True)
+                            self._release_resources()
+                        finally:
+                            destroyed_event.set()
 
                     wait_thread = threading.Thread(target=_wait_for_tasks_to_stop, daemon=True)
                     wait_thread.start()
                 else:
                     self._sync_manager.stop(False)
+                    self._release_resources()
             elif destroyed_event is not None:
                 destroyed_event.set()
         finally:
             self._update_instantiated_factories()
 
+    def _release_resources(self):
+        """Close the http sessions and disk spillover logs once the synchronization is stopped."""
+        if self._api_client is not None:
+            self._api_client.close_sessions()
+        for name in ('impressions', 'events'):
+            storage = self._storages.get(name)
+            if isinstance(storage, (SpilloverImpressionStorage, SpilloverEventStorage)):
+                storage.close_spillover()
+
     def resume(self):
         """
         Function in charge of starting periodic/realtime synchronization after a fork.
@@ -310,12 +333,17 @@ class SplitFactory(SplitFactoryBase):  # pylint: disable=too-many-instance-attri
         if not self._waiting_fork():
             _LOGGER.warning('Cannot call resume')
             return
+        if self._api_client is not None:
+            self._api_client.recreate_sessions()
         self._sync_manager.recreate()
         sdk_ready_flag = threading.Event()
         self._sdk_internal_ready_flag = sdk_ready_flag
         self._sync_manager._ready_flag = sdk_ready_flag
-        self._get_storage('impressions').clear()
-        self._get_storage('events').clear()
+        for name in ('impressions', 'events'):
+            storage = self._get_storage(name)
+            storage.clear()
+            if isinstance(storage, (SpilloverImpressionStorage, SpilloverEventStorage)):
+                storage.reopen_spillover()
         initialization_thread = threading.Thread(
             target=self._sync_manager.start,
             name="SDKInitializer",
@@ -370,6 +398,7 @@ class SplitFactoryAsync(SplitFactoryBase):  # pylint: disable=too-many-instance-
         self._telemetry_submitter = telemetry_submitter
         self._ready_time = get_current_epoch_time_ms()
         _LOGGER.debug("Running in asyncio mode")
+        _LOGGER.debug("Using %s murmur3 implementation", hashfns.IMPLEMENTATION)
         self._manager_start_task = manager_start_task
         self._status = Status.NOT_INITIALIZED
         self._sdk_ready_flag = asyncio.Event()
@@ -494,6 +523,21 @@ def _wrap_impression_listener_async(listener, metadata):
 
     return None
 
+def _build_segment_poll_schedule(cfg):
+    """
+    Build the adaptive segment poll schedule if a max refresh rate is configured.
+
+    :param cfg: Processed configuration.
+    :type cfg: dict
+
+    :return: Schedule or None to poll every segment on each run.
+    :rtype: splitio.sync.segment.SegmentPollSchedule
+    """
+    if cfg['segmentsMaxRefreshRate'] is None:
+        return None
+
+    return SegmentPollSchedule(cfg['segmentsRefreshRate'], cfg['segmentsMaxRefreshRate'])
+
 def _build_in_memory_factory(api_key, cfg, sdk_url=None, events_url=None,  # pylint:disable=too-many-arguments,too-many-locals
                              auth_api_base_url=None, streaming_api_base_url=None, telemetry_api_base_url=None,
                              total_flag_sets=0, invalid_flag_sets=0):
@@ -526,7 +570,8 @@ def _build_in_memory_factory(api_key, cfg, sdk_url=None, events_url=None,  # pyl
             telemetry_url=telemetry_api_base_url,
             timeout=cfg.get('connectionTimeout'),
             authentication_scheme = cfg.get("httpAuthenticateScheme"),
-            authentication_params = authentication_params
+            authentication_params = authentication_params,
+            pool_maxsize=cfg['httpPoolMaxSize']
         )
     else:
         http_client = HttpClient(
@@ -535,6 +580,7 @@ def _build_in_memory_factory(api_key, cfg, sdk_url=None, events_url=None,  # pyl
             auth_url=auth_api_base_url,
             telemetry_url=telemetry_api_base_url,
             timeout=cfg.get('connectionTimeout'),
+            pool_maxsize=cfg['httpPoolMaxSize'],
         )
 
     sdk_metadata = util.get_metadata(cfg)
@@ -555,6 +601,22 @@ def _build_in_memory_factory(api_key, cfg, sdk_url=None, events_url=None,  # pyl
         'events': InMemoryEventStorage(cfg['eventsQueueSize'], telemetry_runtime_producer),
     }
 
+    if cfg['spilloverDirectory'] is not None:
+        storages['impressions'] = SpilloverImpressionStorage(
+            cfg['impressionsQueueSize'], telemetry_runtime_producer,
+            SegmentLog(os.path.join(cfg['spilloverDirectory'], 'impressions'), cfg['spilloverMaxBytes']))
+        storages['events'] = SpilloverEventStorage(
+            cfg['eventsQueueSize'], telemetry_runtime_producer,
+            SegmentLog(os.path.join(cfg['spilloverDirectory'], 'events'), cfg['spilloverMaxBytes']))
+
+    snapshot_task = None
+    if cfg['snapshotFile'] is not None:
+        snapshot = StorageSnapshot(cfg['snapshotFile'], api_key, cfg['flagSetsFilter'])
+        snapshot.load(storages['splits'], storages['rule_based_segments'], storages['segments'])
+        snapshot_task = SnapshotSyncTask(
+            lambda: snapshot.save(storages['splits'], storages['rule_based_segments'], storages['segments']),
+            cfg['snapshotRefreshRate'])
+
     telemetry_submitter = InMemoryTelemetrySubmitter(telemetry_consumer, storages['splits'], storages['segments'], apis['telemetry'])
 
     imp_counter = ImpressionsCounter()
@@ -568,10 +630,13 @@ def _build_in_memory_factory(api_key, cfg, sdk_url=None, events_url=None,  # pyl
 
     synchronizers = SplitSynchronizers(
         SplitSynchronizer(apis['splits'], storages['splits'], storages['rule_based_segments']),
-        SegmentSynchronizer(apis['segments'], storages['splits'], storages['segments'], storages['rule_based_segments']),
+        SegmentSynchronizer(apis['segments'], storages['splits'], storages['segments'], storages['rule_based_segments'],
+                                cfg['segmentsSyncConcurrency'], cfg['criticalSegments'], _build_segment_poll_schedule(cfg)),
         ImpressionSynchronizer(apis['impressions'], storages['impressions'],
-                               cfg['impressionsBulkSize']),
-        EventSynchronizer(apis['events'], storages['events'], cfg['eventsBulkSize']),
+                               cfg['impressionsBulkSize'], cfg['impressionsFlushConcurrency'],
+                               cfg['impressionsQueueSize']),
+        EventSynchronizer(apis['events'], storages['events'], cfg['eventsBulkSize'],
+                          cfg['eventsFlushConcurrency'], cfg['eventsQueueSize']),
         impressions_count_sync,
         TelemetrySynchronizer(telemetry_submitter),
         unique_keys_synchronizer,
@@ -584,18 +649,21 @@ def _build_in_memory_factory(api_key, cfg, sdk_url=None, events_url=None,  # pyl
             cfg['featuresRefreshRate'],
         ),
         SegmentSynchronizationTask(
-            synchronizers.segment_sync.synchronize_segments,
+            synchronizers.segment_sync.synchronize_due_segments,
             cfg['segmentsRefreshRate'],
         ),
         ImpressionsSyncTask(
             synchronizers.impressions_sync.synchronize_impressions,
             cfg['impressionsRefreshRate'],
+            on_stop=synchronizers.impressions_sync.shutdown,
         ),
-        EventsSyncTask(synchronizers.events_sync.synchronize_events, cfg['eventsPushRate']),
+        EventsSyncTask(synchronizers.events_sync.synchronize_events, cfg['eventsPushRate'],
+                       on_stop=synchronizers.events_sync.shutdown),
         impressions_count_task,
         TelemetrySyncTask(synchronizers.telemetry_sync.synchronize_stats, cfg['metricsRefreshRate']),
         unique_keys_task,
         clear_filter_task,
+        snapshot_task,
     )
 
     synchronizer = Synchronizer(synchronizers, tasks)
@@ -628,7 +696,7 @@ def _build_in_memory_factory(api_key, cfg, sdk_url=None, events_url=None,  # pyl
 
         return SplitFactory(api_key, storages, cfg['labelsEnabled'],
                             recorder, manager, None, telemetry_producer, telemetry_init_producer, telemetry_submitter, preforked_initialization=preforked_initialization,
-                            fallback_treatment_calculator=FallbackTreatmentCalculator(cfg['fallbackTreatments']))
+                            fallback_treatment_calculator=FallbackTreatmentCalculator(cfg['fallbackTreatments']), api_client=http_client)
 
     initialization_thread = threading.Thread(target=manager.start, name="SDKInitializer", daemon=True)
     initialization_thread.start()
@@ -636,7 +704,8 @@ def _build_in_memory_factory(api_key, cfg, sdk_url=None, events_url=None,  # pyl
     return SplitFactory(api_key, storages, cfg['labelsEnabled'],
                         recorder, manager, sdk_ready_flag,
                         telemetry_producer, telemetry_init_producer,
-                        telemetry_submitter, fallback_treatment_calculator = FallbackTreatmentCalculator(cfg['fallbackTreatments']))
+                        telemetry_submitter, fallback_treatment_calculator = FallbackTreatmentCalculator(cfg['fallbackTreatments']),
+                        api_client=http_client)
 
 async def _build_in_memory_factory_async(api_key, cfg, sdk_url=None, events_url=None,  # pylint:disable=too-many-arguments,too-many-localsa
                              auth_api_base_url=None, streaming_api_base_url=None, telemetry_api_base_url=None,
@@ -664,7 +733,10 @@ async def _build_in_memory_factory_async(api_key, cfg, sdk_url=None, events_url=
         events_url=events_url,
         auth_url=auth_api_base_url,
         telemetry_url=telemetry_api_base_url,
-        timeout=cfg.get('connectionTimeout')
+        timeout=cfg.get('connectionTimeout'),
+        pool_maxsize=cfg['httpPoolMaxSize'],
+        dns_cache_ttl=cfg['httpDnsCacheTTL'],
+        keepalive_timeout=cfg['httpKeepAliveTimeout']
     )
 
     sdk_metadata = util.get_metadata(cfg)
@@ -685,6 +757,12 @@ async def _build_in_memory_factory_async(api_key, cfg, sdk_url=None, events_url=
         'events': InMemoryEventStorageAsync(cfg['eventsQueueSize'], telemetry_runtime_producer),
     }
 
+    if cfg['spilloverDirectory'] is not None:
+        _LOGGER.warning('Disk spillover is not supported in asyncio mode, `spilloverDirectory` will be ignored.')
+
+    if cfg['snapshotFile'] is not None:
+        _LOGGER.warning('Snapshots are not supported in asyncio mode, `snapshotFile` will be ignored.')
+
     telemetry_submitter = InMemoryTelemetrySubmitterAsync(telemetry_consumer, storages['splits'], storages['segments'], apis['telemetry'])
 
     imp_counter = ImpressionsCounter()
@@ -698,10 +776,13 @@ async def _build_in_memory_factory_async(api_key, cfg, sdk_url=None, events_url=
 
     synchronizers = SplitSynchronizers(
         SplitSynchronizerAsync(apis['splits'], storages['splits'], storages['rule_based_segments']),
-        SegmentSynchronizerAsync(apis['segments'], storages['splits'], storages['segments'], storages['rule_based_segments']),
+        SegmentSynchronizerAsync(apis['segments'], storages['splits'], storages['segments'], storages['rule_based_segments'],
+                                     cfg['segmentsSyncConcurrency'], cfg['criticalSegments'], _build_segment_poll_schedule(cfg)),
         ImpressionSynchronizerAsync(apis['impressions'], storages['impressions'],
-                               cfg['impressionsBulkSize']),
-        EventSynchronizerAsync(apis['events'], storages['events'], cfg['eventsBulkSize']),
+                               cfg['impressionsBulkSize'], cfg['impressionsFlushConcurrency'],
+                               cfg['impressionsQueueSize']),
+        EventSynchronizerAsync(apis['events'], storages['events'], cfg['eventsBulkSize'],
+                               cfg['eventsFlushConcurrency'], cfg['eventsQueueSize']),
         impressions_count_sync,
         TelemetrySynchronizerAsync(telemetry_submitter),
         unique_keys_synchronizer,
@@ -714,14 +795,16 @@ async def _build_in_memory_factory_async(api_key, cfg, sdk_url=None, events_url=
             cfg['featuresRefreshRate'],
         ),
         SegmentSynchronizationTaskAsync(
-            synchronizers.segment_sync.synchronize_segments,
+            synchronizers.segment_sync.synchronize_due_segments,
             cfg['segmentsRefreshRate'],
         ),
         ImpressionsSyncTaskAsync(
             synchronizers.impressions_sync.synchronize_impressions,
             cfg['impressionsRefreshRate'],
+            on_stop=synchronizers.impressions_sync.shutdown,
         ),
-        EventsSyncTaskAsync(synchronizers.events_sync.synchronize_events, cfg['eventsPushRate']),
+        EventsSyncTaskAsync(synchronizers.events_sync.synchronize_events, cfg['eventsPushRate'],
+                            on_stop=synchronizers.events_sync.shutdown),
         impressions_count_task,
         TelemetrySyncTaskAsync(synchronizers.telemetry_sync.synchronize_stats, cfg['metricsRefreshRate']),
         unique_keys_task,
@@ -731,7 +814,8 @@ async def _build_in_memory_factory_async(api_key, cfg, sdk_url=None, events_url=
     synchronizer = SynchronizerAsync(synchronizers, tasks)
 
     manager = ManagerAsync(synchronizer, apis['auth'], cfg['streamingEnabled'],
-                      sdk_metadata, telemetry_runtime_producer, streaming_api_base_url, api_key[-4:])
+                      sdk_metadata, telemetry_runtime_producer, streaming_api_base_url, api_key[-4:],
+                      http_client.connector)
 
     storages['events'].set_queue_full_hook(tasks.events_task.flush)
     storages['impressions'].set_queue_full_hook(tasks.impressions_task.flush)
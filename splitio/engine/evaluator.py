@@ -1,6 +1,7 @@
 """Split evaluator module."""
 import logging
 from collections import namedtuple
+from itertools import islice
 
 from splitio.models.impressions import Label
 from splitio.models.grammar.condition import ConditionType
@@ -8,11 +9,13 @@ from splitio.models.grammar.matchers.misc import DependencyMatcher
 from splitio.models.grammar.matchers.keys import UserDefinedSegmentMatcher
 from splitio.models.grammar.matchers import RuleBasedSegmentMatcher
 from splitio.models.grammar.matchers.prerequisites import PrerequisitesMatcher
+from splitio.models.grammar.matchers.utils.attributes import AttributesView
 from splitio.models.rule_based_segments import SegmentType
 from splitio.optional.loaders import asyncio
 
 CONTROL = 'control'
-EvaluationContext = namedtuple('EvaluationContext', ['flags', 'segment_memberships', 'rbs_segments'])
+EvaluationContext = namedtuple('EvaluationContext', ['flags', 'segment_memberships', 'rbs_segments', 'buckets'],
+                               defaults=(None,))
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,6 +38,7 @@ class Evaluator(object):  # pylint: disable=too-few-public-methods
         ...
         """
         # we can do a linear evaluation here, since all the dependencies are already fetched
+        attrs = AttributesView.wrap(attrs)
         return {
             name: self.eval_with_context(key, bucketing, name, attrs, ctx)
             for name in features
@@ -47,6 +51,7 @@ class Evaluator(object):  # pylint: disable=too-few-public-methods
         label = ''
         _treatment = CONTROL
         _change_number = -1
+        attrs = AttributesView.wrap(attrs)
 
         feature = ctx.flags.get(feature_name)
         if not feature:
@@ -105,11 +110,27 @@ class Evaluator(object):  # pylint: disable=too-few-public-methods
         ...
         """
         bucketing = bucketing if bucketing is not None else key
+        conditions = flag.conditions
+        start = 0
+        if type(key) is str:  # pylint: disable=unidiomatic-typecheck
+            # leading key whitelists are resolved with a single lookup.
+            whitelisted, start = flag.get_whitelist_index()
+            position = whitelisted.get(key)
+            if position is not None:
+                condition = conditions[position]
+                return self._splitter.get_treatment(bucketing, flag.seed, condition.partitions, flag.algo,
+                                                    ctx.buckets), condition.label
+
         rollout = False
-        for condition in flag.conditions:
+        for condition in islice(conditions, start, None):
             if not rollout and condition.condition_type == ConditionType.ROLLOUT:
+                if flag.traffic_allocation <= 0:
+                    # buckets go from 1 to 100, so no key is in a split without traffic
+                    return flag.default_treatment, Label.NOT_IN_SPLIT
+
                 if flag.traffic_allocation < 100:
-                    bucket = self._splitter.get_bucket(bucketing, flag.traffic_allocation_seed, flag.algo)
+                    bucket = self._splitter.get_memoized_bucket(bucketing, flag.traffic_allocation_seed, flag.algo,
+                                                                ctx.buckets)
                     if bucket > flag.traffic_allocation:
                         return flag.default_treatment, Label.NOT_IN_SPLIT
 
@@ -119,9 +140,11 @@ class Evaluator(object):  # pylint: disable=too-few-public-methods
                 'evaluator': self,
                 'bucketing_key': bucketing,
                 'ec': ctx,
+                'flag': flag.name,
                 }):
 
-                return self._splitter.get_treatment(bucketing, flag.seed, condition.partitions, flag.algo), condition.label
+                return self._splitter.get_treatment(bucketing, flag.seed, condition.partitions, flag.algo,
+                                                    ctx.buckets), condition.label
 
         return flag.default_treatment, Label.NO_CONDITION_MATCHED
 
@@ -157,7 +180,8 @@ class EvaluationDataFactory:
             { segment: self._segment_storage.segment_contains(segment, key)
                 for segment in pending_memberships
             },
-            rb_segments
+            rb_segments,
+            {}
         )
         
 class AsyncEvaluationDataFactory:
@@ -196,7 +220,8 @@ class AsyncEvaluationDataFactory:
         return EvaluationContext(
             splits, 
             dict(zip(segment_names, segment_memberships)),
-            rb_segments
+            rb_segments,
+            {}
         )
 
 def get_dependencies(object):
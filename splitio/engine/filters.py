@@ -1,8 +1,11 @@
 import abc
+import math
 import threading
 
 from bloom_filter2 import BloomFilter as BloomFilter2
 
+from splitio.engine.hashfns import murmur_128_pair
+
 class BaseFilter(object, metaclass=abc.ABCMeta):
     """Impressions Filter interface."""
 
@@ -83,3 +86,120 @@ class BloomFilter(BaseFilter):
         with self._lock:
             self._imps_bloom_filter.close()
             self._imps_bloom_filter = BloomFilter2(max_elements=self._max_elements, error_rate=self._error_rate)
+
+
+class RotatingBloomFilter(BaseFilter):
+    """
+    Bloom filter split in generations that age out instead of being cleared at once.
+
+    Items are added to the newest generation and looked up in all of them. Clearing (or filling up
+    the newest generation) drops the oldest generation and reuses its zeroed bitset as the newest one,
+    so recently seen items are still recognized right after a rotation and no memory is reallocated.
+    Bit positions come from double hashing over the two halves of a single murmur3-128 call.
+    """
+
+    def __init__(self, max_elements=5000, error_rate=0.01, generations=2):
+        """
+        Construct a rotating bloom filter instance.
+
+        :param max_elements: maximum elements held by each generation
+        :type max_elements: int
+
+        :param error_rate: error rate for the false positives across all generations
+        :type error_rate: float
+
+        :param generations: amount of generations kept
+        :type generations: int
+        """
+        self._max_elements = max_elements
+        self._error_rate = error_rate
+        slice_error_rate = error_rate / generations
+        self._bits = max(8, int(math.ceil(-max_elements * math.log(slice_error_rate) / (math.log(2) ** 2))))
+        self._hashes = max(1, int(round(self._bits / max_elements * math.log(2))))
+        self._zero = bytes((self._bits + 7) // 8)
+        self._generations = [bytearray(self._zero) for _ in range(generations)]
+        self._count = 0
+        self._lock = threading.RLock()
+
+    def _positions(self, data):
+        """Return the bit positions for an item."""
+        h1, h2 = murmur_128_pair(data, 0)
+        return [(h1 + i * h2) % self._bits for i in range(self._hashes)]
+
+    @staticmethod
+    def _test(bitset, positions):
+        """Return whether every position is set in a bitset."""
+        for position in positions:
+            if not bitset[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def _rotate(self):
+        """Drop the oldest generation, reusing its bitset as the newest one."""
+        oldest = self._generations.pop()
+        oldest[:] = self._zero
+        self._generations.insert(0, oldest)
+        self._count = 0
+
+    def _add_positions(self, positions):
+        """Set positions in the newest generation, rotating first if it is full."""
+        if self._count >= self._max_elements:
+            self._rotate()
+        current = self._generations[0]
+        for position in positions:
+            current[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def add(self, data):
+        """
+        Add an item to the newest generation.
+
+        :param data: element to be added
+        :type string:
+
+        :return: True if successful
+        :rtype: boolean
+        """
+        positions = self._positions(data)
+        with self._lock:
+            self._add_positions(positions)
+        return True
+
+    def contains(self, data):
+        """
+        Check if an item exist in any generation.
+
+        :param data: element to be checked
+        :type string:
+
+        :return: True if exist
+        :rtype: boolean
+        """
+        positions = self._positions(data)
+        with self._lock:
+            return any(self._test(bitset, positions) for bitset in self._generations)
+
+    def contains_or_add(self, data):
+        """
+        Check if an item exists and add it to the newest generation if it does not, hashing once.
+
+        :param data: element to be checked
+        :type string:
+
+        :return: True if the item already existed
+        :rtype: boolean
+        """
+        positions = self._positions(data)
+        with self._lock:
+            if any(self._test(bitset, positions) for bitset in self._generations):
+                return True
+            self._add_positions(positions)
+            return False
+
+    def clear(self):
+        """
+        Age out the oldest generation.
+
+        """
+        with self._lock:
+            self._rotate()
@@ -18,11 +18,22 @@ try:
     def _murmur_hash128(key, seed):
         return mmh3cffi.hash_str_128(key, seed)[0]
 
+    def _murmur_hash128_pair(key, seed):
+        return tuple(mmh3cffi.hash_str_128(key, seed))
+
+    def _murmur_hash128_many(keys, seed):
+        return [mmh3cffi.hash_str_128(key, seed)[0] for key in keys]
+
+    IMPLEMENTATION = 'mmh3cffi'
+
 except ImportError:
     # Fallback to interpreted python hash algoritm (slower)
     from splitio.engine.hashfns import murmur3py  # pylint: disable=ungrouped-imports
     _murmur_hash = murmur3py.murmur32_py  # pylint: disable=invalid-name
     _murmur_hash128 = lambda k, s: murmur3py.hash128_x64(k, s)[0]  # pylint: disable=invalid-name
+    _murmur_hash128_pair = lambda k, s: tuple(murmur3py.hash128_x64(k, s))  # pylint: disable=invalid-name
+    _murmur_hash128_many = lambda ks, s: [pair[0] for pair in murmur3py.hash128_x64_many(ks, s)]  # pylint: disable=invalid-name
+    IMPLEMENTATION = 'python'
 
 
 _HASH_ALGORITHMS = {
@@ -31,6 +42,8 @@ _HASH_ALGORITHMS = {
 }
 
 murmur_128 = _murmur_hash128  # pylint: disable=invalid-name
+murmur_128_pair = _murmur_hash128_pair  # pylint: disable=invalid-name
+murmur_128_many = _murmur_hash128_many  # pylint: disable=invalid-name
 
 
 def get_hash_fn(algo):
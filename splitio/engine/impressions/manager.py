@@ -3,7 +3,7 @@ from collections import defaultdict, namedtuple
 
 from splitio.util.time import utctime_ms
 from splitio.models.impressions import Impression
-from splitio.engine.hashfns import murmur_128
+from splitio.engine.hashfns import murmur_128, murmur_128_many
 from splitio.engine.cache.lru import SimpleLruCache
 from splitio.optional.loaders import asyncio
 
@@ -43,7 +43,7 @@ class Hasher(object):  # pylint:disable=too-few-public-methods
 
     _PATTERN = "%s:%s:%s:%s:%d"
 
-    def __init__(self, hash_fn=murmur_128, seed=0):
+    def __init__(self, hash_fn=murmur_128, seed=0, hash_many_fn=None):
         """
         Class constructor.
 
@@ -52,9 +52,16 @@ class Hasher(object):  # pylint:disable=too-few-public-methods
 
         :param seed: seed to be provided when hashing
         :type seed: int
+
+        :param hash_many_fn: Batch hash function (list(str), int) -> list(int)
+        :type hash_many_fn: callable
         """
         self._hash_fn = hash_fn
         self._seed = seed
+        if hash_many_fn is None:
+            hash_many_fn = murmur_128_many if hash_fn is murmur_128 else \
+                lambda keys, seed: [hash_fn(key, seed) for key in keys]
+        self._hash_many_fn = hash_many_fn
 
     def _stringify(self, impression):
         """
@@ -84,6 +91,18 @@ class Hasher(object):  # pylint:disable=too-few-public-methods
         """
         return self._hash_fn(self._stringify(impression), self._seed)
 
+    def process_many(self, impressions):
+        """
+        Hash many impressions.
+
+        :param impressions: Impressions to hash.
+        :type impressions: list(splitio.models.impressions.Impression)
+
+        :returns: hashes of the supplied impressions' relevant fields, in the same order.
+        :rtype: list(int)
+        """
+        return self._hash_many_fn([self._stringify(impression) for impression in impressions], self._seed)
+
 
 class Observer(object):  # pylint:disable=too-few-public-methods
     """Observe impression and add a previous time if applicable."""
@@ -103,7 +122,34 @@ class Observer(object):  # pylint:disable=too-few-public-methods
         :returns: Impression with populated previous time
         :rtype: splitio.models.impressions.Impression
         """
-        previous_time = self._cache.test_and_set(self._hasher.process(impression), impression.time)
+        return self._with_previous_time(impression, self._hasher.process(impression))
+
+    def test_and_set_many(self, impressions):
+        """
+        Examine many impressions, hashing them in a single batch.
+
+        :param impressions: Impressions to track
+        :type impressions: list(splitio.models.impressions.Impression)
+
+        :returns: Impressions with populated previous time, in the same order
+        :rtype: list(splitio.models.impressions.Impression)
+        """
+        return [self._with_previous_time(impression, impression_hash)
+                for impression, impression_hash in zip(impressions, self._hasher.process_many(impressions))]
+
+    def _with_previous_time(self, impression, impression_hash):
+        """
+        Track an impression hash and return the impression with its previous time.
+
+        :param impression: Impression to track
+        :type impression: splitio.models.impressions.Impression
+        :param impression_hash: Hash of the impression
+        :type impression_hash: int
+
+        :returns: Impression with populated previous time
+        :rtype: splitio.models.impressions.Impression
+        """
+        previous_time = self._cache.test_and_set(impression_hash, impression.time)
         return Impression(impression.matching_key,
                           impression.feature_name,
                           impression.treatment,
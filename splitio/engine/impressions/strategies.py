@@ -5,6 +5,23 @@ from splitio.util.time import utctime_ms
 
 _IMPRESSION_OBSERVER_CACHE_SIZE = 500000
 
+
+def _observe(observer, impressions):
+    """
+    Populate the previous time of impressions without properties, hashing them in a single batch.
+
+    :param observer: Observer tracking seen impressions
+    :type observer: splitio.engine.impressions.manager.Observer
+    :param impressions: List of impression objects with attributes
+    :type impressions: list[tuple[splitio.models.impression.Impression, dict]]
+
+    :returns: Impressions with attributes, in the same order
+    :rtype: list[tuple[splitio.models.impression.Impression, dict]]
+    """
+    observed = iter(observer.test_and_set_many([imp for imp, _ in impressions if imp.properties is None]))
+    return [(imp, attrs) if imp.properties is not None else (next(observed), attrs) for imp, attrs in impressions]
+
+
 class BaseStrategy(object, metaclass=abc.ABCMeta):
     """Strategy interface."""
 
@@ -38,14 +55,7 @@ class StrategyDebugMode(BaseStrategy):
         :returns: Tuple of to be stored, observed and counted impressions, and unique keys tuple
         :rtype: list[tuple[splitio.models.impression.Impression, dict]], list[], list[], list[]
         """
-        imps = []
-        for imp, attrs in impressions:
-            if imp.properties is not None:
-                imps.append((imp, attrs))
-                continue
-            
-            imps.append((self._observer.test_and_set(imp), attrs))
-            
+        imps = _observe(self._observer, impressions)
         return [i for i, _ in imps], imps, [], []
 
 class StrategyNoneMode(BaseStrategy):
@@ -92,14 +102,7 @@ class StrategyOptimizedMode(BaseStrategy):
         :returns: Tuple of to be stored, observed and counted impressions, and unique keys tuple
         :rtype: list[tuple[splitio.models.impression.Impression, dict]], list[splitio.models.impression.Impression], list[splitio.models.impression.Impression], list[]
         """
-        imps = []
-        for imp, attrs in impressions:
-            if imp.properties is not None:
-                imps.append((imp, attrs))
-                continue
-
-            imps.append((self._observer.test_and_set(imp), attrs))
-        
+        imps = _observe(self._observer, impressions)
         counter_imps = [imp for imp, _ in imps if imp.previous_time != None]
         this_hour = truncate_time(utctime_ms())
         return [i for i, _ in imps if i.previous_time is None or i.previous_time < this_hour], imps, counter_imps, []
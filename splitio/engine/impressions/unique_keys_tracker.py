@@ -1,12 +1,18 @@
 import abc
+import sys
 import threading
 import logging
 
-from splitio.engine.filters import BloomFilter
+from splitio.engine.filters import RotatingBloomFilter
 from splitio.optional.loaders import asyncio
 
 _LOGGER = logging.getLogger(__name__)
 
+_MAX_CACHE_BYTES = 16 * 1024 * 1024
+# Approximate per-entry cost of a key in a set (hash table slot + str header) and of a new feature set.
+_KEY_OVERHEAD_BYTES = 80
+_FEATURE_OVERHEAD_BYTES = 300
+
 class UniqueKeysTrackerBase(object, metaclass=abc.ABCMeta):
     """Unique Keys Tracker base class."""
 
@@ -30,28 +36,42 @@ class UniqueKeysTrackerBase(object, metaclass=abc.ABCMeta):
         """
         Add the feature_name+key to both bloom filter and dictionary.
 
+        Keys are interned so the same user tracked across many feature flags is stored once.
+
         :param feature_flag_name: feature flag name associated with the key
         :type feature_flag_name: str
         :param key: key to be added to MTK list
         :type key: int
         """
-        if feature_flag_name not in self._cache:
-            self._cache[feature_flag_name] = set()
-        self._cache[feature_flag_name].add(key)
+        keys = self._cache.get(feature_flag_name)
+        if keys is None:
+            keys = self._cache[sys.intern(feature_flag_name)] = set()
+            self._current_cache_bytes += _FEATURE_OVERHEAD_BYTES + len(feature_flag_name)
+        keys.add(sys.intern(key))
+        self._current_cache_bytes += _KEY_OVERHEAD_BYTES + len(key)
+
+    def _is_full(self):
+        """Return whether the cache went over its entry count or approximate memory limit."""
+        return self._current_cache_size > self._cache_size or \
+            self._current_cache_bytes > self._max_cache_bytes
 
 
 class UniqueKeysTracker(UniqueKeysTrackerBase):
     """Unique Keys Tracker class."""
 
-    def __init__(self, cache_size=30000):
+    def __init__(self, cache_size=30000, max_cache_bytes=_MAX_CACHE_BYTES):
         """
         Initialize unique keys tracker instance
 
         :param cache_size: The size of the unique keys dictionary
         :type key: int
+        :param max_cache_bytes: Approximate memory the unique keys dictionary may use before flushing
+        :type max_cache_bytes: int
         """
         self._cache_size = cache_size
-        self._filter = BloomFilter(cache_size)
+        self._max_cache_bytes = max_cache_bytes
+        self._current_cache_bytes = 0
+        self._filter = RotatingBloomFilter(cache_size)
         self._lock = threading.RLock()
         self._cache = {}
         self._queue_full_hook = None
@@ -70,14 +90,13 @@ class UniqueKeysTracker(UniqueKeysTrackerBase):
         :rtype: boolean
         """
         with self._lock:
-            if self._filter.contains(feature_flag_name+key):
+            if self._filter.contains_or_add(feature_flag_name+key):
                 return False
 
             self._add_or_update(feature_flag_name, key)
-            self._filter.add(feature_flag_name+key)
             self._current_cache_size += 1
 
-        if self._current_cache_size > self._cache_size:
+        if self._is_full():
             _LOGGER.info(
                 'Unique Keys queue is full, flushing the current queue now.'
             )
@@ -88,7 +107,7 @@ class UniqueKeysTracker(UniqueKeysTrackerBase):
 
     def clear_filter(self):
         """
-        Delete the filter items
+        Age out the oldest generation of filter items
 
         """
         with self._lock:
@@ -100,6 +119,7 @@ class UniqueKeysTracker(UniqueKeysTrackerBase):
             temp_cache_size = self._current_cache_size
             self._cache = {}
             self._current_cache_size = 0
+            self._current_cache_bytes = 0
 
             return temp_cach, temp_cache_size
 
@@ -107,15 +127,19 @@ class UniqueKeysTracker(UniqueKeysTrackerBase):
 class UniqueKeysTrackerAsync(UniqueKeysTrackerBase):
     """Unique Keys Tracker async class."""
 
-    def __init__(self, cache_size=30000):
+    def __init__(self, cache_size=30000, max_cache_bytes=_MAX_CACHE_BYTES):
         """
         Initialize unique keys tracker instance
 
         :param cache_size: The size of the unique keys dictionary
         :type key: int
+        :param max_cache_bytes: Approximate memory the unique keys dictionary may use before flushing
+        :type max_cache_bytes: int
         """
         self._cache_size = cache_size
-        self._filter = BloomFilter(cache_size)
+        self._max_cache_bytes = max_cache_bytes
+        self._current_cache_bytes = 0
+        self._filter = RotatingBloomFilter(cache_size)
         self._lock = asyncio.Lock()
         self._cache = {}
         self._queue_full_hook = None
@@ -134,14 +158,13 @@ class UniqueKeysTrackerAsync(UniqueKeysTrackerBase):
         :rtype: boolean
         """
         async with self._lock:
-            if self._filter.contains(feature_flag_name+key):
+            if self._filter.contains_or_add(feature_flag_name+key):
                 return False
 
             self._add_or_update(feature_flag_name, key)
-            self._filter.add(feature_flag_name+key)
             self._current_cache_size += 1
 
-        if self._current_cache_size > self._cache_size:
+        if self._is_full():
             _LOGGER.info(
                 'Unique Keys queue is full, flushing the current queue now.'
             )
@@ -152,7 +175,7 @@ class UniqueKeysTrackerAsync(UniqueKeysTrackerBase):
 
     async def clear_filter(self):
         """
-        Delete the filter items
+        Age out the oldest generation of filter items
 
         """
         async with self._lock:
@@ -164,5 +187,6 @@ class UniqueKeysTrackerAsync(UniqueKeysTrackerBase):
             temp_cache_size = self._current_cache_size
             self._cache = {}
             self._current_cache_size = 0
+            self._current_cache_bytes = 0
 
             return temp_cach, temp_cache_size
\ No newline at end of file
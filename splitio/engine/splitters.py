@@ -6,7 +6,7 @@ from splitio.engine.hashfns import get_hash_fn
 class Splitter(object):
     """Class responsible for choosing the right partition."""
 
-    def get_treatment(self, key, seed, partitions, algo):
+    def get_treatment(self, key, seed, partitions, algo, buckets=None):
         """
         Return the appropriate treatment or CONTROL if no partitions are found.
 
@@ -16,20 +16,56 @@ class Splitter(object):
         :type seed: int
         :param partitions: The condition partitions
         :type partitions: list
+        :param algo: The hashing algorithm
+        :type algo: int
+        :param buckets: Optional memo of buckets already computed in the current evaluation
+        :type buckets: dict
         :return: The treatment
         :rtype: str
         """
         if not partitions:
             return CONTROL
 
-        if len(partitions) == 1 and partitions[0].size == 100:
-            return partitions[0].treatment
+        # A partition covering every bucket makes hashing pointless
+        for partition in partitions:
+            if partition.size == 0:
+                continue
+
+            if partition.size >= 100:
+                return partition.treatment
+
+            break
 
         return self.get_treatment_for_bucket(
-            self.get_bucket(key, seed, algo),
+            self.get_memoized_bucket(key, seed, algo, buckets),
             partitions
         )
 
+    def get_memoized_bucket(self, key, seed, algo, buckets):
+        """
+        Get the bucket for a key, reusing the one computed earlier for the same seed.
+
+        :param key: The key to bucket
+        :type key: str
+        :param seed: The seed to hash with
+        :type seed: int
+        :param algo: The hashing algorithm
+        :type algo: int
+        :param buckets: Memo of (key, seed, algo) -> bucket, or None to always hash
+        :type buckets: dict
+        :return: The bucket
+        :rtype: int
+        """
+        if buckets is None:
+            return self.get_bucket(key, seed, algo)
+
+        memo_key = (key, seed, algo)
+        bucket = buckets.get(memo_key)
+        if bucket is None:
+            bucket = buckets[memo_key] = self.get_bucket(key, seed, algo)
+
+        return bucket
+
     @staticmethod
     def get_bucket(key, seed, algo):
         """
@@ -1,6 +1,23 @@
+"""Models package."""
+import sys
+
+
 class MatcherNotFoundException(Exception):
     """Exception to raise when a matcher is not found."""
 
     def __init__(self, custom_message):
         """Constructor."""
-        Exception.__init__(self, custom_message)
\ No newline at end of file
+        Exception.__init__(self, custom_message)
+
+
+def intern_name(value):
+    """
+    Intern an identifier repeated across parsed models, such as a treatment or segment name.
+
+    :param value: identifier to intern. Non string values are returned as they are.
+    :type value: str
+
+    :return: Interned identifier.
+    :rtype: str
+    """
+    return sys.intern(value) if type(value) is str else value  # pylint: disable=unidiomatic-typecheck
@@ -1,11 +1,17 @@
 """Split conditions module."""
-
+from collections import OrderedDict
 from enum import Enum
+import hashlib
+import marshal
+import threading
 
-from splitio.models import MatcherNotFoundException
+from splitio.models import MatcherNotFoundException, intern_name
 from splitio.models.grammar import matchers
 from splitio.models.grammar import partitions
 
+_PARSED_CONDITIONS_CACHE_SIZE = 32768
+_WHITELIST_INDEXES_CACHE_SIZE = 4096
+
 _MATCHER_COMBINERS = {
     'AND': lambda ms, k, a, c: all(m.evaluate(k, a, c) for m in ms)
 }
@@ -21,6 +27,8 @@ class ConditionType(Enum):
 class Condition(object):
     """Condition object class."""
 
+    __slots__ = ('_matchers', '_combiner', '_partitions', '_label', '_condition_type')
+
     def __init__(  # pylint: disable=too-many-arguments
             self,
             matcher_list,
@@ -38,7 +46,7 @@ class Condition(object):
         self._matchers = matcher_list
         self._combiner = combiner
         self._partitions = tuple(parts)
-        self._label = label
+        self._label = intern_name(label)
         self._condition_type = condition_type
 
     @property
@@ -86,6 +94,35 @@ class Condition(object):
             if isinstance(matcher, matchers.UserDefinedSegmentMatcher)
         ]
 
+    def get_rule_based_segment_names(self):
+        """
+        Fetch rule based segment names for all IN_RULE_BASED_SEGMENT matchers.
+
+        :return: List of rule based segment names
+        :rtype: list(str)
+        """
+        return [
+            matcher._rbs_segment_name for matcher in self.matchers  # pylint: disable=protected-access
+            if isinstance(matcher, matchers.RuleBasedSegmentMatcher)
+        ]
+
+    def get_whitelisted_keys(self):
+        """
+        Return the keys targeted by a condition made of a single key whitelist.
+
+        :return: Whitelisted keys, or None if the condition depends on anything else.
+        :rtype: frozenset
+        """
+        if len(self._matchers) != 1:
+            return None
+
+        matcher = self._matchers[0]
+        if not isinstance(matcher, matchers.WhitelistMatcher) \
+                or matcher._negate or matcher._attribute_name is not None:  # pylint: disable=protected-access
+            return None
+
+        return matcher._whitelist  # pylint: disable=protected-access
+
     def __str__(self):
         """Return the string representation of the condition."""
         return '{matcher} then split {parts}'.format(
@@ -134,3 +171,142 @@ def from_raw(raw_condition):
     condition_type = ConditionType(raw_condition.get('conditionType', ConditionType.WHITELIST))
 
     return Condition(matcher_objects, combiner, parsed_partitions, label, condition_type)
+
+
+class ConditionCache(object):
+    """
+    Parsed conditions keyed by a digest of their raw JSON.
+
+    Updates usually leave most of a flag's conditions untouched. Parsed conditions hold no per
+    flag state, so an unchanged one is reused instead of rebuilding its matchers, which also
+    lets flags with identical conditions share them. Digests come from the marshal encoding,
+    several times cheaper to compute than parsing the condition again.
+    """
+
+    def __init__(self, max_size=_PARSED_CONDITIONS_CACHE_SIZE):
+        """
+        Class constructor.
+
+        :param max_size: Maximum number of parsed conditions to keep.
+        :type max_size: int
+        """
+        self._max_size = max_size
+        self._conditions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def from_raw(self, raw_condition):
+        """
+        Return the parsed condition, building it only when it's not cached.
+
+        :param raw_condition: JSON object extracted from a feature flag's conditions array.
+        :type raw_condition: dict
+
+        :return: A condition object.
+        :rtype: Condition
+        """
+        try:
+            digest = hashlib.blake2b(marshal.dumps(raw_condition, 2), digest_size=16).digest()
+        except ValueError:  # not plain JSON data, parse it without caching.
+            return from_raw(raw_condition)
+
+        with self._lock:
+            parsed = self._conditions.get(digest)
+            if parsed is not None:
+                self._conditions.move_to_end(digest)
+                return parsed
+
+        parsed = from_raw(raw_condition)
+        with self._lock:
+            self._conditions[digest] = parsed
+            if len(self._conditions) > self._max_size:
+                self._conditions.popitem(last=False)
+
+        return parsed
+
+    def clear(self):
+        """Drop every cached condition."""
+        with self._lock:
+            self._conditions.clear()
+
+    def __len__(self):
+        """Return the number of cached conditions."""
+        return len(self._conditions)
+
+
+class WhitelistIndexCache(object):
+    """
+    Key whitelist indexes keyed by the conditions they were built from.
+
+    Storages not keeping parsed flags in memory build a new flag object on every read, but its
+    conditions come from the parsed conditions cache, so the same condition objects are seen
+    again as long as the flag doesn't change. Indexes are keyed by those objects and built only
+    once for them.
+    """
+
+    def __init__(self, max_size=_WHITELIST_INDEXES_CACHE_SIZE):
+        """
+        Class constructor.
+
+        :param max_size: Maximum number of indexes to keep.
+        :type max_size: int
+        """
+        self._max_size = max_size
+        self._indexes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def index_for(self, conditions):
+        """
+        Return an index of the keys targeted by the leading key whitelist conditions.
+
+        Conditions are matched in order, so only the whitelists preceding any other condition
+        are indexed, each key pointing to the first of them listing it.
+
+        :param conditions: Conditions of a feature flag.
+        :type conditions: list(Condition)
+
+        :return: Key to condition position mapping, and the number of conditions indexed.
+        :rtype: tuple(dict, int)
+        """
+        leading = []
+        for cond in conditions:
+            keys = cond.get_whitelisted_keys() if cond.condition_type == ConditionType.WHITELIST else None
+            if keys is None:
+                break
+            leading.append(cond)
+
+        if not leading:
+            return {}, 0
+
+        # conditions compare by identity, keeping them here also keeps their ids from being reused.
+        cache_key = tuple(leading)
+        with self._lock:
+            index = self._indexes.get(cache_key)
+            if index is not None:
+                self._indexes.move_to_end(cache_key)
+                return index
+
+        positions = {}
+        for position, cond in enumerate(leading):
+            for key in cond.get_whitelisted_keys():
+                positions.setdefault(key, position)
+        index = (positions, len(leading))
+
+        with self._lock:
+            self._indexes[cache_key] = index
+            if len(self._indexes) > self._max_size:
+                self._indexes.popitem(last=False)
+
+        return index
+
+    def clear(self):
+        """Drop every cached index."""
+        with self._lock:
+            self._indexes.clear()
+
+    def __len__(self):
+        """Return the number of cached indexes."""
+        return len(self._indexes)
+
+
+PARSED_CONDITIONS = ConditionCache()
+WHITELIST_INDEXES = WhitelistIndexCache()
@@ -2,11 +2,15 @@
 import abc
 
 from splitio.client.key import Key
+from splitio.models import intern_name
+from splitio.models.grammar.matchers.utils.attributes import AttributesView
 
 
 class Matcher(object, metaclass=abc.ABCMeta):
     """Matcher abstract class."""
 
+    __slots__ = ('_negate', '_matcher_type', '_attribute_name')
+
     def __init__(self, raw_matcher):
         """
         Initialize generic data and call matcher-specific parser.
@@ -18,10 +22,10 @@ class Matcher(object, metaclass=abc.ABCMeta):
         :rtype: Matcher
         """
         self._negate = raw_matcher['negate']
-        self._matcher_type = raw_matcher['matcherType']
+        self._matcher_type = intern_name(raw_matcher['matcherType'])
         key_selector = raw_matcher.get('keySelector')
         if key_selector is not None and 'attribute' in key_selector:
-            self._attribute_name = raw_matcher['keySelector']['attribute']
+            self._attribute_name = intern_name(raw_matcher['keySelector']['attribute'])
         else:
             self._attribute_name = None
         self._build(raw_matcher)
@@ -49,6 +53,27 @@ class Matcher(object, metaclass=abc.ABCMeta):
 
         return key
 
+    def _get_matcher_input_as(self, key, attributes, conversion):
+        """
+        Return the matching input converted to the type the matcher works with.
+
+        Conversions of attributes wrapped in an evaluation view are reused across matchers.
+
+        :param key: User-submitted key
+        :type key: str | Key
+        :param attributes: User-submitted attributes
+        :type attributes: dict
+        :param conversion: function converting the input, returning None if it can't.
+        :type conversion: callable
+
+        :returns: converted data to use when matching
+        :rtype: str | frozenset | int | bool | Semver
+        """
+        if self._attribute_name is not None and isinstance(attributes, AttributesView):
+            return attributes.get_as(self._attribute_name, conversion)
+
+        return conversion(self._get_matcher_input(key, attributes))
+
     @abc.abstractmethod
     def _build(self, raw_matcher):
         """
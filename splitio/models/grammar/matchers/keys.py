@@ -1,10 +1,13 @@
 """Keys matchers module."""
+from splitio.models import intern_name
 from splitio.models.grammar.matchers.base import Matcher
 
 
 class AllKeysMatcher(Matcher):
     """A matcher that always returns True."""
 
+    __slots__ = ()
+
     def _build(self, raw_matcher):
         """
         Build an AllKeysMatcher.
@@ -42,6 +45,8 @@ class AllKeysMatcher(Matcher):
 class UserDefinedSegmentMatcher(Matcher):
     """Matcher that returns true when the submitted key belongs to a segment."""
 
+    __slots__ = ('_segment_name',)
+
     def _build(self, raw_matcher):
         """
         Build an UserDefinedSegmentMatcher.
@@ -49,7 +54,7 @@ class UserDefinedSegmentMatcher(Matcher):
         :param raw_matcher: raw matcher as fetched from splitChanges response.
         :type raw_matcher: dict
         """
-        self._segment_name = raw_matcher['userDefinedSegmentMatcherData']['segmentName']
+        self._segment_name = intern_name(raw_matcher['userDefinedSegmentMatcherData']['segmentName'])
 
     def _match(self, key, attributes=None, context=None):
         """
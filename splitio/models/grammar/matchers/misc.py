@@ -1,12 +1,14 @@
 """Miscelaneous matchers that don't fall into other categories."""
-import json
-
+from splitio.models import intern_name
 from splitio.models.grammar.matchers.base import Matcher
+from splitio.models.grammar.matchers.utils.attributes import to_bool
 
 
 class DependencyMatcher(Matcher):
     """Matcher that returns true if the user's key secondary evaluation result matches."""
 
+    __slots__ = ('_split_name', '_treatments')
+
     def _build(self, raw_matcher):
         """
         Build an DependencyMatcher.
@@ -14,7 +16,7 @@ class DependencyMatcher(Matcher):
         :param raw_matcher: raw matcher as fetched from splitChanges response.
         :type raw_matcher: dict
         """
-        self._split_name = raw_matcher['dependencyMatcherData']['split']
+        self._split_name = intern_name(raw_matcher['dependencyMatcherData']['split'])
         self._treatments = raw_matcher['dependencyMatcherData']['treatments']
 
     def _match(self, key, attributes=None, context=None):
@@ -51,6 +53,8 @@ class DependencyMatcher(Matcher):
 class BooleanMatcher(Matcher):
     """Matcher that returns true if the user submited value is similar to the stored boolean."""
 
+    __slots__ = ('_data',)
+
     def _build(self, raw_matcher):
         """
         Build an BooleanMatcher.
@@ -74,22 +78,8 @@ class BooleanMatcher(Matcher):
         :returns: Wheter the match is successful.
         :rtype: bool
         """
-        matching_data = self._get_matcher_input(key, attributes)
-        if matching_data is None:
-            return False
-
-        if isinstance(matching_data, bool):
-            decoded = matching_data
-        elif isinstance(matching_data, str):
-            try:
-                decoded = json.loads(matching_data.lower())
-                if not isinstance(decoded, bool):
-                    return False
-
-            except ValueError:
-                return False
-
-        else:
+        decoded = self._get_matcher_input_as(key, attributes, to_bool)
+        if decoded is None:
             return False
 
         return decoded == self._data
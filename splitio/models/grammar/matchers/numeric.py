@@ -1,8 +1,8 @@
 """Numeric & Date based matchers."""
-import numbers
 import logging
 
 from splitio.models.grammar.matchers.base import Matcher
+from splitio.models.grammar.matchers.utils.attributes import to_int
 from splitio.models import datatypes
 
 
@@ -20,34 +20,14 @@ class Sanitizer(object):  # pylint: disable=too-few-public-methods
         :param input: user supplied input.
         :type input: mixed.
         """
-        if data is None:  # Failed to fetch attribute. no need to convert.
-            return None
-
-        # For some reason bool is considered an integral type. We want to avoid True
-        # to be converted to 1, and False to 0 on numeric matchers since it can be
-        # misleading.
-        if isinstance(data, numbers.Integral) and not isinstance(data, bool):
-            return data
-
-        if not isinstance(data, str):
-            _LOGGER.error('Cannot convert %s to int. Failing.', type(data))
-            return None
-
-        _LOGGER.warning(
-            'Supplied attribute is of type %s and should have been an int. ',
-            type(data)
-        )
-
-        try:
-            return int(data)
-        except ValueError:
-            _LOGGER.error('Cannot convert %s to int. Failing.', type(data))
-            return None
+        return to_int(data)
 
 
 class ZeroSecondDataMatcher(object):  # pylint: disable=too-few-public-methods
     """Mixin to use in matchers that when dealing with datetimes, truncate seconds."""
 
+    __slots__ = ()
+
     data_parsers = {
         'NUMBER': lambda x: x,
         'DATETIME': datatypes.java_ts_truncate_seconds
@@ -62,6 +42,8 @@ class ZeroSecondDataMatcher(object):  # pylint: disable=too-few-public-methods
 class ZeroTimeDataMatcher(object):  # pylint: disable=no-init,too-few-public-methods
     """Mixin to use in matchers that when dealing with datetimes, truncate time."""
 
+    __slots__ = ()
+
     input_parsers = {
         'NUMBER': lambda x: x,
         'DATETIME': datatypes.ts_truncate_time
@@ -76,6 +58,8 @@ class ZeroTimeDataMatcher(object):  # pylint: disable=no-init,too-few-public-met
 class BetweenMatcher(Matcher, ZeroSecondDataMatcher):
     """Matcher that returns true if user input is within a specified range."""
 
+    __slots__ = ('_data_type', '_original_lower', '_original_upper', '_lower', '_upper')
+
     def _build(self, raw_matcher):
         """
         Build InBetweenMatcher.
@@ -103,7 +87,7 @@ class BetweenMatcher(Matcher, ZeroSecondDataMatcher):
         :returns: Wheter the match is successful.
         :rtype: bool
         """
-        matching_data = Sanitizer.ensure_int(self._get_matcher_input(key, attributes))
+        matching_data = self._get_matcher_input_as(key, attributes, to_int)
         if matching_data is None:
             return False
 
@@ -127,6 +111,8 @@ class BetweenMatcher(Matcher, ZeroSecondDataMatcher):
 class EqualToMatcher(Matcher, ZeroTimeDataMatcher):
     """Return true if the provided input is equal to the value stored in the matcher."""
 
+    __slots__ = ('_data_type', '_original_value', '_value')
+
     def _build(self, raw_matcher):
         """
         Build EqualToMatcher.
@@ -152,7 +138,7 @@ class EqualToMatcher(Matcher, ZeroTimeDataMatcher):
         :returns: Wheter the match is successful.
         :rtype: bool
         """
-        matching_data = Sanitizer.ensure_int(self._get_matcher_input(key, attributes))
+        matching_data = self._get_matcher_input_as(key, attributes, to_int)
         if matching_data is None:
             return False
 
@@ -171,6 +157,8 @@ class EqualToMatcher(Matcher, ZeroTimeDataMatcher):
 class GreaterThanOrEqualMatcher(Matcher, ZeroSecondDataMatcher):
     """Return true if the provided input is >= the value stored in the matcher."""
 
+    __slots__ = ('_data_type', '_original_value', '_value')
+
     def _build(self, raw_matcher):
         """
         Build GreaterThanOrEqualMatcher.
@@ -196,7 +184,7 @@ class GreaterThanOrEqualMatcher(Matcher, ZeroSecondDataMatcher):
         :returns: Wheter the match is successful.
         :rtype: bool
         """
-        matching_data = Sanitizer.ensure_int(self._get_matcher_input(key, attributes))
+        matching_data = self._get_matcher_input_as(key, attributes, to_int)
         if matching_data is None:
             return False
 
@@ -215,6 +203,8 @@ class GreaterThanOrEqualMatcher(Matcher, ZeroSecondDataMatcher):
 class LessThanOrEqualMatcher(Matcher, ZeroSecondDataMatcher):
     """Return true if the provided input is <= the value stored in the matcher."""
 
+    __slots__ = ('_data_type', '_original_value', '_value')
+
     def _build(self, raw_matcher):
         """
         Build LessThanOrEqualMatcher.
@@ -240,7 +230,7 @@ class LessThanOrEqualMatcher(Matcher, ZeroSecondDataMatcher):
         :returns: Wheter the match is successful.
         :rtype: bool
         """
-        matching_data = Sanitizer.ensure_int(self._get_matcher_input(key, attributes))
+        matching_data = self._get_matcher_input_as(key, attributes, to_int)
         if matching_data is None:
             return False
 
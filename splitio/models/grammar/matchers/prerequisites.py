@@ -1,7 +1,9 @@
 """Prerequisites matcher classes."""
 
 class PrerequisitesMatcher(object):
-    
+
+    __slots__ = ('_prerequisites',)
+
     def __init__(self, prerequisites):
         """
         Build a PrerequisitesMatcher.
@@ -1,9 +1,12 @@
 """Rule based segment matcher classes."""
+from splitio.models import intern_name
 from splitio.models.grammar.matchers.base import Matcher
 from splitio.models.rule_based_segments import SegmentType
 
 class RuleBasedSegmentMatcher(Matcher):
-    
+
+    __slots__ = ('_rbs_segment_name',)
+
     def _build(self, raw_matcher):
         """
         Build an RuleBasedSegmentMatcher.
@@ -11,7 +14,7 @@ class RuleBasedSegmentMatcher(Matcher):
         :param raw_matcher: raw matcher as fetched from splitChanges response.
         :type raw_matcher: dict
         """
-        self._rbs_segment_name = raw_matcher['userDefinedSegmentMatcherData']['segmentName']
+        self._rbs_segment_name = intern_name(raw_matcher['userDefinedSegmentMatcherData']['segmentName'])
     
     def _match(self, key, attributes=None, context=None):      
         """
@@ -32,10 +35,10 @@ class RuleBasedSegmentMatcher(Matcher):
         
         rb_segment = context['ec'].rbs_segments.get(self._rbs_segment_name)
         
-        if key in rb_segment.excluded.get_excluded_keys():
+        if rb_segment.excluded.is_excluded_key(key):
             return False 
 
-        if self._match_dep_rb_segments(rb_segment.excluded.get_excluded_segments(), key, attributes, context):
+        if self._match_excluded(rb_segment.excluded, key, attributes, context):
             return False
                 
         return self._match_conditions(rb_segment.conditions, key, attributes, context)
@@ -55,6 +58,19 @@ class RuleBasedSegmentMatcher(Matcher):
             
         return False
             
+    def _match_excluded(self, excluded, key, attributes, context):
+        """
+        Return whether the key belongs to any of the excluded segments.
+
+        Exclusions made only of standard segments are checked with a flat lookup over their
+        precomputed names, leaving the ordered walk for the ones nesting rule based segments.
+        """
+        if not excluded.has_rule_based_segments:
+            segment_memberships = context['ec'].segment_memberships
+            return any(segment_memberships[name] for name in excluded.standard_segments)
+
+        return self._match_dep_rb_segments(excluded.get_excluded_segments(), key, attributes, context)
+
     def _match_dep_rb_segments(self, excluded_rb_segments, key, attributes, context):
         for excluded_rb_segment in excluded_rb_segments:
             if excluded_rb_segment.type == SegmentType.STANDARD:
@@ -62,10 +78,10 @@ class RuleBasedSegmentMatcher(Matcher):
                     return True
             else:
                 excluded_segment = context['ec'].rbs_segments.get(excluded_rb_segment.name)
-                if key in excluded_segment.excluded.get_excluded_keys():
+                if excluded_segment.excluded.is_excluded_key(key):
                     return False
 
-                if self._match_dep_rb_segments(excluded_segment.excluded.get_excluded_segments(), key, attributes, context) \
+                if self._match_excluded(excluded_segment.excluded, key, attributes, context) \
                     or self._match_conditions(excluded_segment.conditions, key, attributes, context):
                     return True
                                     
@@ -2,7 +2,7 @@
 import logging
 
 from splitio.models.grammar.matchers.base import Matcher
-from splitio.models.grammar.matchers.string import Sanitizer
+from splitio.models.grammar.matchers.utils.attributes import to_semver
 from splitio.models.grammar.matchers.utils.utils import build_semver_or_none
 
 
@@ -12,6 +12,8 @@ _LOGGER = logging.getLogger(__name__)
 class EqualToSemverMatcher(Matcher):
     """A matcher for Semver equal to."""
 
+    __slots__ = ('_data', '_semver')
+
     def _build(self, raw_matcher):
         """
         Build an EqualToSemverMatcher.
@@ -40,11 +42,7 @@ class EqualToSemverMatcher(Matcher):
             _LOGGER.error("stringMatcherData is required for EQUAL_TO_SEMVER matcher type")
             return False
 
-        matching_data = Sanitizer.ensure_string(self._get_matcher_input(key, attributes))
-        if matching_data is None:
-            return False
-
-        matching_semver = build_semver_or_none(matching_data)
+        matching_semver = self._get_matcher_input_as(key, attributes, to_semver)
         if matching_semver is None:
             return False
 
@@ -61,6 +59,8 @@ class EqualToSemverMatcher(Matcher):
 class GreaterThanOrEqualToSemverMatcher(Matcher):
     """A matcher for Semver greater than or equal to."""
 
+    __slots__ = ('_data', '_semver')
+
     def _build(self, raw_matcher):
         """
         Build a GreaterThanOrEqualToSemverMatcher.
@@ -89,15 +89,11 @@ class GreaterThanOrEqualToSemverMatcher(Matcher):
             _LOGGER.error("stringMatcherData is required for GREATER_THAN_OR_EQUAL_TO_SEMVER matcher type")
             return False
 
-        matching_data = Sanitizer.ensure_string(self._get_matcher_input(key, attributes))
-        if matching_data is None:
-            return False
-
-        matching_semver = build_semver_or_none(matching_data)
+        matching_semver = self._get_matcher_input_as(key, attributes, to_semver)
         if matching_semver is None:
             return False
 
-        return matching_semver.compare(self._semver) in [0, 1]
+        return matching_semver.compare(self._semver) >= 0
 
     def __str__(self):
         """Return string Representation."""
@@ -111,6 +107,8 @@ class GreaterThanOrEqualToSemverMatcher(Matcher):
 class LessThanOrEqualToSemverMatcher(Matcher):
     """A matcher for Semver less than or equal to."""
 
+    __slots__ = ('_data', '_semver')
+
     def _build(self, raw_matcher):
         """
         Build a LessThanOrEqualToSemverMatcher.
@@ -139,15 +137,11 @@ class LessThanOrEqualToSemverMatcher(Matcher):
             _LOGGER.error("stringMatcherData is required for LESS_THAN_OR_EQUAL_TO_SEMVER matcher type")
             return False
 
-        matching_data = Sanitizer.ensure_string(self._get_matcher_input(key, attributes))
-        if matching_data is None:
-            return False
-
-        matching_semver = build_semver_or_none(matching_data)
+        matching_semver = self._get_matcher_input_as(key, attributes, to_semver)
         if matching_semver is None:
             return False
 
-        return matching_semver.compare(self._semver) in [0, -1]
+        return matching_semver.compare(self._semver) <= 0
 
     def __str__(self):
         """Return string Representation."""
@@ -161,6 +155,8 @@ class LessThanOrEqualToSemverMatcher(Matcher):
 class BetweenSemverMatcher(Matcher):
     """A matcher for Semver between."""
 
+    __slots__ = ('_data', '_semver_start', '_semver_end')
+
     def _build(self, raw_matcher):
         """
         Build a BetweenSemverMatcher.
@@ -190,15 +186,11 @@ class BetweenSemverMatcher(Matcher):
             _LOGGER.error("betweenStringMatcherData is required for BETWEEN_SEMVER matcher type")
             return False
 
-        matching_data = Sanitizer.ensure_string(self._get_matcher_input(key, attributes))
-        if matching_data is None:
-            return False
-
-        matching_semver = build_semver_or_none(matching_data)
+        matching_semver = self._get_matcher_input_as(key, attributes, to_semver)
         if matching_semver is None:
             return False
 
-        return (self._semver_start.compare(matching_semver) in [0, -1]) and (self._semver_end.compare(matching_semver) in [0, 1])
+        return self._semver_start.compare(matching_semver) <= 0 and self._semver_end.compare(matching_semver) >= 0
 
     def __str__(self):
         """Return string Representation."""
@@ -212,6 +204,8 @@ class BetweenSemverMatcher(Matcher):
 class InListSemverMatcher(Matcher):
     """A matcher for Semver in list."""
 
+    __slots__ = ('_data', '_semver_list')
+
     def _build(self, raw_matcher):
         """
         Build a InListSemverMatcher.
@@ -241,11 +235,7 @@ class InListSemverMatcher(Matcher):
             _LOGGER.error("whitelistMatcherData is required for IN_LIST_SEMVER matcher type")
             return False
 
-        matching_data = Sanitizer.ensure_string(self._get_matcher_input(key, attributes))
-        if matching_data is None:
-            return False
-
-        matching_semver = build_semver_or_none(matching_data)
+        matching_semver = self._get_matcher_input_as(key, attributes, to_semver)
         if matching_semver is None:
             return False
 
@@ -1,10 +1,13 @@
 """Set based matchers module."""
 from splitio.models.grammar.matchers.base import Matcher
+from splitio.models.grammar.matchers.utils.attributes import to_set
 
 
 class ContainsAllOfSetMatcher(Matcher):
     """Matcher that returns true if the user data is a subset of the matcher's data."""
 
+    __slots__ = ('_whitelist',)
+
     def _build(self, raw_matcher):
         """
         Build an ContainsAllOfSetMatcher.
@@ -28,16 +31,11 @@ class ContainsAllOfSetMatcher(Matcher):
         :returns: Wheter the match is successful.
         :rtype: bool
         """
-        matching_data = self._get_matcher_input(key, attributes)
-        if matching_data is None:
+        setkey = self._get_matcher_input_as(key, attributes, to_set)
+        if setkey is None:
             return False
 
-        try:
-            setkey = set(matching_data)
-            return self._whitelist.issubset(setkey)
-
-        except TypeError:
-            return False
+        return self._whitelist.issubset(setkey)
 
     def _add_matcher_specific_properties_to_json(self):
         """Return ContainsAllOfSet specific properties."""
@@ -57,6 +55,8 @@ class ContainsAllOfSetMatcher(Matcher):
 class ContainsAnyOfSetMatcher(Matcher):
     """Matcher that returns true if the intersection of both sets is not empty."""
 
+    __slots__ = ('_whitelist',)
+
     def _build(self, raw_matcher):
         """
         Build an ContainsAnyOfSetMatcher.
@@ -80,15 +80,11 @@ class ContainsAnyOfSetMatcher(Matcher):
         :returns: Wheter the match is successful.
         :rtype: bool
         """
-        matching_data = self._get_matcher_input(key, attributes)
-        if matching_data is None:
+        setkey = self._get_matcher_input_as(key, attributes, to_set)
+        if setkey is None:
             return False
 
-        try:
-            return len(self._whitelist.intersection(set(matching_data))) != 0
-
-        except TypeError:
-            return False
+        return not self._whitelist.isdisjoint(setkey)
 
     def _add_matcher_specific_properties_to_json(self):
         """Return ContainsAnyOfSet specific properties."""
@@ -108,6 +104,8 @@ class ContainsAnyOfSetMatcher(Matcher):
 class EqualToSetMatcher(Matcher):
     """Matcher that returns true if the set provided by the user is equal to the matcher's one."""
 
+    __slots__ = ('_whitelist',)
+
     def _build(self, raw_matcher):
         """
         Build an EqualToSetMatcher.
@@ -131,15 +129,11 @@ class EqualToSetMatcher(Matcher):
         :returns: Wheter the match is successful.
         :rtype: bool
         """
-        matching_data = self._get_matcher_input(key, attributes)
-        if matching_data is None:
+        setkey = self._get_matcher_input_as(key, attributes, to_set)
+        if setkey is None:
             return False
 
-        try:
-            return self._whitelist == set(matching_data)
-
-        except TypeError:
-            return False
+        return self._whitelist == setkey
 
     def _add_matcher_specific_properties_to_json(self):
         """Return EqualToSet specific properties."""
@@ -159,6 +153,8 @@ class EqualToSetMatcher(Matcher):
 class PartOfSetMatcher(Matcher):
     """a."""
 
+    __slots__ = ('_whitelist',)
+
     def _build(self, raw_matcher):
         """
         Build an PartOfSetMatcher.
@@ -182,16 +178,11 @@ class PartOfSetMatcher(Matcher):
         :returns: Wheter the match is successful.
         :rtype: bool
         """
-        matching_data = self._get_matcher_input(key, attributes)
-        if matching_data is None:
+        setkey = self._get_matcher_input_as(key, attributes, to_set)
+        if setkey is None:
             return False
 
-        try:
-            setkey = set(matching_data)
-            return len(setkey) > 0 and setkey.issubset(set(self._whitelist))
-
-        except TypeError:
-            return False
+        return len(setkey) > 0 and setkey.issubset(self._whitelist)
 
     def _add_matcher_specific_properties_to_json(self):
         """Return PartOfSet specific properties."""
@@ -1,9 +1,10 @@
 """String matchers module."""
 import logging
-import json
-import re
 
 from splitio.models.grammar.matchers.base import Matcher
+from splitio.models.grammar.matchers.utils.attributes import to_string
+from splitio.models.grammar.matchers.utils.regex import compile_regex
+from splitio.models.grammar.matchers.utils.string_index import AffixIndex, SubstringIndex
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -23,26 +24,14 @@ class Sanitizer(object):  # pylint: disable=too-few-public-methods
         :return: String or None
         :rtype: string
         """
-        if data is None:  # Failed to fetch attribute. no need to convert.
-            return None
-
-        if isinstance(data, str):
-            return data
-
-        _LOGGER.warning(
-            'Supplied attribute is of type %s and should have been a string. ',
-            type(data)
-        )
-        try:
-            return json.dumps(data)
-
-        except TypeError:
-            return None
+        return to_string(data)
 
 
 class WhitelistMatcher(Matcher):
     """Matcher that returns true if the user key is within a whitelist."""
 
+    __slots__ = ('_whitelist',)
+
     def _build(self, raw_matcher):
         """
         Build an WhitelistMatcher.
@@ -66,7 +55,7 @@ class WhitelistMatcher(Matcher):
         :returns: Wheter the match is successful.
         :rtype: bool
         """
-        matching_data = Sanitizer.ensure_string(self._get_matcher_input(key, attributes))
+        matching_data = self._get_matcher_input_as(key, attributes, to_string)
         if matching_data is None:
             return False
 
@@ -90,6 +79,8 @@ class WhitelistMatcher(Matcher):
 class StartsWithMatcher(Matcher):
     """Matcher that returns true if the key is a prefix of the stored value."""
 
+    __slots__ = ('_whitelist', '_index')
+
     def _build(self, raw_matcher):
         """
         Build an StartsWithMatcher.
@@ -98,6 +89,7 @@ class StartsWithMatcher(Matcher):
         :type raw_matcher: dict
         """
         self._whitelist = frozenset(raw_matcher['whitelistMatcherData']['whitelist'])
+        self._index = AffixIndex(self._whitelist)
 
     def _match(self, key, attributes=None, context=None):
         """
@@ -113,12 +105,11 @@ class StartsWithMatcher(Matcher):
         :returns: Wheter the match is successful.
         :rtype: bool
         """
-        matching_data = Sanitizer.ensure_string(self._get_matcher_input(key, attributes))
+        matching_data = self._get_matcher_input_as(key, attributes, to_string)
         if matching_data is None:
             return False
 
-        return (isinstance(key, str) and
-                any(matching_data.startswith(s) for s in self._whitelist))
+        return isinstance(key, str) and self._index.matches(matching_data)
 
     def _add_matcher_specific_properties_to_json(self):
         """Return StartsWith specific properties."""
@@ -138,6 +129,8 @@ class StartsWithMatcher(Matcher):
 class EndsWithMatcher(Matcher):
     """Matcher that returns true if the key ends with the suffix stored in matcher data."""
 
+    __slots__ = ('_whitelist', '_index')
+
     def _build(self, raw_matcher):
         """
         Build an EndsWithMatcher.
@@ -146,6 +139,7 @@ class EndsWithMatcher(Matcher):
         :type raw_matcher: dict
         """
         self._whitelist = frozenset(raw_matcher['whitelistMatcherData']['whitelist'])
+        self._index = AffixIndex(self._whitelist, suffix=True)
 
     def _match(self, key, attributes=None, context=None):
         """
@@ -161,12 +155,11 @@ class EndsWithMatcher(Matcher):
         :returns: Wheter the match is successful.
         :rtype: bool
         """
-        matching_data = Sanitizer.ensure_string(self._get_matcher_input(key, attributes))
+        matching_data = self._get_matcher_input_as(key, attributes, to_string)
         if matching_data is None:
             return False
 
-        return (isinstance(key, str) and
-                any(matching_data.endswith(s) for s in self._whitelist))
+        return isinstance(key, str) and self._index.matches(matching_data)
 
     def _add_matcher_specific_properties_to_json(self):
         """Return EndsWith specific properties."""
@@ -186,6 +179,8 @@ class EndsWithMatcher(Matcher):
 class ContainsStringMatcher(Matcher):
     """Matcher that returns true if the input key is part of the string in matcher data."""
 
+    __slots__ = ('_whitelist', '_index')
+
     def _build(self, raw_matcher):
         """
         Build a ContainsStringMatcher.
@@ -194,6 +189,7 @@ class ContainsStringMatcher(Matcher):
         :type raw_matcher: dict
         """
         self._whitelist = frozenset(raw_matcher['whitelistMatcherData']['whitelist'])
+        self._index = SubstringIndex(self._whitelist)
 
     def _match(self, key, attributes=None, context=None):
         """
@@ -209,12 +205,11 @@ class ContainsStringMatcher(Matcher):
         :returns: Wheter the match is successful.
         :rtype: bool
         """
-        matching_data = Sanitizer.ensure_string(self._get_matcher_input(key, attributes))
+        matching_data = self._get_matcher_input_as(key, attributes, to_string)
         if matching_data is None:
             return False
 
-        return (isinstance(matching_data, str) and
-                any(s in matching_data for s in self._whitelist))
+        return isinstance(matching_data, str) and self._index.matches(matching_data)
 
     def _add_matcher_specific_properties_to_json(self):
         """Return ContainsString specific properties."""
@@ -234,6 +229,8 @@ class ContainsStringMatcher(Matcher):
 class RegexMatcher(Matcher):
     """Matcher that returns true if the user input matches the regex stored in the matcher."""
 
+    __slots__ = ('_data', '_regex')
+
     def _build(self, raw_matcher):
         """
         Build a RegexMatcher.
@@ -242,7 +239,9 @@ class RegexMatcher(Matcher):
         :type raw_matcher: dict
         """
         self._data = raw_matcher['stringMatcherData']
-        self._regex = re.compile(self._data)
+        self._regex = compile_regex(self._data)
+        # a flag parsed again gets another chance if the shared pattern ran out of budget.
+        self._regex.reset()
 
     def _match(self, key, attributes=None, context=None):
         """
@@ -258,13 +257,12 @@ class RegexMatcher(Matcher):
         :returns: Wheter the match is successful.
         :rtype: bool
         """
-        matching_data = Sanitizer.ensure_string(self._get_matcher_input(key, attributes))
+        matching_data = self._get_matcher_input_as(key, attributes, to_string)
         if matching_data is None:
             return False
 
         try:
-            matches = re.search(self._regex, matching_data)
-            return matches is not None
+            return self._regex.search(matching_data, context.get('flag') if context else None)
 
         except TypeError:
             return False
@@ -0,0 +1,204 @@
+"""Attribute conversions shared by matchers and the evaluation scoped view memoizing them."""
+import json
+import logging
+import numbers
+from collections.abc import Mapping
+
+from splitio.models.grammar.matchers.utils.utils import build_semver_or_none
+
+
+_LOGGER = logging.getLogger(__name__)
+_MISSING = object()
+
+
+def to_string(data):
+    """
+    Do a best effort attempt to conver input to a string.
+
+    :param data: user supplied input.
+    :type data: mixed.
+
+    :return: String or None
+    :rtype: string
+    """
+    if data is None:  # Failed to fetch attribute. no need to convert.
+        return None
+
+    if isinstance(data, str):
+        return data
+
+    _LOGGER.warning(
+        'Supplied attribute is of type %s and should have been a string. ',
+        type(data)
+    )
+    try:
+        return json.dumps(data)
+
+    except TypeError:
+        return None
+
+
+def to_int(data):
+    """
+    Do a best effort attempt to conver input to a int.
+
+    :param data: user supplied input.
+    :type data: mixed.
+
+    :return: Integer or None
+    :rtype: int
+    """
+    if data is None:  # Failed to fetch attribute. no need to convert.
+        return None
+
+    # For some reason bool is considered an integral type. We want to avoid True
+    # to be converted to 1, and False to 0 on numeric matchers since it can be
+    # misleading.
+    if isinstance(data, numbers.Integral) and not isinstance(data, bool):
+        return data
+
+    if not isinstance(data, str):
+        _LOGGER.error('Cannot convert %s to int. Failing.', type(data))
+        return None
+
+    _LOGGER.warning(
+        'Supplied attribute is of type %s and should have been an int. ',
+        type(data)
+    )
+
+    try:
+        return int(data)
+    except ValueError:
+        _LOGGER.error('Cannot convert %s to int. Failing.', type(data))
+        return None
+
+
+def to_set(data):
+    """
+    Convert an iterable input to a set.
+
+    :param data: user supplied input.
+    :type data: mixed.
+
+    :return: Set or None
+    :rtype: frozenset
+    """
+    if data is None:
+        return None
+
+    try:
+        return frozenset(data)
+
+    except TypeError:
+        return None
+
+
+def to_bool(data):
+    """
+    Convert a boolean or a string holding a boolean literal to a bool.
+
+    :param data: user supplied input.
+    :type data: mixed.
+
+    :return: Boolean or None
+    :rtype: bool
+    """
+    if isinstance(data, bool):
+        return data
+
+    if not isinstance(data, str):
+        return None
+
+    try:
+        decoded = json.loads(data.lower())
+    except ValueError:
+        return None
+
+    return decoded if isinstance(decoded, bool) else None
+
+
+def to_semver(data):
+    """
+    Convert input to a semantic version.
+
+    :param data: user supplied input.
+    :type data: mixed.
+
+    :return: Semver or None
+    :rtype: splitio.models.grammar.matchers.utils.utils.Semver
+    """
+    data = to_string(data)
+    return build_semver_or_none(data) if data is not None else None
+
+
+class AttributesView(Mapping):
+    """
+    Read-only view over the attributes supplied on a single evaluation call.
+
+    Flags and conditions often target the same attributes, so typed conversions are memoized
+    beside the caller's dict (which is not copied) and each warning about a type is logged once
+    per call instead of once per matcher.
+    """
+
+    __slots__ = ('_attributes', '_converted')
+
+    def __init__(self, attributes):
+        """
+        Class constructor.
+
+        :param attributes: user supplied attributes.
+        :type attributes: dict
+        """
+        self._attributes = attributes
+        self._converted = {}
+
+    @classmethod
+    def wrap(cls, attributes):
+        """
+        Return a view over the attributes, reusing it when they are already wrapped.
+
+        :param attributes: user supplied attributes.
+        :type attributes: dict
+
+        :return: View or None if there are no attributes.
+        :rtype: AttributesView
+        """
+        if attributes is None or isinstance(attributes, cls):
+            return attributes
+
+        return cls(attributes)
+
+    def __getitem__(self, name):
+        """Return the raw attribute."""
+        return self._attributes[name]
+
+    def __iter__(self):
+        """Iterate over the attribute names."""
+        return iter(self._attributes)
+
+    def __len__(self):
+        """Return the number of attributes."""
+        return len(self._attributes)
+
+    def get(self, name, default=None):
+        """Return the raw attribute, or a default if missing."""
+        return self._attributes.get(name, default)
+
+    def get_as(self, name, conversion):
+        """
+        Return an attribute converted by a function, running the conversion only once.
+
+        :param name: attribute name.
+        :type name: str
+        :param conversion: function converting the raw value, returning None if it can't.
+        :type conversion: callable
+
+        :return: Converted value or None if missing or not convertible.
+        :rtype: mixed
+        """
+        memo_key = (name, conversion)
+        value = self._converted.get(memo_key, _MISSING)
+        if value is _MISSING:
+            value = self._converted[memo_key] = conversion(self._attributes.get(name))
+
+        return value
@@ -0,0 +1,161 @@
+"""
+Regular expressions shared by matchers.
+
+Patterns are compiled once per process and reused by every flag using them. When the optional
+RE2 bindings are installed, patterns are compiled with its linear time engine, falling back to
+the standard library for the ones it does not support. Backtracking patterns get a CPU time
+budget: once searches with one exceed it several times within a short window, the pattern stops
+matching for a cool-down period, or until a flag using it is parsed again.
+"""
+import logging
+import re
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+
+try:
+    import re2
+except ImportError:
+    re2 = None  # pylint: disable=invalid-name
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_REGEX_CACHE_SIZE = 512
+_SEARCH_BUDGET_SECONDS = 0.1
+_MAX_BUDGET_STRIKES = 3
+_STRIKE_WINDOW_SECONDS = 60
+_COOLDOWN_SECONDS = 600
+
+ENGINE = 're2' if re2 is not None else 're'
+
+_exhausted_lock = threading.Lock()
+_exhausted_count = 0
+
+
+class CompiledRegex(object):
+    """Compiled pattern keeping track of how long searches with it take."""
+
+    __slots__ = ('_pattern', '_regex', '_linear', '_strikes', '_disabled_until')
+
+    def __init__(self, pattern, regex, linear):
+        """
+        Class constructor.
+
+        :param pattern: Source pattern.
+        :type pattern: str
+        :param regex: Compiled pattern.
+        :type regex: re.Pattern
+        :param linear: Whether the pattern runs on a linear time engine.
+        :type linear: bool
+        """
+        self._pattern = pattern
+        self._regex = regex
+        self._linear = linear
+        self._strikes = deque(maxlen=_MAX_BUDGET_STRIKES)
+        self._disabled_until = None
+
+    @property
+    def pattern(self):
+        """Return the source pattern."""
+        return self._pattern
+
+    @property
+    def linear(self):
+        """Return whether the pattern runs on a linear time engine."""
+        return self._linear
+
+    @property
+    def exhausted(self):
+        """Return whether the pattern ran out of budget and doesn't match until its cool-down ends."""
+        disabled_until = self._disabled_until
+        return disabled_until is not None and time.monotonic() < disabled_until
+
+    def search(self, value, owner=None):
+        """
+        Return whether the pattern is found anywhere in the value.
+
+        :param value: String to search.
+        :type value: str
+        :param owner: Name of the feature flag being evaluated, reported if the budget runs out.
+        :type owner: str
+
+        :returns: True if found. Always False while the pattern is out of budget.
+        :rtype: bool
+        """
+        if self._disabled_until is not None:
+            if time.monotonic() < self._disabled_until:
+                return False
+            self.reset()
+
+        if self._linear:
+            return self._regex.search(value) is not None
+
+        # CPU time of this thread, so waiting on the GIL or being preempted doesn't count.
+        started = time.thread_time()
+        found = self._regex.search(value) is not None
+        if time.thread_time() - started > _SEARCH_BUDGET_SECONDS:
+            self._strike(owner)
+
+        return found
+
+    def reset(self):
+        """Forget previous searches over budget, matching again if the pattern was disabled."""
+        with _exhausted_lock:
+            self._strikes.clear()
+            self._disabled_until = None
+
+    def _strike(self, owner):
+        """Record a search over budget, disabling the pattern after too many of them in a row."""
+        global _exhausted_count  # pylint: disable=global-statement
+        now = time.monotonic()
+        with _exhausted_lock:
+            if self._disabled_until is not None:
+                return
+
+            self._strikes.append(now)
+            if len(self._strikes) < _MAX_BUDGET_STRIKES or now - self._strikes[0] > _STRIKE_WINDOW_SECONDS:
+                return
+
+            self._strikes.clear()
+            self._disabled_until = now + _COOLDOWN_SECONDS
+            _exhausted_count += 1
+
+        _LOGGER.warning('Regex %s used by feature flag %s exceeded its time budget %d times within %d seconds '
+                        'and will not match for the next %d seconds. Consider simplifying it.',
+                        self._pattern, owner, _MAX_BUDGET_STRIKES, _STRIKE_WINDOW_SECONDS, _COOLDOWN_SECONDS)
+
+
+@lru_cache(maxsize=_REGEX_CACHE_SIZE)
+def compile_regex(pattern):
+    """
+    Compile a pattern, reusing the result across every matcher built with it.
+
+    :param pattern: Regular expression.
+    :type pattern: str
+
+    :returns: Compiled pattern.
+    :rtype: CompiledRegex
+    """
+    if re2 is not None:
+        try:
+            return CompiledRegex(pattern, re2.compile(pattern), True)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.debug('Regex %s is not supported by re2, using the re module instead.', pattern)
+
+    return CompiledRegex(pattern, re.compile(pattern), False)
+
+
+def pop_exhausted_count():
+    """
+    Return how many patterns ran out of budget since the last call and reset the count.
+
+    :rtype: int
+    """
+    global _exhausted_count  # pylint: disable=global-statement
+    with _exhausted_lock:
+        count = _exhausted_count
+        _exhausted_count = 0
+
+    return count
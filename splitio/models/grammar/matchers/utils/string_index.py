@@ -0,0 +1,141 @@
+"""Indexes answering prefix, suffix and substring queries against a list of patterns."""
+from collections import deque
+
+
+_LINEAR_SCAN_MAX_PATTERNS = 16
+
+
+class AffixIndex(object):
+    """
+    Index telling whether a string starts (or ends) with any of a set of patterns.
+
+    Patterns are kept in a single hash set along with their distinct lengths, so a lookup slices
+    the input once per distinct length no longer than it. That bounds the cost by the input length
+    regardless of how many patterns there are, without the memory of a per character trie.
+    """
+
+    __slots__ = ('_patterns', '_lengths', '_has_empty', '_suffix')
+
+    def __init__(self, patterns, suffix=False):
+        """
+        Class constructor.
+
+        :param patterns: Prefixes (or suffixes) to look for.
+        :type patterns: iterable(str)
+        :param suffix: Whether to match the end of the input instead of its start.
+        :type suffix: bool
+        """
+        self._patterns = frozenset(patterns)
+        self._lengths = tuple(sorted(set(len(pattern) for pattern in self._patterns) - {0}))
+        self._has_empty = '' in self._patterns
+        self._suffix = suffix
+
+    def matches(self, value):
+        """
+        Return whether the value starts (or ends) with any of the patterns.
+
+        :param value: String to check.
+        :type value: str
+
+        :returns: True if any pattern matches.
+        :rtype: bool
+        """
+        if self._has_empty:
+            return True
+
+        patterns = self._patterns
+        size = len(value)
+        for length in self._lengths:
+            if length > size:
+                return False
+
+            if (value[size - length:] if self._suffix else value[:length]) in patterns:
+                return True
+
+        return False
+
+
+class SubstringIndex(object):
+    """
+    Index telling whether a string contains any of a set of patterns.
+
+    Small pattern lists are scanned directly. Bigger ones are compiled into an Aho-Corasick
+    automaton, which finds a match in a single pass over the input.
+    """
+
+    __slots__ = ('_patterns', '_goto', '_fail', '_output')
+
+    def __init__(self, patterns):
+        """
+        Class constructor.
+
+        :param patterns: Substrings to look for.
+        :type patterns: iterable(str)
+        """
+        self._patterns = tuple(frozenset(patterns))
+        self._goto = None
+        self._fail = None
+        self._output = None
+        if len(self._patterns) > _LINEAR_SCAN_MAX_PATTERNS:
+            self._compile()
+
+    def _compile(self):
+        """Build the automaton transitions, failure links and accepting states."""
+        goto = [{}]
+        output = [False]
+        for pattern in self._patterns:
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    output.append(False)
+                state = next_state
+            output[state] = True
+
+        fail = [0] * len(goto)
+        pending = deque(goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for char, next_state in goto[state].items():
+                pending.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0) if state else 0
+                output[next_state] = output[next_state] or output[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+
+    def matches(self, value):
+        """
+        Return whether the value contains any of the patterns.
+
+        :param value: String to check.
+        :type value: str
+
+        :returns: True if any pattern is found.
+        :rtype: bool
+        """
+        if self._goto is None:
+            return any(pattern in value for pattern in self._patterns)
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        if output[0]:
+            return True
+
+        state = 0
+        for char in value:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                return True
+
+        return False
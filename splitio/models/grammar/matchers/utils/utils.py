@@ -1,12 +1,14 @@
 """Utils module."""
 
 import logging
+from functools import lru_cache
 
 _LOGGER = logging.getLogger(__name__)
 
 M_DELIMITER = "+"
 P_DELIMITER = "-"
 V_DELIMITER = "."
+_SEMVER_CACHE_SIZE = 1024
     
 
 def compare(var1, var2):
@@ -31,7 +33,20 @@ def compare(var1, var2):
     return -1
 
 
+@lru_cache(maxsize=_SEMVER_CACHE_SIZE)
 def build_semver_or_none(version):
+    """
+    Parse a version, reusing the instance built for recently seen ones.
+
+    Semver instances are never modified once built, so the same attribute checked by many
+    matchers (or evaluations) is only parsed once while it stays in the cache.
+
+    :param version: raw version.
+    :type version: str
+
+    :returns: parsed version or None if it's not a valid one.
+    :rtype: Semver
+    """
     try:
         return Semver(version)
     except (RuntimeError, ValueError):
@@ -42,6 +57,8 @@ def build_semver_or_none(version):
 class Semver(object):
     """Semver class."""
 
+    __slots__ = ('_major', '_minor', '_patch', '_pre_release', '_is_stable', '_version', '_metadata', '_key')
+
     def __init__(self, version):
         """
         Class Initializer
@@ -57,6 +74,7 @@ class Semver(object):
         self._version = ""
         self._metadata = ""
         self._parse(version)
+        self._key = (self._major, self._minor, self._patch, self._is_stable)
 
     def _parse(self, version):
         """
@@ -132,26 +150,12 @@ class Semver(object):
         :returns: integer based on comparison
         :rtype: int
         """
-        if self.version == to_compare.version:
+        if self._version == to_compare._version:
             return 0
 
-        # Compare major, minor, and patch versions numerically
-        result = compare(self._major, to_compare._major)
-        if result != 0:
-            return result
-
-        result = compare(self._minor, to_compare._minor)
-        if result != 0:
-            return result
-
-        result = compare(self._patch, to_compare._patch)
-        if result != 0:
-            return result
-
-        if not self._is_stable and to_compare._is_stable:
-            return -1
-        elif self._is_stable and not to_compare._is_stable:
-            return 1
+        # Compare major, minor and patch numerically, then stable versions above pre-releases
+        if self._key != to_compare._key:
+            return 1 if self._key > to_compare._key else -1
 
         # Compare pre-release versions lexically
         min_length = min(len(self._pre_release), len(to_compare._pre_release))
@@ -1,9 +1,12 @@
 """Split partition module."""
+from splitio.models import intern_name
 
 
 class Partition(object):
     """Partition object class."""
 
+    __slots__ = ('_treatment', '_size')
+
     def __init__(self, treatment, size):
         """
         Class constructor.
@@ -16,7 +19,7 @@ class Partition(object):
         if size < 0 or size > 100:
             raise ValueError('size MUST BE between 0 and 100')
 
-        self._treatment = treatment
+        self._treatment = intern_name(treatment)
         self._size = size
 
     @property
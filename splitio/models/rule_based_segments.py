@@ -3,7 +3,7 @@
 from enum import Enum
 import logging
 
-from splitio.models import MatcherNotFoundException
+from splitio.models import MatcherNotFoundException, intern_name
 from splitio.models.splits import _DEFAULT_CONDITIONS_TEMPLATE
 from splitio.models.grammar import condition
 from splitio.models.splits import Status
@@ -19,6 +19,8 @@ class SegmentType(Enum):
 class RuleBasedSegment(object):
     """RuleBasedSegment object class."""
 
+    __slots__ = ('_name', '_traffic_type_name', '_change_number', '_conditions', '_excluded', '_status')
+
     def __init__(self, name, traffic_type_name, change_number, status, conditions, excluded):
         """
         Class constructor.
@@ -36,8 +38,8 @@ class RuleBasedSegment(object):
         :param excluded: excluded objects.
         :type excluded: Excluded
         """
-        self._name = name
-        self._traffic_type_name = traffic_type_name
+        self._name = intern_name(name)
+        self._traffic_type_name = intern_name(traffic_type_name)
         self._change_number = change_number
         self._conditions = conditions
         self._excluded = excluded
@@ -88,12 +90,7 @@ class RuleBasedSegment(object):
         }
         
     def get_condition_segment_names(self):
-        segments = set()
-        for condition in self._conditions:
-            for matcher in condition.matchers:
-                if matcher._matcher_type == 'IN_SEGMENT':
-                    segments.add(matcher.to_json()['userDefinedSegmentMatcherData']['segmentName'])
-        return segments
+        return set(name for condition in self._conditions for name in condition.get_segment_names())
         
 def from_raw(raw_rule_based_segment):
     """
@@ -106,7 +103,7 @@ def from_raw(raw_rule_based_segment):
     :rtype: RuleBasedSegment
     """
     try:
-        conditions = [condition.from_raw(c) for c in raw_rule_based_segment['conditions']]
+        conditions = [condition.PARSED_CONDITIONS.from_raw(c) for c in raw_rule_based_segment['conditions']]
     except MatcherNotFoundException as e:
         _LOGGER.error(str(e))
         _LOGGER.debug("Using default conditions template for feature flag: %s", raw_rule_based_segment['name'])
@@ -131,7 +128,9 @@ def from_raw(raw_rule_based_segment):
     )
 
 class Excluded(object):
-    
+
+    __slots__ = ('_keys', '_keys_set', '_segments', '_standard_segments', '_has_rule_based_segments')
+
     def __init__(self, keys, segments):
         """
         Class constructor.
@@ -142,33 +141,57 @@ class Excluded(object):
         :type segments: List
         """
         self._keys = keys
+        self._keys_set = frozenset(keys)
         self._segments = [ExcludedSegment(segment['name'], segment['type']) for segment in segments]
+        self._standard_segments = tuple(segment.name for segment in self._segments
+                                        if segment.type == SegmentType.STANDARD)
+        self._has_rule_based_segments = len(self._standard_segments) < len(self._segments)
 
     def get_excluded_keys(self):
         """Return excluded keys."""        
         return self._keys
 
+    def is_excluded_key(self, key):
+        """
+        Return whether a key is explicitly excluded.
+
+        :param key: key to check.
+        :type key: str
+
+        :returns: True if the key is excluded.
+        :rtype: bool
+        """
+        return key in self._keys_set
+
     def get_excluded_segments(self):
         """Return excluded segments"""
         return self._segments
 
     def get_excluded_standard_segments(self):
         """Return excluded segments"""
-        to_return = []
-        for segment in self._segments:
-            if segment.type == SegmentType.STANDARD:
-                to_return.append(segment.name)
-        return to_return
+        return list(self._standard_segments)
+
+    @property
+    def standard_segments(self):
+        """Return the names of the excluded standard segments."""
+        return self._standard_segments
+
+    @property
+    def has_rule_based_segments(self):
+        """Return whether any excluded segment is a rule based one."""
+        return self._has_rule_based_segments
 
     def to_json(self):
         """Return a JSON representation of this object."""
         return {
             'keys': self._keys,
-            'segments': self._segments
+            'segments': [segment.to_json() for segment in self._segments]
         }
 
 class ExcludedSegment(object):
-    
+
+    __slots__ = ('_name', '_type')
+
     def __init__(self, name, type):
         """
         Class constructor.
@@ -178,7 +201,7 @@ class ExcludedSegment(object):
         :param type: segment type 
         :type type: str
         """
-        self._name = name
+        self._name = intern_name(name)
         try:
             self._type = SegmentType(type)
         except ValueError:
@@ -193,3 +216,10 @@ class ExcludedSegment(object):
     def type(self):
         """Return type."""
         return self._type
+
+    def to_json(self):
+        """Return a JSON representation of this object."""
+        return {
+            'name': self._name,
+            'type': self._type.value
+        }
@@ -3,7 +3,7 @@ from enum import Enum
 from collections import namedtuple
 import logging
 
-from splitio.models import MatcherNotFoundException
+from splitio.models import MatcherNotFoundException, intern_name
 from splitio.models.grammar import condition
 
 _LOGGER = logging.getLogger(__name__)
@@ -42,9 +42,12 @@ _DEFAULT_CONDITIONS_TEMPLATE =   {
 
 class Prerequisites(object):
     """Prerequisites."""
+
+    __slots__ = ('_feature_flag_name', '_treatments')
+
     def __init__(self, feature_flag_name, treatments):
-        self._feature_flag_name = feature_flag_name
-        self._treatments = treatments
+        self._feature_flag_name = intern_name(feature_flag_name)
+        self._treatments = [intern_name(treatment) for treatment in treatments]
     
     @property
     def feature_flag_name(self):
@@ -80,6 +83,12 @@ class HashAlgorithm(Enum):
 class Split(object):  # pylint: disable=too-many-instance-attributes
     """Split model object."""
 
+    __slots__ = ('_name', '_seed', '_killed', '_default_treatment', '_traffic_type_name', '_status',
+                 '_change_number', '_conditions', '_rule_based_segment_names', '_whitelist_index',
+                 '_traffic_allocation',
+                 '_traffic_allocation_seed', '_algo', '_configurations', '_sets',
+                 '_impressions_disabled', '_prerequisites')
+
     def __init__(  # pylint: disable=too-many-arguments
             self,
             name,
@@ -124,11 +133,11 @@ class Split(object):  # pylint: disable=too-many-instance-attributes
         :pram prerequisites: prerequisites
         :type prerequisites: List of Preqreuisites
         """
-        self._name = name
+        self._name = intern_name(name)
         self._seed = seed
         self._killed = killed
-        self._default_treatment = default_treatment
-        self._traffic_type_name = traffic_type_name
+        self._default_treatment = intern_name(default_treatment)
+        self._traffic_type_name = intern_name(traffic_type_name)
         try:
             self._status = Status(status)
         except ValueError:
@@ -136,6 +145,8 @@ class Split(object):  # pylint: disable=too-many-instance-attributes
 
         self._change_number = change_number
         self._conditions = conditions if conditions is not None else []
+        self._rule_based_segment_names = None
+        self._whitelist_index = None
 
         if traffic_allocation is None:
             self._traffic_allocation = 100
@@ -238,6 +249,34 @@ class Split(object):  # pylint: disable=too-many-instance-attributes
         """
         return [name for cond in self.conditions for name in cond.get_segment_names()]
 
+    def get_rule_based_segment_names(self):
+        """
+        Return the names of rule based segments referenced by this split.
+
+        Conditions do not change once parsed, so the names are computed on the first call only.
+
+        :return: Rule based segment names.
+        :rtype: frozenset(string)
+        """
+        if self._rule_based_segment_names is None:
+            self._rule_based_segment_names = frozenset(
+                name for cond in self.conditions for name in cond.get_rule_based_segment_names())
+        return self._rule_based_segment_names
+
+    def get_whitelist_index(self):
+        """
+        Return an index of the keys targeted by the leading key whitelist conditions.
+
+        Indexes are shared by every flag object built from the same parsed conditions, so flags
+        read again from storages that don't keep them in memory don't rebuild it.
+
+        :return: Key to condition position mapping, and the number of conditions indexed.
+        :rtype: tuple(dict, int)
+        """
+        if self._whitelist_index is None:
+            self._whitelist_index = condition.WHITELIST_INDEXES.index_for(self.conditions)
+        return self._whitelist_index
+
     def to_json(self):
         """Return a JSON representation of this split."""
         return {
@@ -287,7 +326,7 @@ class Split(object):  # pylint: disable=too-many-instance-attributes
         :param change_number: change_number
         :type change_number: int
         """
-        self._default_treatment = default_treatment
+        self._default_treatment = intern_name(default_treatment)
         self._change_number = change_number
         self._killed = True
 
@@ -313,7 +352,7 @@ def from_raw(raw_split):
     :rtype: Split
     """
     try:
-        conditions = [condition.from_raw(c) for c in raw_split['conditions']]
+        conditions = [condition.PARSED_CONDITIONS.from_raw(c) for c in raw_split['conditions']]
     except MatcherNotFoundException as e:
         _LOGGER.error(str(e))
         _LOGGER.debug("Using default conditions template for feature flag: %s", raw_split['name'])
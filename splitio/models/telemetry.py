@@ -156,45 +156,131 @@ def get_latency_bucket_index(micros):
 
     return bisect_left(BUCKETS, micros)
 
+_LATENCY_METHODS = (
+    MethodExceptionsAndLatencies.TREATMENT,
+    MethodExceptionsAndLatencies.TREATMENTS,
+    MethodExceptionsAndLatencies.TREATMENT_WITH_CONFIG,
+    MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG,
+    MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SET,
+    MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SETS,
+    MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SET,
+    MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SETS,
+    MethodExceptionsAndLatencies.TRACK,
+)
+
+_LATENCY_OFFSETS = {method: ordinal * MAX_LATENCY_BUCKET_COUNT for ordinal, method in enumerate(_LATENCY_METHODS)}
+
+_MIN_HISTOGRAMS_BEFORE_FOLDING = 64
+
+def _new_method_histogram():
+    """
+    Build an empty method latencies histogram.
+
+    Buckets are laid out flat, one run of MAX_LATENCY_BUCKET_COUNT counters per method in
+    _LATENCY_METHODS order.
+
+    :rtype: list(int)
+    """
+    return [0] * (len(_LATENCY_METHODS) * MAX_LATENCY_BUCKET_COUNT)
+
+def _method_histogram_to_dict(histogram):
+    """
+    Format a method latencies histogram as expected by the telemetry payload.
+
+    :param histogram: Flat histogram.
+    :type histogram: list(int)
+
+    :return: Dictonary of latencies
+    :rtype: dict
+    """
+    return {MethodExceptionsAndLatencies.METHOD_LATENCIES.value: {
+        method.value: histogram[offset:offset + MAX_LATENCY_BUCKET_COUNT]
+        for method, offset in _LATENCY_OFFSETS.items()
+    }}
+
 class MethodLatenciesBase(object, metaclass=abc.ABCMeta):
     """
     Method Latency base class
 
     """
-    def _reset_all(self):
-        """Reset variables"""
-        self._treatment = [0] * MAX_LATENCY_BUCKET_COUNT
-        self._treatments = [0] * MAX_LATENCY_BUCKET_COUNT
-        self._treatment_with_config = [0] * MAX_LATENCY_BUCKET_COUNT
-        self._treatments_with_config = [0] * MAX_LATENCY_BUCKET_COUNT
-        self._treatments_by_flag_set = [0] * MAX_LATENCY_BUCKET_COUNT
-        self._treatments_by_flag_sets = [0] * MAX_LATENCY_BUCKET_COUNT
-        self._treatments_with_config_by_flag_set = [0] * MAX_LATENCY_BUCKET_COUNT
-        self._treatments_with_config_by_flag_sets = [0] * MAX_LATENCY_BUCKET_COUNT
-        self._track = [0] * MAX_LATENCY_BUCKET_COUNT
-
     @abc.abstractmethod
     def add_latency(self, method, latency):
         """
         Add Latency method
         """
 
+    @abc.abstractmethod
+    def add_bucket(self, method, bucket):
+        """
+        Add an already bucketed latency
+        """
+
     @abc.abstractmethod
     def pop_all(self):
         """
         Pop all latencies
         """
 
+class _ThreadMethodHistogram(object):
+    """Method latencies recorded by a single thread."""
+
+    __slots__ = ('counts', 'reported', 'thread')
+
+    def __init__(self):
+        """Constructor"""
+        self.counts = _new_method_histogram()
+        self.reported = _new_method_histogram()
+        self.thread = threading.current_thread()
+
 class MethodLatencies(MethodLatenciesBase):
     """
     Method Latency class
 
+    Every thread counts on a histogram of its own, so recording a latency takes no lock. Only its
+    owner ever writes to a histogram: pop_all reads them all and keeps track of what it already
+    reported, returning the difference, so no count recorded concurrently gets lost. Servers
+    spawning a thread per request would pile up histograms between pops, so once there are too
+    many, those of finished threads are folded into a shared one as new threads register.
     """
     def __init__(self):
         """Constructor"""
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._histograms = []
+        self._folded = _new_method_histogram()
+        self._fold_at = _MIN_HISTOGRAMS_BEFORE_FOLDING
+
+    def _register_thread(self):
+        """
+        Create the histogram of the calling thread.
+
+        :return: Counters of the new histogram
+        :rtype: list(int)
+        """
+        histogram = _ThreadMethodHistogram()
         with self._lock:
-            self._reset_all()
+            if len(self._histograms) >= self._fold_at:
+                self._fold_finished()
+            self._histograms.append(histogram)
+        self._local.counts = histogram.counts
+        return histogram.counts
+
+    def _fold_finished(self):
+        """Move unreported counts of finished threads into the shared histogram. Called with the lock held."""
+        folded = self._folded
+        alive = []
+        for histogram in self._histograms:
+            if histogram.thread.is_alive():
+                alive.append(histogram)
+                continue
+
+            reported = histogram.reported
+            for index, count in enumerate(histogram.counts):
+                if count != reported[index]:
+                    folded[index] += count - reported[index]
+        self._histograms = alive
+        # scan again only after as many new threads as live ones, so registering stays cheap.
+        self._fold_at = max(_MIN_HISTOGRAMS_BEFORE_FOLDING, 2 * len(alive))
 
     def add_latency(self, method, latency):
         """
@@ -205,64 +291,65 @@ class MethodLatencies(MethodLatenciesBase):
         :param latency: amount of latency in microseconds
         :type latency: int
         """
-        latency_bucket = get_latency_bucket_index(latency)
-        with self._lock:
-            if method == MethodExceptionsAndLatencies.TREATMENT:
-                self._treatment[latency_bucket] += 1
-            elif method == MethodExceptionsAndLatencies.TREATMENTS:
-                self._treatments[latency_bucket] += 1
-            elif method == MethodExceptionsAndLatencies.TREATMENT_WITH_CONFIG:
-                self._treatment_with_config[latency_bucket] += 1
-            elif method == MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG:
-                self._treatments_with_config[latency_bucket] += 1
-            elif method == MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SET:
-                self._treatments_by_flag_set[latency_bucket] += 1
-            elif method == MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SETS:
-                self._treatments_by_flag_sets[latency_bucket] += 1
-            elif method == MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SET:
-                self._treatments_with_config_by_flag_set[latency_bucket] += 1
-            elif method == MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SETS:
-                self._treatments_with_config_by_flag_sets[latency_bucket] += 1
-            elif method == MethodExceptionsAndLatencies.TRACK:
-                self._track[latency_bucket] += 1
-            else:
-                return
+        self.add_bucket(method, get_latency_bucket_index(latency))
+
+    def add_bucket(self, method, bucket):
+        """
+        Add an already bucketed latency
+
+        :param method: passed method name
+        :type method: str
+        :param bucket: latency bucket index, as returned by get_latency_bucket_index
+        :type bucket: int
+        """
+        offset = _LATENCY_OFFSETS.get(method)
+        if offset is None:
+            return
+
+        try:
+            counts = self._local.counts
+        except AttributeError:
+            counts = self._register_thread()
+        counts[offset + bucket] += 1
 
     def pop_all(self):
         """
         Pop all latencies
 
+        Histograms of finished threads are dropped once their last counts are reported.
+
         :return: Dictonary of latencies
         :rtype: dict
         """
         with self._lock:
-            latencies = {MethodExceptionsAndLatencies.METHOD_LATENCIES.value: {
-                MethodExceptionsAndLatencies.TREATMENT.value: self._treatment,
-                MethodExceptionsAndLatencies.TREATMENTS.value: self._treatments,
-                MethodExceptionsAndLatencies.TREATMENT_WITH_CONFIG.value: self._treatment_with_config,
-                MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG.value: self._treatments_with_config,
-                MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SET.value: self._treatments_by_flag_set,
-                MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SETS.value: self._treatments_by_flag_sets,
-                MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SET.value: self._treatments_with_config_by_flag_set,
-                MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SETS.value: self._treatments_with_config_by_flag_sets,
-                MethodExceptionsAndLatencies.TRACK.value: self._track}
-            }
-            self._reset_all()
-            return latencies
+            merged, self._folded = self._folded, _new_method_histogram()
+            alive = []
+            for histogram in self._histograms:
+                finished = not histogram.thread.is_alive()
+                counts, reported = histogram.counts, histogram.reported
+                for index, count in enumerate(counts):
+                    if count != reported[index]:
+                        merged[index] += count - reported[index]
+                        reported[index] = count
+                if not finished:
+                    alive.append(histogram)
+            self._histograms = alive
+            self._fold_at = max(_MIN_HISTOGRAMS_BEFORE_FOLDING, 2 * len(alive))
+
+        return _method_histogram_to_dict(merged)
 
 
 class MethodLatenciesAsync(MethodLatenciesBase):
     """
     Method async Latency class
 
+    Counters are only touched from the event loop and never across an await, so no lock is needed.
     """
     @classmethod
     async def create(cls):
         """Constructor"""
         self = cls()
-        self._lock = asyncio.Lock()
-        async with self._lock:
-            self._reset_all()
+        self._histogram = _new_method_histogram()
         return self
 
     async def add_latency(self, method, latency):
@@ -274,28 +361,20 @@ class MethodLatenciesAsync(MethodLatenciesBase):
         :param latency: amount of latency in microseconds
         :type latency: int
         """
-        latency_bucket = get_latency_bucket_index(latency)
-        async with self._lock:
-            if method == MethodExceptionsAndLatencies.TREATMENT:
-                self._treatment[latency_bucket] += 1
-            elif method == MethodExceptionsAndLatencies.TREATMENTS:
-                self._treatments[latency_bucket] += 1
-            elif method == MethodExceptionsAndLatencies.TREATMENT_WITH_CONFIG:
-                self._treatment_with_config[latency_bucket] += 1
-            elif method == MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG:
-                self._treatments_with_config[latency_bucket] += 1
-            elif method == MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SET:
-                self._treatments_by_flag_set[latency_bucket] += 1
-            elif method == MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SETS:
-                self._treatments_by_flag_sets[latency_bucket] += 1
-            elif method == MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SET:
-                self._treatments_with_config_by_flag_set[latency_bucket] += 1
-            elif method == MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SETS:
-                self._treatments_with_config_by_flag_sets[latency_bucket] += 1
-            elif method == MethodExceptionsAndLatencies.TRACK:
-                self._track[latency_bucket] += 1
-            else:
-                return
+        await self.add_bucket(method, get_latency_bucket_index(latency))
+
+    async def add_bucket(self, method, bucket):
+        """
+        Add an already bucketed latency
+
+        :param method: passed method name
+        :type method: str
+        :param bucket: latency bucket index, as returned by get_latency_bucket_index
+        :type bucket: int
+        """
+        offset = _LATENCY_OFFSETS.get(method)
+        if offset is not None:
+            self._histogram[offset + bucket] += 1
 
     async def pop_all(self):
         """
@@ -304,20 +383,8 @@ class MethodLatenciesAsync(MethodLatenciesBase):
         :return: Dictonary of latencies
         :rtype: dict
         """
-        async with self._lock:
-            latencies = {MethodExceptionsAndLatencies.METHOD_LATENCIES.value: {
-                MethodExceptionsAndLatencies.TREATMENT.value: self._treatment,
-                MethodExceptionsAndLatencies.TREATMENTS.value: self._treatments,
-                MethodExceptionsAndLatencies.TREATMENT_WITH_CONFIG.value: self._treatment_with_config,
-                MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG.value: self._treatments_with_config,
-                MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SET.value: self._treatments_by_flag_set,
-                MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SETS.value: self._treatments_by_flag_sets,
-                MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SET.value: self._treatments_with_config_by_flag_set,
-                MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SETS.value: self._treatments_with_config_by_flag_sets,
-                MethodExceptionsAndLatencies.TRACK.value: self._track}
-            }
-            self._reset_all()
-            return latencies
+        histogram, self._histogram = self._histogram, _new_method_histogram()
+        return _method_histogram_to_dict(histogram)
 
 
 class HTTPLatenciesBase(object, metaclass=abc.ABCMeta):
@@ -26,5 +26,10 @@ except ImportError:
     HTTPKerberosAuth = missing_auth_dependencies
     OPTIONAL = missing_auth_dependencies
 
+try:
+    from orjson import loads as json_loads  # faster drop in decoder, used when installed.
+except ImportError:
+    from json import loads as json_loads
+
 async def _anext(it):
     return await it.__anext__()
@@ -278,7 +278,8 @@ class PushManager(PushManagerBase):  # pylint:disable=too-many-instance-attribut
 class PushManagerAsync(PushManagerBase):  # pylint:disable=too-many-instance-attributes
     """Push notifications susbsytem manager."""
 
-    def __init__(self, auth_api, synchronizer, feedback_loop, sdk_metadata, telemetry_runtime_producer, sse_url=None, client_key=None):
+    def __init__(self, auth_api, synchronizer, feedback_loop, sdk_metadata, telemetry_runtime_producer, sse_url=None, client_key=None,
+                 connector=None):
         """
         Class constructor.
 
@@ -302,6 +303,9 @@ class PushManagerAsync(PushManagerBase):  # pylint:disable=too-many-instance-att
 
         :param client_key: client key.
         :type client_key: str
+
+        :param connector: optional connector shared with the api http client.
+        :type connector: aiohttp.BaseConnector
         """
         self._auth_api = auth_api
         self._feedback_loop = feedback_loop
@@ -319,7 +323,7 @@ class PushManagerAsync(PushManagerBase):  # pylint:disable=too-many-instance-att
         }
 
         kwargs = {} if sse_url is None else {'base_url': sse_url}
-        self._sse_client = SplitSSEClientAsync(sdk_metadata, client_key, **kwargs)
+        self._sse_client = SplitSSEClientAsync(sdk_metadata, client_key, connector=connector, **kwargs)
         self._running = False
         self._telemetry_runtime_producer = telemetry_runtime_producer
         self._token_task = None
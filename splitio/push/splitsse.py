@@ -178,7 +178,7 @@ class SplitSSEClient(SplitSSEClientBase):  # pylint: disable=too-many-instance-a
 class SplitSSEClientAsync(SplitSSEClientBase):  # pylint: disable=too-many-instance-attributes
     """Split streaming endpoint SSE client."""
 
-    def __init__(self, sdk_metadata, client_key=None, base_url='https://streaming.split.io'):
+    def __init__(self, sdk_metadata, client_key=None, base_url='https://streaming.split.io', connector=None):
         """
         Construct a split sse client.
 
@@ -190,11 +190,14 @@ class SplitSSEClientAsync(SplitSSEClientBase):  # pylint: disable=too-many-insta
 
         :param base_url: scheme + :// + host
         :type base_url: str
+
+        :param connector: optional connector shared with the api http client.
+        :type connector: aiohttp.BaseConnector
         """
         SplitSSEClientBase.__init__(self, base_url)
         self.status = SplitSSEClient._Status.IDLE
         self._metadata = headers_from_metadata(sdk_metadata, client_key)
-        self._client = SSEClientAsync(self.KEEPALIVE_TIMEOUT)
+        self._client = SSEClientAsync(self.KEEPALIVE_TIMEOUT, connector)
         self._event_source = None
         self._event_source_ended = asyncio.Event()
 
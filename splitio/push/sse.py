@@ -12,40 +12,103 @@ _LOGGER = logging.getLogger(__name__)
 SSE_EVENT_ERROR = 'error'
 SSE_EVENT_MESSAGE = 'message'
 _DEFAULT_HEADERS = {'accept': 'text/event-stream'}
-_EVENT_SEPARATORS = set([b'\n', b'\r\n'])
 _DEFAULT_SOCKET_READ_TIMEOUT = 70
+_READ_CHUNK_SIZE = 64 * 1024
 
 SSEEvent = namedtuple('SSEEvent', ['event_id', 'event', 'retry', 'data'])
 
 
-__ENDING_CHARS = set(['\n', ''])
+class EventParser(object):
+    """
+    Incremental event stream parser.
 
-class EventBuilder(object):
-    """Event builder class."""
+    Chunks read from the connection are appended to a buffer which is scanned in place for
+    complete lines, keeping partial lines until the rest arrives. Field values are kept as raw
+    bytes and only decoded when the event is dispatched.
+    """
 
-    _SEPARATOR = b':'
+    _FIELDS = frozenset([b'id', b'event', b'retry', b'data'])
+    _LF = 0x0a
+    _CR = 0x0d
+    _COLON = 0x3a
 
     def __init__(self):
-        """Construct a builder."""
-        self._lines = {}
+        """Construct a parser."""
+        self._buffer = bytearray()
+        self._fields = {}
 
-    def process_line(self, line):
+    def feed(self, chunk):
         """
-        Process a new line.
+        Process a new chunk of the stream.
+
+        :param chunk: Data read from the connection
+        :type chunk: bytes
 
-        :param line: Line to process
-        :type line: bytes
+        :returns: Events completed by this chunk, in order.
+        :rtype: list(SSEEvent)
         """
-        try:
-            key, val = line.split(self._SEPARATOR, 1)
-            self._lines[key.decode('utf8').strip()] = val.decode('utf8').strip()
-        except ValueError:  # key without a value
-            self._lines[line.decode('utf8').strip()] = None
+        buffer = self._buffer
+        buffer.extend(chunk)
+        events = []
+        start = 0
+        with memoryview(buffer) as view:
+            while True:
+                end = buffer.find(self._LF, start)
+                if end < 0:
+                    break
+
+                line_end = end - 1 if end > start and buffer[end - 1] == self._CR else end
+                if line_end == start:  # empty line, dispatch
+                    events.append(self._build())
+                elif buffer[start] != self._COLON:  # lines starting with a colon are comments
+                    self._process_field(buffer, view, start, line_end)
+                start = end + 1
+
+        if start:
+            del buffer[:start]
+        return events
+
+    def _process_field(self, buffer, view, start, end):
+        """
+        Store the raw value of a field line if it's one of the relevant ones.
+
+        :param buffer: Buffer holding the line
+        :type buffer: bytearray
+        :param view: View over the buffer
+        :type view: memoryview
+        :param start: Index where the line starts
+        :type start: int
+        :param end: Index where the line ends, excluding line terminators
+        :type end: int
+        """
+        colon = buffer.find(self._COLON, start, end)
+        if colon < 0:  # key without a value
+            key, value = bytes(view[start:end]).strip(), None
+        else:
+            key, value = bytes(view[start:colon]).strip(), bytes(view[colon + 1:end])
+
+        if key in self._FIELDS:
+            self._fields[key] = value
+
+    def _build(self):
+        """Construct an event with the fields seen since the last dispatch."""
+        fields, self._fields = self._fields, {}
+        return SSEEvent(_decode(fields.get(b'id')), _decode(fields.get(b'event')),
+                        _decode(fields.get(b'retry')), _decode(fields.get(b'data')))
+
+
+def _decode(value):
+    """
+    Decode a raw field value.
+
+    :param value: Raw value
+    :type value: bytes
+
+    :returns: Decoded and stripped value, or None if the field had no value.
+    :rtype: str
+    """
+    return value.decode('utf8').strip() if value is not None else None
 
-    def build(self):
-        """Construct an event with relevant fields."""
-        return SSEEvent(self._lines.get('id'), self._lines.get('event'),
-                        self._lines.get('retry'), self._lines.get('data'))
 
 class SSEClient(object):
     """SSE Client implementation."""
@@ -70,21 +133,15 @@ class SSEClient(object):
         """
         try:
             response = self._conn.getresponse()
-            event_builder = EventBuilder()
+            parser = EventParser()
             while True:
-                line = response.readline()
-                if line is None or len(line) <= 0:  # connection ended
+                chunk = response.read1(_READ_CHUNK_SIZE)
+                if not chunk:  # connection ended
                     break
-                elif line.startswith(b':'):  # comment. Skip
-                    _LOGGER.debug("skipping sse comment")
-                    continue
-                elif line in _EVENT_SEPARATORS:
-                    event = event_builder.build()
+
+                for event in parser.feed(chunk):
                     _LOGGER.debug("dispatching event: %s", event)
                     self._event_callback(event)
-                    event_builder = EventBuilder()
-                else:
-                    event_builder.process_line(line)
         except Exception:  # pylint:disable=broad-except
             _LOGGER.debug('sse connection ended.')
             _LOGGER.debug('stack trace: ', exc_info=True)
@@ -139,7 +196,7 @@ class SSEClient(object):
 class SSEClientAsync(object):
     """SSE Client implementation."""
 
-    def __init__(self, socket_read_timeout=_DEFAULT_SOCKET_READ_TIMEOUT):
+    def __init__(self, socket_read_timeout=_DEFAULT_SOCKET_READ_TIMEOUT, connector=None):
         """
         Construct an SSE client.
 
@@ -151,12 +208,16 @@ class SSEClientAsync(object):
 
         :param timeout: connection & read timeout
         :type timeout: float
+
+        :param connector: optional connector shared with other sessions, which remain its owners.
+        :type connector: aiohttp.BaseConnector
         """
         self._socket_read_timeout = socket_read_timeout + socket_read_timeout * .3
         self._response = None
         self._done = asyncio.Event()
         client_timeout = aiohttp.ClientTimeout(total=0, sock_read=self._socket_read_timeout)
-        self._sess = aiohttp.ClientSession(timeout=client_timeout)
+        self._sess = aiohttp.ClientSession(timeout=client_timeout, connector=connector,
+                                           connector_owner=connector is None)
 
     async def start(self, url, extra_headers=None):  # pylint:disable=protected-access
         """
@@ -173,17 +234,11 @@ class SSEClientAsync(object):
         try:
             async with self._sess.get(url, headers=get_headers(extra_headers)) as response:
                 self._response = response
-                event_builder = EventBuilder()
-                async for line in response.content:
-                    if line.startswith(b':'):
-                        _LOGGER.debug("skipping emtpy line / comment")
-                        continue
-                    elif line in _EVENT_SEPARATORS:
-                        _LOGGER.debug("dispatching event: %s", event_builder.build())
-                        yield event_builder.build()
-                        event_builder = EventBuilder()
-                    else:
-                        event_builder.process_line(line)
+                parser = EventParser()
+                async for chunk in response.content.iter_any():
+                    for event in parser.feed(chunk):
+                        _LOGGER.debug("dispatching event: %s", event)
+                        yield event
 
         except Exception as exc:  # pylint:disable=broad-except
             if self._is_conn_closed_error(exc):
@@ -2,10 +2,12 @@
 import logging
 import threading
 import abc
+import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import gzip
 import zlib
 import base64
-import json
 from enum import Enum
 
 from splitio.models.splits import from_raw
@@ -13,11 +15,14 @@ from splitio.models.rule_based_segments import from_raw as rbs_from_raw
 from splitio.models.telemetry import UpdateFromSSE
 from splitio.push import SplitStorageException
 from splitio.push.parser import UpdateType
-from splitio.optional.loaders import asyncio
+from splitio.optional.loaders import asyncio, json_loads
 from splitio.util.storage_helper import update_feature_flag_storage, update_feature_flag_storage_async, \
     update_rule_based_segment_storage, update_rule_based_segment_storage_async
 
 _LOGGER = logging.getLogger(__name__)
+_MAX_PARALLEL_SEGMENTS = 5
+_IFF_GAP_TIMEOUT = 0.05  # seconds to wait for a missing inline update before fetching
+_MAX_BUFFERED_IFF = 100
 
 class CompressionMode(Enum):
     """Compression modes """
@@ -54,21 +59,140 @@ class WorkerBase(object, metaclass=abc.ABCMeta):
         cm = CompressionMode(event.compression) # will throw if the number is not defined in compression mode
         return _compression_handlers[cm](event)
     
+    @staticmethod
+    def _coalesce_segment_updates(events):
+        """
+        Keep the highest change number received for each segment.
+
+        :param events: Segment change notifications, in arrival order.
+        :type events: list(splitio.models.notification.SegmentChangeNotification)
+
+        :return: Change number to fetch up to, by segment name.
+        :rtype: dict
+        """
+        pending = {}
+        for event in events:
+            _LOGGER.debug('Processing segment_update: %s, change_number: %d',
+                          event.segment_name, event.change_number)
+            pending[event.segment_name] = max(event.change_number, pending.get(event.segment_name, event.change_number))
+        return pending
+
     def _get_referenced_rbs(self, feature_flag):
-        referenced_rbs = set()
-        for condition in feature_flag.conditions:
-            for matcher in condition.matchers:
-                raw_matcher = matcher.to_json()
-                if raw_matcher['matcherType'] == 'IN_RULE_BASED_SEGMENT':
-                    referenced_rbs.add(raw_matcher['userDefinedSegmentMatcherData']['segmentName'])
-        return referenced_rbs
+        return set(feature_flag.get_rule_based_segment_names())
+
+    @staticmethod
+    def _check_update_type(till, rbs_till, event):
+        if event.update_type == UpdateType.SPLIT_UPDATE:
+            till = event.change_number if till is None else max(till, event.change_number)
+        else:
+            rbs_till = event.change_number if rbs_till is None else max(rbs_till, event.change_number)
+
+        return till, rbs_till
+
+    def _drain(self, work_queue, event):
+        """
+        Collect the given event and every other one already queued.
+
+        :param work_queue: Queue the event was taken from.
+        :type work_queue: queue.Queue
+        :param event: Event just taken from the queue.
+        :type event: object
+
+        :return: Queued events, without stop markers.
+        :rtype: list
+        """
+        events = [event]
+        while True:
+            try:
+                events.append(work_queue.get_nowait())
+            except queue.Empty:
+                break
+        return [event for event in events if event is not self._centinel]
+
+    def _drain_async(self, work_queue, event):
+        """
+        Collect the given event and every other one already queued.
+
+        :param work_queue: Queue the event was taken from.
+        :type work_queue: asyncio.Queue
+        :param event: Event just taken from the queue.
+        :type event: object
+
+        :return: Queued events, without stop markers.
+        :rtype: list
+        """
+        events = [event]
+        while True:
+            try:
+                events.append(work_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return [event for event in events if event is not self._centinel]
+
+    @staticmethod
+    def _is_inline(event):
+        """Return whether the update carries the definition and the change number it follows."""
+        return event.update_type in (UpdateType.SPLIT_UPDATE, UpdateType.RB_SEGMENT_UPDATE) \
+            and event.compression is not None and event.previous_change_number is not None
+
+    def _buffer_iff(self, event, change_number):
+        """
+        Hold an inline update that cannot be applied yet because a previous one is missing.
+
+        :param event: Feature flag or rule based segment update.
+        :type event: splitio.models.notification.SplitChangeUpdate
+        :param change_number: Current change number of the storage the update belongs to.
+        :type change_number: int
+
+        :return: True if the update was buffered. False otherwise.
+        :rtype: bool
+        """
+        if event.previous_change_number <= change_number:
+            return False
+
+        buffered = self._buffered_iff[event.update_type]
+        if len(buffered) >= _MAX_BUFFERED_IFF and event.previous_change_number not in buffered:
+            return False
+
+        _LOGGER.debug('Buffering update %d until %d is applied', event.change_number, event.previous_change_number)
+        buffered[event.previous_change_number] = event
+        return True
+
+    def _pop_buffered_iff(self, event):
+        """
+        Take the buffered update following the one just applied, if any.
+
+        :param event: Update just applied.
+        :type event: splitio.models.notification.SplitChangeUpdate
+
+        :return: Next update in the chain or None.
+        :rtype: splitio.models.notification.SplitChangeUpdate
+        """
+        return self._buffered_iff[event.update_type].pop(event.change_number, None)
+
+    def _flush_buffered_iff(self, till, rbs_till):
+        """
+        Drop buffered updates, extending the change numbers to fetch so they are covered.
+
+        :return: Change numbers to fetch up to, for feature flags and rule based segments.
+        :rtype: tuple
+        """
+        for buffered in self._buffered_iff.values():
+            for event in buffered.values():
+                till, rbs_till = self._check_update_type(till, rbs_till, event)
+            buffered.clear()
+        return till, rbs_till
+
+    def _has_buffered_iff(self):
+        """Return whether there are inline updates waiting for a missing one."""
+        return any(self._buffered_iff.values())
 
 class SegmentWorker(WorkerBase):
     """Segment Worker for processing updates."""
 
     _centinel = object()
 
-    def __init__(self, synchronize_segment, segment_queue):
+    def __init__(self, synchronize_segment, segment_queue, max_parallel=_MAX_PARALLEL_SEGMENTS):
         """
         Class constructor.
 
@@ -77,9 +201,14 @@ class SegmentWorker(WorkerBase):
 
         :param segment_queue: queue with segment updates notifications
         :type segment_queue: queue
+
+        :param max_parallel: max amount of different segments synchronized at the same time
+        :type max_parallel: int
         """
         self._segment_queue = segment_queue
         self._handler = synchronize_segment
+        self._max_parallel = max_parallel
+        self._executor = None
         self._running = False
         self._worker = None
 
@@ -87,21 +216,36 @@ class SegmentWorker(WorkerBase):
         """Return whether the working is running."""
         return self._running
 
+    def _synchronize(self, segment_name, change_number):
+        """Synchronize a segment without raising exceptions."""
+        try:
+            self._handler(segment_name, change_number)
+        except Exception:
+            _LOGGER.error('Exception raised in segment synchronization')
+            _LOGGER.debug('Exception information: ', exc_info=True)
+
     def _run(self):
         """Run worker handler."""
         while self.is_running():
-            event = self._segment_queue.get()
+            events = self._drain(self._segment_queue, self._segment_queue.get())
             if not self.is_running():
                 break
-            if event == self._centinel:
+            pending = self._coalesce_segment_updates(events)
+            if len(pending) <= 1:
+                for segment_name, change_number in pending.items():
+                    self._synchronize(segment_name, change_number)
                 continue
-            _LOGGER.debug('Processing segment_update: %s, change_number: %d',
-                          event.segment_name, event.change_number)
-            try:
-                self._handler(event.segment_name, event.change_number)
-            except Exception:
-                _LOGGER.error('Exception raised in segment synchronization')
-                _LOGGER.debug('Exception information: ', exc_info=True)
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_parallel,
+                                                    thread_name_prefix='PushSegmentWorker')
+            for future in [self._executor.submit(self._synchronize, segment_name, change_number)
+                           for segment_name, change_number in pending.items()]:
+                future.result()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
     def start(self):
         """Start worker."""
@@ -128,7 +272,7 @@ class SegmentWorkerAsync(WorkerBase):
 
     _centinel = object()
 
-    def __init__(self, synchronize_segment, segment_queue):
+    def __init__(self, synchronize_segment, segment_queue, max_parallel=_MAX_PARALLEL_SEGMENTS):
         """
         Class constructor.
 
@@ -137,30 +281,38 @@ class SegmentWorkerAsync(WorkerBase):
 
         :param segment_queue: queue with segment updates notifications
         :type segment_queue: asyncio.Queue
+
+        :param max_parallel: max amount of different segments synchronized at the same time
+        :type max_parallel: int
         """
         self._segment_queue = segment_queue
         self._handler = synchronize_segment
+        self._max_parallel = max_parallel
         self._running = False
 
     def is_running(self):
         """Return whether the working is running."""
         return self._running
 
+    async def _synchronize(self, semaphore, segment_name, change_number):
+        """Synchronize a segment without raising exceptions."""
+        async with semaphore:
+            try:
+                await self._handler(segment_name, change_number)
+            except Exception:
+                _LOGGER.error('Exception raised in segment synchronization')
+                _LOGGER.debug('Exception information: ', exc_info=True)
+
     async def _run(self):
         """Run worker handler."""
+        semaphore = asyncio.Semaphore(self._max_parallel)
         while self.is_running():
-            event = await self._segment_queue.get()
+            events = self._drain_async(self._segment_queue, await self._segment_queue.get())
             if not self.is_running():
                 break
-            if event == self._centinel:
-                continue
-            _LOGGER.debug('Processing segment_update: %s, change_number: %d',
-                          event.segment_name, event.change_number)
-            try:
-                await self._handler(event.segment_name, event.change_number)
-            except Exception:
-                _LOGGER.error('Exception raised in segment synchronization')
-                _LOGGER.debug('Exception information: ', exc_info=True)
+            pending = self._coalesce_segment_updates(events)
+            await asyncio.gather(*[self._synchronize(semaphore, segment_name, change_number)
+                                   for segment_name, change_number in pending.items()])
 
     def start(self):
         """Start worker."""
@@ -186,7 +338,8 @@ class SplitWorker(WorkerBase):
 
     _centinel = object()
 
-    def __init__(self, synchronize_feature_flag, synchronize_segment, feature_flag_queue, feature_flag_storage, segment_storage, telemetry_runtime_producer, rule_based_segment_storage):
+    def __init__(self, synchronize_feature_flag, synchronize_segment, feature_flag_queue, feature_flag_storage, segment_storage, telemetry_runtime_producer, rule_based_segment_storage,
+                 gap_timeout=_IFF_GAP_TIMEOUT):
         """
         Class constructor.
 
@@ -204,6 +357,8 @@ class SplitWorker(WorkerBase):
         :type telemetry_runtime_producer: splitio.engine.telemetry.TelemetryRuntimeProducer
         :param rule_based_segment_storage: Rule based segment Storage.
         :type rule_based_segment_storage: splitio.storage.InMemoryRuleBasedStorage
+        :param gap_timeout: seconds to hold inline updates waiting for a missing previous one
+        :type gap_timeout: float
         """
         self._feature_flag_queue = feature_flag_queue
         self._handler = synchronize_feature_flag
@@ -214,6 +369,8 @@ class SplitWorker(WorkerBase):
         self._segment_storage = segment_storage
         self._telemetry_runtime_producer = telemetry_runtime_producer
         self._rule_based_segment_storage = rule_based_segment_storage
+        self._gap_timeout = gap_timeout
+        self._buffered_iff = {UpdateType.SPLIT_UPDATE: {}, UpdateType.RB_SEGMENT_UPDATE: {}}
 
     def is_running(self):
         """Return whether the working is running."""
@@ -224,7 +381,7 @@ class SplitWorker(WorkerBase):
             return False
         try:
             if event.update_type == UpdateType.SPLIT_UPDATE:                
-                new_feature_flag = from_raw(json.loads(self._get_object_definition(event)))                
+                new_feature_flag = from_raw(json_loads(self._get_object_definition(event)))                
                 segment_list = update_feature_flag_storage(self._feature_flag_storage, [new_feature_flag], event.change_number)
                 for segment_name in segment_list:
                     if self._segment_storage.get(segment_name) is None:
@@ -235,7 +392,7 @@ class SplitWorker(WorkerBase):
                 self._fetch_rbs_segment_if_needed(referenced_rbs, event)
                 self._telemetry_runtime_producer.record_update_from_sse(UpdateFromSSE.SPLIT_UPDATE)
             else:
-                new_rbs = rbs_from_raw(json.loads(self._get_object_definition(event)))
+                new_rbs = rbs_from_raw(json_loads(self._get_object_definition(event)))
                 segment_list = update_rule_based_segment_storage(self._rule_based_segment_storage, [new_rbs], event.change_number)
                 for segment_name in segment_list:
                     if self._segment_storage.get(segment_name) is None:
@@ -252,39 +409,39 @@ class SplitWorker(WorkerBase):
             _LOGGER.debug('Fetching new rule based segment(s) %s', referenced_rbs)
             self._handler(None, event.change_number)
         
-    def _check_instant_ff_update(self, event):
-        if event.update_type == UpdateType.SPLIT_UPDATE and event.compression is not None and event.previous_change_number == self._feature_flag_storage.get_change_number():
-            return True
+    def _get_change_number(self, event):
+        if event.update_type == UpdateType.SPLIT_UPDATE:
+            return self._feature_flag_storage.get_change_number()
 
-        if event.update_type == UpdateType.RB_SEGMENT_UPDATE and event.compression is not None and event.previous_change_number == self._rule_based_segment_storage.get_change_number():
-            return True
+        return self._rule_based_segment_storage.get_change_number()
 
-        return False
+    def _check_instant_ff_update(self, event):
+        return self._is_inline(event) and event.previous_change_number == self._get_change_number(event)
 
-    def _run(self):
-        """Run worker handler."""
-        while self.is_running():
-            event = self._feature_flag_queue.get()
-            if not self.is_running():
-                break
-            if event == self._centinel:
-                continue
-            
+    def _process(self, events):
+        """
+        Apply inline updates and collect the change numbers to fetch for the rest.
+
+        Updates arriving ahead of the storage are buffered and applied as soon as the one they
+        follow is, so out of order notifications do not trigger a fetch.
+        """
+        till = None
+        rbs_till = None
+        pending = deque(events)
+        while pending:
+            event = pending.popleft()
             _LOGGER.debug('Processing feature flag update %d', event.change_number)
             try:
                 if self._apply_iff_if_needed(event):
+                    successor = self._pop_buffered_iff(event)
+                    if successor is not None:
+                        pending.appendleft(successor)
                     continue
-                
-                till = None
-                rbs_till = None
-                till, rbs_till = self._check_update_type(till, rbs_till, event)
-                sync_result = self._handler(till, rbs_till)
-                if not sync_result.success and sync_result.error_code is not None and sync_result.error_code == 414:
-                    _LOGGER.error("URI too long exception caught, sync failed")
 
-                if not sync_result.success:
-                    _LOGGER.error("feature flags sync failed")
+                if self._is_inline(event) and self._buffer_iff(event, self._get_change_number(event)):
+                    continue
 
+                till, rbs_till = self._check_update_type(till, rbs_till, event)
             except SplitStorageException as e:  # pylint: disable=broad-except
                 _LOGGER.error('Exception Updating Feature Flag')
                 _LOGGER.debug('Exception information: ', exc_info=True)
@@ -292,14 +449,43 @@ class SplitWorker(WorkerBase):
                 _LOGGER.error('Exception raised in feature flag synchronization')
                 _LOGGER.debug('Exception information: ', exc_info=True)
 
-    def _check_update_type(self, till, rbs_till, event):
-        if event.update_type == UpdateType.SPLIT_UPDATE:
-            till = event.change_number
-        else:
-            rbs_till = event.change_number
-
         return till, rbs_till
 
+    def _synchronize(self, till, rbs_till):
+        """Fetch up to the given change numbers, covering any buffered update as well."""
+        till, rbs_till = self._flush_buffered_iff(till, rbs_till)
+        try:
+            sync_result = self._handler(till, rbs_till)
+            if not sync_result.success and sync_result.error_code is not None and sync_result.error_code == 414:
+                _LOGGER.error("URI too long exception caught, sync failed")
+
+            if not sync_result.success:
+                _LOGGER.error("feature flags sync failed")
+
+        except Exception as e:  # pylint: disable=broad-except
+            _LOGGER.error('Exception raised in feature flag synchronization')
+            _LOGGER.debug('Exception information: ', exc_info=True)
+
+    def _run(self):
+        """Run worker handler."""
+        while self.is_running():
+            try:
+                event = self._feature_flag_queue.get(timeout=self._gap_timeout if self._has_buffered_iff() else None)
+            except queue.Empty:
+                _LOGGER.debug('Missing inline update did not arrive, fetching')
+                self._synchronize(None, None)
+                continue
+
+            events = self._drain(self._feature_flag_queue, event)
+            if not self.is_running():
+                break
+
+            # Instant updates are applied in order, the rest are collapsed into a single fetch
+            # up to the highest change number received for each kind of object.
+            till, rbs_till = self._process(events)
+            if till is not None or rbs_till is not None:
+                self._synchronize(till, rbs_till)
+
     def start(self):
         """Start worker."""
         if self.is_running():
@@ -325,7 +511,8 @@ class SplitWorkerAsync(WorkerBase):
 
     _centinel = object()
 
-    def __init__(self, synchronize_feature_flag, synchronize_segment, feature_flag_queue, feature_flag_storage, segment_storage, telemetry_runtime_producer, rule_based_segment_storage):
+    def __init__(self, synchronize_feature_flag, synchronize_segment, feature_flag_queue, feature_flag_storage, segment_storage, telemetry_runtime_producer, rule_based_segment_storage,
+                 gap_timeout=_IFF_GAP_TIMEOUT):
         """
         Class constructor.
 
@@ -343,6 +530,8 @@ class SplitWorkerAsync(WorkerBase):
         :type telemetry_runtime_producer: splitio.engine.telemetry.TelemetryRuntimeProducer
         :param rule_based_segment_storage: Rule based segment Storage.
         :type rule_based_segment_storage: splitio.storage.InMemoryRuleBasedStorage
+        :param gap_timeout: seconds to hold inline updates waiting for a missing previous one
+        :type gap_timeout: float
         """
         self._feature_flag_queue = feature_flag_queue
         self._handler = synchronize_feature_flag
@@ -352,6 +541,8 @@ class SplitWorkerAsync(WorkerBase):
         self._segment_storage = segment_storage
         self._telemetry_runtime_producer = telemetry_runtime_producer
         self._rule_based_segment_storage = rule_based_segment_storage
+        self._gap_timeout = gap_timeout
+        self._buffered_iff = {UpdateType.SPLIT_UPDATE: {}, UpdateType.RB_SEGMENT_UPDATE: {}}
         
     def is_running(self):
         """Return whether the working is running."""
@@ -362,7 +553,7 @@ class SplitWorkerAsync(WorkerBase):
             return False
         try:
             if event.update_type == UpdateType.SPLIT_UPDATE:                
-                new_feature_flag = from_raw(json.loads(self._get_object_definition(event)))
+                new_feature_flag = from_raw(json_loads(self._get_object_definition(event)))
                 segment_list = await update_feature_flag_storage_async(self._feature_flag_storage, [new_feature_flag], event.change_number)
                 for segment_name in segment_list:
                     if await self._segment_storage.get(segment_name) is None:
@@ -373,7 +564,7 @@ class SplitWorkerAsync(WorkerBase):
                 await self._fetch_rbs_segment_if_needed(referenced_rbs, event)
                 await self._telemetry_runtime_producer.record_update_from_sse(UpdateFromSSE.SPLIT_UPDATE)
             else:
-                new_rbs = rbs_from_raw(json.loads(self._get_object_definition(event)))                
+                new_rbs = rbs_from_raw(json_loads(self._get_object_definition(event)))                
                 segment_list = await update_rule_based_segment_storage_async(self._rule_based_segment_storage, [new_rbs], event.change_number)
                 for segment_name in segment_list:
                     if await self._segment_storage.get(segment_name) is None:
@@ -390,34 +581,39 @@ class SplitWorkerAsync(WorkerBase):
             _LOGGER.debug('Fetching new rule based segment(s) %s', referenced_rbs)
             await self._handler(None, event.change_number)
 
+    async def _get_change_number(self, event):
+        if event.update_type == UpdateType.SPLIT_UPDATE:
+            return await self._feature_flag_storage.get_change_number()
+
+        return await self._rule_based_segment_storage.get_change_number()
+
     async def _check_instant_ff_update(self, event):
-        if event.update_type == UpdateType.SPLIT_UPDATE and event.compression is not None and event.previous_change_number == await self._feature_flag_storage.get_change_number():
-            return True
+        return self._is_inline(event) and event.previous_change_number == await self._get_change_number(event)
 
-        if event.update_type == UpdateType.RB_SEGMENT_UPDATE and event.compression is not None and event.previous_change_number == await self._rule_based_segment_storage.get_change_number():
-            return True
-        
-        return False
+    async def _process(self, events):
+        """
+        Apply inline updates and collect the change numbers to fetch for the rest.
 
-    async def _run(self):
-        """Run worker handler."""
-        while self.is_running():
-            event = await self._feature_flag_queue.get()
-            if not self.is_running():
-                break
-            if event == self._centinel:
-                continue
+        Updates arriving ahead of the storage are buffered and applied as soon as the one they
+        follow is, so out of order notifications do not trigger a fetch.
+        """
+        till = None
+        rbs_till = None
+        pending = deque(events)
+        while pending:
+            event = pending.popleft()
             _LOGGER.debug('Processing split_update %d', event.change_number)
             try:
                 if await self._apply_iff_if_needed(event):
+                    successor = self._pop_buffered_iff(event)
+                    if successor is not None:
+                        pending.appendleft(successor)
                     continue
-                till = None
-                rbs_till = None
-                if event.update_type == UpdateType.SPLIT_UPDATE:
-                    till = event.change_number
-                else:
-                    rbs_till = event.change_number                
-                await self._handler(till, rbs_till)
+
+                if self._is_inline(event) and self._buffer_iff(event, await self._get_change_number(event)):
+                    continue
+
+                till, rbs_till = self._check_update_type(till, rbs_till, event)
             except SplitStorageException as e:  # pylint: disable=broad-except
                 _LOGGER.error('Exception Updating Feature Flag')
                 _LOGGER.debug('Exception information: ', exc_info=True)
@@ -425,6 +621,40 @@ class SplitWorkerAsync(WorkerBase):
                 _LOGGER.error('Exception raised in split synchronization')
                 _LOGGER.debug('Exception information: ', exc_info=True)
 
+        return till, rbs_till
+
+    async def _synchronize(self, till, rbs_till):
+        """Fetch up to the given change numbers, covering any buffered update as well."""
+        till, rbs_till = self._flush_buffered_iff(till, rbs_till)
+        try:
+            await self._handler(till, rbs_till)
+        except Exception as e:  # pylint: disable=broad-except
+            _LOGGER.error('Exception raised in split synchronization')
+            _LOGGER.debug('Exception information: ', exc_info=True)
+
+    async def _run(self):
+        """Run worker handler."""
+        while self.is_running():
+            try:
+                if self._has_buffered_iff():
+                    event = await asyncio.wait_for(self._feature_flag_queue.get(), self._gap_timeout)
+                else:
+                    event = await self._feature_flag_queue.get()
+            except asyncio.TimeoutError:
+                _LOGGER.debug('Missing inline update did not arrive, fetching')
+                await self._synchronize(None, None)
+                continue
+
+            events = self._drain_async(self._feature_flag_queue, event)
+            if not self.is_running():
+                break
+
+            # Instant updates are applied in order, the rest are collapsed into a single fetch
+            # up to the highest change number received for each kind of object.
+            till, rbs_till = await self._process(events)
+            if till is not None or rbs_till is not None:
+                await self._synchronize(till, rbs_till)
+
     def start(self):
         """Start worker."""
         if self.is_running():
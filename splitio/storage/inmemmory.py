@@ -1731,8 +1731,8 @@ class InMemoryTelemetryStorage(InMemoryTelemetryStorageBase):
         self._tel_config.record_not_ready_usage()
 
     def record_latency(self, method, latency):
-        """Record method latency time."""
-        self._method_latencies.add_latency(method,latency)
+        """Record method latency bucket."""
+        self._method_latencies.add_bucket(method, latency)
 
     def record_exception(self, method):
         """Record method exception."""
@@ -1905,8 +1905,8 @@ class InMemoryTelemetryStorageAsync(InMemoryTelemetryStorageBase):
         await self._tel_config.record_not_ready_usage()
 
     async def record_latency(self, method, latency):
-        """Record method latency time."""
-        await self._method_latencies.add_latency(method,latency)
+        """Record method latency bucket."""
+        await self._method_latencies.add_bucket(method, latency)
 
     async def record_exception(self, method):
         """Record method exception."""
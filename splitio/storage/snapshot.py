@@ -0,0 +1,168 @@
+"""On-disk snapshot of feature flags, rule based segments and segments for warm starts."""
+import hashlib
+import json
+import logging
+import os
+import struct
+import tempfile
+import zlib
+
+from splitio.models import splits, rule_based_segments
+from splitio.models.segments import Segment
+from splitio.util.storage_helper import update_feature_flag_storage, update_rule_based_segment_storage, \
+    get_standard_segment_names_in_rbs_storage
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_MAGIC = b'SPLITSNP'
+_VERSION = 1
+_HEADER = struct.Struct('>8sHIQ')  # magic, version, crc32 of payload, payload length
+
+
+class SnapshotException(Exception):
+    """Exception raised when a snapshot file cannot be used."""
+
+    pass
+
+
+class StorageSnapshot(object):
+    """
+    Persist in-memory rollout data to a single file and load it back on startup.
+
+    The file holds a fixed header (magic, format version, crc32 and length of the payload)
+    followed by a zlib compressed JSON payload. Data is only loaded when it was written for the
+    same SDK key and flag sets filter, so the regular synchronization can resume from the stored
+    change numbers instead of fetching everything from scratch.
+    """
+
+    def __init__(self, path, sdk_key, flag_sets=None):
+        """
+        Class constructor.
+
+        :param path: Snapshot file path.
+        :type path: str
+        :param sdk_key: SDK key the data belongs to. Only a digest of it is stored.
+        :type sdk_key: str
+        :param flag_sets: Flag sets filter in use.
+        :type flag_sets: list(str)
+        """
+        self._path = path
+        self._owner = hashlib.sha256(sdk_key.encode('utf-8')).hexdigest()
+        self._flag_sets = sorted(flag_sets) if flag_sets is not None else []
+
+    def save(self, feature_flag_storage, rule_based_segment_storage, segment_storage):
+        """
+        Write the storages contents, replacing the snapshot file atomically.
+
+        :param feature_flag_storage: Feature flag storage.
+        :type feature_flag_storage: splitio.storage.inmemmory.InMemorySplitStorage
+        :param rule_based_segment_storage: Rule based segment storage.
+        :type rule_based_segment_storage: splitio.storage.inmemmory.InMemoryRuleBasedSegmentStorage
+        :param segment_storage: Segment storage.
+        :type segment_storage: splitio.storage.inmemmory.InMemorySegmentStorage
+        """
+        rbs_names = rule_based_segment_storage.get_segment_names()
+        segment_names = set(feature_flag_storage.get_segment_names())
+        segment_names.update(get_standard_segment_names_in_rbs_storage(rule_based_segment_storage))
+        stored_segments = []
+        for segment_name in sorted(segment_names):
+            segment = segment_storage.get(segment_name)
+            if segment is not None and segment.change_number is not None:
+                stored_segments.append({'name': segment.name, 'till': segment.change_number,
+                                        'keys': list(segment.keys)})
+
+        payload = zlib.compress(json.dumps({
+            'owner': self._owner,
+            'flagSets': self._flag_sets,
+            'ff': {'t': feature_flag_storage.get_change_number(),
+                   'd': [feature_flag.to_json() for feature_flag in feature_flag_storage.get_all_splits()]},
+            'rbs': {'t': rule_based_segment_storage.get_change_number(),
+                    'd': [rule_based_segment_storage.get(name).to_json() for name in rbs_names]},
+            'segments': stored_segments,
+        }, separators=(',', ':')).encode('utf-8'))
+
+        # a temp file of its own, so processes sharing the snapshot don't clobber each other's writes.
+        fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(self._path) + '.',
+                                         suffix='.tmp', dir=os.path.dirname(os.path.abspath(self._path)))
+        try:
+            with os.fdopen(fd, 'wb') as flo:
+                flo.write(_HEADER.pack(_MAGIC, _VERSION, zlib.crc32(payload), len(payload)))
+                flo.write(payload)
+                flo.flush()
+                os.fsync(flo.fileno())
+            os.replace(temp_path, self._path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+        _LOGGER.debug('Snapshot saved with %d feature flags and %d segments',
+                      feature_flag_storage.get_splits_count(), len(stored_segments))
+
+    def _read(self):
+        """
+        Read and validate the snapshot file.
+
+        :return: Snapshot contents.
+        :rtype: dict
+        """
+        with open(self._path, 'rb') as flo:
+            header = flo.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise SnapshotException('truncated header')
+
+            magic, version, checksum, length = _HEADER.unpack(header)
+            if magic != _MAGIC:
+                raise SnapshotException('not a snapshot file')
+
+            if version != _VERSION:
+                raise SnapshotException('unsupported version %d' % version)
+
+            payload = flo.read(length)
+
+        if len(payload) != length or zlib.crc32(payload) != checksum:
+            raise SnapshotException('checksum mismatch')
+
+        data = json.loads(zlib.decompress(payload).decode('utf-8'))
+        if data['owner'] != self._owner or data['flagSets'] != self._flag_sets:
+            raise SnapshotException('written for a different SDK key or flag sets filter')
+
+        return data
+
+    def load(self, feature_flag_storage, rule_based_segment_storage, segment_storage):
+        """
+        Populate empty storages from the snapshot file.
+
+        :param feature_flag_storage: Feature flag storage.
+        :type feature_flag_storage: splitio.storage.inmemmory.InMemorySplitStorage
+        :param rule_based_segment_storage: Rule based segment storage.
+        :type rule_based_segment_storage: splitio.storage.inmemmory.InMemoryRuleBasedSegmentStorage
+        :param segment_storage: Segment storage.
+        :type segment_storage: splitio.storage.inmemmory.InMemorySegmentStorage
+
+        :return: True if the snapshot was loaded. False otherwise.
+        :rtype: bool
+        """
+        if not os.path.exists(self._path):
+            return False
+
+        try:
+            data = self._read()
+            feature_flags = [splits.from_raw(raw) for raw in data['ff']['d']]
+            rbs = [rule_based_segments.from_raw(raw) for raw in data['rbs']['d']]
+            stored_segments = [Segment(raw['name'], raw['keys'], raw['till']) for raw in data['segments']]
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.warning('Ignoring snapshot file %s since it cannot be used', self._path)
+            _LOGGER.debug('Error: ', exc_info=True)
+            return False
+
+        update_rule_based_segment_storage(rule_based_segment_storage, rbs, data['rbs']['t'])
+        update_feature_flag_storage(feature_flag_storage, feature_flags, data['ff']['t'])
+        for segment in stored_segments:
+            segment_storage.put(segment)
+
+        _LOGGER.info('Loaded %d feature flags and %d segments from snapshot', len(feature_flags),
+                     len(stored_segments))
+        return True
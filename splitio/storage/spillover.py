@@ -0,0 +1,518 @@
+"""Disk backed spillover storage classes."""
+import json
+import logging
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # pylint: disable=invalid-name
+
+from splitio.models.events import Event
+from splitio.models.impressions import Impression
+from splitio.models.telemetry import CounterConstants
+from splitio.storage.inmemmory import InMemoryImpressionStorage, InMemoryEventStorage, MAX_SIZE_BYTES
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_RECORD_HEADER = struct.Struct('>I')
+_SEGMENT_SUFFIX = '.log'
+_COUNT_SUFFIX = '.count'
+_CURSOR_FILE = 'cursor'
+_LOCK_FILE = 'lock'
+_DEFAULT_SEGMENT_BYTES = 8 * 1024 * 1024
+_DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+_DEFAULT_FSYNC_RECORDS = 1000
+_DEFAULT_FSYNC_INTERVAL = 1  # seconds
+
+
+class SegmentLog(object):  # pylint: disable=too-many-instance-attributes
+    """
+    Append-only log of length-prefixed records split across segment files.
+
+    Records are appended to the newest segment and read back in order from the oldest one,
+    which is memory-mapped while reading. Fully consumed segments are deleted and the read
+    position is persisted in a cursor file, so pending records are replayed after a restart.
+
+    Each log owns a numbered slot under its directory, locked with flock for as long as the
+    log is open. Processes sharing the directory, such as preforked workers, get a slot each
+    and a restarted process picks up whatever a free slot left pending.
+    """
+
+    def __init__(self, directory, max_bytes=_DEFAULT_MAX_BYTES, segment_bytes=_DEFAULT_SEGMENT_BYTES,
+                 fsync_records=_DEFAULT_FSYNC_RECORDS, fsync_interval=_DEFAULT_FSYNC_INTERVAL):
+        """
+        Class constructor.
+
+        :param directory: Directory where slots are kept. Created if missing.
+        :type directory: str
+        :param max_bytes: Max bytes kept on disk. Appends beyond this limit are rejected.
+        :type max_bytes: int
+        :param segment_bytes: Size at which the active segment is rolled over.
+        :type segment_bytes: int
+        :param fsync_records: Appended records after which data is fsync'ed.
+        :type fsync_records: int
+        :param fsync_interval: Seconds after which pending appends are fsync'ed.
+        :type fsync_interval: float
+        """
+        self._base_directory = directory
+        self._max_bytes = max_bytes
+        self._segment_bytes = segment_bytes
+        self._fsync_records = fsync_records
+        self._fsync_interval = fsync_interval
+        self._open()
+
+    @property
+    def directory(self):
+        """Return the slot directory owned by this log."""
+        return self._directory
+
+    def _open(self):
+        """Lock a free slot and load its pending records."""
+        self._lock = threading.Lock()
+        self._closed = False
+        self._directory, self._slot_lock = _acquire_slot(self._base_directory)
+        self._segments = sorted(
+            int(name[:-len(_SEGMENT_SUFFIX)]) for name in os.listdir(self._directory)
+            if name.endswith(_SEGMENT_SUFFIX) and name[:-len(_SEGMENT_SUFFIX)].isdigit()
+        )
+        self._read_segment, self._read_offset, self._read_index = self._load_cursor()
+        self._segments = [seq for seq in self._segments if seq >= self._read_segment]
+        if not self._segments:
+            self._segments = [self._read_segment]
+            self._read_offset, self._read_index = 0, 0
+        elif self._segments[0] != self._read_segment:
+            self._read_segment, self._read_offset, self._read_index = self._segments[0], 0, 0
+        self._total_bytes = sum(self._segment_size(seq) for seq in self._segments) - self._read_offset
+        self._writer = open(self._segment_path(self._segments[-1]), 'ab')
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._active_records = self._count_records(self._segments[-1], 0)
+        self._pending = self._count_pending()
+
+    def reopen(self):
+        """
+        Move to a slot of its own after a fork.
+
+        The handles inherited from the parent are dropped without unlocking, the parent keeps its
+        slot and whatever it left pending there.
+        """
+        self._writer.close()
+        self._slot_lock.close()
+        self._open()
+
+    def _segment_path(self, seq):
+        """Return the path of a segment file."""
+        return os.path.join(self._directory, '%020d%s' % (seq, _SEGMENT_SUFFIX))
+
+    def _count_path(self, seq):
+        """Return the path of the file holding the record count of a rolled segment."""
+        return os.path.join(self._directory, '%020d%s' % (seq, _COUNT_SUFFIX))
+
+    def _segment_size(self, seq):
+        """Return the size in bytes of a segment file."""
+        try:
+            return os.path.getsize(self._segment_path(seq))
+        except OSError:
+            return 0
+
+    def _remove_segment(self, seq):
+        """Delete a segment file and its record count."""
+        for path in (self._segment_path(seq), self._count_path(seq)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _load_cursor(self):
+        """Read the persisted read position, if any."""
+        try:
+            with open(os.path.join(self._directory, _CURSOR_FILE), 'r') as cursor:
+                seq, offset, index = cursor.read().split()
+                return int(seq), int(offset), int(index)
+        except (OSError, ValueError):
+            return (self._segments[0] if self._segments else 0), 0, 0
+
+    def _store_cursor(self):
+        """Persist the read position atomically."""
+        path = os.path.join(self._directory, _CURSOR_FILE)
+        _write_atomically(path, '%d %d %d' % (self._read_segment, self._read_offset, self._read_index))
+
+    def _load_count(self, seq):
+        """
+        Return the record count persisted when a segment was rolled.
+
+        Segments rolled by a process that crashed before persisting it are counted by reading them.
+        """
+        try:
+            with open(self._count_path(seq), 'r') as count:
+                return int(count.read())
+        except (OSError, ValueError):
+            return self._count_records(seq, 0)
+
+    def _count_pending(self):
+        """Count records not yet consumed, reading only the active segment."""
+        count = 0
+        for seq in self._segments:
+            records = self._active_records if seq == self._segments[-1] else self._load_count(seq)
+            count += records - (self._read_index if seq == self._read_segment else 0)
+        return count
+
+    def _count_records(self, seq, offset):
+        """Count the complete records of a segment from <offset> on, without copying them."""
+        size = self._segment_size(seq)
+        if size <= offset:
+            return 0
+
+        count = 0
+        with open(self._segment_path(seq), 'rb') as segment:
+            with mmap.mmap(segment.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                while offset + _RECORD_HEADER.size <= size:
+                    length, = _RECORD_HEADER.unpack_from(data, offset)
+                    offset += _RECORD_HEADER.size + length
+                    if offset > size:
+                        break
+                    count += 1
+        return count
+
+    def _read_records(self, seq, offset, limit):
+        """
+        Read up to <limit> records from a segment starting at <offset>.
+
+        :return: Tuple of records read and offset right after the last one.
+        :rtype: tuple(list(bytes), int)
+        """
+        size = self._segment_size(seq)
+        if size <= offset:
+            return [], offset
+
+        records = []
+        with open(self._segment_path(seq), 'rb') as segment:
+            with mmap.mmap(segment.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                while offset + _RECORD_HEADER.size <= size and (limit is None or len(records) < limit):
+                    length, = _RECORD_HEADER.unpack_from(data, offset)
+                    end = offset + _RECORD_HEADER.size + length
+                    if end > size:
+                        # Partially written record (ie: crash mid-append), ignore the tail.
+                        break
+                    records.append(data[offset + _RECORD_HEADER.size:end])
+                    offset = end
+        return records, offset
+
+    def _sync(self, force=False):
+        """Fsync the active segment if enough records or time have accumulated."""
+        if not self._unsynced:
+            return
+        if force or self._unsynced >= self._fsync_records or \
+                time.monotonic() - self._last_sync >= self._fsync_interval:
+            os.fsync(self._writer.fileno())
+            self._unsynced = 0
+            self._last_sync = time.monotonic()
+
+    def _roll(self):
+        """Seal the active segment, persisting its record count, and start a new one."""
+        self._writer.flush()
+        os.fsync(self._writer.fileno())
+        self._writer.close()
+        _write_atomically(self._count_path(self._segments[-1]), str(self._active_records))
+        self._segments.append(self._segments[-1] + 1)
+        self._writer = open(self._segment_path(self._segments[-1]), 'ab')
+        self._active_records = 0
+
+    def __len__(self):
+        """Return the amount of records pending to be read."""
+        return self._pending
+
+    def append(self, records):
+        """
+        Append records to the log.
+
+        :param records: Serialized records.
+        :type records: list(bytes)
+
+        :return: Amount of records appended, lower than requested if the size cap was hit or the
+            log is closed.
+        :rtype: int
+        """
+        appended = 0
+        with self._lock:
+            if self._closed:
+                return appended
+            for record in records:
+                size = _RECORD_HEADER.size + len(record)
+                if self._total_bytes + size > self._max_bytes:
+                    break
+                if self._writer.tell() > 0 and self._writer.tell() + size > self._segment_bytes:
+                    self._roll()
+                self._writer.write(_RECORD_HEADER.pack(len(record)))
+                self._writer.write(record)
+                self._total_bytes += size
+                self._active_records += 1
+                appended += 1
+            self._writer.flush()
+            self._unsynced += appended
+            self._pending += appended
+            self._sync()
+        return appended
+
+    def pop_many(self, count):
+        """
+        Read and consume up to <count> records, oldest first.
+
+        :param count: Max amount of records to return.
+        :type count: int
+
+        :return: Records read, none once the log is closed.
+        :rtype: list(bytes)
+        """
+        records = []
+        with self._lock:
+            if self._closed or not self._pending:
+                return records
+            while len(records) < count:
+                read, offset = self._read_records(self._read_segment, self._read_offset,
+                                                  count - len(records))
+                records.extend(read)
+                self._total_bytes -= offset - self._read_offset
+                self._read_offset = offset
+                self._read_index += len(read)
+                if len(records) >= count or self._read_segment == self._segments[-1]:
+                    break
+                # Non-active segment fully consumed, drop it and move on to the next one.
+                self._total_bytes -= self._segment_size(self._read_segment) - self._read_offset
+                self._remove_segment(self._segments.pop(0))
+                self._read_segment, self._read_offset, self._read_index = self._segments[0], 0, 0
+            self._pending -= len(records)
+            self._store_cursor()
+        return records
+
+    def clear(self):
+        """Drop every pending record."""
+        with self._lock:
+            self._writer.close()
+            for seq in self._segments:
+                self._remove_segment(seq)
+            self._segments = [self._segments[-1] + 1]
+            self._read_segment, self._read_offset, self._read_index = self._segments[0], 0, 0
+            self._writer = open(self._segment_path(self._segments[0]), 'ab')
+            self._total_bytes = 0
+            self._pending = 0
+            self._unsynced = 0
+            self._active_records = 0
+            self._store_cursor()
+
+    def close(self):
+        """Fsync pending appends, close the active segment and release the slot."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._sync(True)
+            self._writer.close()
+            self._slot_lock.close()
+
+
+def _write_atomically(path, content):
+    """Replace the content of a small file atomically."""
+    with open(path + '.tmp', 'w') as flo:
+        flo.write(content)
+    os.replace(path + '.tmp', path)
+
+
+def _acquire_slot(directory):
+    """
+    Lock the first free slot under a directory, creating it if needed.
+
+    :param directory: Directory holding the slots.
+    :type directory: str
+
+    :return: Slot directory and the open lock file, which must be kept open to hold the slot.
+    :rtype: tuple(str, file)
+    """
+    slot = 0
+    while True:
+        path = os.path.join(directory, str(slot))
+        os.makedirs(path, exist_ok=True)
+        lock = open(os.path.join(path, _LOCK_FILE), 'a')
+        if fcntl is None:
+            # No flock available (ie: Windows), processes can't share the directory.
+            return path, lock
+        try:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return path, lock
+        except OSError:
+            lock.close()
+            slot += 1
+
+
+class SpilloverImpressionStorage(InMemoryImpressionStorage):
+    """In memory impressions storage that spills over to a disk log when the queue is full."""
+
+    def __init__(self, queue_size, telemetry_runtime_producer, segment_log):
+        """
+        Construct an instance.
+
+        :param queue_size: How many impressions to keep in memory before spilling to disk.
+        :type queue_size: int
+        :param telemetry_runtime_producer: Telemetry runtime producer.
+        :type telemetry_runtime_producer: splitio.engine.telemetry.TelemetryRuntimeProducer
+        :param segment_log: Disk log used for spillover.
+        :type segment_log: splitio.storage.spillover.SegmentLog
+        """
+        InMemoryImpressionStorage.__init__(self, queue_size, telemetry_runtime_producer)
+        self._spillover = segment_log
+
+    def put(self, impressions):
+        """
+        Put one or more impressions in storage.
+
+        :param impressions: List of one or more impressions to store.
+        :type impressions: list
+        """
+        impressions_stored = 0
+        with self._lock:
+            try:
+                for impression in impressions:
+                    self._impressions.put(impression, False)
+                    impressions_stored += 1
+            except queue.Full:
+                pass
+
+        if impressions_stored == len(impressions):
+            self._telemetry_runtime_producer.record_impression_stats(CounterConstants.IMPRESSIONS_QUEUED, len(impressions))
+            return True
+
+        impressions_stored += self._spillover.append(
+            [json.dumps(impression).encode('utf-8') for impression in impressions[impressions_stored:]]
+        )
+        self._telemetry_runtime_producer.record_impression_stats(CounterConstants.IMPRESSIONS_QUEUED, impressions_stored)
+        if self._queue_full_hook is not None and callable(self._queue_full_hook):
+            self._queue_full_hook()
+        if impressions_stored == len(impressions):
+            return True
+
+        self._telemetry_runtime_producer.record_impression_stats(CounterConstants.IMPRESSIONS_DROPPED, len(impressions) - impressions_stored)
+        _LOGGER.warning(
+            'Impression queue and disk spillover are full, failing to add more impressions. \n'
+            'Consider increasing parameter `spilloverMaxBytes` in configuration'
+        )
+        return False
+
+    def pop_many(self, count):
+        """
+        Pop the oldest N impressions from storage, in-memory ones first.
+
+        :param count: Number of impressions to pop.
+        :type count: int
+        """
+        impressions = InMemoryImpressionStorage.pop_many(self, count)
+        if len(impressions) < count:
+            impressions.extend(Impression(*json.loads(record))
+                               for record in self._spillover.pop_many(count - len(impressions)))
+        return impressions
+
+    def clear(self):
+        """
+        Clear in-memory data.
+
+        Records spilled to disk are kept, they are still pending to be sent.
+        """
+        InMemoryImpressionStorage.clear(self)
+
+    def reopen_spillover(self):
+        """Move the disk log to a slot of this process after a fork."""
+        self._spillover.reopen()
+
+    def close_spillover(self):
+        """Close the disk log, keeping pending records for a later process."""
+        self._spillover.close()
+
+
+class SpilloverEventStorage(InMemoryEventStorage):
+    """In memory events storage that spills over to a disk log when the queue is full."""
+
+    def __init__(self, eventsQueueSize, telemetry_runtime_producer, segment_log):
+        """
+        Construct an instance.
+
+        :param eventsQueueSize: How many events to keep in memory before spilling to disk.
+        :type eventsQueueSize: int
+        :param telemetry_runtime_producer: Telemetry runtime producer.
+        :type telemetry_runtime_producer: splitio.engine.telemetry.TelemetryRuntimeProducer
+        :param segment_log: Disk log used for spillover.
+        :type segment_log: splitio.storage.spillover.SegmentLog
+        """
+        InMemoryEventStorage.__init__(self, eventsQueueSize, telemetry_runtime_producer)
+        self._spillover = segment_log
+
+    def put(self, events):
+        """
+        Add events to storage.
+
+        :param events: Event wrappers to be added in the storage
+        """
+        events_stored = 0
+        with self._lock:
+            try:
+                for event in events:
+                    if self._size + event.size >= MAX_SIZE_BYTES:
+                        raise queue.Full
+                    self._events.put(event.event, False)
+                    self._size += event.size
+                    events_stored += 1
+            except queue.Full:
+                pass
+
+        if events_stored == len(events):
+            self._telemetry_runtime_producer.record_event_stats(CounterConstants.EVENTS_QUEUED, len(events))
+            return True
+
+        events_stored += self._spillover.append(
+            [json.dumps(event.event).encode('utf-8') for event in events[events_stored:]]
+        )
+        self._telemetry_runtime_producer.record_event_stats(CounterConstants.EVENTS_QUEUED, events_stored)
+        if self._queue_full_hook is not None and callable(self._queue_full_hook):
+            self._queue_full_hook()
+        if events_stored == len(events):
+            return True
+
+        self._telemetry_runtime_producer.record_event_stats(CounterConstants.EVENTS_DROPPED, len(events) - events_stored)
+        _LOGGER.warning(
+            'Events queue and disk spillover are full, failing to add more events. \n'
+            'Consider increasing parameter `spilloverMaxBytes` in configuration'
+        )
+        return False
+
+    def pop_many(self, count):
+        """
+        Pop multiple items from the storage, in-memory ones first.
+
+        :param count: number of items to be retrieved and removed from the queue.
+        """
+        events = InMemoryEventStorage.pop_many(self, count)
+        if len(events) < count:
+            events.extend(Event(*json.loads(record))
+                          for record in self._spillover.pop_many(count - len(events)))
+        return events
+
+    def clear(self):
+        """
+        Clear in-memory data.
+
+        Records spilled to disk are kept, they are still pending to be sent.
+        """
+        InMemoryEventStorage.clear(self)
+
+    def reopen_spillover(self):
+        """Move the disk log to a slot of this process after a fork."""
+        self._spillover.reopen()
+
+    def close_spillover(self):
+        """Close the disk log, keeping pending records for a later process."""
+        self._spillover.close()
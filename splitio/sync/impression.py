@@ -1,15 +1,18 @@
 import logging
-import queue
 
 from splitio.api import APIException
-from splitio.optional.loaders import asyncio
+from splitio.sync.util import BulkSynchronizer, BulkSynchronizerAsync, _FLUSH_TIME_BUDGET
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class ImpressionSynchronizer(object):
+class ImpressionSynchronizer(BulkSynchronizer):
     """Impressions synchronizer class."""
-    def __init__(self, impressions_api, storage, bulk_size):
+
+    _ITEMS = 'impressions'
+
+    def __init__(self, impressions_api, storage, bulk_size, max_in_flight=1,
+                 failed_queue_size=None, time_budget=_FLUSH_TIME_BUDGET):
         """
         Class constructor.
 
@@ -19,53 +22,24 @@ class ImpressionSynchronizer(object):
         :type storage: splitio.storage.ImpressionsStorage
         :param bulk_size: How many impressions to send per push.
         :type bulk_size: int
+        :param max_in_flight: How many bulks to post concurrently.
+        :type max_in_flight: int
+        :param failed_queue_size: Max impressions kept for retry. Defaults to one round of bulks.
+        :type failed_queue_size: int
+        :param time_budget: Max seconds spent draining storage on a single run.
+        :type time_budget: float
 
         """
+        BulkSynchronizer.__init__(self, storage, bulk_size, max_in_flight, failed_queue_size, time_budget)
         self._api = impressions_api
-        self._impression_storage = storage
-        self._bulk_size = bulk_size
-        self._failed = queue.Queue()
-
-    def _get_failed(self):
-        """Return up to <BULK_SIZE> impressions stored in the failed impressions queue."""
-        imps = []
-        count = 0
-        while count < self._bulk_size:
-            try:
-                imps.append(self._failed.get(False))
-                count += 1
-            except queue.Empty:
-                # If no more items in queue, break the loop
-                break
-        return imps
-
-    def _add_to_failed_queue(self, imps):
-        """
-        Add impressions that were about to be sent to a secondary queue for failed sends.
 
-        :param imps: List of impressions that failed to be pushed.
-        :type imps: list
-        """
-        for impression in imps:
-            self._failed.put(impression, False)
+    def _post(self, bulk):
+        """Send a bulk of impressions to the backend."""
+        self._api.flush_impressions(bulk)
 
     def synchronize_impressions(self):
-        """Send impressions from both the failed and new queues."""
-        to_send = self._get_failed()
-        if len(to_send) < self._bulk_size:
-            # If the amount of previously failed items is less than the bulk
-            # size, try to complete with new impressions from storage
-            to_send.extend(self._impression_storage.pop_many(self._bulk_size - len(to_send)))
-
-        if not to_send:
-            return
-
-        try:
-            self._api.flush_impressions(to_send)
-        except APIException:
-            _LOGGER.error('Exception raised while reporting impressions')
-            _LOGGER.debug('Exception information: ', exc_info=True)
-            self._add_to_failed_queue(to_send)
+        """Send impressions from both the failed and new queues until drained or out of time."""
+        self._synchronize()
 
 
 class ImpressionsCountSynchronizer(object):
@@ -99,65 +73,40 @@ class ImpressionsCountSynchronizer(object):
             _LOGGER.debug('Exception information: ', exc_info=True)
 
 
-class ImpressionSynchronizerAsync(object):
-    """Impressions async synchronizer class."""
-    def __init__(self, impressions_api, storage, bulk_size):
+class ImpressionSynchronizerAsync(BulkSynchronizerAsync):
+    """Impressions synchronizer async class."""
+
+    _ITEMS = 'impressions'
+
+    def __init__(self, impressions_api, storage, bulk_size, max_in_flight=1,
+                 failed_queue_size=None, time_budget=_FLUSH_TIME_BUDGET):
         """
         Class constructor.
 
         :param impressions_api: Impressions Api object to send data to the backend
-        :type impressions_api: splitio.api.impressions.ImpressionsAPI
+        :type impressions_api: splitio.api.impressions.ImpressionsAPIAsync
         :param storage: Impressions Storage
         :type storage: splitio.storage.ImpressionsStorage
         :param bulk_size: How many impressions to send per push.
         :type bulk_size: int
+        :param max_in_flight: How many bulks to post concurrently.
+        :type max_in_flight: int
+        :param failed_queue_size: Max impressions kept for retry. Defaults to one round of bulks.
+        :type failed_queue_size: int
+        :param time_budget: Max seconds spent draining storage on a single run.
+        :type time_budget: float
 
         """
+        BulkSynchronizerAsync.__init__(self, storage, bulk_size, max_in_flight, failed_queue_size, time_budget)
         self._api = impressions_api
-        self._impression_storage = storage
-        self._bulk_size = bulk_size
-        self._failed = asyncio.Queue()
-
-    async def _get_failed(self):
-        """Return up to <BULK_SIZE> impressions stored in the failed impressions queue."""
-        imps = []
-        count = 0
-        while count < self._bulk_size and self._failed.qsize() > 0:
-            try:
-                imps.append(await self._failed.get())
-                count += 1
-            except asyncio.QueueEmpty:
-                # If no more items in queue, break the loop
-                break
-        return imps
-
-    async def _add_to_failed_queue(self, imps):
-        """
-        Add impressions that were about to be sent to a secondary queue for failed sends.
 
-        :param imps: List of impressions that failed to be pushed.
-        :type imps: list
-        """
-        for impression in imps:
-            await self._failed.put(impression)
+    async def _post(self, bulk):
+        """Send a bulk of impressions to the backend."""
+        await self._api.flush_impressions(bulk)
 
     async def synchronize_impressions(self):
-        """Send impressions from both the failed and new queues."""
-        to_send = await self._get_failed()
-        if len(to_send) < self._bulk_size:
-            # If the amount of previously failed items is less than the bulk
-            # size, try to complete with new impressions from storage
-            to_send.extend(await self._impression_storage.pop_many(self._bulk_size - len(to_send)))
-
-        if not to_send:
-            return
-
-        try:
-            await self._api.flush_impressions(to_send)
-        except APIException:
-            _LOGGER.error('Exception raised while reporting impressions')
-            _LOGGER.debug('Exception information: ', exc_info=True)
-            await self._add_to_failed_queue(to_send)
+        """Send impressions from both the failed and new queues until drained or out of time."""
+        await self._synchronize()
 
 
 class ImpressionsCountSynchronizerAsync(object):
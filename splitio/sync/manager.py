@@ -141,7 +141,7 @@ class ManagerAsync(object):  # pylint:disable=too-many-instance-attributes
 
     _CENTINEL_EVENT = object()
 
-    def __init__(self, synchronizer, auth_api, streaming_enabled, sdk_metadata, telemetry_runtime_producer, sse_url=None, client_key=None):  # pylint:disable=too-many-arguments
+    def __init__(self, synchronizer, auth_api, streaming_enabled, sdk_metadata, telemetry_runtime_producer, sse_url=None, client_key=None, connector=None):  # pylint:disable=too-many-arguments
         """
         Construct Manager.
 
@@ -162,6 +162,9 @@ class ManagerAsync(object):  # pylint:disable=too-many-instance-attributes
 
         :param client_key: client key.
         :type client_key: str
+
+        :param connector: optional connector shared with the api http client.
+        :type connector: aiohttp.BaseConnector
         """
         self._streaming_enabled = streaming_enabled
         self._synchronizer = synchronizer
@@ -170,7 +173,8 @@ class ManagerAsync(object):  # pylint:disable=too-many-instance-attributes
             self._push_status_handler_active = True
             self._backoff = Backoff()
             self._queue = asyncio.Queue()
-            self._push = PushManagerAsync(auth_api, synchronizer, self._queue, sdk_metadata, telemetry_runtime_producer, sse_url, client_key)
+            self._push = PushManagerAsync(auth_api, synchronizer, self._queue, sdk_metadata, telemetry_runtime_producer, sse_url, client_key,
+                                          connector)
         self._stopped = False
 
     async def start(self, max_retry_attempts=_SYNC_ALL_NO_RETRIES):
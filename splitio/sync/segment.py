@@ -2,6 +2,9 @@ import logging
 import time
 import json
 import os
+import random
+import threading
+from collections import Counter
 
 from splitio.api import APIException
 from splitio.api.commons import FetchOptions
@@ -20,10 +23,202 @@ _ON_DEMAND_FETCH_BACKOFF_BASE = 10  # backoff base starting at 10 seconds
 _ON_DEMAND_FETCH_BACKOFF_MAX_WAIT = 60  # don't sleep for more than 1 minute
 _ON_DEMAND_FETCH_BACKOFF_MAX_RETRIES = 10
 _MAX_WORKERS = 10
+_POLL_JITTER = 0.1
+
+
+def _prioritize_segment_names(segment_names, feature_flags):
+    """
+    Sort segment names so the ones referenced by most feature flags come first.
+
+    :param segment_names: Segment names to sort.
+    :type segment_names: iterable(str)
+    :param feature_flags: Feature flags referencing the segments.
+    :type feature_flags: list(splitio.models.splits.Split)
+
+    :return: Sorted segment names.
+    :rtype: list(str)
+    """
+    references = Counter(name for feature_flag in feature_flags for name in feature_flag.get_segment_names())
+    return sorted(segment_names, key=lambda name: (-references[name], name))
+
+
+class SegmentSyncProgress(object):
+    """Track segments loading progress while bootstrapping."""
+
+    def __init__(self):
+        """Class constructor."""
+        self._lock = threading.Condition()
+        self._pending = set()
+        self._loaded = set()
+        self._failed = set()
+
+    def add(self, segment_names):
+        """
+        Register segments about to be synchronized.
+
+        :param segment_names: Segment names submitted.
+        :type segment_names: iterable(str)
+        """
+        with self._lock:
+            for segment_name in segment_names:
+                if segment_name not in self._loaded:
+                    self._failed.discard(segment_name)
+                    self._pending.add(segment_name)
+
+    def mark_done(self, segment_name, loaded):
+        """
+        Record a finished segment synchronization.
+
+        :param segment_name: Name of the segment.
+        :type segment_name: str
+        :param loaded: Whether the segment was fetched successfully.
+        :type loaded: bool
+        """
+        with self._lock:
+            self._pending.discard(segment_name)
+            if loaded:
+                self._loaded.add(segment_name)
+                self._failed.discard(segment_name)
+            elif segment_name not in self._loaded:
+                self._failed.add(segment_name)
+            self._lock.notify_all()
+
+    @property
+    def total(self):
+        """Return the amount of segments tracked."""
+        with self._lock:
+            return len(self._pending) + len(self._loaded) + len(self._failed)
+
+    @property
+    def loaded(self):
+        """Return the amount of segments fetched at least once."""
+        with self._lock:
+            return len(self._loaded)
+
+    @property
+    def failed(self):
+        """Return the amount of segments whose last fetch failed and were never loaded."""
+        with self._lock:
+            return len(self._failed)
+
+    def is_ready(self, segment_names=None):
+        """
+        Return whether the segments have been loaded.
+
+        :param segment_names: Segments to check, all tracked segments if None.
+        :type segment_names: iterable(str)
+
+        :rtype: bool
+        """
+        with self._lock:
+            if segment_names is None:
+                return not self._pending and not self._failed
+            return all(segment_name in self._loaded for segment_name in segment_names)
+
+    def wait(self, segment_names=None, timeout=None):
+        """
+        Block until the segments are done synchronizing, successfully or not.
+
+        :param segment_names: Segments to wait for, all tracked segments if None.
+        :type segment_names: iterable(str)
+        :param timeout: Max seconds to wait, None for no limit.
+        :type timeout: float
+
+        :return: True if all the segments were loaded. False otherwise.
+        :rtype: bool
+        """
+        segment_names = set(segment_names) if segment_names is not None else None
+        with self._lock:
+            self._lock.wait_for(
+                lambda: not (self._pending if segment_names is None else self._pending.intersection(segment_names)),
+                timeout)
+        return self.is_ready(segment_names)
+
+
+class SegmentPollSchedule(object):
+    """
+    Decide which segments are due on each periodic synchronization.
+
+    Every segment starts being polled on each run. Each poll without changes doubles the time
+    until the next one, up to `max_period`, and a change brings it back to `base_period`. Delays
+    are shortened by a random jitter so segments backing off together spread over different
+    runs, and never exceed `max_period`: a segment is fetched at most `max_period` plus one
+    synchronization period after its previous fetch.
+    """
+
+    def __init__(self, base_period, max_period, jitter=_POLL_JITTER):
+        """
+        Class constructor.
+
+        :param base_period: Seconds between polls of segments that change.
+        :type base_period: int
+        :param max_period: Max seconds between polls of any segment.
+        :type max_period: int
+        :param jitter: Max fraction by which each delay is randomly shortened.
+        :type jitter: float
+        """
+        self._lock = threading.Lock()
+        self._base_period = base_period
+        self._max_period = max(max_period, base_period)
+        self._jitter = jitter
+        self._segments = {}  # name -> [period, next poll]
+
+    def due(self, segment_names, now=None):
+        """
+        Filter the segments that should be fetched, forgetting those no longer in use.
+
+        :param segment_names: Segments in use.
+        :type segment_names: iterable(str)
+        :param now: Current monotonic time.
+        :type now: float
+
+        :return: Segments never polled or whose next poll time has been reached.
+        :rtype: list(str)
+        """
+        now = time.monotonic() if now is None else now
+        segment_names = list(segment_names)
+        in_use = set(segment_names)
+        with self._lock:
+            for name in [name for name in self._segments if name not in in_use]:
+                del self._segments[name]
+
+            return [name for name in segment_names
+                    if name not in self._segments or self._segments[name][1] <= now]
+
+    def record(self, segment_name, changed, now=None):
+        """
+        Schedule the next poll of a segment just fetched.
+
+        :param segment_name: Name of the segment.
+        :type segment_name: str
+        :param changed: Whether the fetch brought changes.
+        :type changed: bool
+        :param now: Current monotonic time.
+        :type now: float
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            state = self._segments.get(segment_name)
+            if state is None:
+                state = self._segments[segment_name] = [self._base_period, now]
+            else:
+                state[0] = self._base_period if changed else min(state[0] * 2, self._max_period)
+            state[1] = now + state[0] * (1 - random.uniform(0, self._jitter))
+
+    def poll_intervals(self):
+        """
+        Return the current delay between polls of each segment.
+
+        :return: Seconds between polls by segment name, before jitter.
+        :rtype: dict
+        """
+        with self._lock:
+            return {name: state[0] for name, state in self._segments.items()}
 
 
 class SegmentSynchronizer(object):
-    def __init__(self, segment_api, feature_flag_storage, segment_storage, rule_based_segment_storage):
+    def __init__(self, segment_api, feature_flag_storage, segment_storage, rule_based_segment_storage,
+                 max_workers=_MAX_WORKERS, critical_segments=None, poll_schedule=None):
         """
         Class constructor.
 
@@ -36,24 +231,51 @@ class SegmentSynchronizer(object):
         :param segment_storage: Segment storage reference.
         :type segment_storage: splitio.storage.SegmentStorage
 
+        :param max_workers: Amount of segments fetched concurrently.
+        :type max_workers: int
+
+        :param critical_segments: Optional, segments to wait for before reporting a full sync as done.
+        :type critical_segments: list(str)
+
+        :param poll_schedule: Optional, schedule deciding which segments each periodic sync fetches.
+        :type poll_schedule: SegmentPollSchedule
+
         """
         self._api = segment_api
         self._feature_flag_storage = feature_flag_storage
         self._segment_storage = segment_storage
         self._rule_based_segment_storage = rule_based_segment_storage
-        self._worker_pool = workerpool.WorkerPool(_MAX_WORKERS, self.synchronize_segment)
+        self._max_workers = max_workers
+        self._critical_segments = set(critical_segments) if critical_segments is not None else None
+        self._poll_schedule = poll_schedule
+        self._progress = SegmentSyncProgress()
+        self._worker_pool = workerpool.WorkerPool(self._max_workers, self._synchronize_tracked_segment)
         self._worker_pool.start()
+        self._drain = None
+        self._drain_lock = threading.Lock()
         self._backoff = Backoff(
                                 _ON_DEMAND_FETCH_BACKOFF_BASE,
                                 _ON_DEMAND_FETCH_BACKOFF_MAX_WAIT)
 
+    @property
+    def progress(self):
+        """Return segments loading progress."""
+        return self._progress
+
+    @property
+    def poll_schedule(self):
+        """Return the adaptive poll schedule, if any."""
+        return self._poll_schedule
+
     def recreate(self):
         """
         Create worker_pool on forked processes.
 
         """
-        self._worker_pool = workerpool.WorkerPool(_MAX_WORKERS, self.synchronize_segment)
+        self._worker_pool = workerpool.WorkerPool(self._max_workers, self._synchronize_tracked_segment)
         self._worker_pool.start()
+        self._drain = None
+        self._drain_lock = threading.Lock()
 
     def shutdown(self):
         """
@@ -94,19 +316,20 @@ class SegmentSynchronizer(object):
                 _LOGGER.debug('Exception information: ', exc_info=True)
                 raise exc
 
+            since, till_fetched = segment_changes['since'], segment_changes['till']
             if change_number == -1:  # first time fetching the segment
-                new_segment = segments.from_raw(segment_changes)
-                self._segment_storage.put(new_segment)
+                self._segment_storage.put(segments.from_raw(segment_changes))
             else:
                 self._segment_storage.update(
                     segment_name,
                     segment_changes['added'],
                     segment_changes['removed'],
-                    segment_changes['till']
+                    till_fetched
                 )
+            segment_changes = None  # release the page before fetching the next one
 
-            if segment_changes['till'] == segment_changes['since']:
-                return segment_changes['till']
+            if till_fetched == since:
+                return till_fetched
 
     def _attempt_segment_sync(self, segment_name, fetch_options, till=None):
         """
@@ -169,10 +392,71 @@ class SegmentSynchronizer(object):
                         without_cdn_attempts)
         return False
 
+    def _synchronize_tracked_segment(self, segment_name):
+        """
+        Update a segment from the worker pool and record its progress.
+
+        :param segment_name: Name of the segment to update.
+        :type segment_name: str
+        """
+        loaded = False
+        try:
+            if self._poll_schedule is None:
+                loaded = self.synchronize_segment(segment_name)
+                return
+
+            change_number = self._segment_storage.get_change_number(segment_name)
+            loaded = self.synchronize_segment(segment_name)
+            if loaded:
+                self._poll_schedule.record(
+                    segment_name, self._segment_storage.get_change_number(segment_name) != change_number)
+        finally:
+            self._progress.mark_done(segment_name, loaded)
+
+    def _get_segment_names(self):
+        """Return the names of every segment referenced by feature flags or rule based segments."""
+        segment_names = set(self._feature_flag_storage.get_segment_names())
+        segment_names.update(get_standard_segment_names_in_rbs_storage(self._rule_based_segment_storage))
+        return segment_names
+
+    def _drain_worker_pool(self):
+        """Wait for segments left loading in background, resetting the pool's failure flag."""
+        if self._worker_pool.wait_for_completion():
+            _LOGGER.warning('Some non critical segments failed to load, they will be retried on the next sync.')
+
+    def _start_drain(self):
+        """Wait in background for the segments left loading, replacing any previous drain."""
+        drain = threading.Thread(target=self._drain_worker_pool, name='SegmentsDrain', daemon=True)
+        with self._drain_lock:
+            self._drain = drain
+        drain.start()
+
+    def _wait_for_drain(self):
+        """Wait for the previous sync to finish loading its non critical segments."""
+        with self._drain_lock:
+            drain, self._drain = self._drain, None
+        if drain is not None:
+            drain.join()
+
+    def synchronize_due_segments(self):
+        """
+        Periodic synchronization entry point, fetching only the segments due if polling is adaptive.
+
+        :return: True if no error occurs. False otherwise.
+        :rtype: bool
+        """
+        if self._poll_schedule is None:
+            return self.synchronize_segments()
+
+        return self.synchronize_segments(self._poll_schedule.due(self._get_segment_names()))
+
     def synchronize_segments(self, segment_names = None, dont_wait = False):
         """
         Submit all current segments and wait for them to finish depend on dont_wait flag, then set the ready flag.
 
+        Segments referenced by most feature flags are submitted first. When critical segments
+        are configured, only those are waited for and the rest keep loading in background.
+
         :param segment_names: Optional, array of segment names to update.
         :type segment_name: {str}
 
@@ -182,10 +466,13 @@ class SegmentSynchronizer(object):
         :return: True if no error occurs or dont_wait flag is True. False otherwise.
         :rtype: bool
         """
+        if not dont_wait:
+            self._wait_for_drain()
         if segment_names is None:
-            segment_names = set(self._feature_flag_storage.get_segment_names())
-            segment_names.update(get_standard_segment_names_in_rbs_storage(self._rule_based_segment_storage))
+            segment_names = self._get_segment_names()
 
+        segment_names = _prioritize_segment_names(segment_names, self._feature_flag_storage.get_all_splits())
+        self._progress.add(segment_names)
         for segment_name in segment_names:
             _LOGGER.debug("Adding segment name to sync worker")
             _LOGGER.debug(segment_name)
@@ -193,6 +480,12 @@ class SegmentSynchronizer(object):
         if (dont_wait):
             return True
 
+        if self._critical_segments is not None:
+            ready = self._progress.wait(self._critical_segments.intersection(segment_names))
+            # the rest keep loading, the pool is drained in background before the next blocking sync.
+            self._start_drain()
+            return ready
+
         return not self._worker_pool.wait_for_completion()
 
     def segment_exist_in_storage(self, segment_name):
@@ -209,7 +502,8 @@ class SegmentSynchronizer(object):
 
 
 class SegmentSynchronizerAsync(object):
-    def __init__(self, segment_api, feature_flag_storage, segment_storage, rule_based_segment_storage):
+    def __init__(self, segment_api, feature_flag_storage, segment_storage, rule_based_segment_storage,
+                 max_workers=_MAX_WORKERS, critical_segments=None, poll_schedule=None):
         """
         Class constructor.
 
@@ -222,24 +516,49 @@ class SegmentSynchronizerAsync(object):
         :param segment_storage: Segment storage reference.
         :type segment_storage: splitio.storage.SegmentStorage
 
+        :param max_workers: Amount of segments fetched concurrently.
+        :type max_workers: int
+
+        :param critical_segments: Optional, segments to wait for before reporting a full sync as done.
+        :type critical_segments: list(str)
+
+        :param poll_schedule: Optional, schedule deciding which segments each periodic sync fetches.
+        :type poll_schedule: SegmentPollSchedule
+
         """
         self._api = segment_api
         self._feature_flag_storage = feature_flag_storage
         self._segment_storage = segment_storage
         self._rule_based_segment_storage = rule_based_segment_storage
-        self._worker_pool = workerpool.WorkerPoolAsync(_MAX_WORKERS, self.synchronize_segment)
+        self._max_workers = max_workers
+        self._critical_segments = set(critical_segments) if critical_segments is not None else None
+        self._poll_schedule = poll_schedule
+        self._progress = SegmentSyncProgress()
+        self._worker_pool = workerpool.WorkerPoolAsync(self._max_workers, self._synchronize_tracked_segment)
         self._worker_pool.start()
+        self._jobs = None
         self._backoff = Backoff(
                                 _ON_DEMAND_FETCH_BACKOFF_BASE,
                                 _ON_DEMAND_FETCH_BACKOFF_MAX_WAIT)
 
+    @property
+    def progress(self):
+        """Return segments loading progress."""
+        return self._progress
+
+    @property
+    def poll_schedule(self):
+        """Return the adaptive poll schedule, if any."""
+        return self._poll_schedule
+
     def recreate(self):
         """
         Create worker_pool on forked processes.
 
         """
-        self._worker_pool = workerpool.WorkerPoolAsync(_MAX_WORKERS, self.synchronize_segment)
+        self._worker_pool = workerpool.WorkerPoolAsync(self._max_workers, self._synchronize_tracked_segment)
         self._worker_pool.start()
+        self._jobs = None
 
     async def shutdown(self):
         """
@@ -280,19 +599,20 @@ class SegmentSynchronizerAsync(object):
                 _LOGGER.debug('Exception information: ', exc_info=True)
                 raise exc
 
+            since, till_fetched = segment_changes['since'], segment_changes['till']
             if change_number == -1:  # first time fetching the segment
-                new_segment = segments.from_raw(segment_changes)
-                await self._segment_storage.put(new_segment)
+                await self._segment_storage.put(segments.from_raw(segment_changes))
             else:
                 await self._segment_storage.update(
                     segment_name,
                     segment_changes['added'],
                     segment_changes['removed'],
-                    segment_changes['till']
+                    till_fetched
                 )
+            segment_changes = None  # release the page before fetching the next one
 
-            if segment_changes['till'] == segment_changes['since']:
-                return segment_changes['till']
+            if till_fetched == since:
+                return till_fetched
 
     async def _attempt_segment_sync(self, segment_name, fetch_options, till=None):
         """
@@ -356,10 +676,52 @@ class SegmentSynchronizerAsync(object):
                         without_cdn_attempts)
         return False
 
+    async def _synchronize_tracked_segment(self, segment_name):
+        """
+        Update a segment from the worker pool and record its progress.
+
+        :param segment_name: Name of the segment to update.
+        :type segment_name: str
+        """
+        loaded = False
+        try:
+            if self._poll_schedule is None:
+                loaded = await self.synchronize_segment(segment_name)
+                return
+
+            change_number = await self._segment_storage.get_change_number(segment_name)
+            loaded = await self.synchronize_segment(segment_name)
+            if loaded:
+                self._poll_schedule.record(
+                    segment_name, await self._segment_storage.get_change_number(segment_name) != change_number)
+        finally:
+            self._progress.mark_done(segment_name, loaded)
+
+    async def _get_segment_names(self):
+        """Return the names of every segment referenced by feature flags or rule based segments."""
+        segment_names = set(await self._feature_flag_storage.get_segment_names())
+        segment_names.update(await get_standard_segment_names_in_rbs_storage_async(self._rule_based_segment_storage))
+        return segment_names
+
+    async def synchronize_due_segments(self):
+        """
+        Periodic synchronization entry point, fetching only the segments due if polling is adaptive.
+
+        :return: True if no error occurs. False otherwise.
+        :rtype: bool
+        """
+        if self._poll_schedule is None:
+            return await self.synchronize_segments()
+
+        return await self.synchronize_segments(self._poll_schedule.due(await self._get_segment_names()))
+
     async def synchronize_segments(self, segment_names = None, dont_wait = False):
         """
         Submit all current segments and wait for them to finish depend on dont_wait flag, then set the ready flag.
 
+        Segments referenced by most feature flags are submitted first. When critical segments
+        are configured, only those are waited for and the rest keep loading in background.
+
         :param segment_names: Optional, array of segment names to update.
         :type segment_name: {str}
 
@@ -369,15 +731,36 @@ class SegmentSynchronizerAsync(object):
         :return: True if no error occurs or dont_wait flag is True. False otherwise.
         :rtype: bool
         """
+        if self._critical_segments is not None and self._jobs is not None and not dont_wait:
+            # wait for the previous sync to finish loading its non critical segments.
+            jobs, self._jobs = self._jobs, None
+            if not await jobs.await_completion():
+                _LOGGER.warning('Some non critical segments failed to load, they will be retried on the next sync.')
+
         if segment_names is None:
-            segment_names = set(await self._feature_flag_storage.get_segment_names())
-            segment_names.update(await get_standard_segment_names_in_rbs_storage_async(self._rule_based_segment_storage))
+            segment_names = await self._get_segment_names()
+
+        segment_names = _prioritize_segment_names(segment_names, await self._feature_flag_storage.get_all_splits())
+        self._progress.add(segment_names)
+        if self._critical_segments is None or dont_wait:
+            jobs = await self._worker_pool.submit_work(segment_names)
+            if self._critical_segments is None or self._jobs is None:
+                # don't lose track of non critical segments still loading in background.
+                self._jobs = jobs
+            if (dont_wait):
+                return True
 
-        self._jobs = await self._worker_pool.submit_work(segment_names)
-        if (dont_wait):
+            return await jobs.await_completion()
+
+        critical = [segment_name for segment_name in segment_names if segment_name in self._critical_segments]
+        others = [segment_name for segment_name in segment_names if segment_name not in self._critical_segments]
+        critical_jobs = await self._worker_pool.submit_work(critical) if critical else None
+        if others:
+            self._jobs = await self._worker_pool.submit_work(others)
+        if critical_jobs is None:
             return True
 
-        return await self._jobs.await_completion()
+        return await critical_jobs.await_completion()
 
     async def segment_exist_in_storage(self, segment_name):
         """
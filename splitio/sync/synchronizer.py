@@ -90,7 +90,8 @@ class SplitTasks(object):
     """SplitTasks."""
 
     def __init__(self, feature_flag_task, segment_task, impressions_task, events_task,  # pylint:disable=too-many-arguments
-                 impressions_count_task, telemetry_task=None, unique_keys_task = None, clear_filter_task = None):
+                 impressions_count_task, telemetry_task=None, unique_keys_task = None, clear_filter_task = None,
+                 snapshot_task=None):
         """
         Class constructor.
 
@@ -104,6 +105,8 @@ class SplitTasks(object):
         :type events_task: splitio.tasks.events_sync.EventsSyncTask
         :param impressions_count_task: sync for impression_counts
         :type impressions_count_task: splitio.tasks.impressions_sync.ImpressionsCountSyncTask
+        :param snapshot_task: optional task persisting rollout data to disk
+        :type snapshot_task: splitio.tasks.snapshot_sync.SnapshotSyncTask
         """
         self._feature_flag_task = feature_flag_task
         self._segment_task = segment_task
@@ -113,6 +116,7 @@ class SplitTasks(object):
         self._unique_keys_task = unique_keys_task
         self._clear_filter_task = clear_filter_task
         self._telemetry_task = telemetry_task
+        self._snapshot_task = snapshot_task
 
     @property
     def split_task(self):
@@ -154,6 +158,11 @@ class SplitTasks(object):
         """Return clear filter sync task."""
         return self._telemetry_task
 
+    @property
+    def snapshot_task(self):
+        """Return snapshot task."""
+        return self._snapshot_task
+
 class BaseSynchronizer(object, metaclass=abc.ABCMeta):
     """Synchronizer interface."""
 
@@ -257,6 +266,8 @@ class SynchronizerInMemoryBase(BaseSynchronizer):
             self._periodic_data_recording_tasks.append(self._split_tasks.unique_keys_task)
         if self._split_tasks.clear_filter_task:
             self._periodic_data_recording_tasks.append(self._split_tasks.clear_filter_task)
+        if self._split_tasks.snapshot_task:
+            self._periodic_data_recording_tasks.append(self._split_tasks.snapshot_task)
 
     @property
     def split_sync(self):
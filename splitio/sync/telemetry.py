@@ -1,6 +1,26 @@
 """Telemetry Sync Class."""
 import abc
 
+from splitio.models.grammar.matchers.utils import regex
+from splitio.models.telemetry import MAX_TAGS
+
+
+def _add_regex_budget_tag(stats):
+    """
+    Tag the stats with the number of regexes that ran out of time budget since the last push.
+
+    :param stats: formatted stats
+    :type stats: Dict
+    """
+    exhausted = regex.pop_exhausted_count()
+    if not exhausted:
+        return
+
+    tags = stats.get('t') or []
+    if len(tags) < MAX_TAGS:
+        stats['t'] = tags + ['regexBudgetExceeded:%d' % exhausted]
+
+
 class TelemetrySynchronizer(object):
     """Telemetry synchronizer class."""
 
@@ -79,6 +99,7 @@ class InMemoryTelemetrySubmitter(TelemetrySubmitter):
         }
         merged_dict.update(self._telemetry_runtime_consumer.pop_formatted_stats())
         merged_dict.update(self._telemetry_evaluation_consumer.pop_formatted_stats())
+        _add_regex_budget_tag(merged_dict)
         return merged_dict
 
 
@@ -116,6 +137,7 @@ class InMemoryTelemetrySubmitterAsync(TelemetrySubmitter):
         }
         merged_dict.update(await self._telemetry_runtime_consumer.pop_formatted_stats())
         merged_dict.update(await self._telemetry_evaluation_consumer.pop_formatted_stats())
+        _add_regex_budget_tag(merged_dict)
         return merged_dict
 
 class RedisTelemetrySubmitter(object):
@@ -1,3 +1,5 @@
+import itertools
+
 _UNIQUE_KEYS_MAX_BULK_SIZE = 5000
 
 class UniqueKeysSynchronizerBase(object):
@@ -14,39 +16,33 @@ class UniqueKeysSynchronizerBase(object):
 
     def _split_cache_to_bulks(self, cache):
         """
-        Split the current unique keys dictionary into seperate dictionaries,
-        each with the size of max_bulk_size. Overflow the last feature_flag set() to new unique keys dictionary.
+        Stream the unique keys dictionary as dictionaries holding up to max_bulk_size keys each.
+
+        Feature flags are removed from the given cache as they are consumed so memory is released
+        while bulks are sent, and keys are sliced straight from each set without copying it first.
+        A feature flag exceeding the room left in the current bulk overflows into the next ones.
 
-        :return: array of unique keys dictionaries
-        :rtype: [Dict{'feature_flag1': set(), 'feature_flag2': set(), .. }]
+        :return: generator of unique keys dictionaries
+        :rtype: generator(Dict{'feature_flag1': [keys], 'feature_flag2': [keys], .. })
         """
-        bulks = []
         bulk = {}
-        total_size = 0
-        for feature_flag in cache:
-            total_size += len(cache[feature_flag])
-            if total_size > self._max_bulk_size:
-                keys_list = list(cache[feature_flag])
-                chunk_list = self._chunks(keys_list)
-                if bulk != {}:
-                    bulks.append(bulk)
-                for bulk_keys in chunk_list:
-                    bulk[feature_flag] = set(bulk_keys)
-                    bulks.append(bulk)
+        bulk_size = 0
+        while cache:
+            feature_flag, keys = cache.popitem()
+            keys_iter = iter(keys)
+            remaining = len(keys)
+            while remaining > 0:
+                chunk = list(itertools.islice(keys_iter, self._max_bulk_size - bulk_size))
+                bulk[feature_flag] = chunk
+                bulk_size += len(chunk)
+                remaining -= len(chunk)
+                if bulk_size >= self._max_bulk_size:
+                    yield bulk
                     bulk = {}
-            else:
-                bulk[feature_flag] = cache[feature_flag]
-        if total_size != 0 and bulk != {}:
-            bulks.append(bulk)
-
-        return bulks
+                    bulk_size = 0
 
-    def _chunks(self, keys_list):
-        """
-        Split array into chunks
-        """
-        for i in range(0, len(keys_list), self._max_bulk_size):
-            yield keys_list[i:i + self._max_bulk_size]
+        if bulk:
+            yield bulk
 
 
 class UniqueKeysSynchronizer(UniqueKeysSynchronizerBase):
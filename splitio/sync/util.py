@@ -1,8 +1,20 @@
 import hashlib
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from splitio.api import APIException
+from splitio.optional.loaders import asyncio
+from splitio.util.backoff import Backoff
 
 _LOGGER = logging.getLogger(__name__)
 
+_FLUSH_TIME_BUDGET = 10  # seconds
+_FAILED_BACKOFF_BASE = 1  # seconds
+_FAILED_BACKOFF_MAX_WAIT = 60  # seconds
+
 def _get_sha(fetched):
     """
     Return sha256 of given string.
@@ -66,3 +78,404 @@ def _sanitize_object_element(object, object_name, element_name, default_value, l
 def convert_to_new_spec(body):
     return {"ff": {"d": body["splits"], "s": body["since"], "t": body["till"]}, 
             "rbs": {"d": [], "s": -1, "t": -1}}
+
+
+class AdaptiveBulkSize(object):
+    """
+    Bulk size controller driven by observed flush latency.
+
+    Grows the bulk size additively while flushes complete within the target latency and
+    halves it whenever a flush is slow or fails, never going outside [min_size, max_size].
+    Bulks posted concurrently report from several threads, so adjustments are serialized.
+    """
+
+    def __init__(self, max_size, min_size=None, target_latency=5):
+        """
+        Class constructor.
+
+        :param max_size: Upper bound for the bulk size (the configured bulk size).
+        :type max_size: int
+        :param min_size: Lower bound for the bulk size.
+        :type min_size: int
+        :param target_latency: Seconds a bulk post is expected to take at most.
+        :type target_latency: float
+        """
+        self._max_size = max(1, max_size)
+        self._min_size = max(1, min(min_size if min_size is not None else self._max_size // 10,
+                                    self._max_size))
+        self._step = max(1, self._max_size // 10)
+        self._target_latency = target_latency
+        self._size = self._max_size
+        self._lock = threading.Lock()
+
+    @property
+    def size(self):
+        """Return the current bulk size."""
+        return self._size
+
+    def record_success(self, count, elapsed):
+        """
+        Adjust bulk size after a successful flush.
+
+        :param count: Number of items sent in the bulk.
+        :type count: int
+        :param elapsed: Seconds the flush took.
+        :type elapsed: float
+        """
+        with self._lock:
+            if elapsed > self._target_latency:
+                self._size = max(self._min_size, min(self._size, count) // 2)
+            elif count >= self._size:
+                self._size = min(self._max_size, self._size + self._step)
+
+    def record_failure(self):
+        """Shrink bulk size after a failed flush."""
+        with self._lock:
+            self._size = max(self._min_size, self._size // 2)
+
+
+class BulkSynchronizerBase(object):
+    """
+    Base for synchronizers posting queued items in bulks.
+
+    Each run drains storage until it's empty or the time budget runs out, posting up to
+    <max_in_flight> bulks at a time. Bulks the backend rejects are kept in a bounded queue and
+    sent first on later runs, once a backoff since the last failure has passed.
+    """
+
+    _ITEMS = 'items'
+
+    def __init__(self, storage, bulk_size, max_in_flight, time_budget):
+        """
+        Class constructor.
+
+        :param storage: Storage to pop items from.
+        :type storage: object
+        :param bulk_size: How many items to send per push.
+        :type bulk_size: int
+        :param max_in_flight: How many bulks to post concurrently.
+        :type max_in_flight: int
+        :param time_budget: Max seconds spent draining storage on a single run.
+        :type time_budget: float
+        """
+        self._storage = storage
+        self._bulk_size = bulk_size
+        self._bulk_sizer = AdaptiveBulkSize(bulk_size)
+        self._max_in_flight = max(1, max_in_flight)
+        self._time_budget = time_budget
+        self._backoff = Backoff(_FAILED_BACKOFF_BASE, _FAILED_BACKOFF_MAX_WAIT)
+        self._retry_at = 0
+
+    def _failed_queue_size(self, failed_queue_size):
+        """Return the failed queue bound, one round of bulks unless configured."""
+        return failed_queue_size if failed_queue_size is not None else self._bulk_size * self._max_in_flight
+
+    def _backing_off(self, force):
+        """Return whether this run should be skipped while the backend is failing."""
+        if force or time.monotonic() >= self._retry_at:
+            return False
+
+        _LOGGER.debug('%s backend failing, waiting for backoff before retrying.', self._ITEMS.capitalize())
+        return True
+
+    def _record_results(self, failed):
+        """
+        Schedule the next retry after failed bulks, or reset the backoff.
+
+        :return: True if every bulk was accepted. False otherwise.
+        :rtype: bool
+        """
+        if failed:
+            self._retry_at = time.monotonic() + self._backoff.get()
+            return False
+
+        self._backoff.reset()
+        return True
+
+    def _log_post_failure(self):
+        """Log a bulk rejected by the backend."""
+        _LOGGER.error('Exception raised while reporting %s', self._ITEMS)
+        _LOGGER.debug('Exception information: ', exc_info=True)
+
+
+class BulkSynchronizer(BulkSynchronizerBase):
+    """Base for synchronizers posting queued items in bulks, from threads."""
+
+    def __init__(self, storage, bulk_size, max_in_flight=1, failed_queue_size=None,
+                 time_budget=_FLUSH_TIME_BUDGET):
+        """
+        Class constructor.
+
+        :param storage: Storage to pop items from.
+        :type storage: object
+        :param bulk_size: How many items to send per push.
+        :type bulk_size: int
+        :param max_in_flight: How many bulks to post concurrently.
+        :type max_in_flight: int
+        :param failed_queue_size: Max items kept for retry. Defaults to one round of bulks.
+        :type failed_queue_size: int
+        :param time_budget: Max seconds spent draining storage on a single run.
+        :type time_budget: float
+        """
+        BulkSynchronizerBase.__init__(self, storage, bulk_size, max_in_flight, time_budget)
+        self._failed = queue.Queue(self._failed_queue_size(failed_queue_size))
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def _post(self, bulk):
+        """
+        Send a bulk to the backend.
+
+        :param bulk: Items to send.
+        :type bulk: list
+
+        :raises APIException: If the backend rejected the bulk.
+        """
+        raise NotImplementedError()
+
+    def _get_failed(self, count):
+        """Return up to <count> items stored in the failed items queue."""
+        items = []
+        while len(items) < count:
+            try:
+                items.append(self._failed.get(False))
+            except queue.Empty:
+                # If no more items in queue, break the loop
+                break
+        return items
+
+    def _add_to_failed_queue(self, items):
+        """
+        Add items that were about to be sent to a secondary queue for failed sends.
+
+        :param items: List of items that failed to be pushed.
+        :type items: list
+        """
+        for index, item in enumerate(items):
+            try:
+                self._failed.put(item, False)
+            except queue.Full:
+                _LOGGER.warning('Failed %s queue is full, dropping %d %s.',
+                                self._ITEMS, len(items) - index, self._ITEMS)
+                return
+
+    def _next_bulk(self, size):
+        """Build a bulk of up to <size> items, previously failed ones first."""
+        to_send = self._get_failed(size)
+        if len(to_send) < size:
+            # If the amount of previously failed items is less than the bulk
+            # size, try to complete with new items from storage
+            to_send.extend(self._storage.pop_many(size - len(to_send)))
+        return to_send
+
+    def _flush(self, bulk):
+        """
+        Post a single bulk.
+
+        :return: True if the bulk was accepted by the backend. False otherwise.
+        :rtype: bool
+        """
+        start = time.monotonic()
+        try:
+            self._post(bulk)
+        except APIException:
+            self._log_post_failure()
+            self._bulk_sizer.record_failure()
+            return False
+        self._bulk_sizer.record_success(len(bulk), time.monotonic() - start)
+        return True
+
+    def _flush_bulks(self, bulks):
+        """
+        Post bulks concurrently and push the ones that failed into the retry queue.
+
+        :return: True if every bulk was accepted. False otherwise.
+        :rtype: bool
+        """
+        if len(bulks) == 1:
+            results = [self._flush(bulks[0])]
+        else:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(self._max_in_flight,
+                                                        thread_name_prefix='%s_flush' % self._ITEMS)
+                executor = self._executor
+            results = list(executor.map(self._flush, bulks))
+
+        failed = [bulk for bulk, success in zip(bulks, results) if not success]
+        for bulk in failed:
+            self._add_to_failed_queue(bulk)
+
+        return self._record_results(failed)
+
+    def _synchronize(self, force=False):
+        """
+        Send items from both the failed queue and storage until drained or out of time.
+
+        :param force: Whether to send even if still backing off from a previous failure.
+        :type force: bool
+        """
+        if self._backing_off(force):
+            return
+
+        deadline = time.monotonic() + self._time_budget
+        while True:
+            bulks = []
+            drained = False
+            for _ in range(self._max_in_flight):
+                size = self._bulk_sizer.size
+                bulk = self._next_bulk(size)
+                if bulk:
+                    bulks.append(bulk)
+                if len(bulk) < size:
+                    drained = True
+                    break
+
+            if not bulks or not self._flush_bulks(bulks):
+                return
+
+            if drained or time.monotonic() >= deadline:
+                return
+
+    def shutdown(self):
+        """Send what's left ignoring any backoff, then release the threads posting bulks."""
+        try:
+            self._synchronize(force=True)
+        finally:
+            with self._executor_lock:
+                executor, self._executor = self._executor, None
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+
+class BulkSynchronizerAsync(BulkSynchronizerBase):
+    """Base for synchronizers posting queued items in bulks, from the event loop."""
+
+    def __init__(self, storage, bulk_size, max_in_flight=1, failed_queue_size=None,
+                 time_budget=_FLUSH_TIME_BUDGET):
+        """
+        Class constructor.
+
+        :param storage: Storage to pop items from.
+        :type storage: object
+        :param bulk_size: How many items to send per push.
+        :type bulk_size: int
+        :param max_in_flight: How many bulks to post concurrently.
+        :type max_in_flight: int
+        :param failed_queue_size: Max items kept for retry. Defaults to one round of bulks.
+        :type failed_queue_size: int
+        :param time_budget: Max seconds spent draining storage on a single run.
+        :type time_budget: float
+        """
+        BulkSynchronizerBase.__init__(self, storage, bulk_size, max_in_flight, time_budget)
+        self._failed = asyncio.Queue(self._failed_queue_size(failed_queue_size))
+
+    async def _post(self, bulk):
+        """
+        Send a bulk to the backend.
+
+        :param bulk: Items to send.
+        :type bulk: list
+
+        :raises APIException: If the backend rejected the bulk.
+        """
+        raise NotImplementedError()
+
+    async def _get_failed(self, count):
+        """Return up to <count> items stored in the failed items queue."""
+        items = []
+        while len(items) < count and self._failed.qsize() > 0:
+            try:
+                items.append(self._failed.get_nowait())
+            except asyncio.QueueEmpty:
+                # If no more items in queue, break the loop
+                break
+        return items
+
+    async def _add_to_failed_queue(self, items):
+        """
+        Add items that were about to be sent to a secondary queue for failed sends.
+
+        :param items: List of items that failed to be pushed.
+        :type items: list
+        """
+        for index, item in enumerate(items):
+            try:
+                self._failed.put_nowait(item)
+            except asyncio.QueueFull:
+                _LOGGER.warning('Failed %s queue is full, dropping %d %s.',
+                                self._ITEMS, len(items) - index, self._ITEMS)
+                return
+
+    async def _next_bulk(self, size):
+        """Build a bulk of up to <size> items, previously failed ones first."""
+        to_send = await self._get_failed(size)
+        if len(to_send) < size:
+            # If the amount of previously failed items is less than the bulk
+            # size, try to complete with new items from storage
+            to_send.extend(await self._storage.pop_many(size - len(to_send)))
+        return to_send
+
+    async def _flush(self, bulk):
+        """
+        Post a single bulk.
+
+        :return: True if the bulk was accepted by the backend. False otherwise.
+        :rtype: bool
+        """
+        start = time.monotonic()
+        try:
+            await self._post(bulk)
+        except APIException:
+            self._log_post_failure()
+            self._bulk_sizer.record_failure()
+            return False
+        self._bulk_sizer.record_success(len(bulk), time.monotonic() - start)
+        return True
+
+    async def _flush_bulks(self, bulks):
+        """
+        Post bulks concurrently and push the ones that failed into the retry queue.
+
+        :return: True if every bulk was accepted. False otherwise.
+        :rtype: bool
+        """
+        results = await asyncio.gather(*[self._flush(bulk) for bulk in bulks])
+        failed = [bulk for bulk, success in zip(bulks, results) if not success]
+        for bulk in failed:
+            await self._add_to_failed_queue(bulk)
+
+        return self._record_results(failed)
+
+    async def _synchronize(self, force=False):
+        """
+        Send items from both the failed queue and storage until drained or out of time.
+
+        :param force: Whether to send even if still backing off from a previous failure.
+        :type force: bool
+        """
+        if self._backing_off(force):
+            return
+
+        deadline = time.monotonic() + self._time_budget
+        while True:
+            bulks = []
+            drained = False
+            for _ in range(self._max_in_flight):
+                size = self._bulk_sizer.size
+                bulk = await self._next_bulk(size)
+                if bulk:
+                    bulks.append(bulk)
+                if len(bulk) < size:
+                    drained = True
+                    break
+
+            if not bulks or not await self._flush_bulks(bulks):
+                return
+
+            if drained or time.monotonic() >= deadline:
+                return
+
+    async def shutdown(self):
+        """Send what's left ignoring any backoff."""
+        await self._synchronize(force=True)
@@ -37,7 +37,7 @@ class EventsSyncTaskBase(BaseSynchronizationTask):
 class EventsSyncTask(EventsSyncTaskBase):
     """Events synchronization task uses an asynctask.AsyncTask to send events."""
 
-    def __init__(self, synchronize_events, period):
+    def __init__(self, synchronize_events, period, on_stop=None):
         """
         Class constructor.
 
@@ -45,10 +45,13 @@ class EventsSyncTask(EventsSyncTaskBase):
         :type synchronize_events: splitio.api.events.EventsAPI
         :param period: How many seconds to wait between subsequent event pushes to the BE.
         :type period: int
+        :param on_stop: Final flush run when the task stops. Defaults to the sender.
+        :type on_stop: func
 
         """
         self._period = period
-        self._task = AsyncTask(synchronize_events, self._period, on_stop=synchronize_events)
+        self._task = AsyncTask(synchronize_events, self._period,
+                               on_stop=on_stop if on_stop is not None else synchronize_events)
 
     def stop(self, event=None):
         """Stop executing the events synchronization task."""
@@ -58,7 +61,7 @@ class EventsSyncTask(EventsSyncTaskBase):
 class EventsSyncTaskAsync(EventsSyncTaskBase):
     """Events synchronization task uses an asynctask.AsyncTaskAsync to send events."""
 
-    def __init__(self, synchronize_events, period):
+    def __init__(self, synchronize_events, period, on_stop=None):
         """
         Class constructor.
 
@@ -66,10 +69,13 @@ class EventsSyncTaskAsync(EventsSyncTaskBase):
         :type synchronize_events: splitio.api.events.EventsAPIAsync
         :param period: How many seconds to wait between subsequent event pushes to the BE.
         :type period: int
+        :param on_stop: Final flush run when the task stops. Defaults to the sender.
+        :type on_stop: func
 
         """
         self._period = period
-        self._task = AsyncTaskAsync(synchronize_events, self._period, on_stop=synchronize_events)
+        self._task = AsyncTaskAsync(synchronize_events, self._period,
+                                    on_stop=on_stop if on_stop is not None else synchronize_events)
 
     async def stop(self, event=None):
         """Stop executing the events synchronization task."""
@@ -37,7 +37,7 @@ class ImpressionsSyncTaskBase(BaseSynchronizationTask):
 class ImpressionsSyncTask(ImpressionsSyncTaskBase):
     """Impressions synchronization task uses an asynctask.AsyncTask to send impressions."""
 
-    def __init__(self, synchronize_impressions, period):
+    def __init__(self, synchronize_impressions, period, on_stop=None):
         """
         Class constructor.
 
@@ -45,11 +45,13 @@ class ImpressionsSyncTask(ImpressionsSyncTaskBase):
         :type synchronize_impressions: func
         :param period: How many seconds to wait between subsequent impressions pushes to the BE.
         :type period: int
+        :param on_stop: Final flush run when the task stops. Defaults to the sender.
+        :type on_stop: func
 
         """
         self._period = period
         self._task = AsyncTask(synchronize_impressions, self._period,
-                               on_stop=synchronize_impressions)
+                               on_stop=on_stop if on_stop is not None else synchronize_impressions)
 
     def stop(self, event=None):
         """Stop executing the impressions synchronization task."""
@@ -59,7 +61,7 @@ class ImpressionsSyncTask(ImpressionsSyncTaskBase):
 class ImpressionsSyncTaskAsync(ImpressionsSyncTaskBase):
     """Impressions synchronization task uses an asynctask.AsyncTask to send impressions."""
 
-    def __init__(self, synchronize_impressions, period):
+    def __init__(self, synchronize_impressions, period, on_stop=None):
         """
         Class constructor.
 
@@ -67,11 +69,13 @@ class ImpressionsSyncTaskAsync(ImpressionsSyncTaskBase):
         :type synchronize_impressions: func
         :param period: How many seconds to wait between subsequent impressions pushes to the BE.
         :type period: int
+        :param on_stop: Final flush run when the task stops. Defaults to the sender.
+        :type on_stop: func
 
         """
         self._period = period
         self._task = AsyncTaskAsync(synchronize_impressions, self._period,
-                               on_stop=synchronize_impressions)
+                               on_stop=on_stop if on_stop is not None else synchronize_impressions)
 
     async def stop(self, event=None):
         """Stop executing the impressions synchronization task."""
@@ -0,0 +1,46 @@
+"""Snapshot persistence task."""
+import logging
+
+from splitio.tasks import BaseSynchronizationTask
+from splitio.tasks.util.asynctask import AsyncTask
+
+
+_LOGGER = logging.getLogger(__name__)
+_SNAPSHOT_SYNC_PERIOD = 5 * 60  # 5 minutes
+
+
+class SnapshotSyncTask(BaseSynchronizationTask):
+    """Snapshot task uses an asynctask.AsyncTask to persist rollout data to disk."""
+
+    def __init__(self, save_snapshot, period=_SNAPSHOT_SYNC_PERIOD):
+        """
+        Class constructor.
+
+        :param save_snapshot: Function writing the snapshot file.
+        :type save_snapshot: func
+        :param period: How many seconds to wait between subsequent snapshot writes.
+        :type period: int
+        """
+        self._task = AsyncTask(save_snapshot, period, on_stop=save_snapshot)
+
+    def start(self):
+        """Start executing the snapshot task."""
+        self._task.start()
+
+    def stop(self, event=None):
+        """Stop executing the snapshot task, writing a last snapshot."""
+        self._task.stop(event)
+
+    def is_running(self):
+        """
+        Return whether the task is running or not.
+
+        :return: True if the task is running. False otherwise.
+        :rtype: bool
+        """
+        return self._task.running()
+
+    def flush(self):
+        """Force a snapshot write."""
+        _LOGGER.debug('Forcing snapshot write')
+        self._task.force_execution()
@@ -1,11 +1,17 @@
 """Asynchronous tasks that can be controlled."""
+import heapq
+import itertools
+import os
 import threading
 import logging
 import queue
+import time
+import weakref
 from splitio.optional.loaders import asyncio
 
 __TASK_STOP__ = 0
 __TASK_FORCE_RUN__ = 1
+_WORKER_IDLE_TIMEOUT = 60
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,6 +56,119 @@ async def _safe_run_async(func):
         return False
 
 
+class TaskScheduler(object):
+    """
+    Run the periodic tasks of the process from a single timer thread.
+
+    Due executions are kept in a heap ordered by time and handed to daemon workers grown on
+    demand, up to one per registered task. A task never runs concurrently with itself, so a task
+    blocked on slow I/O can't keep the others waiting for a worker. Workers left idle once tasks
+    are unregistered exit on their own.
+    """
+
+    def __init__(self):
+        """Class constructor."""
+        self._reset()
+        _schedulers.add(self)
+
+    def _reset(self):
+        """Initialize the scheduler state, also used to discard it in forked processes."""
+        self._lock = threading.Condition()
+        self._timers = []
+        self._sequence = itertools.count()
+        self._jobs = queue.Queue()
+        self._tasks = 0
+        self._workers = 0
+        self._idle_workers = 0
+        self._thread = None
+
+    def _ensure_started(self):
+        """Start the timer thread if it's not running yet."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run_timers, name='TaskScheduler', daemon=True)
+                self._thread.start()
+
+    def register_task(self):
+        """Account for a new task, allowing one more worker."""
+        with self._lock:
+            self._tasks += 1
+
+    def unregister_task(self):
+        """Account for a finished task."""
+        with self._lock:
+            self._tasks -= 1
+
+    def schedule(self, func, delay):
+        """
+        Run a function once after a delay.
+
+        :param func: Function to execute, receives no arguments.
+        :type func: callable
+        :param delay: Seconds to wait.
+        :type delay: float
+        """
+        self._ensure_started()
+        with self._lock:
+            heapq.heappush(self._timers, (time.monotonic() + delay, next(self._sequence), func))
+            self._lock.notify()
+
+    def submit(self, func):
+        """
+        Run a function as soon as a worker is available.
+
+        :param func: Function to execute, receives no arguments.
+        :type func: callable
+        """
+        self._ensure_started()
+        with self._lock:
+            if self._idle_workers == 0 and self._workers < max(self._tasks, 1):
+                self._workers += 1
+                threading.Thread(target=self._run_jobs, name='TaskScheduler::worker_%d' % self._workers,
+                                 daemon=True).start()
+        self._jobs.put(func)
+
+    def _run_timers(self):
+        """Wait for the next due timer and submit it."""
+        while True:
+            with self._lock:
+                while not self._timers or self._timers[0][0] > time.monotonic():
+                    self._lock.wait(self._timers[0][0] - time.monotonic() if self._timers else None)
+                _, _, func = heapq.heappop(self._timers)
+            self.submit(func)
+
+    def _run_jobs(self):
+        """Execute submitted functions, exiting when idle and no longer needed."""
+        while True:
+            with self._lock:
+                self._idle_workers += 1
+            try:
+                func = self._jobs.get(timeout=_WORKER_IDLE_TIMEOUT)
+            except queue.Empty:
+                with self._lock:
+                    self._idle_workers -= 1
+                    if self._workers > max(self._tasks, 1):
+                        self._workers -= 1
+                        return
+                continue
+
+            with self._lock:
+                self._idle_workers -= 1
+            _safe_run(func)
+
+
+def _reset_schedulers():
+    """Discard the state of every scheduler in a forked child, their threads don't survive the fork."""
+    for scheduler in list(_schedulers):
+        scheduler._reset()  # pylint: disable=protected-access
+
+
+_schedulers = weakref.WeakSet()
+os.register_at_fork(after_in_child=_reset_schedulers)
+
+_scheduler = TaskScheduler()
+
+
 class AsyncTask(object):  # pylint: disable=too-many-instance-attributes
     """
     Asyncrhonous controllable task class.
@@ -59,9 +178,11 @@ class AsyncTask(object):  # pylint: disable=too-many-instance-attributes
     it's status (whether it's running or not) can be obtained from the task
     object.
     It also allows for "on init" and "on stop" functions to be passed.
+
+    Executions are run by the process wide TaskScheduler instead of a dedicated thread.
     """
 
-    def __init__(self, main, period, on_init=None, on_stop=None):
+    def __init__(self, main, period, on_init=None, on_stop=None, scheduler=None):
         """
         Class constructor.
 
@@ -73,60 +194,79 @@ class AsyncTask(object):  # pylint: disable=too-many-instance-attributes
         :type on_init: callable
         :param on_stop: Function to be executed ONCE after the task has finished
         :type on_stop: callable
+        :param scheduler: Optional scheduler to use instead of the process wide one.
+        :type scheduler: TaskScheduler
         """
         self._on_init = on_init
         self._main = main
         self._on_stop = on_stop
         self._period = period
-        self._messages = queue.Queue()
+        self._scheduler = scheduler if scheduler is not None else _scheduler
+        self._lock = threading.Lock()
         self._running = False
-        self._thread = None
+        self._executing = False
+        self._stopping = False
+        self._forced = 0
+        self._token = 0
         self._stop_event = None
+        self._registered = False
+
+    def _schedule_next(self):
+        """Schedule the next periodic execution, invalidating any previous one."""
+        self._token += 1
+        token = self._token
+        self._scheduler.schedule(lambda: self._execute(token), self._period)
+
+    def _initialize(self):
+        """Execute the "on init" hook if available and schedule the first execution."""
+        if self._on_init is not None:
+            if not _safe_run(self._on_init):
+                _LOGGER.error("Error running task initialization function, aborting execution")
+                self._cleanup()
+                return
+
+        with self._lock:
+            if self._stopping:
+                stopped = True
+            else:
+                stopped = False
+                self._running = True
+                self._schedule_next()
+        if stopped:
+            self._cleanup()
 
-    def _execution_wrapper(self):
+    def _execute(self, token):
         """
-        Execute user defined function in separate thread.
-
-        It will execute the "on init" hook is available. If an exception is
-        raised it will abort execution, otherwise it will enter an infinite
-        loop in which the main function is executed every <period> seconds.
-        After stop has been called the "on stop" hook will be invoked if
-        available.
+        Run the main function, draining forced executions and honoring stop requests.
 
-        All custom functions are run within a _safe_run() function which
-        prevents exceptions from being propagated.
+        :param token: Token of the timer or force request triggering this execution.
+        :type token: int
         """
-        try:
-            if self._on_init is not None:
-                if not _safe_run(self._on_init):
-                    _LOGGER.error("Error running task initialization function, aborting execution")
-                    self._running = False
+        with self._lock:
+            if token != self._token or self._executing or not self._running:
+                return
+            self._executing = True
+            if self._forced > 0:
+                self._forced -= 1
+
+        while True:
+            if not _safe_run(self._main):
+                _LOGGER.error(
+                    "An error occurred when executing the task. "
+                    "Retrying after period expires"
+                )
+            with self._lock:
+                if self._forced > 0:
+                    self._forced -= 1
+                    continue
+
+                self._executing = False
+                if not self._stopping:
+                    self._schedule_next()
                     return
-            self._running = True
-            while True:
-                try:
-                    msg = self._messages.get(True, self._period)
-                    if msg == __TASK_STOP__:
-                        _LOGGER.debug("Stop signal received. finishing task execution")
-                        break
-                    elif msg == __TASK_FORCE_RUN__:
-                        _LOGGER.debug("Force execution signal received. Running now")
-                        if not _safe_run(self._main):
-                            _LOGGER.error("An error occurred when executing the task. "
-                                          "Retrying after period expires")
-                        continue
-                except queue.Empty:
-                    # If no message was received, the timeout has expired
-                    # and we're ready for a new execution
-                    pass
+            break
 
-                if not _safe_run(self._main):
-                    _LOGGER.error(
-                        "An error occurred when executing the task. "
-                        "Retrying after period expires"
-                    )
-        finally:
-            self._cleanup()
+        self._cleanup()
 
     def _cleanup(self):
         """Execute on_stop callback, set event if needed, update status."""
@@ -135,6 +275,10 @@ class AsyncTask(object):  # pylint: disable=too-many-instance-attributes
                 _LOGGER.error("An error occurred when executing the task's OnStop hook. ")
 
         self._running = False
+        with self._lock:
+            registered, self._registered = self._registered, False
+        if registered:
+            self._scheduler.unregister_task()
 
         if self._stop_event is not None:
             self._stop_event.set()
@@ -145,19 +289,25 @@ class AsyncTask(object):  # pylint: disable=too-many-instance-attributes
             _LOGGER.warning("Task is already running. Ignoring .start() call")
             return
 
-        # Start execution
-        self._thread = threading.Thread(target=self._execution_wrapper,
-                                        name='AsyncTask::' + getattr(self._main, '__name__', 'N/S'), daemon=True)
-        try:
-            self._thread.start()
+        with self._lock:
+            self._stopping = False
+            self._forced = 0
+            self._token += 1
+            registered, self._registered = self._registered, True
+        if not registered:
+            self._scheduler.register_task()
+
+        if self._on_init is not None:
+            self._scheduler.submit(self._initialize)
+            return
 
-        except RuntimeError:
-            _LOGGER.error("Couldn't create new thread for async task")
-            _LOGGER.debug('Error: ', exc_info=True)
+        with self._lock:
+            self._running = True
+            self._schedule_next()
 
     def stop(self, event=None):
         """
-        Send a signal to the thread in order to stop it. If the task is not running do nothing.
+        Signal the task to stop. If the task is not running do nothing.
 
         Optionally accept an event to be set upon task completion.
 
@@ -172,15 +322,32 @@ class AsyncTask(object):  # pylint: disable=too-many-instance-attributes
                 event.set()
             return
 
-        # Queue is of infinite size, should not raise an exception
-        self._messages.put(__TASK_STOP__, False)
+        with self._lock:
+            if self._stopping:
+                return
+            self._stopping = True
+            if self._executing or self._forced > 0:
+                # the ongoing or forced executions will finish the task
+                return
+            self._token += 1
+
+        self._scheduler.submit(self._cleanup)
 
     def force_execution(self):
         """Force an execution of the task without waiting for the period to end."""
         if not self._running:
             return
-        # Queue is of infinite size, should not raise an exception
-        self._messages.put(__TASK_FORCE_RUN__, False)
+
+        with self._lock:
+            if self._stopping:
+                return
+            self._forced += 1
+            if self._executing:
+                return
+            self._token += 1
+            token = self._token
+
+        self._scheduler.submit(lambda: self._execute(token))
 
     def running(self):
         """Return whether the task is running or not."""
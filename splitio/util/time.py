@@ -30,4 +30,25 @@ def get_current_epoch_time_ms():
     :return: epoch time
     :rtype: int
     """
-    return int(round(time.time() * 1000))
\ No newline at end of file
+    return int(round(time.time() * 1000))
+
+def get_current_perf_counter_ns():
+    """
+    Get a monotonic, high resolution timestamp in nanoseconds, meant to measure elapsed times
+
+    :return: timestamp
+    :rtype: int
+    """
+    return time.perf_counter_ns()
+
+def get_elapsed_micros(start):
+    """
+    Get the microseconds elapsed since a timestamp taken with get_current_perf_counter_ns
+
+    :param start: timestamp
+    :type start: int
+
+    :return: elapsed microseconds
+    :rtype: int
+    """
+    return (time.perf_counter_ns() - start) // 1000
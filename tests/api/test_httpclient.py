@@ -1,11 +1,15 @@
 """HTTPClient test module."""
 from requests_kerberos import HTTPKerberosAuth
+import gzip
+import json
 import pytest
 import unittest.mock as mock
 import requests
 
 from splitio.client.config import AuthenticateScheme
 from splitio.api import client
+from splitio.optional.loaders import asyncio
+from splitio.push.sse import SSEClientAsync
 from splitio.engine.telemetry import TelemetryStorageProducer, TelemetryStorageProducerAsync
 from splitio.storage.inmemmory import InMemoryTelemetryStorage, InMemoryTelemetryStorageAsync
 
@@ -20,7 +24,7 @@ class HttpClientTests(object):
         response_mock.text = 'ok'
         get_mock = mocker.Mock()
         get_mock.return_value = response_mock
-        mocker.patch('splitio.api.client.requests.get', new=get_mock)
+        mocker.patch('splitio.api.client.requests.Session.get', new=get_mock)
         httpclient = client.HttpClient()
         httpclient.set_telemetry_data("metric", mocker.Mock())
         response = httpclient.get('sdk', 'test1', 'some_api_key', {'param1': 123}, {'h1': 'abc'})
@@ -54,7 +58,7 @@ class HttpClientTests(object):
         response_mock.text = 'ok'
         get_mock = mocker.Mock()
         get_mock.return_value = response_mock
-        mocker.patch('splitio.api.client.requests.get', new=get_mock)
+        mocker.patch('splitio.api.client.requests.Session.get', new=get_mock)
         httpclient = client.HttpClient(sdk_url='https://sdk.com', events_url='https://events.com')
         httpclient.set_telemetry_data("metric", mocker.Mock())
         response = httpclient.get('sdk', 'test1', 'some_api_key', {'param1': 123}, {'h1': 'abc'})
@@ -81,6 +85,37 @@ class HttpClientTests(object):
         assert get_mock.mock_calls == [call]
 
 
+    def test_pooled_sessions(self, mocker):
+        """Test each server keeps a reusable keep-alive session."""
+        httpclient = client.HttpClient(pool_maxsize=4)
+        assert set(httpclient._sessions.keys()) == set(['sdk', 'events', 'auth', 'telemetry'])
+        session = httpclient._sessions['sdk']
+        assert session.headers['Accept-Encoding'] == 'gzip'
+        assert session.adapters['https://']._pool_maxsize == 4
+        assert session.adapters['http://']._pool_maxsize == 4
+
+        response_mock = mocker.Mock()
+        response_mock.status_code = 200
+        response_mock.headers = {}
+        response_mock.text = 'ok'
+        get_mock = mocker.Mock()
+        get_mock.return_value = response_mock
+        mocker.patch('splitio.api.client.requests.Session.get', new=get_mock)
+        httpclient.set_telemetry_data("metric", mocker.Mock())
+        httpclient.get('sdk', 'test1', 'some_api_key')
+        httpclient.get('sdk', 'test1', 'some_api_key')
+        assert httpclient._sessions['sdk'] is session
+
+        close_mock = mocker.Mock()
+        mocker.patch('splitio.api.client.requests.Session.close', new=close_mock)
+        httpclient.close_sessions()
+        assert len(close_mock.mock_calls) == 4
+
+        httpclient.recreate_sessions()
+        assert len(close_mock.mock_calls) == 8
+        assert httpclient._sessions['sdk'] is not session
+        assert httpclient._sessions['sdk'].adapters['https://']._pool_maxsize == 4
+
     def test_post(self, mocker):
         """Test HTTP GET verb requests."""
         response_mock = mocker.Mock()
@@ -89,7 +124,7 @@ class HttpClientTests(object):
         response_mock.text = 'ok'
         get_mock = mocker.Mock()
         get_mock.return_value = response_mock
-        mocker.patch('splitio.api.client.requests.post', new=get_mock)
+        mocker.patch('splitio.api.client.requests.Session.post', new=get_mock)
         httpclient = client.HttpClient()
         httpclient.set_telemetry_data("metric", mocker.Mock())
         response = httpclient.post('sdk', 'test1', 'some_api_key', {'p1': 'a'}, {'param1': 123}, {'h1': 'abc'})
@@ -125,7 +160,7 @@ class HttpClientTests(object):
         response_mock.text = 'ok'
         get_mock = mocker.Mock()
         get_mock.return_value = response_mock
-        mocker.patch('splitio.api.client.requests.post', new=get_mock)
+        mocker.patch('splitio.api.client.requests.Session.post', new=get_mock)
         httpclient = client.HttpClient(sdk_url='https://sdk.com', events_url='https://events.com')
         httpclient.set_telemetry_data("metric", mocker.Mock())
         response = httpclient.post('sdk', 'test1', 'some_api_key', {'p1': 'a'}, {'param1': 123}, {'h1': 'abc'})
@@ -164,7 +199,7 @@ class HttpClientTests(object):
         response_mock.text = 'ok'
         get_mock = mocker.Mock()
         get_mock.return_value = response_mock
-        mocker.patch('splitio.api.client.requests.post', new=get_mock)
+        mocker.patch('splitio.api.client.requests.Session.post', new=get_mock)
         httpclient = client.HttpClient(timeout=1500, sdk_url='https://sdk.com', events_url='https://events.com')
         httpclient.set_telemetry_data("metric", telemetry_runtime_producer)
 
@@ -202,7 +237,7 @@ class HttpClientTests(object):
         assert (self.status == 400)
 
         # testing get call
-        mocker.patch('splitio.api.client.requests.get', new=get_mock)
+        mocker.patch('splitio.api.client.requests.Session.get', new=get_mock)
         self.metric1 = None
         self.cur_time = 0
         self.metric2 = None
@@ -448,7 +483,7 @@ class HttpClientKerberosTests(object):
         response_mock.text = 'ok'
         get_mock = mocker.Mock()
         get_mock.return_value = response_mock
-        mocker.patch('splitio.api.client.requests.post', new=get_mock)
+        mocker.patch('splitio.api.client.requests.Session.post', new=get_mock)
         httpclient = client.HttpClient(timeout=1500, sdk_url='https://sdk.com', events_url='https://events.com')
         httpclient.set_telemetry_data("metric", telemetry_runtime_producer)
 
@@ -486,7 +521,7 @@ class HttpClientKerberosTests(object):
         assert (self.status == 400)
 
         # testing get call
-        mocker.patch('splitio.api.client.requests.get', new=get_mock)
+        mocker.patch('splitio.api.client.requests.Session.get', new=get_mock)
         self.metric1 = None
         self.cur_time = 0
         self.metric2 = None
@@ -607,7 +642,7 @@ class HttpClientAsyncTests(object):
         response = await httpclient.post('sdk', 'test1', 'some_api_key', {'p1': 'a'}, {'param1': 123}, {'h1': 'abc'})
         call = mocker.call(
             client.SDK_URL + '/test1',
-            json={"p1": "a"},
+            data=b'{"p1": "a"}',
             headers={'Content-Type': 'application/json', 'Authorization': 'Bearer some_api_key', 'h1': 'abc', 'Accept-Encoding': 'gzip'},
             params={'param1': 123},
             timeout=None
@@ -620,7 +655,7 @@ class HttpClientAsyncTests(object):
         response = await httpclient.post('events', 'test1', 'some_api_key', {'p1': 'a'}, {'param1': 123}, {'h1': 'abc'})
         call = mocker.call(
             client.EVENTS_URL + '/test1',
-            json={'p1': 'a'},
+            data=b'{"p1": "a"}',
             headers={'Authorization': 'Bearer some_api_key', 'h1': 'abc', 'Content-Type': 'application/json', 'Accept-Encoding': 'gzip'},
             params={'param1': 123},
             timeout=None
@@ -644,7 +679,7 @@ class HttpClientAsyncTests(object):
         response = await httpclient.post('sdk', 'test1', 'some_api_key', {'p1': 'a'}, {'param1': 123}, {'h1': 'abc'})
         call = mocker.call(
             'https://sdk.com' + '/test1',
-            json={"p1": "a"},
+            data=b'{"p1": "a"}',
             headers={'Authorization': 'Bearer some_api_key', 'h1': 'abc', 'Content-Type': 'application/json', 'Accept-Encoding': 'gzip'},
             params={'param1': 123},
             timeout=None
@@ -657,7 +692,7 @@ class HttpClientAsyncTests(object):
         response = await httpclient.post('events', 'test1', 'some_api_key', {'p1': 'a'}, {'param1': 123}, {'h1': 'abc'})
         call = mocker.call(
             'https://events.com' + '/test1',
-            json={"p1": "a"},
+            data=b'{"p1": "a"}',
             headers={'Authorization': 'Bearer some_api_key', 'h1': 'abc', 'Content-Type': 'application/json', 'Accept-Encoding': 'gzip'},
             params={'param1': 123},
             timeout=None
@@ -666,6 +701,56 @@ class HttpClientAsyncTests(object):
         assert response.body == 'ok'
         assert get_mock.mock_calls == [call]
 
+    @pytest.mark.asyncio
+    async def test_post_compressed(self, mocker):
+        """Test big POST bodies are gzip compressed."""
+        telemetry_storage = await InMemoryTelemetryStorageAsync.create()
+        telemetry_producer = TelemetryStorageProducerAsync(telemetry_storage)
+        telemetry_runtime_producer = telemetry_producer.get_telemetry_runtime_producer()
+        response_mock = MockResponse('ok', 200, {})
+        post_mock = mocker.Mock()
+        post_mock.return_value = response_mock
+        mocker.patch('splitio.optional.loaders.aiohttp.ClientSession.post', new=post_mock)
+        httpclient = client.HttpClientAsync()
+        httpclient.set_telemetry_data("metric", telemetry_runtime_producer)
+        run_in_executor = mocker.spy(asyncio.get_running_loop(), 'run_in_executor')
+        body = [{'k': 'key%d' % i, 't': 'on', 'm': 123456} for i in range(100)]
+        response = await httpclient.post('events', 'test1', 'some_api_key', body)
+        assert response.status_code == 200
+
+        kwargs = post_mock.mock_calls[0][2]
+        assert kwargs['headers']['Content-Encoding'] == 'gzip'
+        assert json.loads(gzip.decompress(kwargs['data'])) == body
+        assert run_in_executor.call_count == 0
+
+        # only bulks past the threshold are serialized and compressed in a thread.
+        mocker.patch('splitio.api.client._EXECUTOR_MIN_ITEMS', new=100)
+        await httpclient.post('events', 'test1', 'some_api_key', body)
+        assert run_in_executor.call_count == 1
+        assert run_in_executor.mock_calls[0][1][1:] == (client._encode_body, body)
+        assert json.loads(gzip.decompress(post_mock.mock_calls[1][2]['data'])) == body
+        await httpclient.close_session()
+
+    def test_count_items(self):
+        """Test bulks are sized by their records."""
+        assert client._count_items({'a': 1}) == 1
+        assert client._count_items([{'k': 'key1'}, {'k': 'key2'}]) == 2
+        assert client._count_items([{'f': 'flag1', 'i': [{}, {}, {}]}, {'f': 'flag2', 'i': [{}]}]) == 4
+        assert client._count_items([1, 'a']) == 2
+
+    @pytest.mark.asyncio
+    async def test_connector(self, mocker):
+        """Test the connector is configured and can be shared."""
+        httpclient = client.HttpClientAsync(pool_maxsize=5, dns_cache_ttl=60, keepalive_timeout=30)
+        connector = httpclient.connector
+        assert connector.limit_per_host == 5
+
+        sse_client = SSEClientAsync(connector=connector)
+        await sse_client.close_session()
+        assert not connector.closed
+        await httpclient.close_session()
+        assert connector.closed
+
     @pytest.mark.asyncio
     async def test_telemetry(self, mocker):
         telemetry_storage = await InMemoryTelemetryStorageAsync.create()
@@ -59,6 +59,32 @@ class SegmentAPITests(object):
             assert exc_info.type == APIException
             assert exc_info.value.message == 'some_message'
 
+    def test_conditional_fetch(self, mocker):
+        """Test validators of responses without changes are sent back and 304s are not parsed."""
+        httpclient = mocker.Mock(spec=client.HttpClient)
+        segment_api = segments.SegmentsAPI(httpclient, 'some_api_key', SdkMetadata('1.0', 'some', '1.2.3.4'), mocker.Mock())
+        metadata = {'SplitSDKVersion': '1.0', 'SplitSDKMachineIP': '1.2.3.4', 'SplitSDKMachineName': 'some'}
+
+        httpclient.get.return_value = client.HttpResponse(
+            200, '{"name": "some_segment", "added": [], "removed": [], "since": 123, "till": 123}', {'ETag': '"abc"'})
+        segment_api.fetch_segment('some_segment', 123, FetchOptions(None, None, None, None, None))
+
+        httpclient.get.return_value = client.HttpResponse(304, '', {})
+        response = segment_api.fetch_segment('some_segment', 123, FetchOptions(None, None, None, None, None))
+        assert response == {'name': 'some_segment', 'added': [], 'removed': [], 'since': 123, 'till': 123}
+        assert httpclient.get.mock_calls[1] == mocker.call('sdk', 'segmentChanges/some_segment', 'some_api_key',
+                                                           extra_headers=dict(metadata, **{'If-None-Match': '"abc"'}),
+                                                           query={'since': 123})
+
+        # a different change number or a response with changes does not send validators
+        httpclient.reset_mock()
+        httpclient.get.return_value = client.HttpResponse(
+            200, '{"name": "some_segment", "added": ["key1"], "removed": [], "since": 100, "till": 123}', {'ETag': '"def"'})
+        segment_api.fetch_segment('some_segment', 100, FetchOptions(None, None, None, None, None))
+        segment_api.fetch_segment('some_segment', 100, FetchOptions(None, None, None, None, None))
+        assert httpclient.get.mock_calls == [mocker.call('sdk', 'segmentChanges/some_segment', 'some_api_key',
+                                                         extra_headers=metadata, query={'since': 100})] * 2
+
 
 class SegmentAPIAsyncTests(object):
     """Segment async API test cases."""
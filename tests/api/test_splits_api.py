@@ -157,7 +157,27 @@ class SplitAPITests(object):
         assert self.query[2] == {'s': '1.3', 'since': 456, 'rbSince': -1}
         assert self.query[3] == {'s': '1.1', 'since': 456}
         assert response == {"ff": {"d": [], "s": 456, "t": 456}, "rbs": {"d": [], "s": -1, "t": -1}}
-        
+
+    def test_conditional_fetch(self, mocker):
+        """Test validators of responses without changes are sent back and 304s are not parsed."""
+        httpclient = mocker.Mock(spec=client.HttpClient)
+        split_api = splits.SplitsAPI(httpclient, 'some_api_key', SdkMetadata('1.0', 'some', '1.2.3.4'), mocker.Mock())
+        httpclient.get.return_value = client.HttpResponse(
+            200, '{"ff": {"d": [], "s": 123, "t": 123}, "rbs": {"d": [], "s": 5, "t": 5}}',
+            {'ETag': '"abc"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+        split_api.fetch_splits(123, 5, FetchOptions(False, None, None, None))
+
+        httpclient.get.return_value = client.HttpResponse(304, '', {})
+        response = split_api.fetch_splits(123, 5, FetchOptions(False, None, None, None))
+        assert response == {'ff': {'d': [], 's': 123, 't': 123}, 'rbs': {'d': [], 's': 5, 't': 5}}
+        extra_headers = httpclient.get.mock_calls[1][2]['extra_headers']
+        assert extra_headers['If-None-Match'] == '"abc"'
+        assert extra_headers['If-Modified-Since'] == 'Wed, 21 Oct 2015 07:28:00 GMT'
+
+        httpclient.reset_mock()
+        split_api.fetch_splits(124, 5, FetchOptions(False, None, None, None))
+        assert 'If-None-Match' not in httpclient.get.mock_calls[0][2]['extra_headers']
+
 class SplitAPIAsyncTests(object):
     """Split async API test cases."""
 
@@ -0,0 +1,60 @@
+"""
+Helpers shared by the benchmark scripts in this package.
+
+Each benchmark is a module runnable with `python -m tests.benchmarks.<name>`, documented by its
+own docstring, whose first line describes it on `--help`.
+"""
+import argparse
+import time
+
+
+def arg_parser(doc, rounds=3):
+    """
+    Build the argument parser of a benchmark, with the `--rounds` option every one takes.
+
+    :param doc: Docstring of the benchmark module.
+    :type doc: str
+    :param rounds: Default number of rounds.
+    :type rounds: int
+
+    :returns: Parser to add the benchmark specific options to.
+    :rtype: argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(description=doc.strip().splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=rounds)
+    return parser
+
+
+def timed(func, *args):
+    """
+    Call a function, timing it.
+
+    :param func: Function to call.
+    :type func: callable
+
+    :returns: Result of the call and elapsed seconds.
+    :rtype: tuple(object, float)
+    """
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def best_of(rounds, func, *args):
+    """
+    Call a function several times and keep its fastest run.
+
+    :param rounds: Number of calls.
+    :type rounds: int
+    :param func: Function to call.
+    :type func: callable
+
+    :returns: Result of the fastest call and its elapsed seconds.
+    :rtype: tuple(object, float)
+    """
+    best = None
+    for _ in range(rounds):
+        result, elapsed = timed(func, *args)
+        if best is None or elapsed < best[1]:
+            best = (result, elapsed)
+    return best
@@ -0,0 +1,65 @@
+"""
+Time recording evaluation latencies from several threads at once.
+
+Usage:
+    python -m tests.benchmarks.method_latencies [--threads 4] [--records 200000] [--rounds 3]
+
+Every thread records the given number of latencies on a shared in-memory telemetry storage,
+the way the client does after each evaluation, and the storage is popped once at the end.
+"""
+import threading
+
+from splitio.models.telemetry import MethodExceptionsAndLatencies, get_latency_bucket_index
+from splitio.storage.inmemmory import InMemoryTelemetryStorage
+from tests.benchmarks.harness import arg_parser, timed
+
+
+def run(threads, records):
+    """
+    Record latencies from several threads and pop them.
+
+    :param threads: Number of recording threads.
+    :type threads: int
+    :param records: Latencies recorded per thread.
+    :type records: int
+
+    :returns: Elapsed seconds recording, elapsed seconds popping and total recorded.
+    :rtype: tuple(float, float, int)
+    """
+    storage = InMemoryTelemetryStorage()
+    bucket = get_latency_bucket_index(250)
+    method = MethodExceptionsAndLatencies.TREATMENT
+
+    def record():
+        for _ in range(records):
+            storage.record_latency(method, bucket)
+
+    def record_all():
+        workers = [threading.Thread(target=record) for _ in range(threads)]
+        [worker.start() for worker in workers]
+        [worker.join() for worker in workers]
+
+    _, recorded = timed(record_all)
+    latencies, popped = timed(storage.pop_latencies)
+    return recorded, popped, sum(latencies['methodLatencies']['treatment'])
+
+
+def main():
+    """Run the benchmark."""
+    parser = arg_parser(__doc__)
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--records', type=int, default=200000)
+    args = parser.parse_args()
+
+    results = [run(args.threads, args.records) for _ in range(args.rounds)]
+    recorded = min(result[0] for result in results)
+    popped = min(result[1] for result in results)
+    total = args.threads * args.records
+    assert all(result[2] == total for result in results)
+    print('threads: %d, latencies per thread: %d' % (args.threads, args.records))
+    print('record: %.3fs (%.0f ns/latency)' % (recorded, recorded * 1e9 / total))
+    print('pop: %.3fms' % (popped * 1000))
+
+
+if __name__ == '__main__':
+    main()
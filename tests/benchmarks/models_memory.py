@@ -0,0 +1,134 @@
+"""
+Measure the memory retained by parsed feature flags on a large synthetic splitChanges payload.
+
+Usage:
+    python -m tests.benchmarks.models_memory [--flags 5000] [--rounds 3]
+
+Each flag carries a whitelist condition and a few rollout conditions mixing segment, attribute
+and dependency matchers, with treatments and attribute names repeated across flags.
+"""
+import gc
+import json
+import tracemalloc
+
+from splitio.models import splits
+from tests.benchmarks.harness import arg_parser, timed
+
+
+_TREATMENTS = ['on', 'off', 'v1', 'v2']
+_ATTRIBUTES = ['plan', 'country', 'age', 'email', 'version']
+
+
+def _matcher(matcher_type, attribute=None, **data):
+    """Build a raw matcher."""
+    raw = {
+        'keySelector': {'trafficType': 'user', 'attribute': attribute} if attribute else None,
+        'matcherType': matcher_type,
+        'negate': False,
+    }
+    raw.update(data)
+    return raw
+
+
+def _condition(condition_type, label, matchers, partitions):
+    """Build a raw condition."""
+    return {
+        'conditionType': condition_type,
+        'matcherGroup': {'combiner': 'AND', 'matchers': matchers},
+        'partitions': [{'treatment': treatment, 'size': size} for treatment, size in partitions],
+        'label': label,
+    }
+
+
+def build_payload(count):
+    """
+    Build a synthetic list of raw feature flags.
+
+    :param count: Number of flags.
+    :type count: int
+
+    :returns: Raw feature flags.
+    :rtype: list(dict)
+    """
+    flags = []
+    for index in range(count):
+        treatment_on, treatment_off = _TREATMENTS[index % 2 * 2], _TREATMENTS[index % 2 * 2 + 1]
+        attribute = _ATTRIBUTES[index % len(_ATTRIBUTES)]
+        conditions = [
+            _condition('WHITELIST', 'whitelisted', [_matcher(
+                'WHITELIST', whitelistMatcherData={'whitelist': ['user%d' % key for key in range(index % 10)]})],
+                [(treatment_on, 100)]),
+            _condition('ROLLOUT', 'in segment segment%d' % (index % 50), [_matcher(
+                'IN_SEGMENT', userDefinedSegmentMatcherData={'segmentName': 'segment%d' % (index % 50)})],
+                [(treatment_on, 50), (treatment_off, 50)]),
+            _condition('ROLLOUT', 'attribute %s' % attribute, [_matcher(
+                'WHITELIST' if attribute != 'age' else 'GREATER_THAN_OR_EQUAL_TO', attribute,
+                whitelistMatcherData={'whitelist': ['a', 'b', 'c']},
+                unaryNumericMatcherData={'dataType': 'NUMBER', 'value': 18})],
+                [(treatment_on, 20), (treatment_off, 80)]),
+            _condition('ROLLOUT', 'default rule', [_matcher('ALL_KEYS')], [(treatment_on, 0), (treatment_off, 100)]),
+        ]
+        if index:
+            conditions.insert(1, _condition('ROLLOUT', 'dependency', [_matcher(
+                'IN_SPLIT_TREATMENT', dependencyMatcherData={'split': 'flag%d' % (index - 1),
+                                                             'treatments': [treatment_on]})],
+                [(treatment_on, 100)]))
+        flags.append({
+            'name': 'flag%d' % index,
+            'trafficTypeName': 'user',
+            'seed': index,
+            'trafficAllocation': 100,
+            'trafficAllocationSeed': -index,
+            'status': 'ACTIVE',
+            'killed': False,
+            'defaultTreatment': treatment_off,
+            'changeNumber': 1675443569027 + index,
+            'algo': 2,
+            'configurations': {},
+            'sets': [],
+            'conditions': conditions,
+        })
+    return flags
+
+
+def measure(body):
+    """
+    Decode and parse a splitChanges body, measuring the memory retained by the resulting models.
+
+    The decoded payload is dropped before measuring, so only what the models keep alive counts.
+
+    :param body: JSON encoded feature flags.
+    :type body: str
+
+    :returns: Retained bytes and elapsed seconds.
+    :rtype: tuple(int, float)
+    """
+    gc.collect()
+    tracemalloc.start()
+    payload = json.loads(body)
+    parsed, elapsed = timed(lambda: [splits.from_raw(raw) for raw in payload])
+    del payload
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parsed
+    return retained, elapsed
+
+
+def main():
+    """Run the benchmark."""
+    parser = arg_parser(__doc__)
+    parser.add_argument('--flags', type=int, default=5000)
+    args = parser.parse_args()
+
+    body = json.dumps(build_payload(args.flags))
+    results = [measure(body) for _ in range(args.rounds)]
+    retained = min(result[0] for result in results)
+    elapsed = min(result[1] for result in results)
+    print('flags: %d' % args.flags)
+    print('retained: %.1f MiB (%.0f bytes/flag)' % (retained / 1024.0 / 1024.0, retained / args.flags))
+    print('parse time: %.3fs (%.0f flags/s)' % (elapsed, args.flags / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Compare the available murmur3 implementations, one key at a time and in batches.
+
+Usage:
+    python -m tests.benchmarks.murmur [--keys 20000] [--rounds 5]
+
+The pure python fallback is always measured. The mmh3cffi one is added when installed.
+"""
+import uuid
+
+from splitio.engine import hashfns
+from splitio.engine.hashfns import murmur3py
+from tests.benchmarks.harness import arg_parser, best_of
+
+
+def _implementations():
+    """
+    Return the implementations to compare.
+
+    :returns: Name, 32 bit hash, 128 bit hash and 128 bit batch hash per implementation.
+    :rtype: list(tuple)
+    """
+    implementations = [('python', murmur3py.murmur32_py, murmur3py.hash128_x64, murmur3py.hash128_x64_many)]
+    try:
+        import mmh3cffi
+    except ImportError:
+        return implementations
+
+    implementations.append(('mmh3cffi', mmh3cffi.hash_str, mmh3cffi.hash_str_128,
+                            lambda keys, seed: [mmh3cffi.hash_str_128(key, seed) for key in keys]))
+    return implementations
+
+
+def main():
+    """Run the benchmark."""
+    parser = arg_parser(__doc__, rounds=5)
+    parser.add_argument('--keys', type=int, default=20000)
+    args = parser.parse_args()
+
+    keys = [str(uuid.uuid4()) for _ in range(args.keys)]
+    print('active implementation: %s' % hashfns.IMPLEMENTATION)
+    for name, hash32, hash128, hash128_many in _implementations():
+        results = (
+            ('murmur32', best_of(args.rounds, lambda: [hash32(key, 123) for key in keys])),
+            ('murmur128', best_of(args.rounds, lambda: [hash128(key, 0) for key in keys])),
+            ('murmur128 batch', best_of(args.rounds, hash128_many, keys, 0)),
+        )
+        for label, (_, elapsed) in results:
+            print('%-9s %-15s %8.3fs %10.0f keys/s' % (name, label, elapsed, len(keys) / elapsed))
+
+
+if __name__ == '__main__':
+    main()
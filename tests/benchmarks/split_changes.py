@@ -0,0 +1,94 @@
+"""
+Time decoding and parsing a large splitChanges payload, on first fetch and on a later update.
+
+Usage:
+    python -m tests.benchmarks.split_changes [--flags 5000] [--changed 50] [--rounds 3]
+
+Every condition is made distinct, so the first fetch can't reuse any of them. The update bumps
+every change number and alters the conditions of a few flags, which is what a sync after a
+handful of flag edits looks like.
+"""
+import json
+
+from splitio.models import splits
+from splitio.models.grammar import condition
+from splitio.optional.loaders import json_loads
+from tests.benchmarks.harness import arg_parser, timed
+from tests.benchmarks.models_memory import build_payload
+
+
+def make_distinct(payload):
+    """
+    Give every condition of the payload a label of its own.
+
+    :param payload: Raw feature flags.
+    :type payload: list(dict)
+
+    :returns: The same payload.
+    :rtype: list(dict)
+    """
+    for flag in payload:
+        for raw_condition in flag['conditions']:
+            raw_condition['label'] = '%s (%s)' % (raw_condition['label'], flag['name'])
+    return payload
+
+
+def build_update(payload, changed):
+    """
+    Build the payload of a later update.
+
+    :param payload: Raw feature flags of the first fetch.
+    :type payload: list(dict)
+    :param changed: Number of flags whose conditions change.
+    :type changed: int
+
+    :returns: Raw feature flags.
+    :rtype: list(dict)
+    """
+    update = json.loads(json.dumps(payload))
+    for index, flag in enumerate(update):
+        flag['changeNumber'] += len(update)
+        if index < changed:
+            flag['conditions'][-1]['partitions'][0]['size'] = 10
+            flag['conditions'][-1]['partitions'][1]['size'] = 90
+    return update
+
+
+def parse(body):
+    """
+    Decode and parse a splitChanges body.
+
+    :param body: JSON encoded feature flags.
+    :type body: str
+
+    :returns: Elapsed seconds.
+    :rtype: float
+    """
+    return timed(lambda: [splits.from_raw(raw) for raw in json_loads(body)])[1]
+
+
+def main():
+    """Run the benchmark."""
+    parser = arg_parser(__doc__)
+    parser.add_argument('--flags', type=int, default=5000)
+    parser.add_argument('--changed', type=int, default=50)
+    args = parser.parse_args()
+
+    payload = make_distinct(build_payload(args.flags))
+    body = json.dumps(payload)
+    update_body = json.dumps(build_update(payload, args.changed))
+
+    first, updates = [], []
+    for _ in range(args.rounds):
+        condition.PARSED_CONDITIONS.clear()
+        first.append(parse(body))
+        updates.append(parse(update_body))
+
+    print('decoder: %s' % json_loads.__module__)
+    print('flags: %d, changed on update: %d' % (args.flags, args.changed))
+    print('first fetch: %.3fs (%.0f flags/s)' % (min(first), args.flags / min(first)))
+    print('update: %.3fs (%.0f flags/s)' % (min(updates), args.flags / min(updates)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Replay a recorded SSE stream through the event parser and report throughput.
+
+Usage:
+    python -m tests.benchmarks.sse_replay [--file recording.txt] [--chunk-size 1024] [--rounds 5]
+
+When no recording is supplied, a synthetic stream shaped like a burst of feature flag and
+segment notifications is generated.
+"""
+import json
+
+from splitio.push.sse import EventParser
+from tests.benchmarks.harness import arg_parser, best_of
+
+
+def build_stream(count):
+    """
+    Build a synthetic stream with keepalives, control and update notifications.
+
+    :param count: Number of update notifications.
+    :type count: int
+
+    :returns: Raw stream.
+    :rtype: bytes
+    """
+    parts = [b':keepalive\n\n']
+    for index in range(count):
+        if index % 2:
+            payload = {'type': 'SEGMENT_UPDATE', 'segmentName': 'segment%d' % (index % 50),
+                       'changeNumber': 1591996685190 + index}
+        else:
+            payload = {'type': 'SPLIT_UPDATE', 'changeNumber': 1591996685190 + index}
+        data = json.dumps({
+            'id': 'abc%d' % index,
+            'clientId': 'pri:ODc1NjQyNzY1',
+            'timestamp': 1591996685190 + index,
+            'encoding': 'json',
+            'channel': 'NDA5ODc2MTAyNg==_MzAyODY0NDkyOA==_splits',
+            'data': json.dumps(payload),
+        })
+        parts.append(('id: abc%d\nevent: message\ndata: %s\n\n' % (index, data)).encode('utf8'))
+        if index % 100 == 0:
+            parts.append(b':keepalive\n\n')
+    return b''.join(parts)
+
+
+def replay(stream, chunk_size):
+    """
+    Feed a stream to a new parser in fixed size chunks.
+
+    :param stream: Raw stream.
+    :type stream: bytes
+    :param chunk_size: Bytes per chunk.
+    :type chunk_size: int
+
+    :returns: Number of events parsed.
+    :rtype: int
+    """
+    parser = EventParser()
+    view = memoryview(stream)
+    events = 0
+    for offset in range(0, len(stream), chunk_size):
+        events += len(parser.feed(view[offset:offset + chunk_size]))
+    return events
+
+
+def main():
+    """Run the benchmark."""
+    parser = arg_parser(__doc__, rounds=5)
+    parser.add_argument('--file', help='recorded stream to replay')
+    parser.add_argument('--events', type=int, default=20000, help='synthetic notifications')
+    parser.add_argument('--chunk-size', type=int, action='append', help='bytes per read')
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, 'rb') as flo:
+            stream = flo.read()
+    else:
+        stream = build_stream(args.events)
+
+    for chunk_size in args.chunk_size or [256, 4096, 65536]:
+        events, best = best_of(args.rounds, replay, stream, chunk_size)
+        print('chunk=%6d events=%d best=%.4fs %.0f events/s %.1f MB/s' % (
+            chunk_size, events, best, events / best, len(stream) / best / 1e6))
+
+
+if __name__ == '__main__':
+    main()
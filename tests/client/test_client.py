@@ -1194,32 +1194,32 @@ class ClientTests(object):  # pylint: disable=too-few-public-methods
 
         client = Client(factory, recorder, True, FallbackTreatmentCalculator(None))
         assert client.get_treatment('key', 'SPLIT_2') == 'on'
-        assert(telemetry_storage._method_latencies._treatment[0] == 1)
+        assert(sum(telemetry_storage.pop_latencies()['methodLatencies']['treatment']) == 1)
 
         client.get_treatment_with_config('key', 'SPLIT_2')
-        assert(telemetry_storage._method_latencies._treatment_with_config[0] == 1)
+        assert(sum(telemetry_storage.pop_latencies()['methodLatencies']['treatment_with_config']) == 1)
 
         client.get_treatments('key', ['SPLIT_2'])
-        assert(telemetry_storage._method_latencies._treatments[0] == 1)
+        assert(sum(telemetry_storage.pop_latencies()['methodLatencies']['treatments']) == 1)
 
         client.get_treatments_by_flag_set('key', 'set_1')
-        assert(telemetry_storage._method_latencies._treatments_by_flag_set[0] == 1)
+        assert(sum(telemetry_storage.pop_latencies()['methodLatencies']['treatments_by_flag_set']) == 1)
 
         client.get_treatments_by_flag_sets('key', ['set_1'])
-        assert(telemetry_storage._method_latencies._treatments_by_flag_sets[0] == 1)
+        assert(sum(telemetry_storage.pop_latencies()['methodLatencies']['treatments_by_flag_sets']) == 1)
 
         client.get_treatments_with_config('key', ['SPLIT_2'])
-        assert(telemetry_storage._method_latencies._treatments_with_config[0] == 1)
+        assert(sum(telemetry_storage.pop_latencies()['methodLatencies']['treatments_with_config']) == 1)
 
         client.get_treatments_with_config_by_flag_set('key', 'set_1')
-        assert(telemetry_storage._method_latencies._treatments_with_config_by_flag_set[0] == 1)
+        assert(sum(telemetry_storage.pop_latencies()['methodLatencies']['treatments_with_config_by_flag_set']) == 1)
 
         client.get_treatments_with_config_by_flag_sets('key', ['set_1'])
-        assert(telemetry_storage._method_latencies._treatments_with_config_by_flag_sets[0] == 1)
+        assert(sum(telemetry_storage.pop_latencies()['methodLatencies']['treatments_with_config_by_flag_sets']) == 1)
 
         mocker.patch('splitio.client.client.utctime_ms', new=lambda: 1000)
         client.track('key', 'tt', 'ev')
-        assert(telemetry_storage._method_latencies._track[0] == 1)
+        assert(sum(telemetry_storage.pop_latencies()['methodLatencies']['track']) == 1)
         factory.destroy()
 
     @mock.patch('splitio.recorder.recorder.StandardRecorder.record_track_stats', side_effect=Exception())
@@ -2688,32 +2688,32 @@ class ClientAsyncTests(object):  # pylint: disable=too-few-public-methods
             pass
         client = ClientAsync(factory, recorder, True, FallbackTreatmentCalculator(None))
         assert await client.get_treatment('key', 'SPLIT_2') == 'on'
-        assert(telemetry_storage._method_latencies._treatment[0] == 1)
+        assert(sum((await telemetry_storage.pop_latencies())['methodLatencies']['treatment']) == 1)
 
         await client.get_treatment_with_config('key', 'SPLIT_2')
-        assert(telemetry_storage._method_latencies._treatment_with_config[0] == 1)
+        assert(sum((await telemetry_storage.pop_latencies())['methodLatencies']['treatment_with_config']) == 1)
 
         await client.get_treatments('key', ['SPLIT_2'])
-        assert(telemetry_storage._method_latencies._treatments[0] == 1)
+        assert(sum((await telemetry_storage.pop_latencies())['methodLatencies']['treatments']) == 1)
 
         await client.get_treatments_by_flag_set('key', 'set_1')
-        assert(telemetry_storage._method_latencies._treatments_by_flag_set[0] == 1)
+        assert(sum((await telemetry_storage.pop_latencies())['methodLatencies']['treatments_by_flag_set']) == 1)
 
         await client.get_treatments_by_flag_sets('key', ['set_1'])
-        assert(telemetry_storage._method_latencies._treatments_by_flag_sets[0] == 1)
+        assert(sum((await telemetry_storage.pop_latencies())['methodLatencies']['treatments_by_flag_sets']) == 1)
 
         await client.get_treatments_with_config('key', ['SPLIT_2'])
-        assert(telemetry_storage._method_latencies._treatments_with_config[0] == 1)
+        assert(sum((await telemetry_storage.pop_latencies())['methodLatencies']['treatments_with_config']) == 1)
 
         await client.get_treatments_with_config_by_flag_set('key', 'set_1')
-        assert(telemetry_storage._method_latencies._treatments_with_config_by_flag_set[0] == 1)
+        assert(sum((await telemetry_storage.pop_latencies())['methodLatencies']['treatments_with_config_by_flag_set']) == 1)
 
         await client.get_treatments_with_config_by_flag_sets('key', ['set_1'])
-        assert(telemetry_storage._method_latencies._treatments_with_config_by_flag_sets[0] == 1)
+        assert(sum((await telemetry_storage.pop_latencies())['methodLatencies']['treatments_with_config_by_flag_sets']) == 1)
 
         mocker.patch('splitio.client.client.utctime_ms', new=lambda: 1000)
         await client.track('key', 'tt', 'ev')
-        assert(telemetry_storage._method_latencies._track[0] == 1)
+        assert(sum((await telemetry_storage.pop_latencies())['methodLatencies']['track']) == 1)
         await factory.destroy()
 
     @pytest.mark.asyncio
@@ -122,4 +122,59 @@ class ConfigSanitizationTests(object):
         processed = config.sanitize('some', {'fallbackTreatments': fb})
         assert len(processed['fallbackTreatments'].by_flag_fallback_treatment) == 1
         assert processed['fallbackTreatments'].by_flag_fallback_treatment.get("flag2") == fb.by_flag_fallback_treatment["flag2"]
-        assert _logger.warning.mock_calls[1] == mocker.call('Config: fallback treatment parameter for feature flag %s is discarded.', 'flag#%')
\ No newline at end of file
+        assert _logger.warning.mock_calls[1] == mocker.call('Config: fallback treatment parameter for feature flag %s is discarded.', 'flag#%')
+
+    def test_sanitize_tuning(self, mocker):
+        """Test sanitization of connection, concurrency and on-disk storage settings."""
+        _logger = mocker.Mock()
+        mocker.patch('splitio.client.config._LOGGER', new=_logger)
+        processed = config.sanitize('some', {'impressionsMode': 'OPTIMIZED'})
+        for name in config._POSITIVE_INT_SETTINGS + config._NON_NEGATIVE_SETTINGS:
+            assert processed[name] == config.DEFAULT_CONFIG[name]
+        assert processed['criticalSegments'] is None
+        assert processed['segmentsMaxRefreshRate'] is None
+        assert _logger.warning.mock_calls == []
+
+        processed = config.sanitize('some', {
+            'impressionsMode': 'OPTIMIZED',
+            'httpPoolMaxSize': 0,
+            'segmentsSyncConcurrency': '4',
+            'impressionsFlushConcurrency': True,
+            'eventsFlushConcurrency': -1,
+            'spilloverMaxBytes': 1.5,
+            'snapshotRefreshRate': None,
+            'httpDnsCacheTTL': -10,
+            'httpKeepAliveTimeout': '15',
+            'segmentsRefreshRate': 60,
+            'segmentsMaxRefreshRate': 30,
+            'criticalSegments': 'segment1',
+            'spilloverDirectory': 123,
+            'snapshotFile': ['some_file'],
+        })
+        for name in config._POSITIVE_INT_SETTINGS + config._NON_NEGATIVE_SETTINGS:
+            assert processed[name] == config.DEFAULT_CONFIG[name]
+        assert processed['segmentsMaxRefreshRate'] is None
+        assert processed['criticalSegments'] is None
+        assert processed['spilloverDirectory'] is None
+        assert processed['snapshotFile'] is None
+        assert len(_logger.warning.mock_calls) == 12
+
+        _logger.reset_mock()
+        processed = config.sanitize('some', {
+            'impressionsMode': 'OPTIMIZED',
+            'httpPoolMaxSize': 50,
+            'httpDnsCacheTTL': 0,
+            'httpKeepAliveTimeout': 2.5,
+            'segmentsMaxRefreshRate': 600,
+            'criticalSegments': ('segment1', 'segment2'),
+            'spilloverDirectory': '/tmp/spill',
+            'snapshotFile': '/tmp/split.snapshot',
+        })
+        assert processed['httpPoolMaxSize'] == 50
+        assert processed['httpDnsCacheTTL'] == 0
+        assert processed['httpKeepAliveTimeout'] == 2.5
+        assert processed['segmentsMaxRefreshRate'] == 600
+        assert processed['criticalSegments'] == ['segment1', 'segment2']
+        assert processed['spilloverDirectory'] == '/tmp/spill'
+        assert processed['snapshotFile'] == '/tmp/split.snapshot'
+        assert _logger.warning.mock_calls == []
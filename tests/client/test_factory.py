@@ -211,7 +211,7 @@ class SplitFactoryTests(object):
         imp_async_task_mock = mocker.Mock(spec=asynctask.AsyncTask)
         imp_async_task_mock.stop.side_effect = stop_mock
 
-        def _imppression_task_init_mock(self, synchronize_impressions, period):
+        def _imppression_task_init_mock(self, synchronize_impressions, period, on_stop=None):
             self._period = period
             self._task = imp_async_task_mock
         mocker.patch('splitio.client.factory.ImpressionsSyncTask.__init__',
@@ -220,7 +220,7 @@ class SplitFactoryTests(object):
         evt_async_task_mock = mocker.Mock(spec=asynctask.AsyncTask)
         evt_async_task_mock.stop.side_effect = stop_mock
 
-        def _event_task_init_mock(self, synchronize_events, period):
+        def _event_task_init_mock(self, synchronize_events, period, on_stop=None):
             self._period = period
             self._task = evt_async_task_mock
         mocker.patch('splitio.client.factory.EventsSyncTask.__init__', new=_event_task_init_mock)
@@ -312,7 +312,7 @@ class SplitFactoryTests(object):
         imp_async_task_mock = mocker.Mock(spec=asynctask.AsyncTask)
         imp_async_task_mock.stop.side_effect = stop_mock
 
-        def _imppression_task_init_mock(self, synchronize_impressions, period):
+        def _imppression_task_init_mock(self, synchronize_impressions, period, on_stop=None):
             self._period = period
             self._task = imp_async_task_mock
         mocker.patch('splitio.client.factory.ImpressionsSyncTask.__init__',
@@ -321,7 +321,7 @@ class SplitFactoryTests(object):
         evt_async_task_mock = mocker.Mock(spec=asynctask.AsyncTask)
         evt_async_task_mock.stop.side_effect = stop_mock
 
-        def _event_task_init_mock(self, synchronize_events, period):
+        def _event_task_init_mock(self, synchronize_events, period, on_stop=None):
             self._period = period
             self._task = evt_async_task_mock
         mocker.patch('splitio.client.factory.EventsSyncTask.__init__', new=_event_task_init_mock)
@@ -570,6 +570,11 @@ class SplitFactoryTests(object):
         recreate_mock = mocker.Mock()
         mocker.patch('splitio.sync.manager.Manager.recreate', new=recreate_mock)
 
+        recreate_sessions_mock = mocker.Mock()
+        mocker.patch('splitio.api.client.HttpClient.recreate_sessions', new=recreate_sessions_mock)
+        close_sessions_mock = mocker.Mock()
+        mocker.patch('splitio.api.client.HttpClient.close_sessions', new=close_sessions_mock)
+
         config = {
             'preforkedInitialization': True,
         }
@@ -590,12 +595,30 @@ class SplitFactoryTests(object):
         factory.resume()
         assert len(recreate_mock.mock_calls) == 1
         assert len(start_mock.mock_calls) == 1
+        assert len(recreate_sessions_mock.mock_calls) == 1
 
         assert clear_impressions._called == 1
         assert clear_events._called == 1
         factory.destroy()
         time.sleep(0.1)
         assert factory.destroyed
+        assert len(close_sessions_mock.mock_calls) == 1
+
+    def test_spillover_lifecycle(self, mocker, tmpdir):
+        """Test spillover logs move to a slot of their own on resume and are closed on destroy."""
+        mocker.patch('splitio.sync.synchronizer.Synchronizer.sync_all', new=mocker.Mock())
+        mocker.patch('splitio.sync.manager.Manager.start', new=mocker.Mock())
+        mocker.patch('splitio.sync.manager.Manager.recreate', new=mocker.Mock())
+        factory = get_factory("none", config={'preforkedInitialization': True, 'spilloverDirectory': str(tmpdir)})
+        factory._telemetry_submitter = mocker.Mock()
+        impressions = factory._get_storage('impressions')
+        reopen = mocker.spy(impressions._spillover, 'reopen')
+
+        factory.resume()
+        assert len(reopen.mock_calls) == 1
+        factory.destroy()
+        assert impressions._spillover._closed
+        assert factory._get_storage('events')._spillover._closed
 
     def test_error_prefork(self, mocker):
         """Test not handling fork."""
@@ -752,7 +775,7 @@ class SplitFactoryAsyncTests(object):
     async def test_inmemory_client_creation_streaming_false_async(self, mocker):
         """Test that a client with in-memory storage is created correctly for async."""
         # Setup synchronizer
-        def _split_synchronizer(self, ready_flag, some, auth_api, streaming_enabled, sdk_matadata, telemetry_runtime_producer, sse_url=None, client_key=None):
+        def _split_synchronizer(self, ready_flag, some, auth_api, streaming_enabled, sdk_matadata, telemetry_runtime_producer, sse_url=None, client_key=None, connector=None):
             synchronizer = mocker.Mock(spec=SynchronizerAsync)
             async def sync_all(*_):
                 return None
@@ -827,7 +850,7 @@ class SplitFactoryAsyncTests(object):
         imp_async_task_mock = mocker.Mock(spec=asynctask.AsyncTaskAsync)
         imp_async_task_mock.stop.side_effect = stop_mock
 
-        def _imppression_task_init_mock(self, synchronize_impressions, period):
+        def _imppression_task_init_mock(self, synchronize_impressions, period, on_stop=None):
             self._period = period
             self._task = imp_async_task_mock
         mocker.patch('splitio.client.factory.ImpressionsSyncTaskAsync.__init__',
@@ -836,7 +859,7 @@ class SplitFactoryAsyncTests(object):
         evt_async_task_mock = mocker.Mock(spec=asynctask.AsyncTaskAsync)
         evt_async_task_mock.stop.side_effect = stop_mock
 
-        def _event_task_init_mock(self, synchronize_events, period):
+        def _event_task_init_mock(self, synchronize_events, period, on_stop=None):
             self._period = period
             self._task = evt_async_task_mock
         mocker.patch('splitio.client.factory.EventsSyncTaskAsync.__init__', new=_event_task_init_mock)
@@ -873,7 +896,7 @@ class SplitFactoryAsyncTests(object):
                            evt_async_task_mock, imp_count_async_task_mock, telemetry_async_task_mock)
 
         # Setup synchronizer
-        def _split_synchronizer(self, ready_flag, some, auth_api, streaming_enabled, sdk_matadata, telemetry_runtime_producer, sse_url=None, client_key=None):
+        def _split_synchronizer(self, ready_flag, some, auth_api, streaming_enabled, sdk_matadata, telemetry_runtime_producer, sse_url=None, client_key=None, connector=None):
             synchronizer = SynchronizerAsync(syncs, tasks)
             self._ready_flag = ready_flag
             self._synchronizer = synchronizer
@@ -2,7 +2,7 @@
 
 from random import random
 import uuid
-from splitio.engine.filters import BloomFilter
+from splitio.engine.filters import BloomFilter, RotatingBloomFilter
 
 class BloomFilterTests(object):
     """StandardRecorderTests test cases."""
@@ -52,4 +52,47 @@ class BloomFilterTests(object):
                 assert(bloom_filter.contains(myuuid))
                 # False Negative
 
-        assert(false_positive_count/total_sample <= error_rate)
\ No newline at end of file
+        assert(false_positive_count/total_sample <= error_rate)
+
+
+class RotatingBloomFilterTests(object):
+    """Rotating bloom filter test cases."""
+
+    def test_rotating_bloom_filter_methods(self, mocker):
+        bloom_filter = RotatingBloomFilter()
+        key1 = str(uuid.uuid4())
+        key2 = str(uuid.uuid4())
+        bloom_filter.add(key1)
+
+        assert(bloom_filter.contains(key1))
+        assert(not bloom_filter.contains(key2))
+        assert(not bloom_filter.contains_or_add(key2))
+        assert(bloom_filter.contains_or_add(key2))
+
+        # one rotation keeps items in the previous generation, a second one ages them out
+        bitset = bloom_filter._generations[1]
+        bloom_filter.clear()
+        assert(bloom_filter._generations[0] is bitset)
+        assert(bloom_filter.contains(key1))
+        bloom_filter.clear()
+        assert(not bloom_filter.contains(key1))
+        assert(not bloom_filter.contains(key2))
+
+    def test_rotating_bloom_filter_rotates_when_full(self, mocker):
+        bloom_filter = RotatingBloomFilter(100)
+        keys = [str(uuid.uuid4()) for _ in range(250)]
+        for key in keys:
+            bloom_filter.add(key)
+
+        assert(all(bloom_filter.contains(key) for key in keys[200:]))
+        assert(sum(1 for key in keys[:100] if bloom_filter.contains(key)) < 10)
+
+    def test_rotating_bloom_filter_error_percentage(self, mocker):
+        total_sample = 20000
+        error_rate = 0.01
+        bloom_filter = RotatingBloomFilter(total_sample, error_rate)
+        for _ in range(total_sample):
+            bloom_filter.add(str(uuid.uuid4()))
+
+        false_positive_count = sum(1 for _ in range(total_sample) if bloom_filter.contains(str(uuid.uuid4())))
+        assert(false_positive_count/total_sample <= error_rate)
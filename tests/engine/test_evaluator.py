@@ -225,6 +225,7 @@ class EvaluatorTests(object):
         mocked_split.conditions = []
         mocked_split.get_configurations_for = None
         mocked_split.prerequisites = []
+        mocked_split.get_whitelist_index.return_value = ({}, 0)
         
         ctx = EvaluationContext(flags={'some': mocked_split}, segment_memberships=set(), rbs_segments={})
         assert e._treatment_for_flag(mocked_split, 'some_key', 'some_bucketing', {}, ctx) == (
@@ -244,6 +245,7 @@ class EvaluatorTests(object):
         mocked_split.killed = False
         mocked_split.conditions = [mocked_condition_1]
         mocked_split.prerequisites = []
+        mocked_split.get_whitelist_index.return_value = ({}, 0)
         
         treatment, label = e._treatment_for_flag(mocked_split, 'some_key', 'some_bucketing', {}, EvaluationContext(None, None, None))
         assert treatment == 'on'
@@ -374,6 +376,49 @@ class EvaluatorTests(object):
         ctx = evaluation_facctory.context_for('mauro@split.io', ['prereq_chain'])
         assert e.eval_with_context('mauro@split.io', 'mauro@split.io', 'prereq_chain', {'email': 'mauro@split.io'}, ctx)['treatment'] == "on_default"
                 
+    def test_whitelist_index(self):
+        """Test leading key whitelists are resolved like the ordered evaluation."""
+        def whitelist(keys, treatment, label, negate=False, attribute=None):
+            return {
+                'conditionType': 'WHITELIST',
+                'label': label,
+                'matcherGroup': {'combiner': 'AND', 'matchers': [{
+                    'keySelector': {'trafficType': 'user', 'attribute': attribute} if attribute else None,
+                    'matcherType': 'WHITELIST', 'negate': negate, 'whitelistMatcherData': {'whitelist': keys}}]},
+                'partitions': [{'treatment': treatment, 'size': 100}],
+            }
+
+        raw = {
+            'name': 'some', 'seed': 123, 'killed': False, 'defaultTreatment': 'off', 'trafficTypeName': 'user',
+            'status': 'ACTIVE', 'changeNumber': 1, 'algo': 2, 'trafficAllocation': 100, 'trafficAllocationSeed': 1,
+            'conditions': [
+                whitelist(['a', 'b'], 'on', 'first'),
+                whitelist(['b', 'c'], 'v1', 'second'),
+                whitelist(['x'], 'v2', 'negated', negate=True),
+                whitelist(['d'], 'v3', 'after'),
+                {'conditionType': 'ROLLOUT', 'label': 'default rule', 'partitions': [{'treatment': 'off', 'size': 100}],
+                 'matcherGroup': {'combiner': 'AND', 'matchers': [{'matcherType': 'ALL_KEYS', 'negate': False}]}},
+            ]
+        }
+        split = from_raw(raw)
+        assert split.get_whitelist_index() == ({'a': 0, 'b': 0, 'c': 1}, 2)
+        assert split.get_whitelist_index() is split.get_whitelist_index()
+        assert from_raw(copy.deepcopy(raw)).get_whitelist_index() is split.get_whitelist_index()
+
+        e = evaluator.Evaluator(splitters.Splitter())
+        ctx = EvaluationContext({'some': split}, {}, {}, {})
+        assert e._treatment_for_flag(split, 'a', None, {}, ctx) == ('on', 'first')
+        assert e._treatment_for_flag(split, 'b', None, {}, ctx) == ('on', 'first')
+        assert e._treatment_for_flag(split, 'c', None, {}, ctx) == ('v1', 'second')
+        assert e._treatment_for_flag(split, 'd', None, {}, ctx) == ('v2', 'negated')
+        assert e._treatment_for_flag(split, 'x', None, {}, ctx) == ('off', 'default rule')
+
+        raw['conditions'].insert(0, whitelist(['a'], 'v4', 'by attribute', attribute='email'))
+        split = from_raw(raw)
+        assert split.get_whitelist_index() == ({}, 0)
+        assert e._treatment_for_flag(split, 'a', None, {'email': 'a'}, ctx) == ('v4', 'by attribute')
+        assert e._treatment_for_flag(split, 'a', None, {}, ctx) == ('on', 'first')
+
     def test_evaluate_treatment_with_fallback(self, mocker):
         """Test that a evaluation return fallback treatment."""
         splitter_mock = mocker.Mock(spec=splitters.Splitter)
@@ -114,3 +114,9 @@ class HashFunctionsTests(object):
             seed = int(seed)
             hashed = int(hashed)
             assert murmur3_128_py(key, seed)[0] == hashed
+
+    def test_murmur_128_many(self):
+        """Test batch hashing matches hashing keys one by one."""
+        keys = ['key%d' % i for i in range(50)] + ['', 'ñandú', 'a' * 37]
+        assert hashfns.murmur_128_many(keys, 0) == [hashfns.murmur_128(key, 0) for key in keys]
+        assert hashfns.IMPLEMENTATION in ('mmh3cffi', 'python')
@@ -35,10 +35,27 @@ class ImpressionHasherTests(object):
         total.add(hasher.process(Impression('key1', 'feature1', 'on', 'killed', 123, None, 456, None, {})))
         assert len(total) == 6
 
+    def test_process_many(self):
+        """Test batch hashing matches hashing impressions one by one."""
+        hasher = Hasher()
+        impressions = [Impression('key%d' % i, 'feature1', 'on', 'killed', 123, None, 456, None, {}) for i in range(10)]
+        assert hasher.process_many(impressions) == [hasher.process(impression) for impression in impressions]
+
 
 class ImpressionObserverTests(object):
     """Test impression observer behaviour."""
 
+    def test_test_and_set_many(self):
+        """Test batches set previous times in order, including repeated impressions."""
+        observer = Observer(5)
+        observed = observer.test_and_set_many([
+            Impression('key1', 'f1', 'on', 'killed', 123, None, 456, None, None),
+            Impression('key2', 'f1', 'on', 'killed', 123, None, 456, None, None),
+            Impression('key1', 'f1', 'on', 'killed', 123, None, 457, None, None),
+        ])
+        assert [imp.previous_time for imp in observed] == [None, None, 456]
+        assert observer.test_and_set(Impression('key2', 'f1', 'on', 'killed', 123, None, 458, None, None)).previous_time == 456
+
     def test_previous_time_properly_calculated(self):
         """Test that the previous time is properly set."""
         observer = Observer(5)
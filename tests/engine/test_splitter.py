@@ -49,3 +49,29 @@ class SplitterTests(object):
 
 
 
+
+    def test_full_partition_skips_hashing(self, mocker):
+        """Test no hashing happens when a partition covers every bucket."""
+        splitter = Splitter()
+        splitter.get_bucket = mocker.Mock()
+        assert splitter.get_treatment('key', 123, [Partition('on', 0), Partition('off', 100)], 1) == 'off'
+        assert splitter.get_treatment('key', 123, [Partition('on', 100), Partition('off', 0)], 1) == 'on'
+        assert splitter.get_bucket.mock_calls == []
+
+    def test_memoized_bucket(self, mocker):
+        """Test buckets are reused for the same key, seed and algorithm."""
+        splitter = Splitter()
+        buckets = {}
+        bucket = splitter.get_memoized_bucket('key', 123, 2, buckets)
+        assert bucket == Splitter.get_bucket('key', 123, 2)
+        assert buckets == {('key', 123, 2): bucket}
+
+        splitter.get_bucket = mocker.Mock(return_value=7)
+        assert splitter.get_memoized_bucket('key', 123, 2, buckets) == bucket
+        assert splitter.get_memoized_bucket('key', 321, 2, buckets) == 7
+        assert splitter.get_memoized_bucket('key', 123, 2, None) == 7
+        assert len(splitter.get_bucket.mock_calls) == 2
+
+        partitions = [Partition('on', 50), Partition('off', 50)]
+        assert splitter.get_treatment('key', 321, partitions, 2, buckets) == 'on'
+        assert len(splitter.get_bucket.mock_calls) == 2
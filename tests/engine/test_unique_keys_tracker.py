@@ -2,7 +2,7 @@
 import pytest
 
 from splitio.engine.impressions.unique_keys_tracker import UniqueKeysTracker, UniqueKeysTrackerAsync
-from splitio.engine.filters import BloomFilter
+from splitio.engine.filters import RotatingBloomFilter
 
 class UniqueKeysTrackerTests(object):
     """StandardRecorderTests test cases."""
@@ -13,7 +13,7 @@ class UniqueKeysTrackerTests(object):
         assert(tracker._cache_size > 0)
         assert(tracker._current_cache_size == 0)
         assert(tracker._cache == {})
-        assert(isinstance(tracker._filter, BloomFilter))
+        assert(isinstance(tracker._filter, RotatingBloomFilter))
 
         key1 = 'key1'
         key2 = 'key2'
@@ -35,6 +35,9 @@ class UniqueKeysTrackerTests(object):
         assert(key2 in tracker._cache[split2])
         assert(not key3 in tracker._cache[split2])
 
+        # items age out after a full rotation of the filter generations
+        tracker.clear_filter()
+        assert(tracker._filter.contains(split1+key1))
         tracker.clear_filter()
         assert(not tracker._filter.contains(split1+key1))
         assert(not tracker._filter.contains(split2+key2))
@@ -62,6 +65,23 @@ class UniqueKeysTrackerTests(object):
         assert(len(tracker._cache[split1]) == cache_size)
         assert(len(tracker._cache[split2]) == cache_size / 2)
 
+    def test_cache_bytes(self, mocker):
+        tracker = UniqueKeysTracker(30000, max_cache_bytes=1000)
+        hook = mocker.Mock()
+        tracker.set_queue_full_hook(hook)
+
+        tracker.track('key1', 'feature1')
+        tracker.track('key1', 'feature2')
+        assert(tracker._cache['feature1'].pop() is tracker._cache['feature2'].pop())
+        assert(hook.call_count == 0)
+
+        for x in range(1, 20):
+            tracker.track('key' + str(x), 'feature1')
+        assert(hook.call_count > 0)
+
+        tracker.get_cache_info_and_pop_all()
+        assert(tracker._current_cache_bytes == 0)
+
 
 class UniqueKeysTrackerAsyncTests(object):
     """StandardRecorderTests test cases."""
@@ -73,7 +93,7 @@ class UniqueKeysTrackerAsyncTests(object):
         assert(tracker._cache_size > 0)
         assert(tracker._current_cache_size == 0)
         assert(tracker._cache == {})
-        assert(isinstance(tracker._filter, BloomFilter))
+        assert(isinstance(tracker._filter, RotatingBloomFilter))
 
         key1 = 'key1'
         key2 = 'key2'
@@ -95,6 +115,9 @@ class UniqueKeysTrackerAsyncTests(object):
         assert(key2 in tracker._cache[split2])
         assert(not key3 in tracker._cache[split2])
 
+        # items age out after a full rotation of the filter generations
+        await tracker.clear_filter()
+        assert(tracker._filter.contains(split1+key1))
         await tracker.clear_filter()
         assert(not tracker._filter.contains(split1+key1))
         assert(not tracker._filter.contains(split2+key2))
@@ -0,0 +1,51 @@
+"""Attributes view tests module."""
+from splitio.models.grammar import matchers
+from splitio.models.grammar.matchers.utils import attributes
+from splitio.models.grammar.matchers.utils.attributes import AttributesView
+
+
+class AttributesViewTests(object):
+    """Test the evaluation scoped attributes view."""
+
+    def test_conversions(self):
+        raw = {'s': 'abc', 'i': '12', 'l': ['a', 'b'], 'b': 'TRUE', 'v': '1.2.3', 'd': {'x': {1}}}
+        view = AttributesView(raw)
+        assert view.get_as('s', attributes.to_string) == 'abc'
+        assert view.get_as('i', attributes.to_int) == 12
+        assert view.get_as('s', attributes.to_int) is None
+        assert view.get_as('l', attributes.to_set) == frozenset(['a', 'b'])
+        assert view.get_as('i', attributes.to_set) == frozenset(['1', '2'])
+        assert view.get_as('b', attributes.to_bool) is True
+        assert view.get_as('s', attributes.to_bool) is None
+        assert view.get_as('v', attributes.to_semver).version == '1.2.3'
+        assert view.get_as('s', attributes.to_semver) is None
+        assert view.get_as('d', attributes.to_string) is None
+        assert view.get_as('missing', attributes.to_string) is None
+        assert view['s'] == 'abc'
+        assert view.get('missing') is None
+        assert 'i' in view and len(view) == len(raw)
+
+    def test_wrap(self):
+        assert AttributesView.wrap(None) is None
+        raw = {'a': 1}
+        view = AttributesView.wrap(raw)
+        assert isinstance(view, AttributesView)
+        assert AttributesView.wrap(view) is view
+        assert view == {'a': 1}
+        assert view._attributes is raw
+
+    def test_conversions_memoized(self, mocker):
+        logger = mocker.Mock()
+        mocker.patch('splitio.models.grammar.matchers.utils.attributes._LOGGER', new=logger)
+        view = AttributesView({'age': '30'})
+        for matcher_type in ['GREATER_THAN_OR_EQUAL_TO', 'LESS_THAN_OR_EQUAL_TO', 'EQUAL_TO']:
+            matcher = matchers.from_raw({
+                'matcherType': matcher_type,
+                'negate': False,
+                'keySelector': {'attribute': 'age'},
+                'unaryNumericMatcherData': {'dataType': 'NUMBER', 'value': 30},
+            })
+            assert matcher.evaluate('key', view)
+
+        assert len(logger.warning.mock_calls) == 1
+        assert view._converted == {('age', attributes.to_int): 30}
@@ -1,4 +1,5 @@
 """Condition model tests module."""
+import copy
 
 from splitio.models.grammar import condition
 from splitio.models.grammar import partitions
@@ -76,3 +77,56 @@ class ConditionTests(object):
         assert cond.matches('some_key', {'a': 1}, {'some_context_option': 0}) == True
         assert matcher1_mock.evaluate.mock_calls == [mocker.call('some_key', {'a': 1}, {'some_context_option': 0})]
         assert matcher2_mock.evaluate.mock_calls == [mocker.call('some_key', {'a': 1}, {'some_context_option': 0})]
+
+    def test_cache(self):
+        """Test parsed conditions are reused while their raw JSON doesn't change."""
+        cache = condition.ConditionCache(max_size=2)
+        parsed = cache.from_raw(self.raw)
+        assert cache.from_raw(copy.deepcopy(self.raw)) is parsed
+        assert len(cache) == 1
+
+        changed = copy.deepcopy(self.raw)
+        changed['partitions'][0]['size'] = 40
+        changed['partitions'][1]['size'] = 60
+        assert cache.from_raw(changed) is not parsed
+        assert cache.from_raw(changed).partitions[0].size == 40
+
+        other = copy.deepcopy(self.raw)
+        other['label'] = 'other_label'
+        cache.from_raw(other)
+        assert len(cache) == 2
+        assert cache.from_raw(self.raw) is not parsed  # evicted as the least recently used.
+
+        unmarshallable = copy.deepcopy(self.raw)
+        unmarshallable['matcherGroup']['matchers'][0]['extra'] = object()
+        assert cache.from_raw(unmarshallable) is not cache.from_raw(unmarshallable)
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_whitelist_indexes(self):
+        """Test whitelist indexes are shared by flags built from the same conditions."""
+        def whitelist(keys):
+            return condition.from_raw({
+                'conditionType': 'WHITELIST',
+                'label': 'whitelisted',
+                'matcherGroup': {'combiner': 'AND', 'matchers': [{
+                    'keySelector': None, 'matcherType': 'WHITELIST', 'negate': False,
+                    'whitelistMatcherData': {'whitelist': keys}}]},
+                'partitions': [{'treatment': 'on', 'size': 100}],
+            })
+
+        cache = condition.WhitelistIndexCache(max_size=1)
+        first, second = whitelist(['a', 'b']), whitelist(['b', 'c'])
+        rollout = condition.from_raw(self.raw)
+        index = cache.index_for([first, second, rollout])
+        assert index == ({'a': 0, 'b': 0, 'c': 1}, 2)
+        assert cache.index_for([first, second]) is index
+        assert cache.index_for([rollout, first]) == ({}, 0)
+        assert len(cache) == 1
+
+        other = cache.index_for([second])
+        assert other == ({'b': 0, 'c': 0}, 1)
+        assert len(cache) == 1
+        assert cache.index_for([first, second]) is not index  # evicted as the least recently used.
+        cache.clear()
+        assert len(cache) == 0
@@ -5,7 +5,6 @@ import abc
 import calendar
 import json
 import os.path
-import re
 import pytest
 
 from datetime import datetime
@@ -15,6 +14,7 @@ from splitio.models.grammar.matchers.prerequisites import PrerequisitesMatcher
 from splitio.models import splits
 from splitio.models import rule_based_segments
 from splitio.models.grammar import condition
+from splitio.models.grammar.matchers.utils.regex import compile_regex
 from splitio.models.grammar.matchers.utils.utils import Semver
 from splitio.storage import SegmentStorage
 from splitio.engine.evaluator import Evaluator, EvaluationContext
@@ -854,7 +854,8 @@ class RegexMatcherTests(MatcherTestsBase):
         parsed = matchers.from_raw(self.raw)
         assert isinstance(parsed, matchers.RegexMatcher)
         assert parsed._data == "^[a-z][A-Z][0-9]$"
-        assert parsed._regex == re.compile("^[a-z][A-Z][0-9]$")
+        assert parsed._regex is compile_regex("^[a-z][A-Z][0-9]$")
+        assert parsed._regex.pattern == "^[a-z][A-Z][0-9]$"
 
     def test_matcher_behaviour(self, mocker):
         """Test if the matcher works properly."""
@@ -0,0 +1,105 @@
+"""Regex cache tests module."""
+import re
+
+from splitio.models.grammar import matchers
+from splitio.models.grammar.matchers.utils import regex
+
+
+class CompiledRegexTests(object):
+    """Test the shared compiled regexes."""
+
+    def test_cache(self):
+        compiled = regex.compile_regex('^a+b$')
+        assert compiled is regex.compile_regex('^a+b$')
+        assert compiled.pattern == '^a+b$'
+        assert compiled.search('aab')
+        assert not compiled.search('aabc')
+
+    def test_re2_fallback(self, mocker):
+        re2 = mocker.Mock()
+        mocker.patch('splitio.models.grammar.matchers.utils.regex.re2', new=re2)
+        compiled = regex.compile_regex.__wrapped__('^[a-z]+$')
+        assert compiled.linear
+        assert compiled._regex is re2.compile.return_value
+
+        re2.compile.side_effect = Exception('unsupported')
+        compiled = regex.compile_regex.__wrapped__('(a)\\1')
+        assert not compiled.linear
+        assert compiled._regex == re.compile('(a)\\1')
+
+    def test_budget(self, mocker):
+        mocker.patch('splitio.models.grammar.matchers.utils.regex._SEARCH_BUDGET_SECONDS', new=-1)
+        logger = mocker.Mock()
+        mocker.patch('splitio.models.grammar.matchers.utils.regex._LOGGER', new=logger)
+        regex.pop_exhausted_count()
+        compiled = regex.CompiledRegex('abc', re.compile('abc'), False)
+        for _ in range(regex._MAX_BUDGET_STRIKES):
+            assert not compiled.exhausted
+            assert compiled.search('abc')
+
+        assert compiled.exhausted
+        assert not compiled.search('abc')
+        assert len(logger.warning.mock_calls) == 1
+        assert regex.pop_exhausted_count() == 1
+        assert regex.pop_exhausted_count() == 0
+
+        assert logger.warning.mock_calls[0][1][2] is None
+
+        linear = regex.CompiledRegex('abc', re.compile('abc'), True)
+        for _ in range(regex._MAX_BUDGET_STRIKES + 1):
+            assert linear.search('abc')
+        assert not linear.exhausted
+
+    def test_budget_window(self, mocker):
+        mocker.patch('splitio.models.grammar.matchers.utils.regex._SEARCH_BUDGET_SECONDS', new=-1)
+        mocker.patch('splitio.models.grammar.matchers.utils.regex._LOGGER', new=mocker.Mock())
+        now = [1000.0]
+        mocker.patch('splitio.models.grammar.matchers.utils.regex.time.monotonic', new=lambda: now[0])
+        regex.pop_exhausted_count()
+        compiled = regex.CompiledRegex('abc', re.compile('abc'), False)
+        for _ in range(regex._MAX_BUDGET_STRIKES + 2):
+            assert compiled.search('abc')
+            now[0] += regex._STRIKE_WINDOW_SECONDS / 2 + 1
+
+        assert not compiled.exhausted
+        assert regex.pop_exhausted_count() == 0
+
+    def test_cooldown(self, mocker):
+        mocker.patch('splitio.models.grammar.matchers.utils.regex._SEARCH_BUDGET_SECONDS', new=-1)
+        logger = mocker.Mock()
+        mocker.patch('splitio.models.grammar.matchers.utils.regex._LOGGER', new=logger)
+        now = [1000.0]
+        mocker.patch('splitio.models.grammar.matchers.utils.regex.time.monotonic', new=lambda: now[0])
+        regex.pop_exhausted_count()
+        compiled = regex.CompiledRegex('abc', re.compile('abc'), False)
+        for _ in range(regex._MAX_BUDGET_STRIKES):
+            compiled.search('abc', 'some_flag')
+        assert compiled.exhausted
+        assert logger.warning.mock_calls[0][1][2] == 'some_flag'
+
+        now[0] += regex._COOLDOWN_SECONDS - 1
+        assert not compiled.search('abc')
+        now[0] += 2
+        assert not compiled.exhausted
+        assert compiled.search('abc')
+        assert regex.pop_exhausted_count() == 1
+
+    def test_reset_on_parse(self, mocker):
+        mocker.patch('splitio.models.grammar.matchers.utils.regex._SEARCH_BUDGET_SECONDS', new=-1)
+        mocker.patch('splitio.models.grammar.matchers.utils.regex._LOGGER', new=mocker.Mock())
+        raw = {
+            'matcherType': 'MATCHES_STRING',
+            'negate': False,
+            'keySelector': None,
+            'stringMatcherData': 'reparsed[a-z]+',
+        }
+        matcher = matchers.from_raw(raw)
+        for _ in range(regex._MAX_BUDGET_STRIKES):
+            assert matcher.evaluate('reparsedabc', None, {'flag': 'some_flag'})
+        assert matcher._regex.exhausted
+        assert not matcher.evaluate('reparsedabc', None, {'flag': 'some_flag'})
+
+        matcher = matchers.from_raw(raw)
+        assert not matcher._regex.exhausted
+        assert matcher.evaluate('reparsedabc', None, {'flag': 'some_flag'})
+        regex.pop_exhausted_count()
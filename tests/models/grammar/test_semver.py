@@ -69,3 +69,11 @@ class SemverTests(object):
         semver2 = build_semver_or_none('1.01.2-rc.01')
         assert semver2 is not None
         assert semver2.version == '1.1.2-rc.1'
+
+    def test_parse_cache(self):
+        semver = build_semver_or_none('2.3.4-beta.1')
+        assert build_semver_or_none('2.3.4-beta.1') is semver
+        assert build_semver_or_none('2.3.4') is not semver
+        assert build_semver_or_none('2.3.4').compare(semver) == 1
+        assert build_semver_or_none('invalid') is None
+        assert not hasattr(semver, '__dict__')
@@ -0,0 +1,66 @@
+"""String index tests module."""
+import random
+
+from splitio.models.grammar.matchers.utils.string_index import AffixIndex, SubstringIndex
+
+
+def _random_strings(rand, count, min_length, max_length):
+    return [''.join(rand.choice('abc.@') for _ in range(rand.randint(min_length, max_length)))
+            for _ in range(count)]
+
+
+class AffixIndexTests(object):
+    """Test the prefix and suffix index."""
+
+    def test_matches(self):
+        index = AffixIndex(['example.', 'ex', 'test@'])
+        assert index.matches('example.com')
+        assert index.matches('exit')
+        assert index.matches('test@example.com')
+        assert not index.matches('e')
+        assert not index.matches('')
+        assert not index.matches('other')
+
+        index = AffixIndex(['.com', '@split.io', 'o'], suffix=True)
+        assert index.matches('user@split.io')
+        assert index.matches('example.com')
+        assert index.matches('o')
+        assert not index.matches('example.org')
+        assert not index.matches('')
+
+        assert AffixIndex(['', 'abc']).matches('zzz')
+        assert not AffixIndex([]).matches('zzz')
+
+    def test_against_linear_scan(self):
+        rand = random.Random(42)
+        patterns = _random_strings(rand, 500, 1, 6)
+        prefixes = AffixIndex(patterns)
+        suffixes = AffixIndex(patterns, suffix=True)
+        for value in _random_strings(rand, 2000, 0, 12):
+            assert prefixes.matches(value) == any(value.startswith(p) for p in patterns)
+            assert suffixes.matches(value) == any(value.endswith(p) for p in patterns)
+
+
+class SubstringIndexTests(object):
+    """Test the substring index."""
+
+    def test_matches(self):
+        for patterns in (['he', 'she', 'his', 'hers'], ['he', 'she', 'his', 'hers'] + ['x%d' % i for i in range(20)]):
+            index = SubstringIndex(patterns)
+            assert index.matches('ushers')
+            assert index.matches('ahis')
+            assert index.matches('she')
+            assert not index.matches('hi')
+            assert not index.matches('')
+
+        assert SubstringIndex(['', 'abc']).matches('zzz')
+        assert SubstringIndex([''] + ['x%d' % i for i in range(20)]).matches('zzz')
+        assert not SubstringIndex([]).matches('zzz')
+
+    def test_against_linear_scan(self):
+        rand = random.Random(42)
+        patterns = _random_strings(rand, 300, 2, 6)
+        index = SubstringIndex(patterns)
+        assert index._goto is not None
+        for value in _random_strings(rand, 2000, 0, 20):
+            assert index.matches(value) == any(p in value for p in patterns)
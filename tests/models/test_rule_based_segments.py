@@ -100,4 +100,20 @@ class RuleBasedSegmentModelTests(object):
         })
         rbs = rule_based_segments.from_raw(rbs)
         
-        assert rbs.get_condition_segment_names() == {"employees"}
\ No newline at end of file
+        assert rbs.get_condition_segment_names() == {"employees"}
+    def test_excluded(self):
+        """Test excluded keys and segments lookups."""
+        excluded = rule_based_segments.Excluded(
+            ['key1', 'key2'],
+            [{'name': 'seg1', 'type': 'standard'}, {'name': 'rbs1', 'type': 'rule-based'}, {'name': 'seg2', 'type': 'invalid'}])
+        assert excluded.is_excluded_key('key1')
+        assert not excluded.is_excluded_key('key3')
+        assert excluded.get_excluded_keys() == ['key1', 'key2']
+        assert excluded.standard_segments == ('seg1', 'seg2')
+        assert excluded.get_excluded_standard_segments() == ['seg1', 'seg2']
+        assert excluded.has_rule_based_segments
+        assert excluded.to_json() == {
+            'keys': ['key1', 'key2'],
+            'segments': [{'name': 'seg1', 'type': 'standard'}, {'name': 'rbs1', 'type': 'rule-based'}, {'name': 'seg2', 'type': 'standard'}]
+        }
+        assert not rule_based_segments.Excluded([], [{'name': 'seg1', 'type': 'standard'}]).has_rule_based_segments
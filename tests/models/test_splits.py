@@ -1,5 +1,6 @@
 """Split model tests module."""
 import copy
+import json
 
 from splitio.models import splits
 from splitio.models.grammar.condition import Condition
@@ -109,6 +110,17 @@ class SplitTests(object):
         split1 = splits.Split( 'some_split', 123, False, 'off', 'user', 'ACTIVE', 123, [cond1, cond2], None)
         assert split1.get_segment_names() == ['segment%d' % i for i in range(1, 5)]
 
+    def test_get_rule_based_segment_names(self, mocker):
+        """Test fetching rule based segment names."""
+        cond1 = mocker.Mock(spec=Condition)
+        cond2 = mocker.Mock(spec=Condition)
+        cond1.get_rule_based_segment_names.return_value = ['rbs1']
+        cond2.get_rule_based_segment_names.return_value = ['rbs1', 'rbs2']
+        split1 = splits.Split( 'some_split', 123, False, 'off', 'user', 'ACTIVE', 123, [cond1, cond2], None)
+        assert split1.get_rule_based_segment_names() == frozenset(['rbs1', 'rbs2'])
+        assert split1.get_rule_based_segment_names() == frozenset(['rbs1', 'rbs2'])
+        assert cond1.get_rule_based_segment_names.call_count == 1
+
     def test_to_json(self):
         """Test json serialization."""
         as_json = splits.from_raw(self.raw).to_json()
@@ -151,4 +163,20 @@ class SplitTests(object):
         split['conditions'].append(split['conditions'][0])
         split['conditions'][0]['matcherGroup']['matchers'][0]['matcherType'] = 'INVALID_MATCHER'
         parsed = splits.from_raw(split)
-        assert parsed.conditions[0].to_json() == splits._DEFAULT_CONDITIONS_TEMPLATE
\ No newline at end of file
+        assert parsed.conditions[0].to_json() == splits._DEFAULT_CONDITIONS_TEMPLATE
+
+    def test_slots_and_interning(self):
+        """Test parsed models are slotted and share their identifiers."""
+        raw = json.loads(json.dumps(self.raw))
+        parsed = splits.from_raw(raw)
+        other = splits.from_raw(json.loads(json.dumps(self.raw)))
+        condition = parsed.conditions[0]
+        for model in (parsed, condition, condition.partitions[0], condition.matchers[0], parsed.prerequisites[0]):
+            assert not hasattr(model, '__dict__')
+
+        assert parsed.name is other.name
+        assert parsed.default_treatment is other.default_treatment
+        assert parsed.traffic_type_name is other.traffic_type_name
+        assert condition.partitions[0].treatment is other.conditions[1].partitions[0].treatment
+        assert condition.label is other.conditions[0].label
+        assert parsed.prerequisites[0].feature_flag_name is other.prerequisites[0].feature_flag_name
@@ -1,6 +1,7 @@
 """Telemetry model test module."""
 import os
 import random
+import threading
 import pytest
 
 from splitio.models.telemetry import StorageType, OperationMode, MethodLatencies, MethodExceptions, \
@@ -49,55 +50,14 @@ class TelemetryModelTests(object):
         method_latencies.pop_all() # should not raise exception
         for method in ModelTelemetry.MethodExceptionsAndLatencies:
             method_latencies.add_latency(method, 50)
-            if method.value == 'treatment':
-                assert(method_latencies._treatment[ModelTelemetry.get_latency_bucket_index(50)] == 1)
-            elif method.value == 'treatments':
-                assert(method_latencies._treatments[ModelTelemetry.get_latency_bucket_index(50)] == 1)
-            elif method.value == 'treatment_with_config':
-                assert(method_latencies._treatment_with_config[ModelTelemetry.get_latency_bucket_index(50)] == 1)
-            elif method.value == 'treatments_with_config':
-                assert(method_latencies._treatments_with_config[ModelTelemetry.get_latency_bucket_index(50)] == 1)
-            elif method.value == 'treatments_by_flag_set':
-                assert(method_latencies._treatments_by_flag_set[ModelTelemetry.get_latency_bucket_index(50)] == 1)
-            elif method.value == 'treatments_by_flag_sets':
-                assert(method_latencies._treatments_by_flag_sets[ModelTelemetry.get_latency_bucket_index(50)] == 1)
-            elif method.value == 'treatments_with_config_by_flag_set':
-                assert(method_latencies._treatments_with_config_by_flag_set[ModelTelemetry.get_latency_bucket_index(50)] == 1)
-            elif method.value == 'treatments_with_config_by_flag_sets':
-                assert(method_latencies._treatments_with_config_by_flag_sets[ModelTelemetry.get_latency_bucket_index(50)] == 1)
-            elif method.value == 'track':
-                assert(method_latencies._track[ModelTelemetry.get_latency_bucket_index(50)] == 1)
-
             method_latencies.add_latency(method, 50000000)
-            if method.value == 'treatment':
-                assert(method_latencies._treatment[ModelTelemetry.get_latency_bucket_index(50000000)] == 1)
-            if method.value == 'treatments':
-                assert(method_latencies._treatments[ModelTelemetry.get_latency_bucket_index(50000000)] == 1)
-            if method.value == 'treatment_with_config':
-                assert(method_latencies._treatment_with_config[ModelTelemetry.get_latency_bucket_index(50000000)] == 1)
-            if method.value == 'treatments_with_config':
-                assert(method_latencies._treatments_with_config[ModelTelemetry.get_latency_bucket_index(50000000)] == 1)
-            elif method.value == 'treatments_by_flag_set':
-                assert(method_latencies._treatments_by_flag_set[ModelTelemetry.get_latency_bucket_index(50000000)] == 1)
-            elif method.value == 'treatments_by_flag_sets':
-                assert(method_latencies._treatments_by_flag_sets[ModelTelemetry.get_latency_bucket_index(50000000)] == 1)
-            elif method.value == 'treatments_with_config_by_flag_set':
-                assert(method_latencies._treatments_with_config_by_flag_set[ModelTelemetry.get_latency_bucket_index(50000000)] == 1)
-            elif method.value == 'treatments_with_config_by_flag_sets':
-                assert(method_latencies._treatments_with_config_by_flag_sets[ModelTelemetry.get_latency_bucket_index(50000000)] == 1)
-            if method.value == 'track':
-                assert(method_latencies._track[ModelTelemetry.get_latency_bucket_index(50000000)] == 1)
-
-        method_latencies.pop_all()
-        assert(method_latencies._track == [0] * 23)
-        assert(method_latencies._treatment == [0] * 23)
-        assert(method_latencies._treatments == [0] * 23)
-        assert(method_latencies._treatment_with_config == [0] * 23)
-        assert(method_latencies._treatments_with_config == [0] * 23)
-        assert(method_latencies._treatments_by_flag_set == [0] * 23)
-        assert(method_latencies._treatments_by_flag_sets == [0] * 23)
-        assert(method_latencies._treatments_with_config_by_flag_set == [0] * 23)
-        assert(method_latencies._treatments_with_config_by_flag_sets == [0] * 23)
+            method_latencies.add_bucket(method, 5)
+        latencies = method_latencies.pop_all()['methodLatencies']
+        assert len(latencies) == 9
+        for bucket_counts in latencies.values():
+            assert bucket_counts == [1, 0, 0, 0, 0, 1] + [0] * 16 + [1]
+
+        assert method_latencies.pop_all()['methodLatencies'] == {method: [0] * 23 for method in latencies}
 
         method_latencies.add_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENT, 10)
         [method_latencies.add_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS, 20) for i in range(2)]
@@ -119,6 +79,48 @@ class TelemetryModelTests(object):
                                                  'treatments_with_config_by_flag_sets': [6] + [0] * 22,
                                                  'track': [1] + [0] * 22}})
 
+    def test_method_latencies_threads(self, mocker):
+        method_latencies = MethodLatencies()
+        treatment = ModelTelemetry.MethodExceptionsAndLatencies.TREATMENT
+        started, release = threading.Barrier(3), threading.Event()
+
+        def record(bucket):
+            [method_latencies.add_bucket(treatment, bucket) for _ in range(100)]
+            started.wait()
+            release.wait()
+            method_latencies.add_bucket(treatment, bucket)
+
+        threads = [threading.Thread(target=record, args=(bucket,)) for bucket in (1, 2)]
+        [thread.start() for thread in threads]
+        started.wait()
+        method_latencies.add_bucket(treatment, 1)
+        assert len(method_latencies._histograms) == 3
+        assert method_latencies.pop_all()['methodLatencies']['treatment'][:3] == [0, 101, 100]
+
+        release.set()
+        [thread.join() for thread in threads]
+        assert method_latencies.pop_all()['methodLatencies']['treatment'][:3] == [0, 1, 1]
+        assert len(method_latencies._histograms) == 1
+        assert method_latencies.pop_all()['methodLatencies']['treatment'] == [0] * 23
+
+    def test_method_latencies_fold_finished_threads(self, mocker):
+        mocker.patch('splitio.models.telemetry._MIN_HISTOGRAMS_BEFORE_FOLDING', new=4)
+        method_latencies = MethodLatencies()
+        treatment = ModelTelemetry.MethodExceptionsAndLatencies.TREATMENT
+
+        def record():
+            method_latencies.add_bucket(treatment, 1)
+
+        for _ in range(10):
+            thread = threading.Thread(target=record)
+            thread.start()
+            thread.join()
+            assert len(method_latencies._histograms) <= 4
+
+        assert method_latencies.pop_all()['methodLatencies']['treatment'][:3] == [0, 10, 0]
+        assert method_latencies._histograms == []
+        assert method_latencies.pop_all()['methodLatencies']['treatment'] == [0] * 23
+
     def test_http_latencies(self, mocker):
         http_latencies = HTTPLatencies()
 
@@ -373,55 +375,14 @@ class TelemetryModelAsyncTests(object):
 
         for method in ModelTelemetry.MethodExceptionsAndLatencies:
             await method_latencies.add_latency(method, 50)
-            if method.value == 'treatment':
-                assert(method_latencies._treatment[ModelTelemetry.get_latency_bucket_index(50)] == 1)
-            elif method.value == 'treatments':
-                assert(method_latencies._treatments[ModelTelemetry.get_latency_bucket_index(50)] == 1)
-            elif method.value == 'treatment_with_config':
-                assert(method_latencies._treatment_with_config[ModelTelemetry.get_latency_bucket_index(50)] == 1)
-            elif method.value == 'treatments_with_config':
-                assert(method_latencies._treatments_with_config[ModelTelemetry.get_latency_bucket_index(50)] == 1)
-            elif method.value == 'treatments_by_flag_set':
-                assert(method_latencies._treatments_by_flag_set[ModelTelemetry.get_latency_bucket_index(50)] == 1)
-            elif method.value == 'treatments_by_flag_sets':
-                assert(method_latencies._treatments_by_flag_sets[ModelTelemetry.get_latency_bucket_index(50)] == 1)
-            elif method.value == 'treatments_with_config_by_flag_set':
-                assert(method_latencies._treatments_with_config_by_flag_set[ModelTelemetry.get_latency_bucket_index(50)] == 1)
-            elif method.value == 'treatments_with_config_by_flag_sets':
-                assert(method_latencies._treatments_with_config_by_flag_sets[ModelTelemetry.get_latency_bucket_index(50)] == 1)
-            elif method.value == 'track':
-                assert(method_latencies._track[ModelTelemetry.get_latency_bucket_index(50)] == 1)
-
             await method_latencies.add_latency(method, 50000000)
-            if method.value == 'treatment':
-                assert(method_latencies._treatment[ModelTelemetry.get_latency_bucket_index(50000000)] == 1)
-            if method.value == 'treatments':
-                assert(method_latencies._treatments[ModelTelemetry.get_latency_bucket_index(50000000)] == 1)
-            if method.value == 'treatment_with_config':
-                assert(method_latencies._treatment_with_config[ModelTelemetry.get_latency_bucket_index(50000000)] == 1)
-            if method.value == 'treatments_with_config':
-                assert(method_latencies._treatments_with_config[ModelTelemetry.get_latency_bucket_index(50000000)] == 1)
-            elif method.value == 'treatments_by_flag_set':
-                assert(method_latencies._treatments_by_flag_set[ModelTelemetry.get_latency_bucket_index(50000000)] == 1)
-            elif method.value == 'treatments_by_flag_sets':
-                assert(method_latencies._treatments_by_flag_sets[ModelTelemetry.get_latency_bucket_index(50000000)] == 1)
-            elif method.value == 'treatments_with_config_by_flag_set':
-                assert(method_latencies._treatments_with_config_by_flag_set[ModelTelemetry.get_latency_bucket_index(50000000)] == 1)
-            elif method.value == 'treatments_with_config_by_flag_sets':
-                assert(method_latencies._treatments_with_config_by_flag_sets[ModelTelemetry.get_latency_bucket_index(50000000)] == 1)
-            if method.value == 'track':
-                assert(method_latencies._track[ModelTelemetry.get_latency_bucket_index(50000000)] == 1)
-
-        await method_latencies.pop_all()
-        assert(method_latencies._track == [0] * 23)
-        assert(method_latencies._treatment == [0] * 23)
-        assert(method_latencies._treatments == [0] * 23)
-        assert(method_latencies._treatment_with_config == [0] * 23)
-        assert(method_latencies._treatments_with_config == [0] * 23)
-        assert(method_latencies._treatments_by_flag_set == [0] * 23)
-        assert(method_latencies._treatments_by_flag_sets == [0] * 23)
-        assert(method_latencies._treatments_with_config_by_flag_set == [0] * 23)
-        assert(method_latencies._treatments_with_config_by_flag_sets == [0] * 23)
+            await method_latencies.add_bucket(method, 5)
+        latencies = (await method_latencies.pop_all())['methodLatencies']
+        assert len(latencies) == 9
+        for bucket_counts in latencies.values():
+            assert bucket_counts == [1, 0, 0, 0, 0, 1] + [0] * 16 + [1]
+
+        assert (await method_latencies.pop_all())['methodLatencies'] == {method: [0] * 23 for method in latencies}
 
         await method_latencies.add_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENT, 10)
         [await method_latencies.add_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS, 20) for i in range(2)]
@@ -60,6 +60,23 @@ class SegmentWorkerTests(object):
         segment_worker.stop()
         assert not segment_worker.is_running()
 
+    def test_coalesce_updates(self, mocker):
+        q = queue.Queue()
+        handler = mocker.Mock()
+        for change_number in [10, 30, 20]:
+            q.put(SegmentChangeNotification('some', 'SEGMENT_UPDATE', change_number, 'segment1'))
+        q.put(SegmentChangeNotification('some', 'SEGMENT_UPDATE', 15, 'segment2'))
+
+        segment_worker = SegmentWorker(handler, q)
+        segment_worker.start()
+        time.sleep(0.2)
+        assert sorted(handler.mock_calls) == [mocker.call('segment1', 30), mocker.call('segment2', 15)]
+
+        q.put(SegmentChangeNotification('some', 'SEGMENT_UPDATE', 40, 'segment1'))
+        time.sleep(0.1)
+        assert handler.mock_calls[-1] == mocker.call('segment1', 40)
+        segment_worker.stop()
+
 class SegmentWorkerAsyncTests(object):
 
     @pytest.mark.asyncio
@@ -111,3 +128,20 @@ class SegmentWorkerAsyncTests(object):
         await segment_worker.stop()
         await asyncio.sleep(.1)
         assert(not self._worker_running())
+
+    @pytest.mark.asyncio
+    async def test_coalesce_updates(self):
+        q = asyncio.Queue()
+        calls = []
+        async def handler(segment_name, change_number):
+            calls.append((segment_name, change_number))
+
+        for change_number in [10, 30, 20]:
+            await q.put(SegmentChangeNotification('some', 'SEGMENT_UPDATE', change_number, 'segment1'))
+        await q.put(SegmentChangeNotification('some', 'SEGMENT_UPDATE', 15, 'segment2'))
+
+        segment_worker = SegmentWorkerAsync(handler, q)
+        segment_worker.start()
+        await asyncio.sleep(.1)
+        assert sorted(calls) == [('segment1', 30), ('segment2', 15)]
+        await segment_worker.stop()
@@ -2,6 +2,7 @@
 import time
 import queue
 import base64
+import json
 import pytest
 
 from splitio.api import APIException
@@ -47,6 +48,19 @@ rbs = {
         ]
       }
 
+def encoded_feature_flag(name, change_number):
+    return base64.b64encode(json.dumps({
+        'changeNumber': change_number,
+        'trafficTypeName': 'user',
+        'name': name,
+        'seed': 123,
+        'status': 'ACTIVE',
+        'killed': False,
+        'defaultTreatment': 'off',
+        'conditions': [],
+    }).encode('utf-8'))
+
+
 def handler_sync(change_number, rbs_change_number):
     global change_number_received
     global rbs_change_number_received
@@ -142,6 +156,44 @@ class SplitWorkerTests(object):
         split_worker.stop()
         assert not split_worker.is_running()
 
+    def test_coalesce_updates(self, mocker):
+        q = queue.Queue()
+        handler = mocker.Mock()
+        split_worker = SplitWorker(handler, mocker.Mock(), q, mocker.Mock(), mocker.Mock(), mocker.Mock(), mocker.Mock())
+        q.put(SplitChangeUpdate('some', 'SPLIT_UPDATE', 123456790, None, None, None))
+        q.put(SplitChangeUpdate('some', 'SPLIT_UPDATE', 123456792, None, None, None))
+        q.put(SplitChangeUpdate('some', 'SPLIT_UPDATE', 123456791, None, None, None))
+        q.put(RBSChangeUpdate('some', 'RB_SEGMENT_UPDATE', 123456789, None, None, None))
+
+        split_worker.start()
+        time.sleep(0.1)
+        assert handler.mock_calls == [mocker.call(123456792, 123456789)]
+        split_worker.stop()
+
+    def test_out_of_order_updates(self, mocker):
+        q = queue.Queue()
+        handler = mocker.Mock()
+        split_storage = InMemorySplitStorage()
+        split_storage.update([], [], 100)
+        split_worker = SplitWorker(handler, mocker.Mock(), q, split_storage, InMemorySegmentStorage(), mocker.Mock(), mocker.Mock())
+        split_worker.start()
+
+        q.put(SplitChangeUpdate('some', 'SPLIT_UPDATE', 102, 101, encoded_feature_flag('flag2', 102), 0))
+        time.sleep(0.01)
+        q.put(SplitChangeUpdate('some', 'SPLIT_UPDATE', 103, 102, encoded_feature_flag('flag3', 103), 0))
+        q.put(SplitChangeUpdate('some', 'SPLIT_UPDATE', 101, 100, encoded_feature_flag('flag1', 101), 0))
+        time.sleep(0.2)
+        assert split_storage.get_change_number() == 103
+        assert sorted(split_storage.get_split_names()) == ['flag1', 'flag2', 'flag3']
+        assert handler.mock_calls == []
+
+        # the gap is never filled, so the buffered update is fetched instead
+        q.put(SplitChangeUpdate('some', 'SPLIT_UPDATE', 105, 104, encoded_feature_flag('flag5', 105), 0))
+        time.sleep(0.2)
+        assert handler.mock_calls == [mocker.call(105, None)]
+        assert split_storage.get('flag5') is None
+        split_worker.stop()
+
     def test_on_error(self, mocker):
         q = queue.Queue()
         def handler_sync(change_number):
@@ -403,6 +455,31 @@ class SplitWorkerAsyncTests(object):
         assert not split_worker.is_running()
         assert(not self._worker_running())
 
+    @pytest.mark.asyncio
+    async def test_out_of_order_updates(self, mocker):
+        q = asyncio.Queue()
+        handler = mocker.AsyncMock()
+        split_storage = InMemorySplitStorageAsync()
+        await split_storage.update([], [], 100)
+        telemetry_runtime_producer = mocker.Mock()
+        telemetry_runtime_producer.record_update_from_sse = mocker.AsyncMock()
+        split_worker = SplitWorkerAsync(handler, mocker.AsyncMock(), q, split_storage, InMemorySegmentStorageAsync(),
+                                        telemetry_runtime_producer, mocker.Mock())
+        split_worker.start()
+
+        await q.put(SplitChangeUpdate('some', 'SPLIT_UPDATE', 102, 101, encoded_feature_flag('flag2', 102), 0))
+        await asyncio.sleep(0.01)
+        await q.put(SplitChangeUpdate('some', 'SPLIT_UPDATE', 101, 100, encoded_feature_flag('flag1', 101), 0))
+        await asyncio.sleep(0.2)
+        assert await split_storage.get_change_number() == 102
+        assert sorted(await split_storage.get_split_names()) == ['flag1', 'flag2']
+        assert handler.mock_calls == []
+
+        await q.put(SplitChangeUpdate('some', 'SPLIT_UPDATE', 105, 104, encoded_feature_flag('flag5', 105), 0))
+        await asyncio.sleep(0.2)
+        assert handler.mock_calls == [mocker.call(105, None)]
+        await split_worker.stop()
+
     @pytest.mark.asyncio
     async def test_compression(self, mocker):
         q = asyncio.Queue()
@@ -5,10 +5,35 @@ import threading
 import pytest
 from contextlib import suppress
 
-from splitio.push.sse import SSEClient, SSEEvent, SSEClientAsync
+from splitio.push.sse import SSEClient, SSEEvent, SSEClientAsync, EventParser
 from splitio.optional.loaders import asyncio
 from tests.helpers.mockserver import SSEMockServer
 
+class EventParserTests(object):
+    """EventParser test cases."""
+
+    def test_parse_events(self):
+        """Test events are built from complete lines only."""
+        parser = EventParser()
+        assert parser.feed(b':keepalive\n\nid: 1\nevent: message\nda') == [SSEEvent(None, None, None, None)]
+        assert parser.feed(b'ta: {"a": 1}\nretry\n') == []
+        assert parser.feed(b'unknown: x\r\n\r\nid:2\ndata:abc\n\ndata: d') == [
+            SSEEvent('1', 'message', None, '{"a": 1}'),
+            SSEEvent('2', None, None, 'abc'),
+        ]
+        assert parser.feed(b'ef\n\n') == [SSEEvent(None, None, None, 'def')]
+        assert parser._buffer == bytearray()
+
+    def test_split_multibyte_characters(self):
+        """Test values are decoded once the whole event is received."""
+        raw = 'data: caf\u00e9 \u2713\n\n'.encode('utf8')
+        parser = EventParser()
+        events = []
+        for index in range(len(raw)):
+            events.extend(parser.feed(raw[index:index + 1]))
+        assert events == [SSEEvent(None, None, None, 'caf\u00e9 \u2713')]
+
+
 class SSEClientTests(object):
     """SSEClient test cases."""
 
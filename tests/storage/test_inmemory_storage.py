@@ -1302,17 +1302,11 @@ class InMemoryTelemetryStorageTests(object):
         storage = InMemoryTelemetryStorage()
 
         for method in ModelTelemetry.MethodExceptionsAndLatencies:
-            if self._get_method_latency(method, storage) == None:
-                continue
-            storage.record_latency(method, 50)
-            assert(self._get_method_latency(method, storage)[ModelTelemetry.get_latency_bucket_index(50)] == 1)
-            storage.record_latency(method, 50000000)
-            assert(self._get_method_latency(method, storage)[ModelTelemetry.get_latency_bucket_index(50000000)] == 1)
-            for j in range(10):
-                latency = random.randint(1001, 4987885)
-                current_count = self._get_method_latency(method, storage)[ModelTelemetry.get_latency_bucket_index(latency)]
-                [storage.record_latency(method, latency) for i in range(2)]
-                assert(self._get_method_latency(method, storage)[ModelTelemetry.get_latency_bucket_index(latency)] == 2 + current_count)
+            storage.record_latency(method, ModelTelemetry.get_latency_bucket_index(50))
+            storage.record_latency(method, ModelTelemetry.get_latency_bucket_index(50000000))
+            [storage.record_latency(method, 5) for i in range(2)]
+        for bucket_counts in storage.pop_latencies()['methodLatencies'].values():
+            assert(bucket_counts == [1, 0, 0, 0, 0, 2] + [0] * 16 + [1])
 
         for resource in ModelTelemetry.HTTPExceptionsAndLatencies:
             if self._get_http_latency(resource, storage) == None:
@@ -1327,28 +1321,6 @@ class InMemoryTelemetryStorageTests(object):
                 [storage.record_sync_latency(resource, latency) for i in range(2)]
                 assert(self._get_http_latency(resource, storage)[ModelTelemetry.get_latency_bucket_index(latency)] == 2 + current_count)
 
-    def _get_method_latency(self, resource, storage):
-        if resource == ModelTelemetry.MethodExceptionsAndLatencies.TREATMENT:
-            return storage._method_latencies._treatment
-        elif resource == ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS:
-            return storage._method_latencies._treatments
-        elif resource == ModelTelemetry.MethodExceptionsAndLatencies.TREATMENT_WITH_CONFIG:
-            return storage._method_latencies._treatment_with_config
-        elif resource == ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG:
-            return storage._method_latencies._treatments_with_config
-        elif resource == ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SET:
-            return storage._method_latencies._treatments_by_flag_set
-        elif resource == ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SETS:
-            return storage._method_latencies._treatments_by_flag_sets
-        elif resource == ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SET:
-            return storage._method_latencies._treatments_with_config_by_flag_set
-        elif resource == ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SETS:
-            return storage._method_latencies._treatments_with_config_by_flag_sets
-        elif resource == ModelTelemetry.MethodExceptionsAndLatencies.TRACK:
-            return storage._method_latencies._track
-        else:
-            return
-
     def _get_http_latency(self, resource, storage):
         if resource == ModelTelemetry.HTTPExceptionsAndLatencies.SPLIT:
             return storage._http_latencies._split
@@ -1437,26 +1409,17 @@ class InMemoryTelemetryStorageTests(object):
     def test_pop_latencies(self):
         storage = InMemoryTelemetryStorage()
 
-        [storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENT, i) for i in [5, 10, 10, 10]]
-        [storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS, i) for i in [7, 10, 14, 13]]
-        [storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENT_WITH_CONFIG, i) for i in [200]]
-        [storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG, i) for i in [50, 40]]
-        [storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SET, i) for i in [15, 20]]
-        [storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SETS, i) for i in [14, 25]]
-        [storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SET, i) for i in [100]]
-        [storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SETS, i) for i in [50, 20]]
-        [storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TRACK, i) for i in [1, 10, 100]]
+        [storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENT, ModelTelemetry.get_latency_bucket_index(i)) for i in [5, 10, 10, 10]]
+        [storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS, ModelTelemetry.get_latency_bucket_index(i)) for i in [7, 10, 14, 13]]
+        [storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENT_WITH_CONFIG, ModelTelemetry.get_latency_bucket_index(i)) for i in [200]]
+        [storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG, ModelTelemetry.get_latency_bucket_index(i)) for i in [50, 40]]
+        [storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SET, ModelTelemetry.get_latency_bucket_index(i)) for i in [15, 20]]
+        [storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SETS, ModelTelemetry.get_latency_bucket_index(i)) for i in [14, 25]]
+        [storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SET, ModelTelemetry.get_latency_bucket_index(i)) for i in [100]]
+        [storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SETS, ModelTelemetry.get_latency_bucket_index(i)) for i in [50, 20]]
+        [storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TRACK, ModelTelemetry.get_latency_bucket_index(i)) for i in [1, 10, 100]]
         latencies = storage.pop_latencies()
 
-        assert(storage._method_latencies._treatment == [0] * 23)
-        assert(storage._method_latencies._treatments == [0] * 23)
-        assert(storage._method_latencies._treatment_with_config == [0] * 23)
-        assert(storage._method_latencies._treatments_with_config == [0] * 23)
-        assert(storage._method_latencies._treatments_by_flag_set == [0] * 23)
-        assert(storage._method_latencies._treatments_by_flag_sets == [0] * 23)
-        assert(storage._method_latencies._treatments_with_config_by_flag_set == [0] * 23)
-        assert(storage._method_latencies._treatments_with_config_by_flag_sets == [0] * 23)
-        assert(storage._method_latencies._track == [0] * 23)
         assert(latencies ==  {'methodLatencies': {
                     'treatment': [4] + [0] * 22,
                     'treatments': [4] + [0] * 22,
@@ -1467,6 +1430,7 @@ class InMemoryTelemetryStorageTests(object):
                     'treatments_with_config_by_flag_set': [1] + [0] * 22,
                     'treatments_with_config_by_flag_sets': [2] + [0] * 22,
                     'track': [3] + [0] * 22}})
+        assert(storage.pop_latencies()['methodLatencies'] == {method: [0] * 23 for method in latencies['methodLatencies']})
 
         [storage.record_sync_latency(ModelTelemetry.HTTPExceptionsAndLatencies.SPLIT, i) for i in [50, 10, 20, 40]]
         [storage.record_sync_latency(ModelTelemetry.HTTPExceptionsAndLatencies.SEGMENT, i) for i in [70, 100, 40, 30]]
@@ -1624,17 +1588,11 @@ class InMemoryTelemetryStorageAsyncTests(object):
         storage = await InMemoryTelemetryStorageAsync.create()
 
         for method in ModelTelemetry.MethodExceptionsAndLatencies:
-            if self._get_method_latency(method, storage) == None:
-                continue
-            await storage.record_latency(method, 50)
-            assert(self._get_method_latency(method, storage)[ModelTelemetry.get_latency_bucket_index(50)] == 1)
-            await storage.record_latency(method, 50000000)
-            assert(self._get_method_latency(method, storage)[ModelTelemetry.get_latency_bucket_index(50000000)] == 1)
-            for j in range(10):
-                latency = random.randint(1001, 4987885)
-                current_count = self._get_method_latency(method, storage)[ModelTelemetry.get_latency_bucket_index(latency)]
-                [await storage.record_latency(method, latency) for i in range(2)]
-                assert(self._get_method_latency(method, storage)[ModelTelemetry.get_latency_bucket_index(latency)] == 2 + current_count)
+            await storage.record_latency(method, ModelTelemetry.get_latency_bucket_index(50))
+            await storage.record_latency(method, ModelTelemetry.get_latency_bucket_index(50000000))
+            [await storage.record_latency(method, 5) for i in range(2)]
+        for bucket_counts in (await storage.pop_latencies())['methodLatencies'].values():
+            assert(bucket_counts == [1, 0, 0, 0, 0, 2] + [0] * 16 + [1])
 
         for resource in ModelTelemetry.HTTPExceptionsAndLatencies:
             if self._get_http_latency(resource, storage) == None:
@@ -1649,28 +1607,6 @@ class InMemoryTelemetryStorageAsyncTests(object):
                 [await storage.record_sync_latency(resource, latency) for i in range(2)]
                 assert(self._get_http_latency(resource, storage)[ModelTelemetry.get_latency_bucket_index(latency)] == 2 + current_count)
 
-    def _get_method_latency(self, resource, storage):
-        if resource == ModelTelemetry.MethodExceptionsAndLatencies.TREATMENT:
-            return storage._method_latencies._treatment
-        elif resource == ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS:
-            return storage._method_latencies._treatments
-        elif resource == ModelTelemetry.MethodExceptionsAndLatencies.TREATMENT_WITH_CONFIG:
-            return storage._method_latencies._treatment_with_config
-        elif resource == ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG:
-            return storage._method_latencies._treatments_with_config
-        elif resource == ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SET:
-            return storage._method_latencies._treatments_by_flag_set
-        elif resource == ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SETS:
-            return storage._method_latencies._treatments_by_flag_sets
-        elif resource == ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SET:
-            return storage._method_latencies._treatments_with_config_by_flag_set
-        elif resource == ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SETS:
-            return storage._method_latencies._treatments_with_config_by_flag_sets
-        elif resource == ModelTelemetry.MethodExceptionsAndLatencies.TRACK:
-            return storage._method_latencies._track
-        else:
-            return
-
     def _get_http_latency(self, resource, storage):
         if resource == ModelTelemetry.HTTPExceptionsAndLatencies.SPLIT:
             return storage._http_latencies._split
@@ -1761,26 +1697,17 @@ class InMemoryTelemetryStorageAsyncTests(object):
     async def test_pop_latencies(self):
         storage = await InMemoryTelemetryStorageAsync.create()
 
-        [await storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENT, i) for i in [5, 10, 10, 10]]
-        [await storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS, i) for i in [7, 10, 14, 13]]
-        [await storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENT_WITH_CONFIG, i) for i in [200]]
-        [await storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG, i) for i in [50, 40]]
-        [await storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SET, i) for i in [15, 20]]
-        [await storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SETS, i) for i in [14, 25]]
-        [await storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SET, i) for i in [100]]
-        [await storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SETS, i) for i in [50, 20]]
-        [await storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TRACK, i) for i in [1, 10, 100]]
+        [await storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENT, ModelTelemetry.get_latency_bucket_index(i)) for i in [5, 10, 10, 10]]
+        [await storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS, ModelTelemetry.get_latency_bucket_index(i)) for i in [7, 10, 14, 13]]
+        [await storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENT_WITH_CONFIG, ModelTelemetry.get_latency_bucket_index(i)) for i in [200]]
+        [await storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG, ModelTelemetry.get_latency_bucket_index(i)) for i in [50, 40]]
+        [await storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SET, ModelTelemetry.get_latency_bucket_index(i)) for i in [15, 20]]
+        [await storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SETS, ModelTelemetry.get_latency_bucket_index(i)) for i in [14, 25]]
+        [await storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SET, ModelTelemetry.get_latency_bucket_index(i)) for i in [100]]
+        [await storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SETS, ModelTelemetry.get_latency_bucket_index(i)) for i in [50, 20]]
+        [await storage.record_latency(ModelTelemetry.MethodExceptionsAndLatencies.TRACK, ModelTelemetry.get_latency_bucket_index(i)) for i in [1, 10, 100]]
         latencies = await storage.pop_latencies()
 
-        assert(storage._method_latencies._treatment == [0] * 23)
-        assert(storage._method_latencies._treatments == [0] * 23)
-        assert(storage._method_latencies._treatment_with_config == [0] * 23)
-        assert(storage._method_latencies._treatments_with_config == [0] * 23)
-        assert(storage._method_latencies._treatments_by_flag_set == [0] * 23)
-        assert(storage._method_latencies._treatments_by_flag_sets == [0] * 23)
-        assert(storage._method_latencies._treatments_with_config_by_flag_set == [0] * 23)
-        assert(storage._method_latencies._treatments_with_config_by_flag_sets == [0] * 23)
-        assert(storage._method_latencies._track == [0] * 23)
         assert(latencies ==  {'methodLatencies': {
                     'treatment': [4] + [0] * 22,
                     'treatments': [4] + [0] * 22,
@@ -1791,6 +1718,7 @@ class InMemoryTelemetryStorageAsyncTests(object):
                     'treatments_with_config_by_flag_set': [1] + [0] * 22,
                     'treatments_with_config_by_flag_sets': [2] + [0] * 22,
                     'track': [3] + [0] * 22}})
+        assert((await storage.pop_latencies())['methodLatencies'] == {method: [0] * 23 for method in latencies['methodLatencies']})
 
         [await storage.record_sync_latency(ModelTelemetry.HTTPExceptionsAndLatencies.SPLIT, i) for i in [50, 10, 20, 40]]
         [await storage.record_sync_latency(ModelTelemetry.HTTPExceptionsAndLatencies.SEGMENT, i) for i in [70, 100, 40, 30]]
@@ -0,0 +1,125 @@
+"""Storage snapshot test module."""
+# pylint: disable=no-self-use
+import os
+
+import pytest
+
+from splitio.models import splits, rule_based_segments
+from splitio.models.segments import Segment
+from splitio.storage.inmemmory import InMemorySplitStorage, InMemoryRuleBasedSegmentStorage, InMemorySegmentStorage
+from splitio.storage.snapshot import StorageSnapshot
+
+
+def _raw_split(name, segment_name):
+    return {
+        'changeNumber': 123,
+        'trafficTypeName': 'user',
+        'name': name,
+        'trafficAllocation': 100,
+        'trafficAllocationSeed': 123456,
+        'seed': 321654,
+        'status': 'ACTIVE',
+        'killed': False,
+        'defaultTreatment': 'off',
+        'algo': 2,
+        'conditions': [{
+            'conditionType': 'ROLLOUT',
+            'label': 'in segment',
+            'partitions': [{'treatment': 'on', 'size': 100}],
+            'matcherGroup': {
+                'combiner': 'AND',
+                'matchers': [{
+                    'matcherType': 'IN_SEGMENT',
+                    'negate': False,
+                    'userDefinedSegmentMatcherData': {'segmentName': segment_name},
+                }],
+            },
+        }],
+        'sets': ['set1'],
+    }
+
+
+def _build_storages():
+    split_storage = InMemorySplitStorage()
+    rbs_storage = InMemoryRuleBasedSegmentStorage()
+    segment_storage = InMemorySegmentStorage()
+    split_storage.update([splits.from_raw(_raw_split('flag1', 'segment1'))], [], 123)
+    rbs_storage.update([rule_based_segments.from_raw({
+        'name': 'rbs1', 'conditions': [], 'trafficTypeName': 'user', 'changeNumber': 456, 'status': 'ACTIVE',
+        'excluded': {'keys': ['key3'], 'segments': [{'type': 'standard', 'name': 'segment2'}]}})], [], 456)
+    segment_storage.put(Segment('segment1', ['key1', 'key2'], 789))
+    segment_storage.put(Segment('segment2', ['key4'], 790))
+    return split_storage, rbs_storage, segment_storage
+
+
+class StorageSnapshotTests(object):
+    """Storage snapshot test cases."""
+
+    def test_save_and_load(self, tmpdir):
+        """Test storages are restored with their change numbers."""
+        path = os.path.join(str(tmpdir), 'split.snapshot')
+        StorageSnapshot(path, 'some_sdk_key').save(*_build_storages())
+        assert os.listdir(str(tmpdir)) == ['split.snapshot']
+
+        split_storage = InMemorySplitStorage()
+        rbs_storage = InMemoryRuleBasedSegmentStorage()
+        segment_storage = InMemorySegmentStorage()
+        assert StorageSnapshot(path, 'some_sdk_key').load(split_storage, rbs_storage, segment_storage)
+
+        assert split_storage.get_change_number() == 123
+        assert split_storage.get('flag1').to_json() == splits.from_raw(_raw_split('flag1', 'segment1')).to_json()
+        assert rbs_storage.get_change_number() == 456
+        assert rbs_storage.get('rbs1').excluded.get_excluded_keys() == ['key3']
+        assert segment_storage.get_change_number('segment1') == 789
+        assert segment_storage.get('segment1').keys == set(['key1', 'key2'])
+        assert segment_storage.get('segment2').keys == set(['key4'])
+
+    def test_save_failure(self, tmpdir, mocker):
+        """Test a failed save leaves neither a temp file nor a partial snapshot."""
+        path = os.path.join(str(tmpdir), 'split.snapshot')
+        mocker.patch('splitio.storage.snapshot.os.replace', side_effect=OSError('disk full'))
+        with pytest.raises(OSError):
+            StorageSnapshot(path, 'some_sdk_key').save(*_build_storages())
+        assert os.listdir(str(tmpdir)) == []
+
+    def test_load_missing(self, tmpdir):
+        """Test nothing is loaded when there is no snapshot."""
+        split_storage = InMemorySplitStorage()
+        snapshot = StorageSnapshot(os.path.join(str(tmpdir), 'split.snapshot'), 'some_sdk_key')
+        assert not snapshot.load(split_storage, InMemoryRuleBasedSegmentStorage(), InMemorySegmentStorage())
+        assert split_storage.get_change_number() == -1
+
+    def test_load_other_owner(self, tmpdir):
+        """Test snapshots written for another sdk key or flag sets are ignored."""
+        path = os.path.join(str(tmpdir), 'split.snapshot')
+        StorageSnapshot(path, 'some_sdk_key').save(*_build_storages())
+
+        split_storage = InMemorySplitStorage()
+        assert not StorageSnapshot(path, 'other_sdk_key').load(
+            split_storage, InMemoryRuleBasedSegmentStorage(), InMemorySegmentStorage())
+        assert not StorageSnapshot(path, 'some_sdk_key', ['set1']).load(
+            split_storage, InMemoryRuleBasedSegmentStorage(), InMemorySegmentStorage())
+        assert split_storage.get_change_number() == -1
+
+    def test_load_corrupted(self, tmpdir):
+        """Test snapshots failing the checksum or version check are ignored."""
+        path = os.path.join(str(tmpdir), 'split.snapshot')
+        StorageSnapshot(path, 'some_sdk_key').save(*_build_storages())
+        with open(path, 'rb') as flo:
+            contents = bytearray(flo.read())
+
+        corrupted = bytearray(contents)
+        corrupted[-1] ^= 0xff
+        with open(path, 'wb') as flo:
+            flo.write(corrupted)
+        split_storage = InMemorySplitStorage()
+        assert not StorageSnapshot(path, 'some_sdk_key').load(
+            split_storage, InMemoryRuleBasedSegmentStorage(), InMemorySegmentStorage())
+        assert split_storage.get_change_number() == -1
+
+        other_version = bytearray(contents)
+        other_version[9] = 99
+        with open(path, 'wb') as flo:
+            flo.write(other_version)
+        assert not StorageSnapshot(path, 'some_sdk_key').load(
+            split_storage, InMemoryRuleBasedSegmentStorage(), InMemorySegmentStorage())
@@ -0,0 +1,167 @@
+"""Disk spillover storage test module."""
+# pylint: disable=no-self-use
+import os
+
+from splitio.models.impressions import Impression
+from splitio.models.events import Event, EventWrapper
+from splitio.engine.telemetry import TelemetryStorageProducer
+from splitio.storage.inmemmory import InMemoryTelemetryStorage
+from splitio.storage.spillover import SegmentLog, SpilloverImpressionStorage, SpilloverEventStorage
+
+
+class SegmentLogTests(object):
+    """Segment log test cases."""
+
+    def test_append_pop(self, tmpdir):
+        """Test records are read back in order across segments."""
+        log = SegmentLog(str(tmpdir), segment_bytes=32)
+        assert log.append([b'record%d' % i for i in range(10)]) == 10
+        assert len(log) == 10
+        assert len([name for name in os.listdir(log.directory) if name.endswith('.log')]) > 1
+
+        assert log.pop_many(4) == [b'record0', b'record1', b'record2', b'record3']
+        assert log.pop_many(100) == [b'record%d' % i for i in range(4, 10)]
+        assert log.pop_many(100) == []
+        assert len(log) == 0
+        assert len([name for name in os.listdir(log.directory) if name.endswith('.log')]) == 1
+        assert [name for name in os.listdir(log.directory) if name.endswith('.count')] == []
+
+    def test_size_cap(self, tmpdir):
+        """Test appends beyond max bytes are rejected."""
+        log = SegmentLog(str(tmpdir), max_bytes=30)
+        assert log.append([b'0123456789'] * 5) == 2
+        assert log.pop_many(5) == [b'0123456789'] * 2
+        assert log.append([b'0123456789'] * 5) == 2
+
+    def test_replay_after_restart(self, tmpdir):
+        """Test pending records are replayed by a new log over the same directory."""
+        log = SegmentLog(str(tmpdir), segment_bytes=32)
+        log.append([b'record%d' % i for i in range(10)])
+        assert log.pop_many(3) == [b'record0', b'record1', b'record2']
+        log.close()
+
+        log = SegmentLog(str(tmpdir), segment_bytes=32)
+        assert len(log) == 7
+        assert log.pop_many(100) == [b'record%d' % i for i in range(3, 10)]
+
+    def test_partial_record_ignored(self, tmpdir):
+        """Test a truncated trailing record is not returned."""
+        log = SegmentLog(str(tmpdir))
+        log.append([b'record0', b'record1'])
+        log.close()
+        segment = [name for name in os.listdir(log.directory) if name.endswith('.log')][0]
+        with open(os.path.join(log.directory, segment), 'ab') as flo:
+            flo.write(b'\x00\x00\x00\x10abc')
+
+        log = SegmentLog(str(tmpdir))
+        assert log.pop_many(10) == [b'record0', b'record1']
+
+    def test_pending_count_persisted(self, tmpdir, mocker):
+        """Test rolled segments are not read again to count pending records after a restart."""
+        log = SegmentLog(str(tmpdir), segment_bytes=32)
+        log.append([b'record%d' % i for i in range(10)])
+        assert log.pop_many(3) == [b'record0', b'record1', b'record2']
+        log.close()
+
+        count_records = mocker.spy(SegmentLog, '_count_records')
+        log = SegmentLog(str(tmpdir), segment_bytes=32)
+        assert len(log) == 7
+        assert len(count_records.mock_calls) == 1
+        assert log.pop_many(100) == [b'record%d' % i for i in range(3, 10)]
+
+    def test_slots(self, tmpdir):
+        """Test logs open at the same time over a directory get a slot each."""
+        log1 = SegmentLog(str(tmpdir))
+        log2 = SegmentLog(str(tmpdir))
+        assert log1.directory != log2.directory
+        log1.append([b'record0'])
+        log2.append([b'record1'])
+        assert log1.pop_many(10) == [b'record0']
+        assert log2.pop_many(10) == [b'record1']
+
+        log1.append([b'record2'])
+        log1.close()
+        assert log1.append([b'record3']) == 0
+        assert log1.pop_many(10) == []
+        log3 = SegmentLog(str(tmpdir))
+        assert log3.directory == log1.directory
+        assert log3.pop_many(10) == [b'record2']
+
+    def test_reopen(self, tmpdir):
+        """Test a reopened log locks a free slot again and reloads its pending records."""
+        log = SegmentLog(str(tmpdir))
+        log.append([b'record0'])
+        directory = log.directory
+        log.reopen()
+        assert log.directory == directory
+        assert len(log) == 1
+
+        other = SegmentLog(str(tmpdir))
+        assert other.directory != directory
+        assert len(other) == 0
+
+    def test_clear(self, tmpdir):
+        """Test clearing drops pending records."""
+        log = SegmentLog(str(tmpdir))
+        log.append([b'record0', b'record1'])
+        log.clear()
+        assert len(log) == 0
+        assert log.pop_many(10) == []
+
+
+class SpilloverImpressionStorageTests(object):
+    """Spillover impressions storage test cases."""
+
+    def test_spill_and_replay(self, tmpdir):
+        """Test impressions that do not fit in memory go to disk and are popped afterwards."""
+        telemetry_storage = InMemoryTelemetryStorage()
+        telemetry_runtime_producer = TelemetryStorageProducer(telemetry_storage).get_telemetry_runtime_producer()
+        storage = SpilloverImpressionStorage(2, telemetry_runtime_producer, SegmentLog(str(tmpdir)))
+        impressions = [Impression('key%d' % i, 'feature1', 'on', 'l1', 123456, 'b1', 321654, None, None)
+                       for i in range(5)]
+        assert storage.put(impressions)
+        assert telemetry_storage._counters._impressions_queued == 5
+        assert telemetry_storage._counters._impressions_dropped == 0
+
+        assert storage.pop_many(3) == impressions[:3]
+        assert storage.pop_many(3) == impressions[3:]
+        assert storage.pop_many(3) == []
+
+    def test_clear_keeps_spilled(self, tmpdir):
+        """Test clearing after a fork drops only the in-memory queue."""
+        telemetry_storage = InMemoryTelemetryStorage()
+        telemetry_runtime_producer = TelemetryStorageProducer(telemetry_storage).get_telemetry_runtime_producer()
+        segment_log = SegmentLog(str(tmpdir))
+        storage = SpilloverImpressionStorage(1, telemetry_runtime_producer, segment_log)
+        impressions = [Impression('key%d' % i, 'feature1', 'on', 'l1', 123456, 'b1', 321654, None, None)
+                       for i in range(3)]
+        storage.put(impressions)
+        storage.clear()
+        assert len(segment_log) == 2
+        assert storage.pop_many(3) == impressions[1:]
+
+    def test_spillover_full(self, tmpdir):
+        """Test impressions are dropped once memory and disk are full."""
+        telemetry_storage = InMemoryTelemetryStorage()
+        telemetry_runtime_producer = TelemetryStorageProducer(telemetry_storage).get_telemetry_runtime_producer()
+        storage = SpilloverImpressionStorage(1, telemetry_runtime_producer, SegmentLog(str(tmpdir), max_bytes=100))
+        impressions = [Impression('key%d' % i, 'feature1', 'on', 'l1', 123456, 'b1', 321654, None, None)
+                       for i in range(5)]
+        assert not storage.put(impressions)
+        assert telemetry_storage._counters._impressions_queued == 2
+        assert telemetry_storage._counters._impressions_dropped == 3
+
+
+class SpilloverEventStorageTests(object):
+    """Spillover events storage test cases."""
+
+    def test_spill_and_replay(self, tmpdir):
+        """Test events that do not fit in memory go to disk and are popped afterwards."""
+        telemetry_storage = InMemoryTelemetryStorage()
+        telemetry_runtime_producer = TelemetryStorageProducer(telemetry_storage).get_telemetry_runtime_producer()
+        storage = SpilloverEventStorage(2, telemetry_runtime_producer, SegmentLog(str(tmpdir)))
+        events = [Event('key%d' % i, 'user', 'purchase', 5.3, 123456, {'a': 1}) for i in range(5)]
+        assert storage.put([EventWrapper(event=event, size=10) for event in events])
+        assert telemetry_storage._counters._events_queued == 5
+
+        assert storage.pop_many(10) == events
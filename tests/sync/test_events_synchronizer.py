@@ -68,6 +68,35 @@ class EventsSynchronizerTests(object):
         assert event_synchronizer._failed.qsize() == 0
 
 
+    def test_synchronize_events_drains_storage(self, mocker):
+        events = [Event('key%d' % i, 'user', 'purchase', 5.3, 123456, None) for i in range(12)]
+        storage = mocker.Mock(spec=EventStorage)
+        storage.pop_many.side_effect = lambda count: [events.pop(0) for _ in range(min(count, len(events)))]
+
+        api = mocker.Mock()
+        api.flush_events.return_value = HttpResponse(200, '', {})
+
+        event_synchronizer = EventSynchronizer(api, storage, 5, max_in_flight=2)
+        event_synchronizer.synchronize_events()
+        assert [len(call[1][0]) for call in api.flush_events.mock_calls] == [5, 5, 2]
+        assert events == []
+
+    def test_synchronize_events_bounded_retry(self, mocker):
+        storage = mocker.Mock(spec=EventStorage)
+        storage.pop_many.return_value = [
+            Event('key%d' % i, 'user', 'purchase', 5.3, 123456, None) for i in range(5)
+        ]
+        api = mocker.Mock()
+        api.flush_events.side_effect = APIException("something broke")
+
+        event_synchronizer = EventSynchronizer(api, storage, 5, failed_queue_size=3)
+        event_synchronizer.synchronize_events()
+        assert event_synchronizer._failed.qsize() == 3
+
+        # backend still in backoff, nothing is sent
+        event_synchronizer.synchronize_events()
+        assert len(api.flush_events.mock_calls) == 1
+
 class EventsSynchronizerAsyncTests(object):
     """Events synchronizer async test cases."""
 
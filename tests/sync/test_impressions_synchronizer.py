@@ -68,6 +68,69 @@ class ImpressionsSynchronizerTests(object):
         assert impression_synchronizer._failed.qsize() == 0
 
 
+    def test_synchronize_impressions_drains_storage(self, mocker):
+        impressions = [Impression('key%d' % i, 'split1', 'on', 'l1', 123456, 'b1', 321654, None, None)
+                       for i in range(12)]
+        storage = mocker.Mock(spec=ImpressionStorage)
+        storage.pop_many.side_effect = lambda count: [impressions.pop(0) for _ in range(min(count, len(impressions)))]
+
+        api = mocker.Mock()
+        api.flush_impressions.return_value = HttpResponse(200, '', {})
+
+        impression_synchronizer = ImpressionSynchronizer(api, storage, 5, max_in_flight=2)
+        impression_synchronizer.synchronize_impressions()
+        assert [len(call[1][0]) for call in api.flush_impressions.mock_calls] == [5, 5, 2]
+        assert impressions == []
+
+    def test_synchronize_impressions_bounded_retry_with_backoff(self, mocker):
+        storage = mocker.Mock(spec=ImpressionStorage)
+        storage.pop_many.return_value = [
+            Impression('key%d' % i, 'split1', 'on', 'l1', 123456, 'b1', 321654, None, None)
+            for i in range(5)
+        ]
+        api = mocker.Mock()
+        api.flush_impressions.side_effect = APIException("something broke")
+
+        impression_synchronizer = ImpressionSynchronizer(api, storage, 5, failed_queue_size=3)
+        impression_synchronizer.synchronize_impressions()
+        assert impression_synchronizer._failed.qsize() == 3
+        assert len(api.flush_impressions.mock_calls) == 1
+
+        # backend still in backoff, nothing is sent
+        impression_synchronizer.synchronize_impressions()
+        assert len(api.flush_impressions.mock_calls) == 1
+
+        impression_synchronizer._retry_at = 0
+        api.flush_impressions.side_effect = None
+        storage.pop_many.return_value = []
+        impression_synchronizer.synchronize_impressions()
+        # bulk size was shrunk after the failure, retried impressions go out in smaller bulks
+        assert sum(len(call[1][0]) for call in api.flush_impressions.mock_calls[1:]) == 3
+        assert impression_synchronizer._failed.qsize() == 0
+
+    def test_shutdown(self, mocker):
+        impressions = [Impression('key%d' % i, 'split1', 'on', 'l1', 123456, 'b1', 321654, None, None)
+                       for i in range(12)]
+        storage = mocker.Mock(spec=ImpressionStorage)
+        storage.pop_many.side_effect = lambda count: [impressions.pop(0) for _ in range(min(count, len(impressions)))]
+        api = mocker.Mock()
+        api.flush_impressions.side_effect = APIException("something broke")
+
+        impression_synchronizer = ImpressionSynchronizer(api, storage, 5, max_in_flight=2)
+        impression_synchronizer.synchronize_impressions()
+        executor = impression_synchronizer._executor
+        assert executor is not None
+        assert impression_synchronizer._failed.qsize() == 10
+
+        # stopping sends what's left even while backing off, and releases the flush threads.
+        api.flush_impressions.side_effect = None
+        impression_synchronizer.shutdown()
+        assert impression_synchronizer._failed.qsize() == 0
+        assert impressions == []
+        assert impression_synchronizer._executor is None
+        assert executor._shutdown
+
+
 class ImpressionsSynchronizerAsyncTests(object):
     """Impressions synchronizer test cases."""
 
@@ -131,3 +194,52 @@ class ImpressionsSynchronizerAsyncTests(object):
         await impression_synchronizer.synchronize_impressions()
         assert run._called == 1
         assert impression_synchronizer._failed.qsize() == 0
+
+
+    @pytest.mark.asyncio
+    async def test_synchronize_impressions_drains_storage(self, mocker):
+        impressions = [Impression('key%d' % i, 'split1', 'on', 'l1', 123456, 'b1', 321654, None, None)
+                       for i in range(12)]
+        storage = mocker.Mock(spec=ImpressionStorage)
+        async def pop_many(count):
+            return [impressions.pop(0) for _ in range(min(count, len(impressions)))]
+        storage.pop_many = pop_many
+
+        api = mocker.Mock()
+        self.sent = []
+        async def run(imps):
+            self.sent.append(len(imps))
+            return HttpResponse(200, '', {})
+        api.flush_impressions = run
+
+        impression_synchronizer = ImpressionSynchronizerAsync(api, storage, 5, max_in_flight=2)
+        await impression_synchronizer.synchronize_impressions()
+        assert self.sent == [5, 5, 2]
+        assert impressions == []
+
+    @pytest.mark.asyncio
+    async def test_shutdown(self, mocker):
+        impressions = [Impression('key%d' % i, 'split1', 'on', 'l1', 123456, 'b1', 321654, None, None)
+                       for i in range(5)]
+        storage = mocker.Mock(spec=ImpressionStorage)
+        async def pop_many(count):
+            return [impressions.pop(0) for _ in range(min(count, len(impressions)))]
+        storage.pop_many = pop_many
+
+        api = mocker.Mock()
+        self.sent = []
+        async def run(imps):
+            self.sent.append(len(imps))
+            if len(self.sent) == 1:
+                raise APIException("something broke")
+            return HttpResponse(200, '', {})
+        api.flush_impressions = run
+
+        impression_synchronizer = ImpressionSynchronizerAsync(api, storage, 5)
+        await impression_synchronizer.synchronize_impressions()
+        await impression_synchronizer.synchronize_impressions()
+        assert self.sent == [5]
+
+        await impression_synchronizer.shutdown()
+        assert sum(self.sent[1:]) == 5
+        assert impression_synchronizer._failed.qsize() == 0
@@ -1,26 +1,107 @@
 """Split Worker tests."""
 
 import os
+import threading
 
 from splitio.util.backoff import Backoff
 from splitio.api import APIException
 from splitio.api.commons import FetchOptions
 from splitio.storage import SplitStorage, SegmentStorage, RuleBasedSegmentsStorage
 from splitio.storage.inmemmory import InMemorySegmentStorage, InMemorySegmentStorageAsync, InMemorySplitStorage, InMemorySplitStorageAsync
-from splitio.sync.segment import SegmentSynchronizer, SegmentSynchronizerAsync, LocalSegmentSynchronizer, LocalSegmentSynchronizerAsync
+from splitio.sync.segment import SegmentSynchronizer, SegmentSynchronizerAsync, LocalSegmentSynchronizer, LocalSegmentSynchronizerAsync, \
+    SegmentPollSchedule
 from splitio.models.segments import Segment
 from splitio.models import rule_based_segments
 from splitio.optional.loaders import aiofiles, asyncio
 
 import pytest
 
+class SegmentPollScheduleTests(object):
+    """Segment poll schedule test cases."""
+
+    def test_backoff(self, mocker):
+        """Test unchanged segments are polled less often, up to the max period."""
+        mocker.patch('splitio.sync.segment.random.uniform', return_value=0)
+        schedule = SegmentPollSchedule(30, 100)
+        assert schedule.due(['segmentA'], now=0) == ['segmentA']
+
+        schedule.record('segmentA', True, now=0)
+        assert schedule.due(['segmentA'], now=29) == []
+        assert schedule.due(['segmentA'], now=30) == ['segmentA']
+
+        schedule.record('segmentA', False, now=30)
+        assert schedule.due(['segmentA'], now=89) == []
+        schedule.record('segmentA', False, now=90)
+        schedule.record('segmentA', False, now=190)
+        assert schedule.due(['segmentA'], now=289) == []
+        assert schedule.due(['segmentA'], now=290) == ['segmentA']
+
+        schedule.record('segmentA', True, now=290)
+        assert schedule.due(['segmentA', 'segmentB'], now=320) == ['segmentA', 'segmentB']
+        assert schedule.poll_intervals() == {'segmentA': 30}
+
+    def test_purge(self):
+        """Test segments no longer in use are forgotten."""
+        schedule = SegmentPollSchedule(30, 100)
+        schedule.record('segmentA', True, now=0)
+        schedule.record('segmentB', False, now=0)
+        assert schedule.due(['segmentB', 'segmentC'], now=10) == ['segmentC']
+        assert schedule.poll_intervals() == {'segmentB': 30}
+
+    def test_jitter(self):
+        """Test jitter only brings polls forward."""
+        schedule = SegmentPollSchedule(30, 100, jitter=0.5)
+        for index in range(20):
+            schedule.record('segment%d' % index, True, now=0)
+        due = schedule.due(['segment%d' % index for index in range(20)], now=25)
+        assert 0 < len(due) < 20
+        assert len(schedule.due(['segment%d' % index for index in range(20)], now=30)) == 20
+
+
 class SegmentsSynchronizerTests(object):
     """Segments synchronizer test cases."""
 
+    def test_synchronize_due_segments(self, mocker):
+        """Test the periodic synchronization only fetches due segments."""
+        mocker.patch('splitio.sync.segment.random.uniform', return_value=0)
+        split_storage = mocker.Mock(spec=SplitStorage)
+        split_storage.get_segment_names.return_value = ['segmentA', 'segmentB']
+        split_storage.get_all_splits.return_value = []
+        rbs_storage = mocker.Mock(spec=RuleBasedSegmentsStorage)
+        rbs_storage.get_segment_names.return_value = []
+        storage = InMemorySegmentStorage()
+
+        versions = {'segmentA': 10, 'segmentB': 10}
+        def fetch_segment_mock(segment_name, change_number, fetch_options):
+            since = change_number if change_number != -1 else versions[segment_name]
+            return {'name': segment_name, 'added': [], 'removed': [], 'since': since, 'till': versions[segment_name]}
+        api = mocker.Mock()
+        api.fetch_segment.side_effect = fetch_segment_mock
+
+        schedule = SegmentPollSchedule(30, 300)
+        segments_synchronizer = SegmentSynchronizer(api, split_storage, storage, rbs_storage, poll_schedule=schedule)
+        mocker.patch('splitio.sync.segment.time.monotonic', return_value=1000)
+        assert segments_synchronizer.synchronize_due_segments()
+
+        versions['segmentA'] = 11
+        mocker.patch('splitio.sync.segment.time.monotonic', return_value=1030)
+        assert schedule.due(['segmentA', 'segmentB']) == ['segmentA', 'segmentB']
+        assert segments_synchronizer.synchronize_due_segments()
+
+        versions['segmentA'] = 12
+        mocker.patch('splitio.sync.segment.time.monotonic', return_value=1060)
+        api.fetch_segment.reset_mock()
+        assert segments_synchronizer.synchronize_due_segments()
+        assert set(call[1][0] for call in api.fetch_segment.mock_calls) == set(['segmentA'])
+        assert storage.get_change_number('segmentA') == 12
+        assert segments_synchronizer.poll_schedule.poll_intervals() == {'segmentA': 30, 'segmentB': 60}
+        segments_synchronizer.shutdown()
+
     def test_synchronize_segments_error(self, mocker):
         """On error."""
         split_storage = mocker.Mock(spec=SplitStorage)
         split_storage.get_segment_names.return_value = ['segmentA', 'segmentB', 'segmentC']
+        split_storage.get_all_splits.return_value = []
 
         storage = mocker.Mock(spec=SegmentStorage)
         storage.get_change_number.return_value = -1
@@ -40,6 +121,7 @@ class SegmentsSynchronizerTests(object):
         """Test the normal operation flow."""
         split_storage = mocker.Mock(spec=SplitStorage)
         split_storage.get_segment_names.return_value = ['segmentA', 'segmentB', 'segmentC']
+        split_storage.get_all_splits.return_value = []
 
         rbs_storage = mocker.Mock(spec=RuleBasedSegmentsStorage)
         rbs_storage.get_segment_names.return_value = ['rbs']
@@ -119,6 +201,84 @@ class SegmentsSynchronizerTests(object):
             assert segment.name in segments_to_validate
             segments_to_validate.remove(segment.name)
 
+    def test_synchronize_segments_priority(self, mocker):
+        """Test segments referenced by most feature flags are fetched first."""
+        split_storage = mocker.Mock(spec=SplitStorage)
+        split_storage.get_segment_names.return_value = ['segmentA', 'segmentB', 'segmentC']
+        flag1 = mocker.Mock()
+        flag1.get_segment_names.return_value = ['segmentB']
+        flag2 = mocker.Mock()
+        flag2.get_segment_names.return_value = ['segmentB', 'segmentC']
+        split_storage.get_all_splits.return_value = [flag1, flag2]
+        rbs_storage = mocker.Mock(spec=RuleBasedSegmentsStorage)
+        rbs_storage.get_segment_names.return_value = []
+        storage = mocker.Mock(spec=SegmentStorage)
+        storage.get_change_number.return_value = -1
+
+        api = mocker.Mock()
+        api.fetch_segment.side_effect = lambda name, change_number, fetch_options: \
+            {'name': name, 'added': ['key1'], 'removed': [], 'since': 123, 'till': 123}
+
+        segments_synchronizer = SegmentSynchronizer(api, split_storage, storage, rbs_storage, max_workers=1)
+        assert segments_synchronizer.synchronize_segments()
+        assert [call[1][0] for call in api.fetch_segment.mock_calls] == ['segmentB', 'segmentC', 'segmentA']
+        assert segments_synchronizer.progress.total == 3
+        assert segments_synchronizer.progress.loaded == 3
+        assert segments_synchronizer.progress.is_ready()
+        segments_synchronizer.shutdown()
+
+    def test_synchronize_critical_segments(self, mocker):
+        """Test only critical segments are waited for."""
+        split_storage = mocker.Mock(spec=SplitStorage)
+        split_storage.get_segment_names.return_value = ['segmentA', 'segmentB']
+        split_storage.get_all_splits.return_value = []
+        rbs_storage = mocker.Mock(spec=RuleBasedSegmentsStorage)
+        rbs_storage.get_segment_names.return_value = []
+        storage = mocker.Mock(spec=SegmentStorage)
+        storage.get_change_number.return_value = -1
+
+        release = threading.Event()
+        def fetch_segment_mock(segment_name, change_number, fetch_options):
+            if segment_name == 'segmentB':
+                release.wait(5)
+            return {'name': segment_name, 'added': [], 'removed': [], 'since': 123, 'till': 123}
+        api = mocker.Mock()
+        api.fetch_segment.side_effect = fetch_segment_mock
+
+        segments_synchronizer = SegmentSynchronizer(api, split_storage, storage, rbs_storage,
+                                                    critical_segments=['segmentA'])
+        assert segments_synchronizer.synchronize_segments()
+        assert segments_synchronizer.progress.is_ready(['segmentA'])
+        assert not segments_synchronizer.progress.is_ready()
+
+        assert segments_synchronizer._drain.is_alive()
+
+        # on demand syncs triggered by flag updates don't wait for the background load.
+        drain = segments_synchronizer._drain
+        assert segments_synchronizer.synchronize_segments(['segmentC'], dont_wait=True)
+        assert segments_synchronizer._drain is drain and drain.is_alive()
+
+        release.set()
+        assert segments_synchronizer.progress.wait(timeout=5)
+        assert segments_synchronizer.progress.loaded == 3
+        segments_synchronizer._drain.join(5)
+        assert not segments_synchronizer._worker_pool._failed
+
+        # failures of segments loaded in background don't leak into the next sync.
+        def failing_fetch_segment_mock(segment_name, change_number, fetch_options):
+            if segment_name == 'segmentB':
+                raise Exception('something broke')
+            return fetch_segment_mock(segment_name, change_number, fetch_options)
+        api.fetch_segment.side_effect = failing_fetch_segment_mock
+        logger = mocker.patch('splitio.sync.segment._LOGGER')
+        assert segments_synchronizer.synchronize_segments()
+        assert segments_synchronizer.synchronize_segments(['segmentA'])
+        assert len(logger.warning.mock_calls) == 1
+        assert segments_synchronizer._drain is not None
+        segments_synchronizer._wait_for_drain()
+        assert not segments_synchronizer._worker_pool._failed
+        segments_synchronizer.shutdown()
+
     def test_synchronize_segment(self, mocker):
         """Test particular segment update."""
         split_storage = mocker.Mock(spec=SplitStorage)
@@ -228,6 +388,9 @@ class SegmentsSynchronizerAsyncTests(object):
         async def get_segment_names():
             return ['segmentA', 'segmentB', 'segmentC']
         split_storage.get_segment_names = get_segment_names
+        async def get_all_splits():
+            return []
+        split_storage.get_all_splits = get_all_splits
 
         storage = mocker.Mock(spec=SegmentStorage)
         async def get_change_number(*args):
@@ -254,6 +417,9 @@ class SegmentsSynchronizerAsyncTests(object):
         async def get_segment_names():
             return ['segmentA', 'segmentB', 'segmentC']
         split_storage.get_segment_names = get_segment_names
+        async def get_all_splits():
+            return []
+        split_storage.get_all_splits = get_all_splits
 
         rbs_storage = mocker.Mock(spec=RuleBasedSegmentsStorage)
         async def get_segment_names_rbs():
@@ -354,6 +520,54 @@ class SegmentsSynchronizerAsyncTests(object):
 
         await segments_synchronizer.shutdown()
 
+    @pytest.mark.asyncio
+    async def test_synchronize_critical_segments(self, mocker):
+        """Test only critical segments are waited for."""
+        split_storage = mocker.Mock(spec=SplitStorage)
+        async def get_segment_names():
+            return ['segmentA', 'segmentB']
+        split_storage.get_segment_names = get_segment_names
+        async def get_all_splits():
+            return []
+        split_storage.get_all_splits = get_all_splits
+        rbs_storage = mocker.Mock(spec=RuleBasedSegmentsStorage)
+        async def get_segment_names_rbs():
+            return []
+        rbs_storage.get_segment_names = get_segment_names_rbs
+
+        storage = mocker.Mock(spec=SegmentStorage)
+        async def get_change_number(*args):
+            return -1
+        storage.get_change_number = get_change_number
+        async def put(*args):
+            pass
+        storage.put = put
+
+        release = asyncio.Event()
+        async def fetch_segment_mock(segment_name, change_number, fetch_options):
+            if segment_name == 'segmentB':
+                await release.wait()
+            return {'name': segment_name, 'added': [], 'removed': [], 'since': 123, 'till': 123}
+        api = mocker.Mock()
+        api.fetch_segment = fetch_segment_mock
+
+        segments_synchronizer = SegmentSynchronizerAsync(api, split_storage, storage, rbs_storage,
+                                                         critical_segments=['segmentA'])
+        assert await segments_synchronizer.synchronize_segments()
+        assert segments_synchronizer.progress.is_ready(['segmentA'])
+        assert not segments_synchronizer.progress.is_ready()
+
+        # on demand syncs triggered by flag updates don't wait for the background load.
+        jobs = segments_synchronizer._jobs
+        assert await segments_synchronizer.synchronize_segments(['segmentC'], dont_wait=True)
+        assert segments_synchronizer._jobs is jobs
+        assert not segments_synchronizer.progress.is_ready(['segmentB'])
+
+        release.set()
+        assert await segments_synchronizer._jobs.await_completion()
+        assert segments_synchronizer.progress.is_ready(['segmentA', 'segmentB'])
+        await segments_synchronizer.shutdown()
+
     @pytest.mark.asyncio
     async def test_synchronize_segment(self, mocker):
         """Test particular segment update."""
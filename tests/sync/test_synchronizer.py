@@ -106,6 +106,7 @@ class SynchronizerTests(object):
         storage = mocker.Mock()
         split_storage = mocker.Mock(spec=SplitStorage)
         split_storage.get_segment_names.return_value = ['segmentA']
+        split_storage.get_all_splits.return_value = []
         rbs_storage = mocker.Mock(spec=RuleBasedSegmentsStorage)
         rbs_storage.get_segment_names.return_value = []
         split_sync = mocker.Mock(spec=SplitSynchronizer)
@@ -181,6 +182,7 @@ class SynchronizerTests(object):
         rbs_storage.get_segment_names.return_value = []
         split_storage.get_change_number.return_value = 123
         split_storage.get_segment_names.return_value = ['segmentA']
+        split_storage.get_all_splits.return_value = []
         class flag_set_filter():
             def should_filter():
                 return False
@@ -483,6 +485,9 @@ class SynchronizerAsyncTests(object):
         async def get_segment_names():
             return ['seg']
         split_storage.get_segment_names = get_segment_names
+        async def get_all_splits():
+            return []
+        split_storage.get_all_splits = get_all_splits
 
         async def get_segment_names_rbs():
             return []
@@ -592,6 +597,9 @@ class SynchronizerAsyncTests(object):
         async def get_segment_names():
             return ['segmentA']
         split_storage.get_segment_names = get_segment_names
+        async def get_all_splits():
+            return []
+        split_storage.get_all_splits = get_all_splits
 
         class flag_set_filter():
             def should_filter():
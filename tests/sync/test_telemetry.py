@@ -7,7 +7,7 @@ from splitio.engine.telemetry import TelemetryStorageConsumer, TelemetryStorageC
 from splitio.storage.inmemmory import InMemoryTelemetryStorage, InMemoryTelemetryStorageAsync, InMemorySegmentStorage, InMemorySegmentStorageAsync, InMemorySplitStorage, InMemorySplitStorageAsync
 from splitio.models.splits import Split, Status
 from splitio.models.segments import Segment
-from splitio.models.telemetry import StreamingEvents, StreamingEventsAsync
+from splitio.models.telemetry import StreamingEvents, StreamingEventsAsync, MethodExceptionsAndLatencies
 from splitio.api.telemetry import TelemetryAPI
 
 class TelemetrySynchronizerTests(object):
@@ -102,15 +102,9 @@ class TelemetrySubmitterTests(object):
         telemetry_storage._streaming_events = StreamingEvents()
         telemetry_storage._tags = ['tag1']
 
-        telemetry_storage._method_latencies._treatment = [1] + [0] * 22
-        telemetry_storage._method_latencies._treatments = [0] * 23
-        telemetry_storage._method_latencies._treatment_with_config = [0] * 23
-        telemetry_storage._method_latencies._treatments_with_config = [0] * 23
-        telemetry_storage._method_latencies._treatments_by_flag_set = [1] + [0] * 22
-        telemetry_storage._method_latencies._treatments_by_flag_sets = [0] * 23
-        telemetry_storage._method_latencies._treatments_with_config_by_flag_set = [1] + [0] * 22
-        telemetry_storage._method_latencies._treatments_with_config_by_flag_sets = [0] * 23
-        telemetry_storage._method_latencies._track = [0] * 23
+        telemetry_storage.record_latency(MethodExceptionsAndLatencies.TREATMENT, 0)
+        telemetry_storage.record_latency(MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SET, 0)
+        telemetry_storage.record_latency(MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SET, 0)
 
         telemetry_storage._http_latencies._split = [1] + [0] * 22
         telemetry_storage._http_latencies._segment = [0] * 23
@@ -173,6 +167,17 @@ class TelemetrySubmitterTests(object):
             "t": ['tag1']
         })
 
+    def test_regex_budget_tag(self, mocker):
+        mocker.patch('splitio.sync.telemetry.regex.pop_exhausted_count', return_value=2)
+        telemetry_storage = InMemoryTelemetryStorage()
+        telemetry_storage._tags = ['tag1']
+        telemetry_submitter = InMemoryTelemetrySubmitter(TelemetryStorageConsumer(telemetry_storage), InMemorySplitStorage(),
+                                                         InMemorySegmentStorage(), mocker.Mock(spec=TelemetryAPI))
+        assert telemetry_submitter._build_stats()['t'] == ['tag1', 'regexBudgetExceeded:2']
+
+        mocker.patch('splitio.sync.telemetry.regex.pop_exhausted_count', return_value=0)
+        assert telemetry_submitter._build_stats()['t'] == []
+
 
 class TelemetrySubmitterAsyncTests(object):
     """Telemetry submitter async test cases."""
@@ -227,15 +232,9 @@ class TelemetrySubmitterAsyncTests(object):
         telemetry_storage._streaming_events = await StreamingEventsAsync.create()
         telemetry_storage._tags = ['tag1']
 
-        telemetry_storage._method_latencies._treatment = [1] + [0] * 22
-        telemetry_storage._method_latencies._treatments = [0] * 23
-        telemetry_storage._method_latencies._treatment_with_config = [0] * 23
-        telemetry_storage._method_latencies._treatments_with_config = [0] * 23
-        telemetry_storage._method_latencies._treatments_by_flag_set = [1] + [0] * 22
-        telemetry_storage._method_latencies._treatments_by_flag_sets = [0] * 23
-        telemetry_storage._method_latencies._treatments_with_config_by_flag_set = [1] + [0] * 22
-        telemetry_storage._method_latencies._treatments_with_config_by_flag_sets = [0] * 23
-        telemetry_storage._method_latencies._track = [0] * 23
+        await telemetry_storage.record_latency(MethodExceptionsAndLatencies.TREATMENT, 0)
+        await telemetry_storage.record_latency(MethodExceptionsAndLatencies.TREATMENTS_BY_FLAG_SET, 0)
+        await telemetry_storage.record_latency(MethodExceptionsAndLatencies.TREATMENTS_WITH_CONFIG_BY_FLAG_SET, 0)
 
         telemetry_storage._http_latencies._split = [1] + [0] * 22
         telemetry_storage._http_latencies._segment = [0] * 23
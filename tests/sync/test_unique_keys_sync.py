@@ -19,7 +19,7 @@ class UniqueKeysSynchronizerTests(object):
         cache, cache_size = unique_keys_synchronizer._uniqe_keys_tracker.get_cache_info_and_pop_all()
         assert(cache_size > unique_keys_synchronizer._max_bulk_size)
 
-        bulks = unique_keys_synchronizer._split_cache_to_bulks(cache)
+        bulks = list(unique_keys_synchronizer._split_cache_to_bulks(cache))
         assert(len(bulks) == int(total_mtks / unique_keys_synchronizer._max_bulk_size) + 1)
         for i in range(0 , int(total_mtks / unique_keys_synchronizer._max_bulk_size)):
             if i > int(total_mtks / unique_keys_synchronizer._max_bulk_size):
@@ -43,6 +43,28 @@ class UniqueKeysSynchronizerTests(object):
     def mocked_record_unique_keys(self, cache):
         return mock.Mock()
 
+    def test_split_cache_to_bulks_multiple_features(self, mocker):
+        unique_keys_synchronizer = UniqueKeysSynchronizer(mocker.Mock(), UniqueKeysTracker())
+        unique_keys_synchronizer._max_bulk_size = 10
+        cache = {
+            'feature1': set('key%d' % i for i in range(7)),
+            'feature2': set('key%d' % i for i in range(12)),
+            'feature3': set('key%d' % i for i in range(3)),
+        }
+
+        bulks = list(unique_keys_synchronizer._split_cache_to_bulks(cache))
+        assert [sum(len(keys) for keys in bulk.values()) for bulk in bulks] == [10, 10, 2]
+        assert cache == {}
+        sent = {}
+        for bulk in bulks:
+            for feature, keys in bulk.items():
+                sent.setdefault(feature, set()).update(keys)
+        assert sent == {
+            'feature1': set('key%d' % i for i in range(7)),
+            'feature2': set('key%d' % i for i in range(12)),
+            'feature3': set('key%d' % i for i in range(3)),
+        }
+
     def test_clear_all_filter(self, mocker):
         unique_keys_tracker = UniqueKeysTracker()
         total_mtks = 50
@@ -51,6 +73,11 @@ class UniqueKeysSynchronizerTests(object):
 
         clear_filter_sync = ClearFilterSynchronizer(unique_keys_tracker)
         clear_filter_sync.clear_all()
+        for i in range(0 , total_mtks):
+            assert(unique_keys_tracker._filter.contains('feature1key'+str(i)))
+
+        # items age out after a full rotation of the filter generations
+        clear_filter_sync.clear_all()
         for i in range(0 , total_mtks):
             assert(not unique_keys_tracker._filter.contains('feature1key'+str(i)))
 
@@ -69,7 +96,7 @@ class UniqueKeysSynchronizerAsyncTests(object):
         cache, cache_size = await unique_keys_synchronizer._uniqe_keys_tracker.get_cache_info_and_pop_all()
         assert(cache_size > unique_keys_synchronizer._max_bulk_size)
 
-        bulks = unique_keys_synchronizer._split_cache_to_bulks(cache)
+        bulks = list(unique_keys_synchronizer._split_cache_to_bulks(cache))
         assert(len(bulks) == int(total_mtks / unique_keys_synchronizer._max_bulk_size) + 1)
         for i in range(0 , int(total_mtks / unique_keys_synchronizer._max_bulk_size)):
             if i > int(total_mtks / unique_keys_synchronizer._max_bulk_size):
@@ -103,4 +130,9 @@ class UniqueKeysSynchronizerAsyncTests(object):
         clear_filter_sync = ClearFilterSynchronizerAsync(unique_keys_tracker)
         await clear_filter_sync.clear_all()
         for i in range(0 , total_mtks):
-            assert(not unique_keys_tracker._filter.contains('feature1key'+str(i)))
\ No newline at end of file
+            assert(unique_keys_tracker._filter.contains('feature1key'+str(i)))
+
+        # items age out after a full rotation of the filter generations
+        await clear_filter_sync.clear_all()
+        for i in range(0 , total_mtks):
+            assert(not unique_keys_tracker._filter.contains('feature1key'+str(i)))
@@ -27,7 +27,8 @@ class EventsSyncTests(object):
             Event('key5', 'user', 'purchase', 5.3, 123456, None),
         ]
 
-        storage.pop_many.return_value = events
+        # each run drains storage, so alternate between a full bulk and an empty storage
+        storage.pop_many.side_effect = lambda count: events if storage.pop_many.call_count % 2 else []
         api = mocker.Mock(spec=EventsAPI)
         api.flush_events.return_value = HttpResponse(200, '', {})
         event_synchronizer = EventSynchronizer(api, storage, 5)
@@ -60,9 +61,12 @@ class EventsSyncAsyncTests(object):
         ]
         storage = mocker.Mock(spec=EventStorage)
         self.called = False
+        self.pop_called = 0
         async def pop_many(*args):
+            # each run drains storage, so alternate between a full bulk and an empty storage
             self.called = True
-            return self.events
+            self.pop_called += 1
+            return self.events if self.pop_called % 2 else []
         storage.pop_many = pop_many
 
         api = mocker.Mock(spec=EventsAPI)
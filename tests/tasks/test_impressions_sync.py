@@ -26,7 +26,8 @@ class ImpressionsSyncTaskTests(object):
             Impression('key4', 'split2', 'on', 'l1', 123456, 'b1', 321654, None, None),
             Impression('key5', 'split3', 'off', 'l1', 123456, 'b1', 321654, None, None)
         ]
-        storage.pop_many.return_value = impressions
+        # each run drains storage, so alternate between a full bulk and an empty storage
+        storage.pop_many.side_effect = lambda count: impressions if storage.pop_many.call_count % 2 else []
         api = mocker.Mock(spec=ImpressionsAPI)
         api.flush_impressions.return_value = HttpResponse(200, '', {})
         impression_synchronizer = ImpressionSynchronizer(api, storage, 5)
@@ -63,8 +64,9 @@ class ImpressionsSyncTaskAsyncTests(object):
         ]
         self.pop_called = 0
         async def pop_many(*args):
+            # each run drains storage, so alternate between a full bulk and an empty storage
             self.pop_called += 1
-            return impressions
+            return impressions if self.pop_called % 2 else []
         storage.pop_many = pop_many
 
         api = mocker.Mock(spec=ImpressionsAPI)
@@ -84,7 +86,7 @@ class ImpressionsSyncTaskAsyncTests(object):
         task.start()
         await asyncio.sleep(2)
         assert task.is_running()
-        assert self.pop_called == 1
+        assert self.pop_called == 2
         assert self.flushed == impressions
 
         calls_now = self.called
@@ -21,6 +21,7 @@ class SegmentSynchronizationTests(object):
         """Test the normal operation flow."""
         split_storage = mocker.Mock(spec=SplitStorage)
         split_storage.get_segment_names.return_value = ['segmentA', 'segmentB', 'segmentC']
+        split_storage.get_all_splits.return_value = []
         rbs_storage = mocker.Mock(spec=RuleBasedSegmentsStorage)
         rbs_storage.get_segment_names.return_value = []
 
@@ -101,6 +102,7 @@ class SegmentSynchronizationTests(object):
         """Test that if fetching segments fails at some_point, the task will continue running."""
         split_storage = mocker.Mock(spec=SplitStorage)
         split_storage.get_segment_names.return_value = ['segmentA', 'segmentB', 'segmentC']
+        split_storage.get_all_splits.return_value = []
         rbs_storage = mocker.Mock(spec=RuleBasedSegmentsStorage)
         rbs_storage.get_segment_names.return_value = []
 
@@ -186,6 +188,9 @@ class SegmentSynchronizationAsyncTests(object):
         async def get_segment_names():
             return ['segmentA', 'segmentB', 'segmentC']
         split_storage.get_segment_names = get_segment_names
+        async def get_all_splits():
+            return []
+        split_storage.get_all_splits = get_all_splits
 
         rbs_storage = mocker.Mock(spec=RuleBasedSegmentsStorage)
         async def get_segment_names_rbs():
@@ -284,6 +289,9 @@ class SegmentSynchronizationAsyncTests(object):
         async def get_segment_names():
             return ['segmentA', 'segmentB', 'segmentC']
         split_storage.get_segment_names = get_segment_names
+        async def get_all_splits():
+            return []
+        split_storage.get_all_splits = get_all_splits
 
         rbs_storage = mocker.Mock(spec=RuleBasedSegmentsStorage)
         async def get_segment_names_rbs():
@@ -0,0 +1,25 @@
+"""Snapshot task test module."""
+import threading
+import time
+
+from splitio.tasks.snapshot_sync import SnapshotSyncTask
+
+
+class SnapshotSyncTests(object):
+    """Snapshot task test cases."""
+
+    def test_normal_operation(self, mocker):
+        """Test snapshots are written periodically and once more on stop."""
+        save = mocker.Mock()
+        task = SnapshotSyncTask(save, 1)
+        task.start()
+        time.sleep(1.5)
+        assert task.is_running()
+        assert len(save.mock_calls) == 1
+
+        stop_event = threading.Event()
+        task.stop(stop_event)
+        stop_event.wait(5)
+        assert stop_event.is_set()
+        assert not task.is_running()
+        assert len(save.mock_calls) == 2
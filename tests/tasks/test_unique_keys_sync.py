@@ -49,7 +49,8 @@ class ClearFilterSyncTests(object):
         clear_filter_sync = ClearFilterSynchronizer(unique_keys_tracker)
         task = ClearFilterSyncTask(clear_filter_sync.clear_all, 1)
         task.start()
-        time.sleep(2)
+        # keys age out after two filter rotations
+        time.sleep(2.5)
         assert task.is_running()
         assert not unique_keys_tracker._filter.contains("split1key1")
         assert not unique_keys_tracker._filter.contains("split1key2")
@@ -94,7 +95,8 @@ class ClearFilterSyncTests(object):
         clear_filter_sync = ClearFilterSynchronizerAsync(unique_keys_tracker)
         task = ClearFilterSyncTaskAsync(clear_filter_sync.clear_all, 1)
         task.start()
-        await asyncio.sleep(2)
+        # keys age out after two filter rotations
+        await asyncio.sleep(2.5)
         assert task.is_running()
         assert not unique_keys_tracker._filter.contains("split1key1")
         assert not unique_keys_tracker._filter.contains("split1key2")
@@ -119,6 +119,67 @@ class AsyncTaskTests(object):
         assert len(main_func.mock_calls) == 2
         assert not task.running()
 
+    def test_force_run_while_executing(self, mocker):
+        """Test a forced execution requested while running happens right after the current one."""
+        release = threading.Event()
+        calls = []
+        def main_func():
+            calls.append(time.time())
+            if len(calls) == 1:
+                release.wait(1)
+
+        task = asynctask.AsyncTask(main_func, 0.1, scheduler=asynctask.TaskScheduler())
+        task.start()
+        time.sleep(0.3)
+        task.force_execution()
+        release.set()
+        time.sleep(0.05)
+        on_stop_event = threading.Event()
+        task.stop(on_stop_event)
+        on_stop_event.wait(1)
+
+        assert on_stop_event.is_set()
+        assert len(calls) == 2
+        assert not task.running()
+
+    def test_shared_scheduler(self, mocker):
+        """Test tasks share the scheduler thread and get at most one worker each."""
+        scheduler = asynctask.TaskScheduler()
+        mains = [mocker.Mock() for _ in range(10)]
+        tasks = [asynctask.AsyncTask(main_func, 0.1, scheduler=scheduler) for main_func in mains]
+        for task in tasks:
+            task.start()
+        time.sleep(0.5)
+
+        assert all(len(main_func.mock_calls) >= 2 for main_func in mains)
+        assert scheduler._tasks == 10
+        assert scheduler._workers <= 10
+
+        events = [threading.Event() for _ in tasks]
+        for task, event in zip(tasks, events):
+            task.stop(event)
+        assert all(event.wait(1) for event in events)
+        assert scheduler._tasks == 0
+
+    def test_blocked_tasks_dont_starve_others(self, mocker):
+        """Test tasks blocked on I/O don't keep the remaining ones from running."""
+        scheduler = asynctask.TaskScheduler()
+        release = threading.Event()
+        blocked = [asynctask.AsyncTask(lambda: release.wait(2), 0.05, scheduler=scheduler) for _ in range(6)]
+        main_func = mocker.Mock()
+        task = asynctask.AsyncTask(main_func, 0.1, scheduler=scheduler)
+        for blocked_task in blocked:
+            blocked_task.start()
+        task.start()
+        time.sleep(0.5)
+
+        assert len(main_func.mock_calls) >= 3
+        release.set()
+        events = [threading.Event() for _ in blocked + [task]]
+        for stopped_task, event in zip(blocked + [task], events):
+            stopped_task.stop(event)
+        assert all(event.wait(1) for event in events)
+
 
 class AsyncTaskAsyncTests(object):
     """AsyncTask test cases."""